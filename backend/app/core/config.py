@@ -45,6 +45,21 @@ class Settings(BaseSettings):
     # 개발 모드 설정 추가
     DEV_MODE: bool = os.getenv("DEV_MODE", "False") == "True"
 
+    # 문화 데이터 수집을 별도 워커(run_ingestion_scheduler.py)에서만 실행 (API 프로세스는 대기열 등록만)
+    CULTURAL_HUB_COLLECT_IN_WORKER: bool = os.getenv("CULTURAL_HUB_COLLECT_IN_WORKER", "False") == "True"
+
+    # 공개 조회 API 응답 캐시 (Redis URL이 없으면 프로세스 메모리 캐시)
+    RESPONSE_CACHE_REDIS_URL: str = os.getenv("RESPONSE_CACHE_REDIS_URL", "")
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+    # 실시간 이벤트 전달: local(단일 프로세스) 또는 postgres(LISTEN/NOTIFY, 다중 워커)
+    PUSH_BACKEND: str = os.getenv("PUSH_BACKEND", "local")
+    # 관리자 통계용 일간 사용량 집계 갱신 주기 (초, 0이면 이 프로세스에서는 갱신하지 않음)
+    USAGE_ROLLUP_REFRESH_SECONDS: int = int(os.getenv("USAGE_ROLLUP_REFRESH_SECONDS", "300"))
+    # 포트원 웹훅 대기열 확인 주기 (초, 0이면 이 프로세스에서는 처리하지 않고 run_payment_webhook_worker.py로 처리)
+    PAYMENT_WEBHOOK_POLL_SECONDS: float = float(os.getenv("PAYMENT_WEBHOOK_POLL_SECONDS", "5"))
+    # 포트원 정기결제 예약 대사 실행 시각 (0~23시, -1이면 이 프로세스에서는 실행하지 않음)
+    SUBSCRIPTION_RECONCILE_HOUR: int = int(os.getenv("SUBSCRIPTION_RECONCILE_HOUR", "4"))
+
     CLOUDFRONT_DOMAIN: str
     CLOUDFRONT_DISTRIBUTION_ID: str
 
@@ -0,0 +1,334 @@
+"""
+사용자 실시간 이벤트 (SSE)
+배지/잔액을 주기적으로 조회하는 대신, 서버가 바뀐 순간에만 사용자 연결로 이벤트를 보낸다
+  - notification: 새 알림 (user_id 없이 발행하면 연결된 모든 사용자)
+  - token_balance: 스톤 사용/충전 후 잔액
+  - payment_status: 결제 상태 변경
+
+단일 서버(PUSH_BACKEND=local)는 프로세스 안 브로커로 바로 전달하고,
+여러 워커/서버(PUSH_BACKEND=postgres)는 Postgres NOTIFY로 발행해 각 프로세스의 LISTEN 스레드가
+자기 연결에 나눠 준다. 발행은 커밋 후에 호출하며, 실패해도 요청 처리는 막지 않는다
+
+같은 경로로 프로세스 사이 내부 이벤트(예: 구독 상태 캐시 무효화)도 보낸다
+내부 이벤트는 사용자 연결로 보내지 않고 add_handler로 등록한 처리 함수만 호출한다
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import select
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = 'culf_push'
+QUEUE_SIZE = 100
+KEEPALIVE_SECONDS = 15
+LAG_SAMPLES = 1000
+LISTEN_RETRY_SECONDS = 5
+# NOTIFY 페이로드 한도(8000 bytes) 안에 들도록 여러 사용자 대상 이벤트를 나눠 발행
+USER_IDS_PER_MESSAGE = 100
+
+EVENT_NOTIFICATION = 'notification'
+EVENT_UNREAD_COUNT = 'unread_count'
+EVENT_TOKEN_BALANCE = 'token_balance'
+EVENT_PAYMENT_STATUS = 'payment_status'
+
+# 내부 이벤트
+EVENT_SUBSCRIPTION_CHANGED = 'subscription_changed'
+# LISTEN 연결이 (다시) 시작됨 - 끊겨 있던 동안의 내부 이벤트는 받지 못했을 수 있음
+EVENT_LISTEN_STARTED = 'listen_started'
+INTERNAL_EVENTS = {EVENT_SUBSCRIPTION_CHANGED, EVENT_LISTEN_STARTED}
+
+Handler = Callable[[Dict[str, Any]], None]
+
+
+def make_message(event: str, data: Dict[str, Any], user_ids: Optional[List[Any]] = None) -> Dict[str, Any]:
+    """user_ids가 None이면 연결된 모든 사용자 대상"""
+    return {
+        'event': event,
+        'user_ids': [str(user_id) for user_id in user_ids] if user_ids is not None else None,
+        'data': data,
+        'published_at': time.time(),
+    }
+
+
+def format_sse(message: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {message['event']}")
+    lines.append("data: " + json.dumps(message['data'], ensure_ascii=False, default=str))
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscription:
+    """사용자 연결 하나 (이벤트 루프의 큐로 전달)"""
+
+    def __init__(self, user_id: str, loop: asyncio.AbstractEventLoop,
+                 muted_types: Iterable[str] = (), queue_size: int = QUEUE_SIZE):
+        self.user_id = user_id
+        self.loop = loop
+        # 수신 거부한 알림 유형 (전체 알림 이벤트에서 제외)
+        self.muted_types = set(muted_types)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def accepts(self, message: Dict[str, Any]) -> bool:
+        return not (message['event'] == EVENT_NOTIFICATION and message['data'].get('type') in self.muted_types)
+
+    def offer(self, message: Dict[str, Any]) -> None:
+        """이벤트 루프 스레드에서 실행 - 느린 연결은 오래된 이벤트부터 버림"""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class PushBroker:
+    """프로세스 안 구독자 목록과 전달 지표"""
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._lags: Deque[float] = deque(maxlen=LAG_SAMPLES)
+        self.published = 0
+        self.delivered = 0
+
+    def subscribe(self, user_id: Any, muted_types: Iterable[str] = (),
+                  loop: Optional[asyncio.AbstractEventLoop] = None) -> Subscription:
+        subscription = Subscription(str(user_id), loop or asyncio.get_running_loop(), muted_types)
+        with self._lock:
+            self._subscribers.setdefault(subscription.user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscribers.get(subscription.user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[subscription.user_id]
+
+    def add_handler(self, event: str, handler: Handler) -> None:
+        """내부 이벤트 처리 함수 등록"""
+        with self._lock:
+            self._handlers.setdefault(event, []).append(handler)
+
+    def _handle(self, message: Dict[str, Any]) -> None:
+        with self._lock:
+            handlers = list(self._handlers.get(message['event'], ()))
+        for handler in handlers:
+            try:
+                handler(message)
+            except Exception:
+                logger.exception(f"내부 이벤트 처리 실패 ({message['event']})")
+
+    def dispatch(self, message: Dict[str, Any]) -> int:
+        """아무 스레드에서나 호출 가능 - 대상 연결 수 반환"""
+        if message['event'] in INTERNAL_EVENTS:
+            self._handle(message)
+            return 0
+        with self._lock:
+            self.published += 1
+            if message.get('user_ids') is None:
+                targets = [sub for subscriptions in self._subscribers.values() for sub in subscriptions]
+            else:
+                targets = [sub for user_id in message['user_ids'] for sub in self._subscribers.get(user_id, ())]
+        targets = [subscription for subscription in targets if subscription.accepts(message)]
+        for subscription in targets:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘 (연결 정리 전)
+                self.unsubscribe(subscription)
+        return len(targets)
+
+    def record_delivery(self, message: Dict[str, Any]) -> int:
+        """연결로 내보낸 직후 호출 - 발행부터 전송까지 지연 기록, 이벤트 id 반환"""
+        with self._lock:
+            self.delivered += 1
+            self._lags.append(max(time.time() - message.get('published_at', time.time()), 0.0))
+            return next(self._ids)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lags = sorted(self._lags)
+            connections = sum(len(subscriptions) for subscriptions in self._subscribers.values())
+            dropped = sum(sub.dropped for subscriptions in self._subscribers.values() for sub in subscriptions)
+            return {
+                'connections': connections,
+                'connected_users': len(self._subscribers),
+                'published': self.published,
+                'delivered': self.delivered,
+                'dropped': dropped,
+                'lag_ms': {
+                    'avg': round(sum(lags) / len(lags) * 1000, 1) if lags else 0.0,
+                    'p95': round(lags[min(len(lags) - 1, int(len(lags) * 0.95))] * 1000, 1) if lags else 0.0,
+                    'max': round(lags[-1] * 1000, 1) if lags else 0.0,
+                },
+            }
+
+
+class LocalTransport:
+    """단일 프로세스 - 바로 브로커로 전달"""
+    name = 'local'
+
+    def __init__(self, broker: PushBroker):
+        self.broker = broker
+
+    def start(self) -> None:
+        pass
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        self.broker.dispatch(message)
+
+
+class PostgresTransport:
+    """NOTIFY로 발행하고 LISTEN 스레드가 받은 이벤트를 이 프로세스의 브로커로 전달"""
+    name = 'postgres'
+
+    def __init__(self, broker: PushBroker, engine):
+        self.broker = broker
+        self.engine = engine
+        self._listener: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen_forever, name='push-listener', daemon=True)
+                self._listener.start()
+
+    def publish(self, message: Dict[str, Any]) -> None:
+        from sqlalchemy import text
+
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"), {
+                'channel': NOTIFY_CHANNEL,
+                'payload': json.dumps(message, ensure_ascii=False, default=str),
+            })
+            conn.commit()
+
+    def _listen_forever(self) -> None:
+        while True:
+            try:
+                self._listen()
+            except Exception as e:
+                logger.error(f"푸시 LISTEN 연결 오류, {LISTEN_RETRY_SECONDS}초 후 재연결: {str(e)}")
+                time.sleep(LISTEN_RETRY_SECONDS)
+
+    def _listen(self) -> None:
+        raw = self.engine.raw_connection()
+        try:
+            connection = raw.driver_connection
+            connection.set_session(autocommit=True)
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            logger.info(f"푸시 LISTEN 시작: {NOTIFY_CHANNEL}")
+            self.broker.dispatch(make_message(EVENT_LISTEN_STARTED, {}))
+            while True:
+                if select.select([connection], [], [], KEEPALIVE_SECONDS) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    notify = connection.notifies.pop(0)
+                    try:
+                        self.broker.dispatch(json.loads(notify.payload))
+                    except ValueError:
+                        logger.warning(f"잘못된 푸시 메시지: {notify.payload[:200]}")
+        finally:
+            raw.invalidate()
+
+
+class PushHub:
+    def __init__(self, transport):
+        self.transport = transport
+        self.broker = transport.broker
+
+    def subscribe(self, user_id: Any, muted_types: Iterable[str] = ()) -> Subscription:
+        self.transport.start()
+        return self.broker.subscribe(user_id, muted_types)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.broker.unsubscribe(subscription)
+
+    def add_handler(self, event: str, handler: Handler) -> None:
+        """내부 이벤트를 받도록 등록 (postgres면 LISTEN 시작)"""
+        self.broker.add_handler(event, handler)
+        self.transport.start()
+
+    def publish(self, event: str, data: Dict[str, Any], user_ids: Optional[List[Any]] = None) -> None:
+        if user_ids is not None and not user_ids:
+            return
+        try:
+            if user_ids is None:
+                self.transport.publish(make_message(event, data))
+                return
+            for start in range(0, len(user_ids), USER_IDS_PER_MESSAGE):
+                self.transport.publish(make_message(event, data, user_ids[start:start + USER_IDS_PER_MESSAGE]))
+        except Exception as e:
+            logger.error(f"푸시 발행 실패 ({event}): {str(e)}")
+
+    def metrics(self) -> Dict[str, Any]:
+        return {'backend': self.transport.name, **self.broker.metrics()}
+
+    async def stream(self, request, user_id: Any, muted_types: Iterable[str] = (), initial_messages=()):
+        """SSE 본문 - 응답을 보내는 이벤트 루프에서 구독하고, 연결이 끊기면 구독 해제"""
+        subscription = self.subscribe(user_id, muted_types)
+        try:
+            for message in initial_messages:
+                yield format_sse(message)
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), timeout=KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(message, self.broker.record_delivery(message))
+        finally:
+            self.unsubscribe(subscription)
+
+
+_push_hub: Optional[PushHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_push_hub() -> PushHub:
+    global _push_hub
+    if _push_hub is None:
+        with _hub_lock:
+            if _push_hub is None:
+                from app.core.config import settings
+
+                broker = PushBroker()
+                if settings.PUSH_BACKEND == 'postgres':
+                    from app.db.session import engine
+                    transport = PostgresTransport(broker, engine)
+                else:
+                    transport = LocalTransport(broker)
+                _push_hub = PushHub(transport)
+    return _push_hub
+
+
+def publish(event: str, data: Dict[str, Any], user_id: Optional[Any] = None) -> None:
+    """커밋 후 호출 (user_id가 없으면 연결된 모든 사용자)"""
+    get_push_hub().publish(event, data, [user_id] if user_id is not None else None)
+
+
+def publish_to(event: str, data: Dict[str, Any], user_ids: List[Any]) -> None:
+    """여러 사용자에게 같은 이벤트 (커밋 후 호출)"""
+    get_push_hub().publish(event, data, list(user_ids))
+
+
+def add_handler(event: str, handler: Handler) -> None:
+    """다른 프로세스에서 발행한 내부 이벤트도 받도록 처리 함수 등록 (앱 시작 시)"""
+    get_push_hub().add_handler(event, handler)
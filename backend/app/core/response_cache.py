@@ -0,0 +1,248 @@
+"""
+공개 조회 API 응답 캐시
+배너/큐레이터/공지/약관/푸터/상품 목록처럼 앱을 열 때마다 호출되지만 거의 바뀌지 않는 응답을
+직렬화한 JSON 바이트와 강한 ETag로 저장해 두고, If-None-Match가 일치하면 DB 조회 없이 304를 돌려준다
+
+키는 네임스페이스(엔드포인트) + 버전 + 쿼리 파라미터이고, 생성/수정/삭제 서비스가 invalidate()로
+네임스페이스 버전을 올리면 이전 키는 더 이상 읽히지 않고 TTL이 지나면 사라진다
+RESPONSE_CACHE_REDIS_URL이 설정되어 있고 redis 패키지가 있으면 여러 워커가 Redis를 함께 쓰고,
+아니면 프로세스 메모리에 둔다 (캐시 저장소 오류는 응답을 막지 않고 DB 조회로 대신한다)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300
+# 클라이언트는 이 시간 동안 재요청 없이 쓰고, 이후에는 ETag로 재검증 (304는 DB 조회 없음)
+DEFAULT_MAX_AGE_SECONDS = 60
+MAX_MEMORY_ENTRIES = 1024
+REDIS_KEY_PREFIX = 'response_cache'
+
+# 캐시 네임스페이스 (엔드포인트 단위)
+BANNERS = 'banners'
+CURATORS = 'curators'
+NOTICES = 'notices'
+TERMS = 'terms'
+FOOTER = 'footer'
+PRODUCTS = 'products'
+# 관리자 결제 목록 전체 개수 (필터별, 짧은 TTL)
+ADMIN_PAYMENT_COUNT = 'admin_payment_count'
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def serialize_payload(payload: Any) -> bytes:
+    """JSONResponse와 같은 형식의 바이트 (키 순서 고정이라 같은 내용이면 같은 ETag)"""
+    return json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 비교 (여러 값/W/ 접두어/* 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate == '*':
+            return True
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> str:
+    if not params:
+        return ''
+    return urlencode(sorted((key, '' if value is None else str(value)) for key, value in params.items()))
+
+
+class MemoryBackend:
+    """프로세스 메모리 저장소 (LRU + 만료시각)"""
+
+    def __init__(self, max_entries: int = MAX_MEMORY_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def version(self, namespace: str) -> int:
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            # 이전 버전 항목은 다시 읽히지 않으므로 바로 정리
+            prefix = f"{namespace}:"
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class RedisBackend:
+    """여러 API 워커가 함께 쓰는 Redis 저장소"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{REDIS_KEY_PREFIX}:{key}")
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self.client.set(f"{REDIS_KEY_PREFIX}:{key}", value, ex=ttl)
+
+    def version(self, namespace: str) -> int:
+        value = self.client.get(f"{REDIS_KEY_PREFIX}:version:{namespace}")
+        return int(value) if value else 0
+
+    def bump(self, namespace: str) -> None:
+        self.client.incr(f"{REDIS_KEY_PREFIX}:version:{namespace}")
+
+
+class ResponseCache:
+    def __init__(self, backend, default_ttl: int = DEFAULT_TTL_SECONDS):
+        self.backend = backend
+        self.default_ttl = default_ttl
+
+    def _version(self, namespace: str) -> Optional[int]:
+        try:
+            return self.backend.version(namespace)
+        except Exception as e:
+            logger.warning(f"응답 캐시 버전 조회 실패 ({namespace}): {str(e)}")
+            return None
+
+    def make_key(self, namespace: str, version: int, params: Optional[Dict[str, Any]] = None) -> str:
+        return f"{namespace}:v{version}:{_encode_params(params)}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"응답 캐시 조회 실패 ({key}): {str(e)}")
+            return None
+        if not value:
+            return None
+        etag, _, body = value.partition(b'\n')
+        return CachedResponse(body=body, etag=etag.decode('ascii'))
+
+    def put(self, key: str, payload: Any, ttl: Optional[int] = None) -> CachedResponse:
+        body = serialize_payload(payload)
+        cached = CachedResponse(body=body, etag=make_etag(body))
+        try:
+            self.backend.set(key, cached.etag.encode('ascii') + b'\n' + body, ttl or self.default_ttl)
+        except Exception as e:
+            logger.warning(f"응답 캐시 저장 실패 ({key}): {str(e)}")
+        return cached
+
+    def load(self, namespace: str, loader: Callable[[], Any],
+             params: Optional[Dict[str, Any]] = None, ttl: Optional[int] = None,
+             refresh: bool = False) -> CachedResponse:
+        """캐시된 응답, 없으면 loader() 결과를 직렬화해 저장 (refresh면 캐시를 읽지 않고 다시 저장)"""
+        version = self._version(namespace)
+        if version is None:
+            body = serialize_payload(loader())
+            return CachedResponse(body=body, etag=make_etag(body))
+        # 조회 시점의 버전 키에 저장 - 로딩 중 무효화되면 이 항목은 다시 읽히지 않음
+        key = self.make_key(namespace, version, params)
+        cached = None if refresh else self.get(key)
+        if cached is None:
+            cached = self.put(key, loader(), ttl)
+        return cached
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            try:
+                self.backend.bump(namespace)
+            except Exception as e:
+                logger.error(f"응답 캐시 무효화 실패 ({namespace}): {str(e)}")
+
+    def respond(self, request: Request, namespace: str, loader: Callable[[], Any],
+                params: Optional[Dict[str, Any]] = None, ttl: Optional[int] = None,
+                max_age: int = DEFAULT_MAX_AGE_SECONDS, private: bool = False) -> Response:
+        """ETag/Cache-Control을 붙인 JSON 응답 (If-None-Match 일치 시 본문 없는 304)"""
+        cached = self.load(namespace, loader, params, ttl)
+        headers = {
+            'ETag': cached.etag,
+            'Cache-Control': f"{'private' if private else 'public'}, max-age={max_age}",
+        }
+        if etag_matches(request.headers.get('if-none-match'), cached.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type='application/json', headers=headers)
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def _create_backend():
+    from app.core.config import settings
+
+    if settings.RESPONSE_CACHE_REDIS_URL:
+        if redis is None:
+            logger.warning("RESPONSE_CACHE_REDIS_URL이 설정되어 있지만 redis 패키지가 없어 메모리 캐시를 사용합니다")
+        else:
+            return RedisBackend(redis.Redis.from_url(settings.RESPONSE_CACHE_REDIS_URL, socket_timeout=0.5))
+    return MemoryBackend()
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        from app.core.config import settings
+
+        _response_cache = ResponseCache(_create_backend(), default_ttl=settings.RESPONSE_CACHE_TTL_SECONDS)
+    return _response_cache
+
+
+def cached_response(request: Request, namespace: str, loader: Callable[[], Any],
+                    params: Optional[Dict[str, Any]] = None, **kwargs) -> Response:
+    return get_response_cache().respond(request, namespace, loader, params, **kwargs)
+
+
+def invalidate(*namespaces: str) -> None:
+    """생성/수정/삭제 서비스에서 커밋 후 호출"""
+    get_response_cache().invalidate(*namespaces)
@@ -3,12 +3,12 @@ from app.domains.user.models import User, UserProvider, CorporateUser
 from app.domains.inquiry.models import Inquiry
 from app.domains.conversation.models import Conversation
 from app.domains.token.models import Token, TokenUsageHistory, TokenPlan, TokenGrant
-from app.domains.notification.models import Notification, UserNotificationSetting
-from app.domains.notice.models import Notice, UserNoticeRead
-from app.domains.payment.models import Payment, PaymentCache
+from app.domains.notification.models import Notification, UserNotificationSetting, UserNotificationMark
+from app.domains.notice.models import Notice, UserNoticeRead, UserNoticeReadBitmap
+from app.domains.payment.models import Payment, PaymentCache, PaymentWebhookEvent
 from app.domains.curator.models import Curator
 from app.domains.subscription.models import SubscriptionPlan, UserSubscription
 from app.domains.banner.models import Banner
-from app.domains.admin.models import SystemSetting
+from app.domains.admin.models import SystemSetting, UserUsageDaily
 from app.domains.footer.models import Footer
 from app.domains.terms.models import Terms
\ No newline at end of file
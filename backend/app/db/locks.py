@@ -0,0 +1,46 @@
+"""
+여러 워커가 함께 쓰는 DB 도우미
+- Postgres advisory lock (SQLite 테스트에서는 항상 잡힌 것으로 취급)
+- 방언별 INSERT (ON CONFLICT 구문을 쓰기 위함)
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.bind.dialect.name == 'postgresql'
+
+
+def try_xact_lock(db: Session, key: int) -> bool:
+    """트랜잭션 단위 잠금 (커밋/롤백 시 자동 해제)"""
+    if not _is_postgres(db):
+        return True
+    return bool(db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {'key': key}).scalar())
+
+
+def try_session_lock(db: Session, key: int, sub_key: int) -> bool:
+    """세션 단위 잠금 (같은 연결에서 release_session_lock으로 해제해야 함)
+
+    두 인자 형식이라 key, sub_key 모두 int4 범위여야 한다
+    """
+    if not _is_postgres(db):
+        return True
+    return bool(db.execute(
+        text("SELECT pg_try_advisory_lock(:key, :sub_key)"), {'key': key, 'sub_key': sub_key}
+    ).scalar())
+
+
+def release_session_lock(db: Session, key: int, sub_key: int) -> None:
+    if not _is_postgres(db):
+        return
+    db.execute(text("SELECT pg_advisory_unlock(:key, :sub_key)"), {'key': key, 'sub_key': sub_key})
+
+
+def insert_statement(db: Session, model):
+    """방언별 insert() - on_conflict_do_nothing/do_update 사용 가능"""
+    if _is_postgres(db):
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model)
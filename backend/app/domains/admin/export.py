@@ -0,0 +1,210 @@
+"""
+관리자 사용자 목록 내보내기 (CSV/XLSX 스트리밍)
+사용자별 집계(최근 30일 스톤 사용량은 일간 집계 rollup, 마지막 대화 시각, 소셜 가입 경로)는 사용자 단위 서브쿼리로 먼저 줄여서 붙이므로
+대화/사용 내역 수만큼 행이 불어나는 조인이 없고, 결과는 서버 측 커서(yield_per)로 일정 개수씩만 읽어
+바로 파일 형식으로 내보낸다. 행 수와 상관없이 메모리 사용량이 일정하다
+"""
+
+import csv
+import io
+import logging
+import tempfile
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.domains.conversation.models import Conversation
+from app.domains.token.models import Token
+from app.domains.user.models import User, UserProvider
+from . import rollup
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+CSV_FLUSH_ROWS = 500
+FILE_CHUNK_SIZE = 64 * 1024
+
+FORMAT_CSV = 'csv'
+FORMAT_XLSX = 'xlsx'
+
+MEDIA_TYPES = {
+    FORMAT_CSV: 'text/csv; charset=utf-8',
+    FORMAT_XLSX: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# (키, 엑셀 헤더)
+EXPORT_COLUMNS = [
+    ('nickname', '닉네임'),
+    ('email', '이메일'),
+    ('created_at', '가입일'),
+    ('last_chat_at', '최근 대화일'),
+    ('status', '상태'),
+    ('role', '권한'),
+    ('total_tokens', '보유 스톤'),
+    ('monthly_token_usage', '최근 30일 사용 스톤'),
+    ('marketing_agreed', '마케팅 동의'),
+    ('is_corporate', '기업 회원'),
+    ('provider', '가입 경로'),
+    ('phone_number', '전화번호'),
+    ('birthdate', '생년월일'),
+    ('gender', '성별'),
+]
+
+PROVIDER_DISPLAY = {
+    'GOOGLE': '구글',
+    'KAKAO': '카카오',
+}
+
+# 스프레드시트가 수식으로 실행하는 시작 문자 (닉네임 등 사용자 입력이 그대로 실행되지 않도록 막음)
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def export_query(db: Session, today: Optional[date] = None):
+    """사용자 한 명당 한 행 (집계는 서브쿼리)"""
+    usage = rollup.user_usage_since(db, rollup.window_start(today=today))
+
+    last_chat = db.query(
+        Conversation.user_id.label('user_id'),
+        func.max(Conversation.question_time).label('last_chat_at')
+    ).group_by(Conversation.user_id).subquery('last_chat')
+
+    # 소셜 계정을 여러 개 연결한 사용자도 한 행만 나오도록 하나만 표시
+    provider = db.query(
+        UserProvider.user_id.label('user_id'),
+        func.min(UserProvider.provider).label('provider')
+    ).group_by(UserProvider.user_id).subquery('provider')
+
+    return db.query(
+        User.nickname,
+        User.email,
+        User.created_at,
+        last_chat.c.last_chat_at,
+        User.status,
+        User.role,
+        func.coalesce(Token.total_tokens, 0).label('total_tokens'),
+        func.coalesce(usage.c.tokens_used, 0).label('monthly_token_usage'),
+        User.marketing_agreed,
+        User.is_corporate,
+        provider.c.provider,
+        User.phone_number,
+        User.birthdate,
+        User.gender,
+    ).outerjoin(
+        Token, Token.user_id == User.user_id
+    ).outerjoin(
+        usage, usage.c.user_id == User.user_id
+    ).outerjoin(
+        last_chat, last_chat.c.user_id == User.user_id
+    ).outerjoin(
+        provider, provider.c.user_id == User.user_id
+    ).order_by(User.created_at, User.user_id)
+
+
+def to_export_row(row) -> Dict[str, Any]:
+    values = dict(row._mapping)
+    values['total_tokens'] = int(values['total_tokens'] or 0)
+    values['monthly_token_usage'] = int(values['monthly_token_usage'] or 0)
+    values['provider'] = PROVIDER_DISPLAY.get(values['provider'], '일반가입')
+    return values
+
+
+def iter_export_rows(db: Session, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """서버 측 커서로 batch_size개씩 읽음"""
+    for row in export_query(db).execution_options(yield_per=batch_size):
+        yield to_export_row(row)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return 'Y' if value else 'N'
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return '' if value is None else value
+
+
+def _xlsx_value(sheet, value: Any) -> Any:
+    # 엑셀은 시간대 정보가 있는 날짜를 저장하지 못함
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    # openpyxl은 '='로 시작하는 문자열을 수식으로 저장하므로 문자열 셀로 고정
+    if isinstance(value, str) and value.startswith('='):
+        from openpyxl.cell import WriteOnlyCell
+
+        cell = WriteOnlyCell(sheet, value)
+        cell.data_type = 's'
+        return cell
+    return value
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], flush_rows: int = CSV_FLUSH_ROWS) -> Iterator[bytes]:
+    """엑셀에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for _, header in EXPORT_COLUMNS])
+    pending = 1
+    first = True
+    for row in rows:
+        writer.writerow([_csv_value(row.get(key)) for key, _ in EXPORT_COLUMNS])
+        pending += 1
+        if pending >= flush_rows:
+            yield buffer.getvalue().encode('utf-8-sig' if first else 'utf-8')
+            first = False
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending or first:
+        yield buffer.getvalue().encode('utf-8-sig' if first else 'utf-8')
+
+
+def iter_xlsx(rows: Iterable[Dict[str, Any]], chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[bytes]:
+    """write-only 워크북으로 행을 임시 파일에 흘려 쓰고, 완성된 파일을 조각내 전송
+    (xlsx는 zip이라 끝까지 쓰기 전에는 보낼 수 없으므로 메모리 대신 디스크에 모음)
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('사용자')
+    sheet.append([header for _, header in EXPORT_COLUMNS])
+    for row in rows:
+        sheet.append([_xlsx_value(sheet, row.get(key)) for key, _ in EXPORT_COLUMNS])
+
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            chunk = output.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+WRITERS = {
+    FORMAT_CSV: iter_csv,
+    FORMAT_XLSX: iter_xlsx,
+}
+
+
+def stream_users_export(export_format: str,
+                        session_factory: Optional[Callable[[], Session]] = None) -> Iterator[bytes]:
+    """StreamingResponse 본문 - 응답을 보내는 동안 쓸 세션을 직접 열고 닫음"""
+    if session_factory is None:
+        from app.db.session import SessionLocal
+        session_factory = SessionLocal
+    db = session_factory()
+    try:
+        yield from WRITERS[export_format](iter_export_rows(db))
+    except Exception:
+        logger.exception(f"사용자 목록 내보내기 실패 ({export_format})")
+        raise
+    finally:
+        db.close()
+
+
+def export_filename(export_format: str, today: Optional[date] = None) -> str:
+    return f"users_{(today or date.today()).strftime('%Y%m%d')}.{export_format}"
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Date, Float, ForeignKey, Index
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import UUID
 from app.db.base_class import Base
 
 class SystemSetting(Base):
@@ -9,4 +10,24 @@ class SystemSetting(Base):
     key = Column(String(50), unique=True, nullable=False)
     value = Column(String(255), nullable=False)
     updated_at = Column(DateTime(timezone=True), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
\ No newline at end of file
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class UserUsageDaily(Base):
+    """사용자별 일간 사용량 집계 (rollup.py가 갱신, 관리자 통계 조회용)"""
+    __tablename__ = "user_usage_daily"
+
+    usage_date = Column(Date, primary_key=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.user_id', ondelete="CASCADE"), primary_key=True)
+    tokens_used = Column(Integer, nullable=False, default=0)
+    usage_count = Column(Integer, nullable=False, default=0)  # 스톤 사용 건수
+    max_tokens_used = Column(Integer)  # 한 번에 사용한 최대/최소 스톤
+    min_tokens_used = Column(Integer)
+    conversations = Column(Integer, nullable=False, default=0)
+    payments = Column(Integer, nullable=False, default=0)  # 성공한 결제 건수/금액
+    payment_amount = Column(Float, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('idx_user_usage_daily_user', 'user_id', 'usage_date'),
+    )
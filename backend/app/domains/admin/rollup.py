@@ -0,0 +1,216 @@
+"""
+관리자 통계용 일간 사용량 집계 (rollup)
+token_usage_history / conversations / payments 원본을 매번 SUM, GROUP BY 하지 않도록
+하루 단위로 미리 합산해 user_usage_daily에 둔다
+
+집계는 날짜 범위를 지우고 원본에서 다시 INSERT ... SELECT 하므로 몇 번을 실행해도 결과가 같다
+백그라운드 스레드가 주기적으로 최근 며칠(늦게 들어온 기록)을 다시 계산하고,
+그 사이 승인된 환불이 있으면 환불된 결제의 결제일도 함께 다시 계산한다 (결제일이 오래전이어도 반영)
+집계가 비어 있으면 원본의 가장 오래된 날짜부터 한 번 채운다
+여러 워커가 동시에 돌더라도 트랜잭션 advisory lock을 잡은 한 곳만 갱신한다
+"""
+
+import logging
+import threading
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from app.db.locks import try_xact_lock
+from .models import UserUsageDaily
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_LOCK_KEY = zlib.crc32(b'culf:usage-rollup')
+REFRESH_INTERVAL_SECONDS = 300
+# 매 주기마다 다시 계산하는 최근 일수 (오늘 포함)
+REFRESH_DAYS = 2
+
+_DELETE_USER_SQL = "DELETE FROM user_usage_daily WHERE usage_date >= :start_date AND usage_date < :end_date"
+
+_USER_ROLLUP_SQL = """
+    INSERT INTO user_usage_daily (
+        usage_date, user_id, tokens_used, usage_count, max_tokens_used, min_tokens_used,
+        conversations, payments, payment_amount, updated_at
+    )
+    SELECT
+        usage_date, user_id,
+        SUM(tokens_used), SUM(usage_count), MAX(max_tokens_used), MIN(min_tokens_used),
+        SUM(conversations), SUM(payments), SUM(payment_amount), CURRENT_TIMESTAMP
+    FROM (
+        SELECT DATE(used_at) AS usage_date, user_id,
+               SUM(tokens_used) AS tokens_used, COUNT(*) AS usage_count,
+               MAX(tokens_used) AS max_tokens_used, MIN(tokens_used) AS min_tokens_used,
+               0 AS conversations, 0 AS payments, 0 AS payment_amount
+        FROM token_usage_history
+        WHERE used_at >= :start_at AND used_at < :end_at AND user_id IS NOT NULL
+        GROUP BY DATE(used_at), user_id
+
+        UNION ALL
+
+        SELECT DATE(question_time), user_id, 0, 0, NULL, NULL, COUNT(*), 0, 0
+        FROM conversations
+        WHERE question_time >= :start_at AND question_time < :end_at
+        GROUP BY DATE(question_time), user_id
+
+        UNION ALL
+
+        SELECT DATE(payment_date), user_id, 0, 0, NULL, NULL, 0, COUNT(*), SUM(amount)
+        FROM payments
+        WHERE payment_date >= :start_at AND payment_date < :end_at AND status = 'SUCCESS'
+        GROUP BY DATE(payment_date), user_id
+    ) facts
+    GROUP BY usage_date, user_id
+"""
+
+# since 이후 승인된 환불의 결제일 (결제 상태가 REFUNDED로 바뀐 날짜)
+_REFUNDED_DAYS_SQL = """
+    SELECT DISTINCT DATE(p.payment_date)
+    FROM refunds r
+    JOIN payments p ON p.payment_id = r.payment_id
+    WHERE r.status = 'APPROVED' AND r.processed_at >= :since AND p.payment_date < :before
+"""
+
+_EARLIEST_FACT_SQL = """
+    SELECT MIN(d) FROM (
+        SELECT MIN(DATE(used_at)) AS d FROM token_usage_history
+        UNION ALL SELECT MIN(DATE(question_time)) FROM conversations
+        UNION ALL SELECT MIN(DATE(payment_date)) FROM payments
+    ) earliest
+"""
+
+
+def _as_date(value) -> date:
+    # SQLite는 DATE()를 문자열로 돌려줌
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _start_of(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def _rebuild(db: Session, start_date: date, end_date: date) -> None:
+    """[start_date, end_date] 범위를 지우고 원본에서 다시 집계 (커밋하지 않음)"""
+    params = {
+        'start_date': start_date,
+        'end_date': end_date + timedelta(days=1),
+        'start_at': _start_of(start_date),
+        'end_at': _start_of(end_date + timedelta(days=1)),
+    }
+    db.execute(text(_DELETE_USER_SQL), params)
+    db.execute(text(_USER_ROLLUP_SQL), params)
+
+
+def _refresh(db: Session, ranges: Iterable[tuple]) -> bool:
+    """여러 날짜 범위를 한 트랜잭션에서 재집계 (다른 곳에서 갱신 중이면 건너뜀)"""
+    ranges = [(start_date, end_date) for start_date, end_date in ranges if start_date <= end_date]
+    if not ranges:
+        return False
+    try:
+        if not try_xact_lock(db, ROLLUP_LOCK_KEY):
+            db.rollback()
+            logger.info("다른 작업자가 사용량 집계 갱신 중 - 건너뜀")
+            return False
+        for start_date, end_date in ranges:
+            _rebuild(db, start_date, end_date)
+        db.commit()
+        return True
+    except Exception as e:
+        db.rollback()
+        logger.error(f"사용량 집계 실패 ({ranges}): {str(e)}")
+        raise
+
+
+def refresh_range(db: Session, start_date: date, end_date: date) -> bool:
+    """[start_date, end_date] 범위를 원본에서 다시 집계 (한 트랜잭션, 다른 곳에서 갱신 중이면 건너뜀)"""
+    return _refresh(db, [(start_date, end_date)])
+
+
+def refunded_days(db: Session, since: datetime, before: date) -> List[date]:
+    """since 이후 승인된 환불 중 결제일이 before 이전인 결제의 결제일"""
+    rows = db.execute(text(_REFUNDED_DAYS_SQL), {'since': since, 'before': _start_of(before)}).scalars()
+    return sorted(_as_date(day) for day in rows if day is not None)
+
+
+def refresh_recent(db: Session, days: int = REFRESH_DAYS, today: Optional[date] = None) -> bool:
+    """
+    최근 며칠 재집계 (집계가 비어 있으면 원본 전체 기간)
+    같은 기간에 승인된 환불이 있으면 그 결제일도 다시 계산 (결제 건수/금액에서 빠지도록)
+    """
+    today = today or date.today()
+    start_date = today - timedelta(days=days - 1)
+    if db.query(UserUsageDaily.usage_date).first() is None:
+        earliest = db.execute(text(_EARLIEST_FACT_SQL)).scalar()
+        if earliest is not None:
+            start_date = min(start_date, _as_date(earliest))
+            logger.info(f"사용량 집계 초기 채우기: {start_date} ~ {today}")
+    refunded = refunded_days(db, _start_of(today - timedelta(days=days - 1)), start_date)
+    if refunded:
+        logger.info(f"환불된 결제일 재집계: {refunded}")
+    return _refresh(db, [(start_date, today)] + [(day, day) for day in refunded])
+
+
+def window_start(days: int = 30, today: Optional[date] = None) -> date:
+    """
+    최근 N일 집계 구간의 시작일 (오늘 포함 N일)
+    집계가 일 단위라 기존 '지금부터 30일 전' 기준과 달리 자정에서 끊으며, 오늘을 포함한 30개 날짜를 합산한다
+    """
+    return (today or date.today()) - timedelta(days=days - 1)
+
+
+def user_usage_since(db: Session, since: date):
+    """사용자별 기간 합계 서브쿼리 (user_id, tokens_used, usage_count, max/min, payments, payment_amount)"""
+    return db.query(
+        UserUsageDaily.user_id.label('user_id'),
+        func.sum(UserUsageDaily.tokens_used).label('tokens_used'),
+        func.sum(UserUsageDaily.usage_count).label('usage_count'),
+        func.max(UserUsageDaily.max_tokens_used).label('max_tokens_used'),
+        func.min(UserUsageDaily.min_tokens_used).label('min_tokens_used'),
+        func.sum(UserUsageDaily.payments).label('payments'),
+        func.sum(UserUsageDaily.payment_amount).label('payment_amount'),
+    ).filter(
+        UserUsageDaily.usage_date >= since
+    ).group_by(UserUsageDaily.user_id).subquery('usage')
+
+
+class RollupRefresher:
+    """주기적으로 최근 집계를 갱신하는 백그라운드 스레드"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None,
+                 interval_seconds: float = REFRESH_INTERVAL_SECONDS):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> bool:
+        if self.session_factory is None:
+            from app.db.session import SessionLocal
+            self.session_factory = SessionLocal
+        db = self.session_factory()
+        try:
+            return refresh_recent(db)
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("사용량 집계 백그라운드 갱신 오류")
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> threading.Thread:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='usage-rollup', daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
+
@@ -2,13 +2,14 @@ import uuid
 from datetime import timedelta, datetime
 from sqlalchemy import func
 from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Body
+from fastapi.responses import StreamingResponse
 from pydantic import HttpUrl
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
 from app.db.session import get_db
-from app.domains.admin import services, schemas
+from app.domains.admin import services, schemas, export
 from app.domains.admin.models import SystemSetting
 from app.domains.admin.schemas import NotificationResponse, NotificationCreate, NotificationListResponse, \
     WelcomeTokenResponse, WelcomeTokenUpdate, TokenGrantResponse, TokenGrantCreate, SubscriptionPlanUpdate, \
@@ -23,6 +24,7 @@ from app.core.deps import get_current_active_superuser, get_current_admin_user
 from app.domains.user.models import User
 from typing import List, Optional, Dict
 from app.core.config import settings
+from app.core import push
 from datetime import datetime, date
 import logging
 
@@ -64,12 +66,21 @@ async def search_users(
 
 @router.get("/users/export")
 async def export_users(
+    format: Optional[str] = Query(None, pattern='^(csv|xlsx)$', description="csv 또는 xlsx면 파일로 스트리밍"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
 ):
     """
     전체 사용자 목록을 엑셀 다운로드용으로 조회합니다.
+    format을 지정하면 파일을 만들면서 바로 내려보내므로 사용자 수와 상관없이 메모리 사용량이 일정합니다.
     """
+    if format:
+        return StreamingResponse(
+            export.stream_users_export(format),
+            media_type=export.MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="{export.export_filename(format)}"'}
+        )
+
     try:
         users = services.get_admin_users_for_export(db)
         return {"users": users}
@@ -599,6 +610,25 @@ async def create_notification(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/notifications/{notification_id}/delivery")
+async def get_notification_delivery(
+    notification_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """알림 발송 진행 상황 조회"""
+    delivery = services.get_notification_delivery(db, notification_id)
+    if not delivery:
+        raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다.")
+    return delivery
+
+@router.get("/push/metrics")
+async def get_push_metrics(
+    current_user: User = Depends(get_current_admin_user)
+):
+    """실시간 이벤트 연결 수/전달 지연 (응답한 워커 프로세스 기준)"""
+    return push.get_push_hub().metrics()
+
 @router.delete("/notifications/{notification_id}", status_code=204)
 async def delete_notification(
     notification_id: int,
@@ -1,15 +1,19 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, desc, asc, case, distinct
+from sqlalchemy import func, or_, desc, asc, case, cast, Float
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
-from app.domains.admin.models import SystemSetting
+from app.core import response_cache
+from app.domains.admin import export, rollup
+from app.domains.admin.models import SystemSetting, UserUsageDaily
 from app.domains.admin.schemas import NotificationCreate, TokenPlanUpdate, SubscriptionPlanUpdate
 from app.domains.notice.models import Notice
 from app.domains.notification.models import Notification, UserNotification
+from app.domains.notification import fanout, inbox
 from app.domains.subscription.models import SubscriptionPlan
-from app.domains.user.models import User, UserProvider
-from app.domains.token.models import Token, TokenUsageHistory, TokenGrant, TokenPlan
+from app.domains.subscription import services as subscription_services
+from app.domains.user.models import User
+from app.domains.token.models import Token, TokenGrant, TokenPlan
 from app.domains.conversation.models import Conversation
 from app.domains.payment.models import Payment
 import logging
@@ -27,31 +31,25 @@ def get_admin_users(
         status: str = "all",
         token_filter: str = "all"
 ) -> Dict:
+    # 최근 30일 스톤 사용량은 일간 집계(user_usage_daily)에서
+    monthly_usage_subquery = rollup.user_usage_since(db, rollup.window_start())
+
+    # 마지막 대화 시각은 조회된 행에 대해서만 (conversations 전체 GROUP BY 없음)
+    last_chat_at = db.query(
+        func.max(Conversation.question_time)
+    ).filter(
+        Conversation.user_id == User.user_id
+    ).correlate(User).scalar_subquery()
+
     # Base query
     query = db.query(
         User,
         Token.total_tokens,
-        func.max(Conversation.question_time).label('question_time')
+        last_chat_at.label('question_time'),
+        monthly_usage_subquery.c.tokens_used.label('monthly_usage')
     ).outerjoin(
         Token, User.user_id == Token.user_id
     ).outerjoin(
-        Conversation,
-        User.user_id == Conversation.user_id
-    ).group_by(User.user_id, Token.total_tokens)
-
-    # Subquery for monthly token usage
-    monthly_usage_subquery = (
-        db.query(
-            TokenUsageHistory.user_id,
-            func.coalesce(func.sum(TokenUsageHistory.tokens_used), 0).label('monthly_usage')
-        )
-        .filter(TokenUsageHistory.used_at >= datetime.now() - timedelta(days=30))
-        .group_by(TokenUsageHistory.user_id)
-        .subquery()
-    )
-
-    # Add monthly usage to base query
-    query = query.outerjoin(
         monthly_usage_subquery,
         User.user_id == monthly_usage_subquery.c.user_id
     )
@@ -83,12 +81,12 @@ def get_admin_users(
         if token_filter in token_ranges:
             min_val, max_val = token_ranges[token_filter]
             if max_val:
-                query = query.having(
-                    monthly_usage_subquery.c.monthly_usage.between(min_val, max_val)
+                query = query.filter(
+                    monthly_usage_subquery.c.tokens_used.between(min_val, max_val)
                 )
             else:
-                query = query.having(
-                    monthly_usage_subquery.c.monthly_usage >= min_val
+                query = query.filter(
+                    monthly_usage_subquery.c.tokens_used >= min_val
                 )
 
     total_count = query.count()
@@ -105,15 +103,10 @@ def get_admin_users(
     query = query.offset((page - 1) * limit).limit(limit)
 
     results = query.all()
+    # 구독 여부는 페이지의 사용자들을 한 번에
+    subscriptions = subscription_services.get_active_subscriptions(db, [user.user_id for user, *_ in results])
     users = []
-    for user, total_tokens, question_time in results:
-        # Get monthly usage from subquery result
-        monthly_usage = db.query(
-            func.coalesce(monthly_usage_subquery.c.monthly_usage, 0)
-        ).filter(
-            monthly_usage_subquery.c.user_id == user.user_id
-        ).scalar() or 0
-
+    for user, total_tokens, question_time, monthly_usage in results:
         users.append({
             "user_id": str(user.user_id),
             "nickname": user.nickname,
@@ -123,7 +116,8 @@ def get_admin_users(
             "role": user.role,
             "total_tokens": total_tokens or 0,
             "monthly_token_usage": int(monthly_usage or 0),
-            "last_chat_at": question_time
+            "last_chat_at": question_time,
+            "is_subscribed": subscriptions.get(str(user.user_id)) is not None
         })
 
     return {
@@ -135,55 +129,8 @@ def get_admin_users(
 
 
 def get_admin_users_for_export(db: Session) -> List[Dict]:
-    """전체 사용자 목록을 엑셀 다운로드용으로 조회합니다."""
-    query = db.query(
-        User,
-        Token.total_tokens,
-        func.coalesce(func.sum(TokenUsageHistory.tokens_used), 0).label('monthly_token_usage'),
-        func.max(Conversation.question_time).label('question_time'),
-        UserProvider.provider.label('social_provider')
-    ).outerjoin(
-        Token, User.user_id == Token.user_id
-    ).outerjoin(
-        TokenUsageHistory,
-        (User.user_id == TokenUsageHistory.user_id) &
-        (TokenUsageHistory.used_at >= datetime.now() - timedelta(days=30))
-    ).outerjoin(
-        Conversation,
-        User.user_id == Conversation.user_id
-    ).outerjoin(  # UserProvider 테이블과 조인
-        UserProvider,
-        User.user_id == UserProvider.user_id
-    ).group_by(User.user_id, Token.total_tokens, UserProvider.provider)
-
-    results = query.all()
-    users = []
-    for user, total_tokens, monthly_usage, question_time, social_provider in results:
-        # provider 정보 변환
-        provider_display = {
-            'GOOGLE': '구글',
-            'KAKAO': '카카오',
-            None: '일반가입'
-        }.get(social_provider, '일반가입')
-
-        users.append({
-            "nickname": user.nickname,
-            "email": user.email,
-            "created_at": user.created_at,
-            "last_chat_at": question_time,
-            "status": user.status,
-            "role": user.role,
-            "total_tokens": total_tokens or 0,
-            "monthly_token_usage": int(monthly_usage or 0),
-            "marketing_agreed": user.marketing_agreed,
-            "is_corporate": user.is_corporate,
-            "provider": provider_display,
-            "phone_number": user.phone_number,
-            "birthdate": user.birthdate,
-            "gender": user.gender,
-        })
-
-    return users
+    """전체 사용자 목록을 엑셀 다운로드용으로 조회합니다. (대량이면 export.stream_users_export 사용)"""
+    return list(export.iter_export_rows(db))
 
 def update_user_status(db: Session, user_id: str, status: str) -> User:
     """사용자의 상태를 업데이트합니다."""
@@ -252,13 +199,15 @@ def get_admin_user_detail(db: Session, user_id: str) -> Optional[Dict]:
         # 토큰 정보 조회
         token = db.query(Token).filter(Token.user_id == user_id).first()
 
-        # 최근 30일 토큰 사용량
-        monthly_token_usage = db.query(
-            func.coalesce(func.sum(TokenUsageHistory.tokens_used), 0)
+        # 최근 30일 토큰 사용량/결제 금액 (일간 집계)
+        monthly = db.query(
+            func.coalesce(func.sum(UserUsageDaily.tokens_used), 0),
+            func.coalesce(func.sum(UserUsageDaily.payment_amount), 0)
         ).filter(
-            TokenUsageHistory.user_id == user_id,
-            TokenUsageHistory.used_at >= datetime.now() - timedelta(days=30)
-        ).scalar()
+            UserUsageDaily.user_id == user_id,
+            UserUsageDaily.usage_date >= rollup.window_start()
+        ).one()
+        monthly_token_usage, monthly_payment = monthly
 
         # 총 결제 금액
         total_payment = db.query(
@@ -268,15 +217,6 @@ def get_admin_user_detail(db: Session, user_id: str) -> Optional[Dict]:
             Payment.status == 'SUCCESS'
         ).scalar()
 
-        # 최근 30일 결제 금액
-        monthly_payment = db.query(
-            func.coalesce(func.sum(Payment.amount), 0)
-        ).filter(
-            Payment.user_id == user_id,
-            Payment.status == 'SUCCESS',
-            Payment.payment_date >= datetime.now() - timedelta(days=30)
-        ).scalar()
-
         # 상세 정보 구성
         user_detail = {
             "user_id": str(user.user_id),
@@ -332,27 +272,30 @@ def get_user_stats(db: Session) -> Dict:
             User.created_at >= datetime.now() - timedelta(days=30)
         ).scalar()
 
-        # 토큰 사용량 통계
+        # 토큰 사용량 통계 (최근 30일 일간 집계, 사용 1건 기준 평균/최대/최소)
+        since = rollup.window_start()
         token_stats = db.query(
-            func.avg(TokenUsageHistory.tokens_used).label('avg_usage'),
-            func.max(TokenUsageHistory.tokens_used).label('max_usage'),
-            func.min(TokenUsageHistory.tokens_used).label('min_usage')
+            (cast(func.sum(UserUsageDaily.tokens_used), Float) / func.nullif(func.sum(UserUsageDaily.usage_count), 0)).label('avg_usage'),
+            func.max(UserUsageDaily.max_tokens_used).label('max_usage'),
+            func.min(UserUsageDaily.min_tokens_used).label('min_usage')
         ).filter(
-            TokenUsageHistory.used_at >= datetime.now() - timedelta(days=30)
+            UserUsageDaily.usage_date >= since
         ).first()
 
-        # 토큰 사용량 구간별 사용자 수
+        # 토큰 사용량 구간별 사용자 수 (사용자별 30일 합계 기준)
+        usage = rollup.user_usage_since(db, since)
+        usage_level = case(
+            (usage.c.tokens_used >= 1000, 'high'),
+            (usage.c.tokens_used >= 500, 'medium'),
+            else_='low'
+        )
         token_usage_distribution = dict(
             db.query(
-                case(
-                    (func.coalesce(func.sum(TokenUsageHistory.tokens_used), 0) >= 1000, 'high'),
-                    (func.coalesce(func.sum(TokenUsageHistory.tokens_used), 0) >= 500, 'medium'),
-                    else_='low'
-                ).label('usage_level'),
-                func.count(distinct(TokenUsageHistory.user_id))
+                usage_level.label('usage_level'),
+                func.count()
             ).filter(
-                TokenUsageHistory.used_at >= datetime.now() - timedelta(days=30)
-            ).group_by('usage_level').all()
+                usage.c.usage_count > 0
+            ).group_by(usage_level).all()
         )
 
         return {
@@ -432,26 +375,41 @@ def get_admin_notifications(
         .limit(limit) \
         .all()
 
-    for notif in query_results:
-        # 각 알림별 읽음 상태 통계 조회
-        # case when 구문 수정
-        stats = db.query(
+    # 페이지의 알림별 수신/읽음 수를 알림마다 조회하지 않고 한 번의 GROUP BY로
+    page_ids = [notif.notification_id for notif in query_results]
+    recipient_stats = {
+        row.notification_id: row
+        for row in db.query(
+            UserNotification.notification_id,
             func.count(UserNotification.user_id).label('total_recipients'),
             func.sum(case(
                 (UserNotification.is_read == True, 1),
                 else_=0
             )).label('read_count')
         ).filter(
-            UserNotification.notification_id == notif.notification_id
-        ).first()
+            UserNotification.notification_id.in_(page_ids)
+        ).group_by(UserNotification.notification_id)
+    } if page_ids else {}
+    broadcast_reads = inbox.broadcast_read_counts(
+        db, [notif.notification_id for notif in query_results if notif.audience]
+    )
+
+    for notif in query_results:
+        stats = recipient_stats.get(notif.notification_id)
+        total_recipients = stats.total_recipients if stats else 0
+        read_count = int(stats.read_count or 0) if stats else 0
+        if notif.audience:
+            # 전체 알림은 사용자별 행이 읽거나 지울 때만 생기므로 발송 시점 대상 수와 읽음 기준으로 계산
+            total_recipients = notif.target_count or 0
+            read_count = broadcast_reads[notif.notification_id]
 
         notifications.append({
             "notification_id": notif.notification_id,
             "type": notif.type.value,
             "message": notif.message,
             "created_at": notif.created_at,
-            "total_recipients": stats.total_recipients or 0,
-            "read_count": int(stats.read_count or 0)  # None 처리를 위해 int 변환
+            "total_recipients": total_recipients,
+            "read_count": read_count
         })
 
     return notifications, total
@@ -472,26 +430,19 @@ def create_notification(
 
         # 수신자 지정
         if notification_data.user_ids:
-            # 특정 사용자들에게만 알림 전송
-            for user_id_str in notification_data.user_ids:
-                user_id = UUID(user_id_str)
-                user_notification = UserNotification(
-                    user_id=user_id,
-                    notification_id=db_notification.notification_id
-                )
-                db.add(user_notification)
+            # 특정 사용자들에게만 알림 전송 (관리자 지정이므로 수신 설정과 무관)
+            db_notification.recipient_count = fanout.insert_targeted(
+                db, db_notification.notification_id, notification_data.type,
+                notification_data.user_ids, respect_settings=False
+            )
         else:
-            # 전체 사용자에게 알림 전송
-            users = db.query(User).filter(User.status == 'ACTIVE').all()
-            for user in users:
-                user_notification = UserNotification(
-                    user_id=user.user_id,
-                    notification_id=db_notification.notification_id
-                )
-                db.add(user_notification)
+            # 전체 사용자에게 알림 전송 - 한 행만 저장하고 사용자별 행은 읽거나 지울 때 생성
+            db_notification.audience = inbox.BROADCAST_ALL
+            db_notification.target_count = fanout.count_active_users(db)
 
         db.commit()
         db.refresh(db_notification)
+        inbox.publish_created(db, db_notification)
         return db_notification
 
     except Exception as e:
@@ -500,6 +451,14 @@ def create_notification(
         raise
 
 
+def get_notification_delivery(db: Session, notification_id: int) -> Optional[Dict]:
+    """전체 발송 진행 상황"""
+    notification = db.query(Notification).filter(Notification.notification_id == notification_id).first()
+    if not notification:
+        return None
+    return fanout.delivery_progress(notification)
+
+
 def delete_notification(
         db: Session,
         notification_id: int
@@ -522,17 +481,7 @@ def mark_notification_as_read(
         user_id: UUID
 ) -> bool:
     """알림을 읽음 처리"""
-    user_notification = db.query(UserNotification).filter(
-        UserNotification.notification_id == notification_id,
-        UserNotification.user_id == user_id
-    ).first()
-
-    if user_notification:
-        user_notification.is_read = True
-        user_notification.read_at = datetime.now()
-        db.commit()
-        return True
-    return False
+    return inbox.mark_read(db, notification_id, user_id)
 
 
 def get_notification_read_status(db: Session, notification_id: int) -> List[dict]:
@@ -590,6 +539,7 @@ def create_notice(db: Session, notice_data: dict):
     db.add(notice)
     db.commit()
     db.refresh(notice)
+    response_cache.invalidate(response_cache.NOTICES)
     return notice
 
 
@@ -599,6 +549,7 @@ def update_admin_notice(db: Session, notice_id: int, update_data: dict):
         setattr(notice, key, value)
     db.commit()
     db.refresh(notice)
+    response_cache.invalidate(response_cache.NOTICES)
     return notice
 
 
@@ -606,6 +557,7 @@ def delete_admin_notice(db: Session, notice_id: int):
     notice = get_admin_notice(db, notice_id)
     db.delete(notice)
     db.commit()
+    response_cache.invalidate(response_cache.NOTICES)
 
 
 def get_welcome_tokens(db: Session) -> Dict[str, int]:
@@ -714,6 +666,7 @@ def update_subscription_plan(
 
         db.commit()
         db.refresh(plan)
+        response_cache.invalidate(response_cache.PRODUCTS)
         return plan
     except Exception as e:
         db.rollback()
@@ -739,6 +692,7 @@ def update_token_plan(
 
         db.commit()
         db.refresh(plan)
+        response_cache.invalidate(response_cache.PRODUCTS)
         return plan
     except Exception as e:
         db.rollback()
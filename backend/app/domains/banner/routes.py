@@ -1,18 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 from app.db.session import get_db
 from app.core.deps import get_current_user, get_current_admin_user
+from app.core import response_cache
 from app.domains.user.models import User
 from . import schemas, services
 
 router = APIRouter()
 
 @router.get("/banners", response_model=List[schemas.Banner])
-async def get_active_banners(db: Session = Depends(get_db)):
+async def get_active_banners(request: Request, db: Session = Depends(get_db)):
     """현재 활성화된 배너 목록을 조회합니다."""
-    return services.get_active_banners(db)
+    # 노출 기간이 날짜 기준이므로 날짜를 키에 포함 (클릭 수는 TTL 동안 늦게 반영될 수 있음)
+    return response_cache.cached_response(
+        request,
+        response_cache.BANNERS,
+        lambda: [schemas.Banner.from_orm(banner) for banner in services.get_active_banners(db)],
+        params={"date": date.today()}
+    )
 
 @router.get("/banners/all", response_model=List[schemas.Banner])
 async def get_all_banners(
@@ -4,6 +4,7 @@ from . import models, schemas
 from app.utils.s3_client import upload_file_to_s3, delete_file_from_s3
 from app.utils.cloudfront_utils import get_cloudfront_url, invalidate_cloudfront_cache
 from app.core.config import settings
+from app.core import response_cache
 import uuid
 
 def create_banner(db: Session, banner: schemas.BannerCreate, image_file=None):
@@ -28,6 +29,7 @@ def create_banner(db: Session, banner: schemas.BannerCreate, image_file=None):
     db.add(db_banner)
     db.commit()
     db.refresh(db_banner)
+    response_cache.invalidate(response_cache.BANNERS)
     return db_banner
 
 def get_banners(db: Session, skip: int = 0, limit: int = 100, is_public: bool = None):
@@ -72,6 +74,7 @@ def update_banner(db: Session, banner_id: int, banner_update: schemas.BannerUpda
     db.add(db_banner)
     db.commit()
     db.refresh(db_banner)
+    response_cache.invalidate(response_cache.BANNERS)
     return db_banner
 
 def delete_banner(db: Session, banner_id: int):
@@ -84,6 +87,7 @@ def delete_banner(db: Session, banner_id: int):
             # DB에서 배너 정보 삭제
             db.delete(banner)
             db.commit()
+            response_cache.invalidate(response_cache.BANNERS)
             return True
     return False
 
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Body, Request
 from sqlalchemy.orm import Session
 from app.domains.curator import schemas
 from app.domains.curator import services as curator_services
 from app.db.session import get_db
 from app.core.deps import get_current_admin_user
+from app.core import response_cache
 from app.domains.user.models import User
 from typing import List, Optional
 
@@ -44,12 +45,21 @@ def create_curator(
 
 @router.get("/curators", response_model=List[schemas.Curator])
 def read_curators(
+    request: Request,
     category: Optional[str] = Query(None, description="카테고리로 필터링"),
     tag: Optional[str] = Query(None, description="태그로 필터링"),
     db: Session = Depends(get_db)
 ):
     """큐레이터 목록 조회"""
-    return curator_services.get_curators(db, category=category, tag=tag)
+    return response_cache.cached_response(
+        request,
+        response_cache.CURATORS,
+        lambda: [
+            schemas.Curator.from_orm(curator)
+            for curator in curator_services.get_curators(db, category=category, tag=tag)
+        ],
+        params={"category": category, "tag": tag}
+    )
 
 @router.get("/curators/{curator_id}", response_model=schemas.Curator)
 def read_curator(
@@ -4,6 +4,7 @@ from typing import List, Optional
 from app.utils.s3_client import upload_file_to_s3
 from app.utils.cloudfront_utils import get_cloudfront_url, invalidate_cloudfront_cache
 from app.core.config import settings
+from app.core import response_cache
 from fastapi import HTTPException
 import uuid
 import logging
@@ -68,6 +69,7 @@ def create_curator(db: Session, curator: schemas.CuratorCreate, main_image=None,
         db.add(db_curator)
         db.commit()
         db.refresh(db_curator)
+        response_cache.invalidate(response_cache.CURATORS)
         return db_curator
     except Exception as e:
         db.rollback()
@@ -126,6 +128,7 @@ def update_curator(db: Session, curator_id: int, curator: schemas.CuratorUpdate,
         db.add(db_curator)
         db.commit()
         db.refresh(db_curator)
+        response_cache.invalidate(response_cache.CURATORS)
         return db_curator
     except Exception as e:
         db.rollback()
@@ -143,6 +146,7 @@ def delete_curator(db: Session, curator_id: int):
     if db_curator:
         db.delete(db_curator)
         db.commit()
+        response_cache.invalidate(response_cache.CURATORS)
         return True
     return False
 
@@ -165,4 +169,5 @@ def update_curator_tags(db: Session, curator_id: int, tag_names: List[str]) -> C
     db.add(history)
     db.commit()
     db.refresh(curator)
+    response_cache.invalidate(response_cache.CURATORS)
     return curator
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+"지금 볼 수 있는" 문화행사 구체화 뷰 (active_culture_events)
+culture_hubs 중 활성/대표 행사이면서 오늘 진행 중이거나 곧 시작하는 행만 모아 두고,
+카테고리/지역/종료일 인덱스로 목록 페이지를 바로 읽는다
+종료일이 없는 행사는 시작일부터 OPEN_ENDED_DAYS일 동안만 진행 중으로 본다
+뷰는 수집 후와 매일 자정(수집 워커)에 CONCURRENTLY로 갱신하므로 조회가 막히지 않는다
+"""
+
+import logging
+import re
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import Date, DateTime, bindparam, text
+from sqlalchemy.exc import ProgrammingError
+
+from app.domains.exhibition.source_adapters import CULTURAL_API_CONFIG
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_EVENTS_VIEW = 'active_culture_events'
+# 자정 갱신이 늦어도 새로 시작한 행사가 빠지지 않도록 며칠 앞서 시작하는 행사까지 담아 둠
+UPCOMING_DAYS = 7
+# 종료일을 알 수 없는 행사를 진행 중으로 보는 기간 (시작일 기준)
+OPEN_ENDED_DAYS = 30
+MAX_PAGE_SIZE = 100
+
+SORT_COLUMNS = {
+    'end_date': 'end_date ASC NULLS LAST, id',      # 곧 끝나는 순
+    'start_date': 'start_date DESC NULLS LAST, id',  # 최근 시작한 순
+    'title': 'title, id',
+}
+
+
+def source_regions() -> List[Tuple[str, str, str]]:
+    """culture_hubs.api_source 값 → (소스, 지역 표기, 대표 지역) - 수집 설정 기준"""
+    rows = []
+    for api_key, config in CULTURAL_API_CONFIG.items():
+        location = config.get('location') or '미상'
+        region = re.split(r'[/\s]', location, maxsplit=1)[0] or '미상'
+        rows.append((config.get('stored_source_name') or api_key, location, region))
+    return rows
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def view_statements() -> List[str]:
+    """구체화 뷰와 인덱스 생성 SQL"""
+    values = ",\n        ".join(
+        f"({_quote(source)}, {_quote(location)}, {_quote(region)})"
+        for source, location, region in source_regions()
+    )
+    return [
+        f"""
+    CREATE MATERIALIZED VIEW IF NOT EXISTS {ACTIVE_EVENTS_VIEW} AS
+    SELECT
+        c.id, c.title, c.description, c.start_date, c.end_date, c.period,
+        c.venue, c.category, c.artist, c.price, c.website, c.image_url,
+        c.api_source, c.canonical_id,
+        COALESCE(s.location, '미상') AS location,
+        COALESCE(s.region, '미상') AS region,
+        c.collected_at
+    FROM culture_hubs c
+    LEFT JOIN (VALUES
+        {values}
+    ) AS s(api_source, location, region) ON s.api_source = c.api_source
+    WHERE c.is_active = TRUE
+      AND COALESCE(c.is_duplicate, FALSE) = FALSE
+      AND (c.start_date IS NOT NULL OR c.end_date IS NOT NULL)
+      AND (c.start_date IS NULL OR c.start_date <= CURRENT_DATE + {UPCOMING_DAYS})
+      AND (c.end_date >= CURRENT_DATE
+           OR (c.end_date IS NULL AND c.start_date >= CURRENT_DATE - {OPEN_ENDED_DAYS}))
+    WITH DATA
+    """,
+        # CONCURRENTLY 갱신에 필요한 고유 인덱스
+        f"CREATE UNIQUE INDEX IF NOT EXISTS idx_active_events_id ON {ACTIVE_EVENTS_VIEW}(id)",
+        f"CREATE INDEX IF NOT EXISTS idx_active_events_end_date ON {ACTIVE_EVENTS_VIEW}(end_date)",
+        f"CREATE INDEX IF NOT EXISTS idx_active_events_category ON {ACTIVE_EVENTS_VIEW}(category, end_date)",
+        f"CREATE INDEX IF NOT EXISTS idx_active_events_region ON {ACTIVE_EVENTS_VIEW}(region, end_date)",
+    ]
+
+
+def ensure_active_events_view(conn) -> None:
+    """뷰가 없으면 생성 (conn: Connection 또는 Session, 커밋은 호출자가)"""
+    for statement in view_statements():
+        conn.execute(text(statement))
+
+
+def refresh_active_events(db) -> bool:
+    """뷰 갱신 (없으면 생성) - 실패해도 예외를 올리지 않고 False"""
+    try:
+        db.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {ACTIVE_EVENTS_VIEW}"))
+        db.commit()
+        return True
+    except ProgrammingError:
+        # 뷰가 아직 없음 - 생성하면서 데이터도 채워짐
+        db.rollback()
+        try:
+            ensure_active_events_view(db)
+            db.commit()
+            logger.info(f"{ACTIVE_EVENTS_VIEW} 구체화 뷰 생성")
+            return True
+        except Exception as e:
+            db.rollback()
+            logger.error(f"{ACTIVE_EVENTS_VIEW} 구체화 뷰 생성 실패: {str(e)}")
+            return False
+    except Exception as e:
+        db.rollback()
+        logger.error(f"{ACTIVE_EVENTS_VIEW} 갱신 실패: {str(e)}")
+        return False
+
+
+def query_active_events(db, category: Optional[str] = None, region: Optional[str] = None,
+                        page: int = 1, size: int = 20, sort_by: str = 'end_date',
+                        today: Optional[date] = None) -> Dict[str, Any]:
+    """오늘 진행 중인 행사 페이지 (region 지정 시 전국 단위 소스도 포함)"""
+    size = max(1, min(size, MAX_PAGE_SIZE))
+    today = today or date.today()
+    conditions = [
+        "(start_date IS NULL OR start_date <= :today)",
+        "(end_date >= :today OR (end_date IS NULL AND start_date >= :open_ended_since))",
+    ]
+    params: Dict[str, Any] = {
+        'today': today,
+        'open_ended_since': today - timedelta(days=OPEN_ENDED_DAYS),
+        'limit': size,
+        'offset': (max(page, 1) - 1) * size
+    }
+    if category:
+        conditions.append("category = :category")
+        params['category'] = category
+    if region:
+        conditions.append("region IN (:region, '전국')")
+        params['region'] = region
+
+    where = " AND ".join(conditions)
+    order_by = SORT_COLUMNS.get(sort_by, SORT_COLUMNS['end_date'])
+    date_params = (bindparam('today', type_=Date), bindparam('open_ended_since', type_=Date))
+    total = db.execute(
+        text(f"SELECT COUNT(*) FROM {ACTIVE_EVENTS_VIEW} WHERE {where}").bindparams(*date_params), params
+    ).scalar() or 0
+    rows = db.execute(
+        text(
+            f"SELECT * FROM {ACTIVE_EVENTS_VIEW} WHERE {where} ORDER BY {order_by} LIMIT :limit OFFSET :offset"
+        ).bindparams(*date_params).columns(start_date=Date, end_date=Date, collected_at=DateTime),
+        params
+    ).mappings().all()
+
+    return {
+        'items': [
+            {
+                **{key: value for key, value in row.items() if key not in ('start_date', 'end_date', 'collected_at')},
+                'start_date': row['start_date'].isoformat() if row['start_date'] else None,
+                'end_date': row['end_date'].isoformat() if row['end_date'] else None,
+                'collected_at': row['collected_at'].isoformat() if row['collected_at'] else None,
+            }
+            for row in rows
+        ],
+        'total': total,
+        'page': page,
+        'size': size,
+        'pages': (total + size - 1) // size
+    }
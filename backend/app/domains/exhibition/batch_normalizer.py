@@ -0,0 +1,240 @@
+"""
+문화 데이터 배치 정규화
+한 페이지(또는 한 소스 배치)의 레코드를 pandas로 컬럼 단위 변환한다
+
+1단계 (SourceMapper): API 원본 항목 → 표준 한글 컬럼 (소스별로 미리 만든 매퍼)
+2단계 (map_culture_hub_fields): 표준 컬럼 → CultureHub 필드 (후보 컬럼 병합, 길이 제한, 날짜 변환,
+    비어 있는 시작일/종료일은 기간 문자열에서 보완)
+기관별 특수 보정은 여전히 레코드 단위로 cultural_hub_service에서 처리한다
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from app.domains.exhibition.date_parser import parse_date, resolve_dates
+
+logger = logging.getLogger(__name__)
+
+# 원본에 제목이 없을 때 대신 쓸 필드 (원본 항목 기준)
+TITLE_FALLBACK_FIELDS = ('subject', 'title', 'I_TITLE', '장소', 'place', 'locNames')
+
+# CultureHub 필드 ← 표준/원본 컬럼 후보 (앞에서부터 값이 있는 첫 컬럼 사용)
+CULTURE_HUB_FIELD_CANDIDATES = {
+    'title': ('제목', 'title', 'subject'),
+    'subtitle': ('부제목', 'subtitle', 'sub_title'),
+    'description': ('소개설명', 'description', 'content'),
+    'venue': ('장소', 'venue', 'place'),
+    'start_date': ('시작일', 'start_date'),
+    'end_date': ('종료일', 'end_date'),
+    'period': ('기간', 'period'),
+    'time': ('시간', 'time_info', 'hour'),
+    'price': ('관람료할인정보', 'price', 'pay'),
+    'contact': ('문의', 'contact', 'tel'),
+    'website': ('홈페이지주소', 'website', 'homepage'),
+    'image_url': ('이미지주소', 'image_url', 'cover'),
+    'category': ('장르', 'category', 'event_gubun'),
+    'genre': ('분류', 'genre', 'classification'),
+    'artist': ('작가', 'artist', 'author'),
+    'creator': ('작가', 'creator', 'artist_name'),
+    'host': ('주최', 'organizer', 'host', '수집처'),
+    'culture_code': ('전시ID', 'external_id', 'event_seq', 'LOCAL_ID', 'I_ID', 'rowid', 'seq'),
+}
+
+DATE_FIELDS = frozenset(('start_date', 'end_date'))
+
+# 필드별 최대 길이 (없으면 DEFAULT_MAX_LENGTH)
+CULTURE_HUB_MAX_LENGTHS = {
+    'title': 200,
+    'subtitle': 200,
+    'venue': 200,
+    'category': 100,
+    'genre': 100,
+    'artist': 200,
+    'creator': 200,
+    'host': 200,
+    'contact': 100,
+    'website': 500,
+    'image_url': 500,
+    'price': 100,
+    'time': 100,
+    'period': 100,
+}
+DEFAULT_MAX_LENGTH = 200
+
+
+def _is_missing(value: Any) -> bool:
+    """DataFrame 변환 과정에서 생긴 결측값(NaN/None)"""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _truthy(series: pd.Series) -> pd.Series:
+    """원본 dict에서 `if value:`가 참이 되는 행"""
+    return series.notna() & series.astype(bool)
+
+
+def _blank(series: pd.Series) -> pd.Series:
+    """값이 없거나(0 포함) 공백뿐인 행"""
+    return ~_truthy(series) | (series.astype(str).str.strip() == '')
+
+
+def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """DataFrame → dict 목록 (결측 컬럼은 키를 만들지 않음)"""
+    columns = list(frame.columns)
+    return [
+        {column: value for column, value in zip(columns, row) if not _is_missing(value)}
+        for row in frame.itertuples(index=False, name=None)
+    ]
+
+
+class SourceMapper:
+    """한 소스의 원본 항목을 표준 컬럼으로 바꾸는 매퍼 (어댑터 설정으로 한 번만 구성)"""
+
+    def __init__(self, adapter, standard_columns: Sequence[str]):
+        config = adapter.config
+        self.adapter = adapter
+        self.name = config['name']
+        self.constants = {
+            'data_source': config['name'],
+            'api_key': adapter.api_key,
+            'api_source': adapter.stored_source_name or adapter.api_key,
+            'category': config.get('category', '기타'),
+            'institution_type': config.get('institution_type', '기타'),
+            'location': config.get('location', '미상'),
+        }
+        # 같은 대상 컬럼에 여러 원본이 매핑되면 뒤의 값이 우선
+        self.column_mapping = adapter.column_mapping
+        self.fixed_institution = adapter.institution_name if config.get('institution_name') else None
+        self.date_fields = adapter.date_fields
+        self.standard_columns = tuple(standard_columns)
+
+    def normalize(self, raw_items: List[Dict], collected_at: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """원본 항목 목록 → 표준 컬럼 레코드 목록 (입력 순서 유지)"""
+        if not raw_items:
+            return []
+        adapter = self.adapter
+
+        # object dtype - 결측이 섞인 정수 컬럼이 float로 바뀌지 않도록
+        fields = pd.DataFrame([adapter.item_fields(item) for item in raw_items], dtype=object)
+        out = pd.DataFrame(index=fields.index)
+
+        # 상수 컬럼 (수집시간은 배치당 한 번만 계산)
+        for column, value in self.constants.items():
+            out[column] = value
+        out['수집시간'] = (collected_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')
+
+        # 컬럼 매핑
+        for source_field, target_field in self.column_mapping:
+            if source_field not in fields.columns:
+                continue
+            column = fields[source_field]
+            out[target_field] = column if target_field not in out else column.where(column.notna(), out[target_field])
+
+        # 기관별 추가 처리 (SourceAdapter.normalize_extras와 같은 규칙)
+        if self.fixed_institution:
+            out['연계기관명'] = self.fixed_institution
+        record_ids = [adapter.record_id(item) for item in raw_items]
+        if any(record_id is not None for record_id in record_ids):
+            ids = pd.Series([None if record_id is None else str(record_id) for record_id in record_ids], index=out.index)
+            out['전시ID'] = ids.where(ids.notna(), out['전시ID']) if '전시ID' in out else ids
+        if self.date_fields:
+            for source_field, target_field in zip(self.date_fields, ('시작일', '종료일')):
+                if source_field in fields.columns:
+                    column = fields[source_field]
+                    out[target_field] = column.where(column.notna(), out[target_field]) if target_field in out else column
+
+        # 누락된 표준 컬럼은 빈 값
+        for column in self.standard_columns:
+            out[column] = out[column].where(out[column].notna(), '') if column in out else ''
+
+        # 제목이 없으면 원본의 다른 필드, 그것도 없으면 기본 제목
+        for position in out.index[_blank(out['제목'])]:
+            item = raw_items[position]
+            for candidate in TITLE_FALLBACK_FIELDS:
+                if item.get(candidate):
+                    out.at[position, '제목'] = str(item[candidate]).strip()
+                    break
+            else:
+                out.at[position, '제목'] = f"{self.name} 문화행사 #{position + 1}"
+
+        out.loc[_blank(out['연계기관명']), '연계기관명'] = adapter.institution_name
+
+        return _records(out)
+
+
+_SOURCE_MAPPERS: Dict[str, SourceMapper] = {}
+
+
+def get_source_mapper(adapter, standard_columns: Sequence[str]) -> SourceMapper:
+    """어댑터별 매퍼 (같은 어댑터면 재사용)"""
+    mapper = _SOURCE_MAPPERS.get(adapter.api_key)
+    if mapper is None or mapper.adapter is not adapter or mapper.standard_columns != tuple(standard_columns):
+        mapper = SourceMapper(adapter, standard_columns)
+        _SOURCE_MAPPERS[adapter.api_key] = mapper
+    return mapper
+
+
+def _convert_dates(values: pd.Series, selected: pd.Series) -> pd.Series:
+    """날짜 값 변환 (같은 문자열은 파서 캐시로 한 번만 해석, 해석할 수 없으면 None)"""
+    converted = pd.Series(None, index=values.index, dtype=object)
+    chosen = values[selected]
+    # Series.map은 None을 NaN으로 바꾸므로 직접 대입
+    converted[selected] = pd.Series([parse_date(value) for value in chosen], index=chosen.index, dtype=object)
+    return converted
+
+
+def _fill_dates_from_period(out: pd.DataFrame) -> None:
+    """시작일/종료일이 비어 있는 행은 기간 문자열에서 보완"""
+    if 'period' not in out:
+        return
+    for field in DATE_FIELDS:
+        if field not in out:
+            out[field] = pd.Series(None, index=out.index, dtype=object)
+    period = out['period']
+    missing = period.notna() & (out['start_date'].isna() | out['end_date'].isna())
+    for position in out.index[missing]:
+        start, end = resolve_dates(out.at[position, 'start_date'], out.at[position, 'end_date'], period[position])
+        out.at[position, 'start_date'] = start
+        out.at[position, 'end_date'] = end
+
+
+def map_culture_hub_fields(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """표준 컬럼 레코드 → CultureHub 필드 (값이 있는 필드만 포함, 입력 순서 유지)"""
+    if not records:
+        return []
+
+    frame = pd.DataFrame(records, dtype=object)
+    out = pd.DataFrame(index=frame.index)
+    for target_field, candidates in CULTURE_HUB_FIELD_CANDIDATES.items():
+        present = [candidate for candidate in candidates if candidate in frame.columns]
+        if not present:
+            continue
+
+        # 앞 후보부터 값이 있는 첫 컬럼 선택
+        values = pd.Series(None, index=frame.index, dtype=object)
+        selected = pd.Series(False, index=frame.index)
+        for candidate in present:
+            column = frame[candidate]
+            take = ~selected & _truthy(column)
+            values[take] = column[take]
+            selected |= take
+        if not selected.any():
+            continue
+
+        if target_field in DATE_FIELDS:
+            out[target_field] = _convert_dates(values, selected)
+            continue
+
+        max_length = CULTURE_HUB_MAX_LENGTHS.get(target_field, DEFAULT_MAX_LENGTH)
+        text = values[selected].astype(str).str.strip()
+        too_long = text.str.len() > max_length
+        if too_long.any():
+            logger.warning(f"필드 '{target_field}' 값 {int(too_long.sum())}개가 {max_length}자를 초과하여 잘림")
+        values[selected] = text.str.slice(0, max_length)
+
+        out[target_field] = values.where(selected, other=None)
+
+    _fill_dates_from_period(out)
+    return _records(out)
@@ -0,0 +1,341 @@
+"""
+문화 데이터 수집 작업 저장소
+진행 상황과 취소 요청을 collection_jobs 테이블에 두어
+어느 uvicorn 워커에서든 조회/취소할 수 있게 하고, 끝난 작업은 TTL로 정리한다
+"""
+
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import func, or_
+
+from app.domains.exhibition.models import CollectionJob
+
+logger = logging.getLogger(__name__)
+
+# 끝난 작업 보관 기간
+JOB_TTL = timedelta(hours=24)
+# 하트비트가 이 시간 이상 없으면 워커가 죽은 것으로 간주
+STALE_HEARTBEAT = timedelta(minutes=10)
+# 이 시간 동안 어느 워커도 가져가지 않은 대기 작업은 만료
+QUEUED_TTL = timedelta(hours=1)
+# 저장 단계 하트비트 DB 갱신 간격 (초) - 행마다 호출되므로 캐시
+HEARTBEAT_INTERVAL = 30.0
+# 취소 여부 DB 확인 간격 (초) - cancel_check는 0.1초마다 호출되므로 캐시
+CANCEL_CHECK_INTERVAL = 2.0
+
+STATUS_QUEUED = 'queued'  # 별도 수집 워커가 가져갈 작업
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_CANCELLED = 'cancelled'
+STATUS_FAILED = 'failed'
+ACTIVE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING)
+
+NOT_FOUND_PROGRESS = {
+    'step': 0,
+    'message': '진행 상황을 찾을 수 없습니다',
+    'percentage': 0,
+    'completed': True,
+    'error': '진행 상황을 찾을 수 없습니다'
+}
+
+
+def current_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _json_safe(value: Any) -> Any:
+    """JSONB 저장용 변환 (날짜 등은 문자열로)"""
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+def _compact_results(result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """수집 결과에서 원본 데이터 목록(integrated_data)을 제외 - 진행 상황 조회에는 통계만 필요"""
+    if not result:
+        return result
+    compact = dict(result)
+    details = compact.get('details')
+    if isinstance(details, dict) and 'integrated_data' in details:
+        compact['details'] = {k: v for k, v in details.items() if k != 'integrated_data'}
+    return _json_safe(compact)
+
+
+def job_to_progress(job: CollectionJob) -> Dict[str, Any]:
+    """기존 진행 상황 응답 형식으로 변환"""
+    progress = {
+        'progress_id': job.id,
+        'status': job.status,
+        'step': job.step,
+        'message': job.message,
+        'percentage': job.percentage,
+        'completed': job.status not in ACTIVE_STATUSES,
+        'cancelled': job.status == STATUS_CANCELLED,
+        'error': job.error,
+        'job_type': job.job_type,
+        'api_key': job.api_key,
+        'params': job.params or {},
+        'source_counters': job.source_counters or {},
+        'worker_id': job.worker_id,
+        'heartbeat_at': job.heartbeat_at.isoformat() if job.heartbeat_at else None,
+        'updated_at': job.updated_at.isoformat() if job.updated_at else None,
+    }
+    if job.results is not None:
+        progress['results'] = job.results
+    return progress
+
+
+class CollectionJobStore:
+    """collection_jobs 테이블 기반 수집 작업 저장소
+
+    수집 스레드의 DB 세션과 분리된 짧은 세션으로 매 호출을 커밋하므로
+    다른 워커가 즉시 진행 상황/취소 요청을 볼 수 있다
+    """
+
+    def __init__(self, session_factory: Optional[Callable] = None):
+        self._session_factory = session_factory
+
+    @contextmanager
+    def _session(self):
+        if self._session_factory is None:
+            from app.db.session import SessionLocal
+            self._session_factory = SessionLocal
+        db = self._session_factory()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def create(self, job_id: str, job_type: str, message: str, api_key: Optional[str] = None,
+               params: Optional[Dict[str, Any]] = None, queued: bool = False) -> None:
+        """작업 등록 (queued=True면 별도 수집 워커가 claim_next_queued로 가져감)"""
+        with self._session() as db:
+            db.add(CollectionJob(
+                id=job_id,
+                job_type=job_type,
+                api_key=api_key,
+                params=params,
+                status=STATUS_QUEUED if queued else STATUS_RUNNING,
+                step=1,
+                message=message,
+                percentage=0 if queued else 5,
+                worker_id=None if queued else current_worker_id(),
+                heartbeat_at=func.now()
+            ))
+
+    def claim_next_queued(self) -> Optional[Dict[str, Any]]:
+        """대기 중인 작업 하나를 이 워커의 실행 중 작업으로 가져옴 (여러 워커가 동시에 가져가지 않도록 SKIP LOCKED)"""
+        with self._session() as db:
+            job = db.query(CollectionJob).filter(
+                CollectionJob.status == STATUS_QUEUED
+            ).order_by(CollectionJob.created_at).with_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            job.status = STATUS_RUNNING
+            job.percentage = 5
+            job.worker_id = current_worker_id()
+            job.heartbeat_at = func.now()
+            db.flush()
+            db.refresh(job)
+            return job_to_progress(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._session() as db:
+            job = db.get(CollectionJob, job_id)
+            return job_to_progress(job) if job else None
+
+    def update_progress(self, job_id: str, step: int, message: str, percentage: int,
+                        source_counters: Optional[Dict[str, Any]] = None) -> bool:
+        """진행 상황 갱신 - 취소됐거나 끝난 작업이면 False"""
+        values = {
+            'step': step,
+            'message': message,
+            'percentage': percentage,
+            'heartbeat_at': func.now(),
+        }
+        if source_counters is not None:
+            values['source_counters'] = _json_safe(source_counters)
+
+        with self._session() as db:
+            updated = db.query(CollectionJob).filter(
+                CollectionJob.id == job_id,
+                CollectionJob.status == STATUS_RUNNING,
+                CollectionJob.cancel_requested.is_(False)
+            ).update(values, synchronize_session=False)
+        return updated > 0
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        """취소 요청 확인 (하트비트 갱신 겸용) - 작업이 없거나 끝났으면 True"""
+        with self._session() as db:
+            updated = db.query(CollectionJob).filter(
+                CollectionJob.id == job_id,
+                CollectionJob.status == STATUS_RUNNING,
+                CollectionJob.cancel_requested.is_(False)
+            ).update({'heartbeat_at': func.now()}, synchronize_session=False)
+        return updated == 0
+
+    def heartbeat(self, job_id: str) -> bool:
+        """하트비트만 갱신 (진행률이 바뀌지 않는 긴 저장 단계용) - 실행 중인 작업이 아니면 False"""
+        with self._session() as db:
+            updated = db.query(CollectionJob).filter(
+                CollectionJob.id == job_id,
+                CollectionJob.status == STATUS_RUNNING
+            ).update({'heartbeat_at': func.now()}, synchronize_session=False)
+        return updated > 0
+
+    def heartbeat_callback(self, job_id: str, interval: float = HEARTBEAT_INTERVAL) -> Callable[[], None]:
+        """저장 루프용 heartbeat 콜백 (interval 초마다만 DB 갱신, 실패해도 저장은 계속)"""
+        state = {'beat_at': None}
+        lock = threading.Lock()
+
+        def heartbeat() -> None:
+            with lock:
+                now = time.monotonic()
+                if state['beat_at'] is not None and now - state['beat_at'] < interval:
+                    return
+                state['beat_at'] = now
+                try:
+                    self.heartbeat(job_id)
+                except Exception as e:
+                    logger.warning(f"하트비트 갱신 실패 ({job_id}): {str(e)}")
+
+        return heartbeat
+
+    def cancel_checker(self, job_id: str, interval: float = CANCEL_CHECK_INTERVAL) -> Callable[[], bool]:
+        """수집 루프용 cancel_check 콜백 (interval 초마다만 DB 확인, 한 번 취소되면 계속 True)"""
+        state = {'checked_at': None, 'cancelled': False}
+        lock = threading.Lock()
+
+        def cancel_check() -> bool:
+            with lock:
+                if state['cancelled']:
+                    return True
+                now = time.monotonic()
+                if state['checked_at'] is not None and now - state['checked_at'] < interval:
+                    return False
+                state['checked_at'] = now
+                try:
+                    state['cancelled'] = self.is_cancel_requested(job_id)
+                except Exception as e:
+                    logger.warning(f"취소 여부 확인 실패 ({job_id}): {str(e)}")
+                return state['cancelled']
+
+        return cancel_check
+
+    def complete(self, job_id: str, message: str, results: Optional[Dict[str, Any]] = None) -> bool:
+        """작업 완료 처리 (취소된 작업은 변경하지 않음)"""
+        compact = _compact_results(results)
+        values = {
+            'status': STATUS_COMPLETED,
+            'step': 8,
+            'message': message,
+            'percentage': 100,
+            'results': compact,
+            'finished_at': func.now(),
+            'heartbeat_at': func.now(),
+        }
+        if compact and compact.get('api_details'):
+            values['source_counters'] = compact['api_details']
+
+        with self._session() as db:
+            updated = db.query(CollectionJob).filter(
+                CollectionJob.id == job_id,
+                CollectionJob.status == STATUS_RUNNING,
+                CollectionJob.cancel_requested.is_(False)
+            ).update(values, synchronize_session=False)
+        return updated > 0
+
+    def fail(self, job_id: str, message: str, error: str) -> None:
+        with self._session() as db:
+            db.query(CollectionJob).filter(
+                CollectionJob.id == job_id,
+                CollectionJob.status == STATUS_RUNNING
+            ).update({
+                'status': STATUS_FAILED,
+                'step': 8,
+                'message': message,
+                'percentage': 100,
+                'error': error,
+                'finished_at': func.now(),
+            }, synchronize_session=False)
+
+    def request_cancel(self, job_id: str, message: str = '사용자에 의해 취소되었습니다') -> bool:
+        """취소 요청 등록 - 작업을 실행 중인 워커는 다음 cancel_check에서 감지"""
+        with self._session() as db:
+            updated = db.query(CollectionJob).filter(
+                CollectionJob.id == job_id,
+                CollectionJob.status.in_(ACTIVE_STATUSES)
+            ).update({
+                'status': STATUS_CANCELLED,
+                'cancel_requested': True,
+                'message': message,
+                'percentage': 100,
+                'finished_at': func.now(),
+            }, synchronize_session=False)
+        return updated > 0
+
+    def cancel_all_running(self, message: str = '관리자에 의해 강제 중단되었습니다') -> int:
+        with self._session() as db:
+            return db.query(CollectionJob).filter(
+                CollectionJob.status.in_(ACTIVE_STATUSES)
+            ).update({
+                'status': STATUS_CANCELLED,
+                'cancel_requested': True,
+                'message': message,
+                'percentage': 100,
+                'finished_at': func.now(),
+            }, synchronize_session=False)
+
+    def purge_expired(self, ttl: timedelta = JOB_TTL, stale_after: timedelta = STALE_HEARTBEAT,
+                      queued_ttl: timedelta = QUEUED_TTL) -> Dict[str, int]:
+        """하트비트가 끊긴 작업과 오래 대기한 작업은 실패 처리하고, TTL이 지난 끝난 작업은 삭제"""
+        with self._session() as db:
+            stale = db.query(CollectionJob).filter(
+                CollectionJob.status == STATUS_RUNNING,
+                or_(
+                    CollectionJob.heartbeat_at < func.now() - stale_after,
+                    CollectionJob.heartbeat_at.is_(None)
+                )
+            ).update({
+                'status': STATUS_FAILED,
+                'step': 8,
+                'message': '수집 작업 응답이 없어 중단되었습니다',
+                'percentage': 100,
+                'error': '워커 하트비트 없음',
+                'finished_at': func.now(),
+            }, synchronize_session=False)
+
+            # 수집 워커가 떠 있지 않으면 대기 작업이 계속 남으므로 실패로 끝냄
+            expired = db.query(CollectionJob).filter(
+                CollectionJob.status == STATUS_QUEUED,
+                CollectionJob.created_at < func.now() - queued_ttl
+            ).update({
+                'status': STATUS_FAILED,
+                'step': 8,
+                'message': '수집 워커가 작업을 가져가지 않아 만료되었습니다',
+                'percentage': 100,
+                'error': '대기 시간 초과',
+                'finished_at': func.now(),
+            }, synchronize_session=False)
+
+            purged = db.query(CollectionJob).filter(
+                CollectionJob.status.notin_(ACTIVE_STATUSES),
+                CollectionJob.finished_at < func.now() - ttl
+            ).delete(synchronize_session=False)
+
+        if stale or expired or purged:
+            logger.info(f"수집 작업 정리: 응답 없음 {stale}개, 대기 만료 {expired}개, 만료 삭제 {purged}개")
+        return {'stale': stale, 'expired': expired, 'purged': purged}
+
+
+collection_job_store = CollectionJobStore()
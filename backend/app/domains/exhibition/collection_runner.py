@@ -0,0 +1,194 @@
+"""
+문화 데이터 수집 작업 실행기
+웹 워커의 백그라운드 스레드와 별도 수집 워커(run_ingestion_scheduler.py)가 같은 코드로
+수집을 실행하고, 진행 상황은 collection_jobs 테이블에 기록한다
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from app.domains.exhibition.collection_jobs import collection_job_store
+from app.domains.exhibition.cultural_hub_service import CulturalHubExhibitionService
+
+
+def run_collection_with_progress_sync(progress_id: str, max_pages: int, use_sequential: bool, incremental: bool) -> Optional[Dict[str, Any]]:
+    """진행 상황을 업데이트하면서 데이터 수집 실행 (취소/오류 시 None)"""
+    try:
+        from app.db.session import SessionLocal
+        
+        def update_progress(step: int, message: str, percentage: int, source_counters: Optional[Dict[str, Any]] = None):
+            # 취소됐거나 끝난 작업이면 False
+            return collection_job_store.update_progress(progress_id, step, message, percentage, source_counters)
+        
+        # 취소 요청 확인 (다른 워커에서 요청해도 감지, DB 확인은 일정 간격으로만)
+        cancel_check = collection_job_store.cancel_checker(progress_id)
+        # 저장/중복 판별/좌표 연결 단계에서도 하트비트 유지
+        heartbeat = collection_job_store.heartbeat_callback(progress_id)
+        
+        # 새로운 DB 세션 생성
+        db = SessionLocal()
+        
+        try:
+            cultural_service = CulturalHubExhibitionService(db)
+            
+            # 단계별 진행 상황 업데이트 (각 단계에서 취소 확인)
+            if not update_progress(2, 'API 연결을 확인하는 중...', 10):
+                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            if not update_progress(3, '데이터 소스를 초기화하는 중...', 20):
+                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            if not update_progress(4, '문화 데이터를 수집하는 중...', 30):
+                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
+                return
+            
+            # 데이터 수집 실행 (취소 확인 콜백 포함)
+            def collection_progress_callback(step, message, api_info=None):
+                # 진행 상황 업데이트 (취소된 경우 False)
+                if not update_progress(4, f"API 수집 중: {message}", min(30 + (step * 10), 80), api_info):
+                    logging.info(f"수집 중 취소 감지: {progress_id}")
+                    return False
+                return True
+            
+            # 동기 버전으로 호출
+            import asyncio
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                result = loop.run_until_complete(cultural_service.collect_all_exhibitions_safely(
+                    max_pages=max_pages, 
+                    use_sequential=use_sequential,
+                    incremental=incremental,
+                    progress_callback=collection_progress_callback,
+                    cancel_check=cancel_check,
+                    heartbeat=heartbeat
+                ))
+            finally:
+                loop.close()
+            
+            if not update_progress(6, '수집된 데이터를 검증하는 중...', 85):
+                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            if not update_progress(7, '데이터베이스에 저장하는 중...', 95):
+                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            # 완료 (취소되지 않은 경우만)
+            if collection_job_store.complete(progress_id, '데이터 수집이 완료되었습니다', result):
+                logging.info(f"수집 완료: success={result['success']}")
+                if result['success']:
+                    logging.info(f"총 데이터 수: {result.get('total_collected', 0)}")
+            
+            return result
+                
+        finally:
+            db.close()
+
+    except Exception as e:
+        logging.error(f"수집 작업 오류: {str(e)}")
+        try:
+            collection_job_store.fail(progress_id, f'오류 발생: {str(e)}', str(e))
+        except Exception as store_error:
+            logging.error(f"수집 작업 상태 기록 실패: {str(store_error)}")
+
+
+def run_single_api_collection_sync(progress_id: str, api_key: str, max_pages: int, use_sequential: bool, incremental: bool) -> Optional[Dict[str, Any]]:
+    """개별 API 데이터 수집 실행 (취소/오류 시 None)"""
+    try:
+        from app.db.session import SessionLocal
+        
+        def update_progress(step: int, message: str, percentage: int, source_counters: Optional[Dict[str, Any]] = None):
+            # 취소됐거나 끝난 작업이면 False
+            return collection_job_store.update_progress(progress_id, step, message, percentage, source_counters)
+        
+        # 취소 요청 확인 (다른 워커에서 요청해도 감지, DB 확인은 일정 간격으로만)
+        cancel_check = collection_job_store.cancel_checker(progress_id)
+        # 저장/중복 판별/좌표 연결 단계에서도 하트비트 유지
+        heartbeat = collection_job_store.heartbeat_callback(progress_id)
+        
+        # 새로운 DB 세션 생성
+        db = SessionLocal()
+        
+        try:
+            cultural_service = CulturalHubExhibitionService(db)
+            
+            # 단계별 진행 상황 업데이트
+            if not update_progress(2, f'{api_key} API 연결을 확인하는 중...', 10):
+                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            if not update_progress(3, f'{api_key} API 데이터를 수집하는 중...', 30):
+                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
+                return
+            
+            # 개별 API 수집 실행
+            def collection_progress_callback(step, message, api_info=None):
+                # 진행 상황 업데이트 (취소된 경우 False)
+                if not update_progress(4, f"{api_key}: {message}", min(40 + (step * 15), 80), api_info):
+                    logging.info(f"개별 수집 중 취소 감지: {progress_id}")
+                    return False
+                return True
+            
+            # 개별 API 수집 (동기 버전으로 호출)
+            import asyncio
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                result = loop.run_until_complete(cultural_service.collect_single_api_safely(
+                    api_key=api_key,
+                    max_pages=max_pages,
+                    use_sequential=use_sequential,
+                    incremental=incremental,
+                    progress_callback=collection_progress_callback,
+                    cancel_check=cancel_check,
+                    heartbeat=heartbeat
+                ))
+            finally:
+                loop.close()
+            
+            if not update_progress(6, f'{api_key} 수집된 데이터를 검증하는 중...', 85):
+                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            if not update_progress(7, f'{api_key} 데이터베이스에 저장하는 중...', 95):
+                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
+                return
+            time.sleep(0.5)
+            
+            # 완료 (취소되지 않은 경우만)
+            if collection_job_store.complete(progress_id, f'{api_key} API 수집이 완료되었습니다', result):
+                logging.info(f"개별 API 수집 완료: {api_key}, success={result.get('success', False)}")
+            
+            return result
+                
+        finally:
+            db.close()
+        
+    except Exception as e:
+        logging.error(f"개별 API 수집 오류: {str(e)}")
+        try:
+            collection_job_store.fail(progress_id, f'{api_key} 수집 중 오류 발생: {str(e)}', str(e))
+        except Exception as store_error:
+            logging.error(f"수집 작업 상태 기록 실패: {str(store_error)}")
+
+
+def run_collection_job(job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """대기열에서 가져온 작업 실행 (job_type에 따라 전체/개별 수집)"""
+    params = job.get('params') or {}
+    max_pages = params.get('max_pages', 1)
+    use_sequential = params.get('use_sequential', True)
+    incremental = params.get('incremental', True)
+
+    if job.get('api_key'):
+        return run_single_api_collection_sync(job['progress_id'], job['api_key'], max_pages, use_sequential, incremental)
+    return run_collection_with_progress_sync(job['progress_id'], max_pages, use_sequential, incremental)
@@ -25,6 +25,20 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import html
 from html import unescape
 
+try:
+    from app.domains.exhibition.source_adapters import (
+        CULTURAL_API_CONFIG, CULTURAL_STANDARD_COLUMNS, KCISA_BASE_URL,
+        KCISA_DIRECT_BASE_URL, SEMA_RESULT_PATTERN, SOURCE_ADAPTERS, SourceAdapter, get_source_adapter
+    )
+    from app.domains.exhibition.batch_normalizer import get_source_mapper
+except ImportError:
+    # 스크립트로 직접 실행할 때
+    from source_adapters import (
+        CULTURAL_API_CONFIG, CULTURAL_STANDARD_COLUMNS, KCISA_BASE_URL,
+        KCISA_DIRECT_BASE_URL, SEMA_RESULT_PATTERN, SOURCE_ADAPTERS, SourceAdapter, get_source_adapter
+    )
+    from batch_normalizer import get_source_mapper
+
 # ======================================
 # 페이지 수 설정 (전역 변수)
 # ======================================
@@ -39,7 +53,7 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('cultural_hub_api.log', encoding='utf-8'),
+        logging.FileHandler(os.getenv('CULTURAL_HUB_LOG_FILE', 'cultural_hub_api.log'), encoding='utf-8'),
         logging.StreamHandler()
     ]
 )
@@ -49,8 +63,8 @@ class CulturalHubAPISystem:
     
     def __init__(self):
         """문화 허브 시스템 초기화"""
-        self.base_url = "https://api.kcisa.kr/openapi"
-        self.direct_base_url = "https://api.kcisa.kr"  # 국립중앙박물관용 직접 URL
+        self.base_url = KCISA_BASE_URL
+        self.direct_base_url = KCISA_DIRECT_BASE_URL  # 국립중앙박물관용 직접 URL
         self.request_lock = threading.Lock()
         
                     # 문화 허브 안전 연결 설정
@@ -64,442 +78,10 @@ class CulturalHubAPISystem:
             'sequential_fallback': True  # 순차 처리 폴백
         }
         
-        # 16개 문화기관 API 완전 검증된 허브 설정
-        self.cultural_api_config = {
-            'arts_center': {
-                'endpoint': 'API_CCA_149/request',
-                'service_key': '67a7bb34-331e-4136-a32d-61d663c1f902',
-                'name': '예술의전당 전시정보',
-                'category': '전시',
-                'priority': 1,  # 우선순위 (낮을수록 먼저 처리)
-                'institution_type': '공연장',
-                'location': '서울',
-                'column_mapping': {
-                    'TITLE': '제목',
-                    'CNTC_INSTT_NM': '연계기관명',
-                    'COLLECTED_DATE': '수집일',
-                    'ISSUED_DATE': '자료생성일자',
-                    'DESCRIPTION': '소개설명',
-                    'IMAGE_OBJECT': '이미지주소',
-                    'LOCAL_ID': '전시ID',
-                    'URL': '홈페이지주소',
-                    'EVENT_SITE': '장소',
-                    'GENRE': '장르',
-                    'PERIOD': '기간',
-                    'EVENT_PERIOD': '시간',
-                    'AUTHOR': '작가',
-                    'CONTACT_POINT': '문의',
-                    'CHARGE': '관람료할인정보'
-                }
-            },
-            
-            'history_museum': {
-                'endpoint': 'service/rest/meta2020/getMCHBspecial',
-                'service_key': '2be9e796-ad86-4052-a35a-cbbfc690dd98',
-                'name': '대한민국역사박물관 특별전시',
-                'category': '특별전시',
-                'priority': 2,
-                'institution_type': '국립박물관',
-                'location': '서울',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'url': '홈페이지주소',
-                    'collectionDb': '장르',
-                    'eventPeriod': '기간',
-                    'venue': '장소',
-                    'publisher': '발행처',
-                }
-            },
-            
-            'hangeul_museum': {
-                'endpoint': 'service/rest/meta2020/getNHMBex',
-                'service_key': '61bd783c-310d-446f-b954-474c7e5e5786',
-                'name': '국립한글박물관 전시정보',
-                'category': '전시',
-                'priority': 3,
-                'institution_type': '국립박물관',
-                'location': '서울',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'url': '홈페이지주소',
-                    'collectionDb': '장르',
-                    'publisher': '발행처',
-                    'subDescription': '부가설명',
-                }
-            },
-            
-            'kocaca': {
-                'endpoint': 'service/rest/meta2020/getKOCAperf',
-                'service_key': 'e0511ad1-e637-44dc-a2ad-608a0562417a',
-                'name': '한국문화예술회관연합회 공연전시정보',
-                'category': '공연전시',
-                'priority': 4,
-                'institution_type': '문화예술회관',
-                'location': '전국',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'referenceIdentifier': '이미지주소',
-                    'url': '홈페이지주소',
-                    'venue': '장소',
-                    'collectionDb': '장르',
-                    'eventPeriod': '기간',
-                    'charge': '관람료할인정보',
-                    'publisher': '발행처',
-                    'sourceTitle': '원본제목',
-                    'rights': '문의',
-                }
-            },
-            
-            'kcdf': {
-                'endpoint': 'service/rest/meta8/getKCDA1503',
-                'service_key': 'e77c4454-1197-4856-8003-d9a4af692cf1',
-                'name': '한국공예디자인문화진흥원 전시도록',
-                'category': '전시도록',
-                'priority': 5,
-                'institution_type': '진흥원',
-                'location': '서울',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'referenceIdentifier': '이미지주소',
-                    'url': '홈페이지주소',
-                    'collectionDb': '장르',
-                    'alternativeTitle': '부제목',
-                    'extent': '크기정보',
-                    'language': '언어',
-                    'contributor': '기여자',
-                    'copyrightOthers': '저작권정보',
-                }
-            },
-            
-            'arko': {
-                'endpoint': 'service/rest/meta4/getARKA1202',
-                'service_key': '52dd795c-83cb-46fc-bbf8-d09e078c7a55',
-                'name': '한국문화예술위원회 아르코미술관전시',
-                'category': '미술관전시',
-                'priority': 6,
-                'institution_type': '미술관',
-                'location': '서울',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'url': '홈페이지주소',
-                    'collectionDb': '장르',
-                    'subjectKeyword': '키워드',
-                    'alternativeTitle': '부제목',
-                    'extent': '크기정보',
-                    'language': '언어',
-                    'contributor': '기여자',
-                    'copyrightOthers': '저작권정보',
-                    'sourceTitle': '원본제목',
-                }
-            },
-            
-            'jeonju_culture': {
-                'endpoint': 'service/rest/other/getJEON5201',
-                'service_key': '9fe0e24d-ba40-470c-bd06-79147e932871',
-                'name': '전주시 공연전시정보',
-                'category': '지역공연전시',
-                'priority': 7,
-                'institution_type': '지방자치단체',
-                'location': '전주',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'url': '홈페이지주소',
-                    'spatialCoverage': '장소',
-                    'collectionDb': '장르',
-                    'temporalCoverage': '기간',
-                    'charge': '관람료할인정보',
-                    'grade': '등급정보',
-                    'alternativeTitle': '부제목',
-                    'extent': '크기정보',
-                    'language': '언어',
-                    'contributor': '기여자',
-                    'copyrightOthers': '저작권정보',
-                    'rights': '문의',
-                }
-            },
-            
-            'sema': {
-                'endpoint': 'service/rest/other/getSEMN5601',
-                'service_key': 'feb3f330-c7e3-41e6-ac1f-2aa79ca17078',
-                'name': '서울시립미술관 전시정보',
-                'category': '시립미술관전시',
-                'priority': 8,
-                'institution_type': '시립미술관',
-                'location': '서울',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'url': '홈페이지주소',
-                    'venue': '장소',
-                    'collectionDb': '장르',
-                    'eventPeriod': '기간',
-                    'charge': '관람료할인정보',
-                    'grade': '등급정보',
-                    'referenceIdentifier': '이미지주소',
-                    'alternativeTitle': '부제목',
-                    'extent': '크기정보',
-                    'language': '언어',
-                    'contributor': '기여자',
-                    'copyrightOthers': '저작권정보',
-                    'sourceTitle': '원본제목',
-                    'rights': '문의',
-                }
-            },
-            
-            'mapo_art': {
-                'endpoint': 'service/rest/other/getMAPN0701',
-                'service_key': 'bf972437-adb8-432b-90f9-4aa739fe61f8',
-                'name': '마포문화재단 마포아트센터공연전시',
-                'category': '지역아트센터',
-                'priority': 9,
-                'institution_type': '문화재단',
-                'location': '서울 마포',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'regDate': '수집일',
-                    'description': '소개설명',
-                    'url': '홈페이지주소',
-                    'venue': '장소',
-                    'collectionDb': '장르',
-                    'eventPeriod': '기간',
-                    'charge': '관람료할인정보',
-                    'grade': '등급정보',
-                    'rights': '문의',
-                    'alternativeTitle': '부제목',
-                    'extent': '크기정보',
-                    'language': '언어',
-                    'contributor': '기여자',
-                    'copyrightOthers': '저작권정보',
-                    'sourceTitle': '원본제목',
-                }
-            },
-            
-            'mmca': {
-                'endpoint': 'service/rest/moca/docMeta',
-                'service_key': '1851aea9-303e-4df4-ab29-903227afd400',
-                'name': '국립현대미술관 전시정보',
-                'category': '국립미술관전시',
-                'priority': 10,
-                'institution_type': '국립미술관',
-                'location': '서울/과천/덕수궁/청주',
-                'column_mapping': {
-                    'title': '제목',
-                    'creator': '연계기관명',
-                    'subDescription': '소개설명',
-                    'venue': '장소',
-                    'collectionDb': '장르',
-                    'eventPeriod': '기간',
-                    'person': '작가',
-                    'charge': '관람료할인정보',
-                    'rights': '문의',
-                    'subjectCategory': '카테고리',
-                    'publisher': '발행처',
-                }
-            },
-            
-            'integrated_exhibition': {
-                'endpoint': 'API_CCA_145/request',
-                'service_key': '7daab567-98f0-463a-83f7-2daf3708699b',
-                'name': '한국문화정보원 외 전시정보(통합)',
-                'category': '통합전시정보',
-                'priority': 11,
-                'institution_type': '통합정보원',
-                'location': '전국',
-                'column_mapping': {
-                    'TITLE': '제목',
-                    'CNTC_INSTT_NM': '연계기관명',
-                    'COLLECTED_DATE': '수집일',
-                    'ISSUED_DATE': '자료생성일자',
-                    'DESCRIPTION': '소개설명',
-                    'IMAGE_OBJECT': '이미지주소',
-                    'LOCAL_ID': '전시ID',
-                    'URL': '홈페이지주소',
-                    'EVENT_SITE': '장소',
-                    'GENRE': '장르',
-                    'PERIOD': '기간',
-                    'EVENT_PERIOD': '시간',
-                    'AUTHOR': '작가',
-                    'CONTACT_POINT': '문의',
-                    'CHARGE': '관람료할인정보',
-                    'CONTRIBUTOR': '기여기관',
-                    'AUDIENCE': '관람대상',
-                    'SUB_DESCRIPTION': '부가설명',
-                    'VIEW_COUNT': '조회수',
-                }
-            },
-            
-            'barrier_free': {
-                'endpoint': 'API_TOU_049/request',
-                'service_key': '1c0b4f33-9d42-43f2-afea-ce63933132b0',
-                'name': '한국문화정보원 전국 문화예술관광지 배리어프리 정보',
-                'category': '배리어프리정보',
-                'priority': 12,
-                'institution_type': '정보원',
-                'location': '전국',
-                'column_mapping': {
-                    'title': '제목',
-                    'category1': '카테고리1',
-                    'issuedDate': '수집일',
-                    'description': '소개설명',
-                    'url': '홈페이지주소',
-                    'address': '장소',
-                    'category2': '카테고리2',
-                    'subDescription': '시설정보',
-                    'coordinates': '좌표정보',
-                    'tel': '문의전화',
-                    'category3': '세부카테고리'
-                }
-            },
-            
-            # 특별 처리가 필요한 문화기관
-            'museum_catalog': {
-                'endpoint': 'API_CNV_049/request',
-                'service_key': '82050181-5c55-4adb-9232-310ba3b625c7',
-                'name': '국립중앙박물관 외 전시도록',
-                'category': '박물관전시도록',
-                'priority': 13,
-                'institution_type': '국립박물관',
-                'location': '서울',
-                'sensitive': True,  # 민감한 API 표시
-                'column_mapping': {
-                    'title': '제목',
-                    'alternativeTitle': '부제목',
-                    'createdDate': '수집일',
-                    'description': '소개설명',
-                    'imageObject': '이미지주소',
-                    'url': '홈페이지주소',
-                    'subjectKeyword': '키워드',
-                    'period': '기간',
-                    'subDescription': '부가설명',
-                    'sizing': '크기정보',
-                    'charge': '유료무료정보',
-                    'localId': '원천기관자료식별자',
-                    'viewCount': '조회수'
-                }
-            },
-            
-            # 지역 문화기관: 제주문화예술진흥원
-            'jeju_culture': {
-                'endpoint': 'rest/JejuExhibitionService/getJejucultureExhibitionList',
-                'service_key': None,  # 키 불필요
-                'name': '제주문화예술진흥원 공연/전시 정보',
-                'category': '지역문화예술',
-                'priority': 14,
-                'institution_type': '지역진흥원',
-                'location': '제주',
-                'base_url': 'http://www.jeju.go.kr',  # 특별한 베이스 URL
-                'response_format': 'xml',  # XML 응답
-                'column_mapping': {
-                    'title': '제목',
-                    'owner': '연계기관명',
-                    'start': '시작일',
-                    'end': '종료일',
-                    'hour': '시간',
-                    'cover': '이미지주소',
-                    'coverThumb': '썸네일이미지',
-                    'locNames': '장소',
-                    'categoryName': '장르',
-                    'pay': '관람료정보',
-                    'tel': '문의전화',
-                    'stat': '상태정보',
-                    'seq': '일련번호',
-                    'divName': '상세장르',
-                    'category': '카테고리코드',
-                    'locs': '장소코드',
-                }
-            },
-            
-            # 지역 문화기관: 대구광역시
-            'daegu_culture': {
-                'endpoint': 'api/daegu/cultural-events',
-                'service_key': None,  # 키 불필요
-                'name': '대구광역시 공연·전시 정보',
-                'category': '지역문화행사',
-                'priority': 15,
-                'institution_type': '광역시',
-                'location': '대구',
-                'base_url': 'https://dgfca.or.kr',  # 특별한 베이스 URL
-                'response_format': 'json',  # JSON 응답
-                'column_mapping': {
-                    'subject': '제목',
-                    'event_gubun': '구분',
-                    'start_date': '시작일',
-                    'end_date': '종료일',
-                    'place': '장소',
-                    'event_area': '지역',
-                    'host': '주최',
-                    'contact': '문의',
-                    'pay_gubun': '유료무료',
-                    'pay': '관람료할인정보',
-                    'homepage': '홈페이지주소',
-                    'content': '소개설명',
-                    'event_seq': '전시ID'
-                }
-            },
-            
-            # 서울시립미술관 아카이브
-            'sema_archive': {
-                'endpoint': 'semaaa/front/openapi.do',
-                'service_key': '76f1a6fddd3d4a2d8c6b92f14d414fbb',
-                'name': '서울시립미술관 아카이브',
-                'category': '미술관아카이브',
-                'priority': 16,
-                'institution_type': '시립미술관아카이브',
-                'location': '서울',
-                'base_url': 'https://sema.seoul.go.kr',  # 특별한 베이스 URL
-                'response_format': 'html',  # HTML 응답
-                'column_mapping': {
-                    'I_TITLE': '제목',
-                    'I_SCOPE': '소개설명',
-                    'CP_CLASS_NM': '장르',
-                    'I_CREATOR': '작가',
-                    'I_DT': '생산일자',
-                    'I_DONOR': '수집처',
-                    'I_TYPE': '자료유형',
-                    'I_TYPE_NM': '자료유형명',
-                    'I_TITLE_STR': '부제목',
-                    'I_CLSSSUB_SUB': '분류',
-                    'BK_VOL_NO': '권호',
-                    'I_REGNO': '등록번호',
-                    'IMG_URL': '이미지URL',
-                    'REG_DT': '등록일자',
-                    'I_ID': '아이디',
-                    'CP_CLASS': '분류코드',
-                    'I_DIGITAL_NM': '전자여부'
-                }
-            }
-        }
-        
-        # 문화예술 표준 컬럼 정의
-        self.cultural_standard_columns = [
-            '제목', '연계기관명', '수집일', '자료생성일자', '소개설명', 
-            '이미지주소', '홈페이지주소', '장소', '장르', '기간', '시간',
-            '작가', '문의', '관람료할인정보', '전시ID', '부제목', '크기정보',
-            '키워드', '시설정보', '접근성정보', '등급정보', '시간적범위',
-            '공간정보', '좌표정보', '문의전화', '세부카테고리', '부가설명',
-            '유료무료정보', '원천기관자료식별자', '조회수', '카테고리1', 
-            '카테고리2'
-        ]
+        # 16개 문화기관 API 설정과 표준 컬럼은 source_adapters 모듈에서 임포트 시 한 번만 구성
+        self.cultural_api_config = CULTURAL_API_CONFIG
+        self.cultural_standard_columns = CULTURAL_STANDARD_COLUMNS
+        self.source_adapters = SOURCE_ADAPTERS
         
         # 안전한 문화 허브 연결 세션 설정
         self.session = self.create_safe_cultural_session()
@@ -568,25 +150,16 @@ class CulturalHubAPISystem:
         
         return True
     
+    def get_source_adapter(self, api_key: str, config: Dict = None) -> SourceAdapter:
+        """API 키에 해당하는 소스 어댑터 조회"""
+        return get_source_adapter(api_key, config)
+    
     def safe_cultural_api_call(self, api_key: str, config: Dict, params: Dict, attempt: int = 0, cancel_check=None) -> Tuple[bool, Any, str]:
-        """완전 안전한 문화 허브 API 호출"""
-        # 특별한 URL 구성
-        if api_key == 'museum_catalog':
-            url = f"{self.direct_base_url}/{config['endpoint']}"
-        elif api_key == 'jeju_culture':
-            # 제주문화예술진흥원은 특별한 베이스 URL 사용
-            url = f"{config['base_url']}/{config['endpoint']}"
-        elif api_key == 'daegu_culture':
-            # 대구광역시는 특별한 베이스 URL 사용 (JSON 응답)
-            url = f"{config['base_url']}/{config['endpoint']}"
-        elif api_key == 'sema_archive':
-            # 서울시립미술관 아카이브는 특별한 베이스 URL 사용
-            url = f"{config['base_url']}/{config['endpoint']}"
-        else:
-            url = f"{self.base_url}/{config['endpoint']}"
+        """완전 안전한 문화 허브 API 호출 (응답은 어댑터가 표준 구조로 변환)"""
+        adapter = self.get_source_adapter(api_key, config)
         
         # 민감한 문화기관 API는 더 긴 대기 시간
-        base_delay = 2.0 if config.get('sensitive', False) else self.safe_config['base_delay']
+        base_delay = adapter.base_delay or self.safe_config['base_delay']
         
         with self.request_lock:
             # 문화 허브 서버를 위한 안전한 지연 (취소 확인 포함)
@@ -607,7 +180,7 @@ class CulturalHubAPISystem:
                 
                 try:
                     response = self.session.get(
-                        url, 
+                        adapter.url, 
                         params=params, 
                         timeout=short_timeout
                     )
@@ -635,140 +208,7 @@ class CulturalHubAPISystem:
             
             response.raise_for_status()
             
-            # 서울시립미술관 아카이브는 HTML 응답
-            if api_key == 'sema_archive':
-                try:
-                    # HTML에서 {result=...} 패턴 찾기
-                    pattern = r'\{result=(\{.*?\}), totCnt=(\d+), message=(.*?), list=(.*?), status=(\w+)\}'
-                    match = re.search(pattern, response.text, re.DOTALL)
-                    
-                    if match:
-                        result_json = match.group(1)
-                        total_count = int(match.group(2))
-                        message = match.group(3)
-                        list_data = match.group(4)
-                        status = match.group(5)
-                        
-                        # result JSON 파싱
-                        try:
-                            result_data = json.loads(result_json)
-                            
-                            # 표준 API 응답 구조로 변환
-                            formatted_response = {
-                                'header': {
-                                    'resultCode': '00',
-                                    'resultMsg': 'SUCCESS'
-                                },
-                                'body': {
-                                    'totalCount': str(total_count),
-                                    'items': {
-                                        'item': result_data.get('rows', []) if isinstance(result_data, dict) else []
-                            }
-                                }
-                            }
-                            
-                            return True, {'response': formatted_response}, f"성공 (총 {total_count}개)"
-                            
-                        except json.JSONDecodeError as e:
-                            return False, None, f'JSON 파싱 실패: {str(e)}'
-                    else:
-                        return False, None, '패턴 매칭 실패'
-                        
-                except Exception as e:
-                    return False, None, f'추출 실패: {str(e)}'
-            
-            # 대구광역시 API는 JSON 응답
-            elif api_key == 'daegu_culture':
-                try:
-                    json_data = response.json()
-                    
-                    # 배열 형태의 응답을 표준 구조로 변환
-                    if isinstance(json_data, list):
-                        total_count = len(json_data)
-                        message = f"성공 (JSON 배열, 총 데이터: {total_count}개)"
-                        
-                        # 표준 API 응답 구조로 변환
-                        formatted_response = {
-                            'header': {
-                                'resultCode': '00',
-                                'resultMsg': 'SUCCESS'
-                            },
-                            'body': {
-                                'totalCount': str(total_count),
-                                'items': {
-                                    'item': json_data
-                                }
-                            }
-                        }
-                        
-                        return True, {'response': formatted_response}, message
-                    else:
-                        return False, None, "대구 API 응답이 예상 형식이 아닙니다."
-                        
-                except json.JSONDecodeError:
-                    return False, None, "대구 API JSON 파싱 오류"
-            
-            # XML 파싱 (기존 API들)
-            xml_data = xmltodict.parse(response.content)
-            
-            # 제주문화예술진흥원 API는 특별한 응답 구조
-            if api_key == 'jeju_culture':
-                if 'jejunetApi' in xml_data:
-                    jeju_data = xml_data['jejunetApi']
-                    result_code = jeju_data.get('resultCode', 'UNKNOWN')
-                    result_msg = jeju_data.get('resultMsg', 'Unknown')
-                    
-                    if result_code == '00':
-                        items = jeju_data.get('items', {})
-                        # items 안의 item들 추출
-                        if isinstance(items, dict) and 'item' in items:
-                            item_list = items['item']
-                            if isinstance(item_list, dict):
-                                item_list = [item_list]  # 단일 아이템을 리스트로 변환
-                            total_count = len(item_list) if item_list else 0
-                        else:
-                            item_list = []
-                            total_count = 0
-                        
-                        message = f"성공 (코드: {result_code}, 총 데이터: {total_count}개)"
-                        
-                        # 제주 API용 응답 구조로 변환
-                        formatted_response = {
-                            'header': {
-                                'resultCode': result_code,
-                                'resultMsg': result_msg
-                            },
-                            'body': {
-                                'totalCount': str(total_count),
-                                'items': {
-                                    'item': item_list
-                                }
-                            }
-                        }
-                        
-                        return True, {'response': formatted_response}, message
-                    else:
-                        message = f"제주 문화기관 API 응답 코드: {result_code} - {result_msg}"
-                        return False, None, message
-            
-            # 기존 문화공공데이터 광장 API 처리
-            if 'response' in xml_data:
-                response_data = xml_data['response']
-                
-                if 'header' in response_data:
-                    result_code = response_data['header'].get('resultCode', 'UNKNOWN')
-                    result_msg = response_data['header'].get('resultMsg', 'Unknown')
-                    
-                    if result_code in ['00', '0000']:
-                        body = response_data.get('body', {})
-                        total_count = int(body.get('totalCount', 0))
-                        message = f"성공 (코드: {result_code}, 총 데이터: {total_count}개)"
-                        return True, response_data, message
-                    else:
-                        message = f"문화기관 API 응답 코드: {result_code} - {result_msg}"
-                        return False, None, message
-            
-            return False, None, "문화기관 API 응답 구조가 예상과 다릅니다."
+            return adapter.parse_response(response.content, response.encoding)
             
         except requests.exceptions.Timeout:
             return False, None, f"문화기관 서버 타임아웃 ({self.safe_config['timeout']}초)"
@@ -781,19 +221,8 @@ class CulturalHubAPISystem:
     
     def test_cultural_api_safely(self, api_key: str, config: Dict, cancel_check=None) -> Tuple[bool, int, str]:
         """안전한 문화 허브 API 테스트"""
-        # 특별한 파라미터 구조가 필요한 API들
-        if api_key == 'jeju_culture':
-            params = {}  # 제주 API는 파라미터 없이 모든 데이터 반환
-        elif api_key == 'daegu_culture':
-            params = {}  # 대구 API는 파라미터 없이 모든 데이터 반환
-        elif api_key == 'sema_archive':
-            params = {'ApiKey': config['service_key'], 'display': '5'}  # 서울시립미술관 아카이브
-        else:
-            params = {
-                'serviceKey': config['service_key'],
-                'numOfRows': 5,
-                'pageNo': 1
-            }
+        adapter = self.get_source_adapter(api_key, config)
+        params = adapter.test_params()
         
         last_error = "알 수 없는 오류"
         
@@ -806,18 +235,8 @@ class CulturalHubAPISystem:
             
             if success:
                 # 성공한 경우 데이터 개수 추출
-                if data and 'response' in data:
-                    response_data = data['response']
-                    if 'body' in response_data:
-                        body = response_data['body']
-                        total_count = int(body.get('totalCount', 0))
-                        return True, total_count, message
-                elif data and 'body' in data:
-                    # 기존 일반 API 구조 지원
-                    body = data['body']
-                    total_count = int(body.get('totalCount', 0))
-                    return True, total_count, message
-                return True, 0, message
+                _, total_count = adapter.extract_items(data)
+                return True, total_count, message
             
             # 취소 메시지 확인
             if "취소됨" in message:
@@ -846,8 +265,7 @@ class CulturalHubAPISystem:
         """서울시립미술관 아카이브 HTML 응답에서 JSON 데이터 추출"""
         try:
             # HTML에서 {result=...} 패턴 찾기
-            pattern = r'\{result=(\{.*?\}), totCnt=(\d+), message=(.*?), list=(.*?), status=(\w+)\}'
-            match = re.search(pattern, html_response, re.DOTALL)
+            match = SEMA_RESULT_PATTERN.search(html_response)
             
             if match:
                 result_json = match.group(1)
@@ -887,109 +305,35 @@ class CulturalHubAPISystem:
             }
     
     def collect_cultural_data_safely(self, api_key: str, config: Dict, max_pages: int = 10, cancel_check=None) -> List[Dict]:
-        """안전한 문화 허브 데이터 수집"""
+        """안전한 문화 허브 데이터 수집 (페이징/실패 허용 정책은 어댑터가 결정)"""
+        adapter = self.get_source_adapter(api_key, config)
         all_data = []
         page = 1
         consecutive_failures = 0
-        max_consecutive_failures = 3
         
-        # 특별 처리가 필요한 API들 (페이징 없이 모든 데이터를 한 번에 반환)
-        if api_key in ['jeju_culture', 'daegu_culture', 'sema_archive']:
-            if api_key == 'sema_archive':
-                # 서울시립미술관 아카이브는 페이징 지원 (최대 100개씩)
-                total_collected = 0
-                for page in range(1, max_pages + 1):  # 설정된 페이지 수만큼 수집
-                    params = {
-                        'ApiKey': config['service_key'], 
-                        'display': '100',
-                        'page': str(page)
-                    }
-                    success, data, message = self.safe_cultural_api_call(api_key, config, params)
-                    
-                    if success and data and 'response' in data:
-                        response_data = data['response']
-                        if 'body' in response_data:
-                            body = response_data['body']
-                            items = body.get('items', {})
-                            if isinstance(items, dict) and 'item' in items:
-                                page_items = items['item']
-                                if isinstance(page_items, dict):
-                                    page_items = [page_items]
-                                elif isinstance(page_items, list):
-                                    pass
-                                else:
-                                    break
-                                
-                                all_data.extend(page_items)
-                                total_collected += len(page_items)
-                                logging.info(f"{config['name']} - 페이지 {page}: {len(page_items)}개 아카이브 수집 (총 {total_collected}개)")
-                                
-                                # 첫 페이지의 처음 3개 데이터 샘플 로그 출력
-                                if page == 1 and len(page_items) > 0:
-                                    for i, item in enumerate(page_items[:3]):
-                                        logging.info(f"  샘플 {i+1}: {item}")
-                                
-                                if len(page_items) < 100:
-                                    break
-                            else:
-                                break
-                    else:
-                        logging.warning(f"{config['name']} - 페이지 {page} 실패: {message}")
-                        break
-                
-                logging.info(f"{config['name']} - 총 {len(all_data)}개 아카이브 데이터 수집 완료")
-            else:
-                # 제주, 대구는 기존 로직
-                params = {}
-                success, data, message = self.safe_cultural_api_call(api_key, config, params)
-            
-            if success and data and 'response' in data:
-                response_data = data['response']
-                if 'body' in response_data:
-                    body = response_data['body']
-                    items = body.get('items', {})
-                    if isinstance(items, dict) and 'item' in items:
-                        page_items = items['item']
-                        if isinstance(page_items, dict):
-                            page_items = [page_items]
-                        elif isinstance(page_items, list):
-                            pass
-                        else:
-                            page_items = []
-                        
-                        all_data.extend(page_items)
-                        if api_key == 'daegu_culture':
-                            logging.info(f"{config['name']} - {len(page_items)}개 문화행사 수집 완료")
-                        else:
-                            logging.info(f"{config['name']} - {len(page_items)}개 항목 수집 완료")
-            
-            return all_data
+        # 페이징 없는 API는 한 번의 호출로 모든 데이터를 반환
+        last_page = max_pages if adapter.paged else 1
         
-        # 기존 문화공공데이터 광장 API 처리 (페이징)
-        while page <= max_pages and consecutive_failures < max_consecutive_failures:
+        while page <= last_page and consecutive_failures < adapter.max_consecutive_failures:
             # 취소 확인
             if cancel_check and cancel_check():
                 logging.info(f"{config['name']} 페이징 중 취소 요청 감지")
                 break
             
-            params = {
-                'serviceKey': config['service_key'],
-                'numOfRows': 100,
-                'pageNo': page
-            }
-            
+            params = adapter.build_params(page)
             success, data, message = self.safe_cultural_api_call(api_key, config, params, 0, cancel_check)
             
             if not success:
                 consecutive_failures += 1
                 logging.warning(f"{config['name']} 페이지 {page} 실패: {message}")
                 
-                if consecutive_failures >= max_consecutive_failures:
-                    logging.error(f"{config['name']} 연속 실패 한계 도달, 중단")
+                if consecutive_failures >= adapter.max_consecutive_failures:
+                    if adapter.max_consecutive_failures > 1:
+                        logging.error(f"{config['name']} 연속 실패 한계 도달, 중단")
                     break
                 
                 # 실패 시 더 긴 대기 (취소 확인 포함)
-                for _ in range(30):  # 3초를 0.1초 단위로 분할
+                for _ in range(int(adapter.failure_wait * 10)):  # 0.1초 단위로 분할
                     time.sleep(0.1)
                     if cancel_check and cancel_check():
                         logging.info(f"{config['name']} 실패 대기 중 취소 요청 감지")
@@ -998,36 +342,24 @@ class CulturalHubAPISystem:
             
             consecutive_failures = 0  # 성공 시 연속 실패 카운터 리셋
             
-            if not data or 'body' not in data:
+            page_items, total_count = adapter.extract_items(data)
+            if page_items is None:
                 break
             
-            body = data['body']
-            total_count = int(body.get('totalCount', 0))
+            all_data.extend(page_items)
             
-            if total_count == 0:
+            if not adapter.paged:
+                logging.info(f"{config['name']} - {len(page_items)}개 항목 수집 완료")
                 break
             
-            items = body.get('items', {})
-            if isinstance(items, dict) and 'item' in items:
-                page_items = items['item']
-                if isinstance(page_items, dict):
-                    page_items = [page_items]
-                elif isinstance(page_items, list):
-                    pass
-                else:
-                    break
-                
-                all_data.extend(page_items)
-                logging.info(f"{config['name']} - 페이지 {page}: {len(page_items)}개 항목 수집 (총 {len(all_data)}개)")
-                
-                # 첫 페이지의 처음 3개 데이터 샘플 로그 출력
-                if page == 1 and len(page_items) > 0:
-                    for i, item in enumerate(page_items[:3]):
-                        logging.info(f"  샘플 {i+1}: {item}")
-                
-                if len(page_items) < 100:
-                    break
-            else:
+            logging.info(f"{config['name']} - 페이지 {page}: {len(page_items)}개 항목 수집 (총 {len(all_data)}개)")
+            
+            # 첫 페이지의 처음 3개 데이터 샘플 로그 출력
+            if page == 1 and len(page_items) > 0:
+                for i, item in enumerate(page_items[:3]):
+                    logging.info(f"  샘플 {i+1}: {item}")
+            
+            if adapter.is_last_page(page_items):
                 break
             
             page += 1
@@ -1036,91 +368,9 @@ class CulturalHubAPISystem:
         return all_data
     
     def normalize_cultural_data(self, raw_data: List[Dict], source_api: str, config: Dict) -> List[Dict]:
-        """문화예술 데이터 표준화"""
-        normalized_data = []
-        column_mapping = config.get('column_mapping', {})
-        
-        for item in raw_data:
-            normalized_item = {
-                'data_source': config['name'],
-                'api_key': source_api,  # api_key를 사용
-                'api_source': source_api,  # api_source에도 api_key 사용
-                'category': config.get('category', '기타'),
-                'institution_type': config.get('institution_type', '기타'),
-                'location': config.get('location', '미상'),
-                '수집시간': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # 컬럼 매핑 적용
-            for source_field, target_field in column_mapping.items():
-                # 서울시립미술관 아카이브는 fields 안에 데이터가 있음
-                if source_api == 'sema_archive' and 'fields' in item:
-                    if source_field in item['fields']:
-                        normalized_item[target_field] = item['fields'][source_field]
-                else:
-                    if source_field in item:
-                        normalized_item[target_field] = item[source_field]
-            
-            # 특별 API들의 추가 처리
-            if source_api == 'sema_archive':
-                normalized_item['연계기관명'] = '서울시립미술관'
-                normalized_item['api_source'] = '서울시립미술관 아카이브'  # DB 조인 조건에 맞춤
-                if 'location' in item and 'rowid' in item['location']:
-                    normalized_item['전시ID'] = str(item['location']['rowid'])
-            elif source_api == 'jeju_culture':
-                # 제주 API 특별 처리
-                normalized_item['연계기관명'] = '제주문화예술진흥원'
-                normalized_item['api_source'] = '제주문화예술진흥원 공연전시정보'  # DB 조인 조건에 맞춤 (제주%로 매칭됨)
-                if 'seq' in item:
-                    normalized_item['전시ID'] = str(item['seq'])
-                # 제주 API는 start와 end 필드가 같은 값을 가질 수 있음
-                if 'start' in item:
-                    normalized_item['시작일'] = item['start']
-                if 'end' in item:
-                    normalized_item['종료일'] = item['end']
-            elif source_api == 'daegu_culture':
-                # 대구 API 특별 처리
-                normalized_item['연계기관명'] = '대구광역시'
-                normalized_item['api_source'] = '대구광역시 공연전시정보'  # DB 조인 조건에 맞춤 (대구%로 매칭됨)
-                if 'event_seq' in item:
-                    normalized_item['전시ID'] = str(item['event_seq'])
-                # 대구 API의 날짜 형식 처리
-                if 'start_date' in item:
-                    normalized_item['시작일'] = item['start_date']
-                if 'end_date' in item:
-                    normalized_item['종료일'] = item['end_date']
-            
-            # 표준 컬럼들 중 누락된 것들을 빈 값으로 채움
-            for standard_col in self.cultural_standard_columns:
-                if standard_col not in normalized_item:
-                    normalized_item[standard_col] = ""
-            
-            # 필수 필드 검증 및 기본값 설정
-            if not normalized_item.get('제목') or normalized_item.get('제목').strip() == '':
-                # 제목이 없으면 다른 필드로 대체
-                title_candidates = ['subject', 'title', 'I_TITLE', '장소', 'place', 'locNames']
-                for candidate in title_candidates:
-                    if candidate in item and item[candidate]:
-                        normalized_item['제목'] = str(item[candidate]).strip()
-                        break
-                else:
-                    # 모든 후보가 없으면 기본 제목 설정
-                    normalized_item['제목'] = f"{config['name']} 문화행사 #{len(normalized_data) + 1}"
-            
-            # 연계기관명이 없으면 설정
-            if not normalized_item.get('연계기관명') or normalized_item.get('연계기관명').strip() == '':
-                if source_api == 'jeju_culture':
-                    normalized_item['연계기관명'] = '제주문화예술진흥원'
-                elif source_api == 'daegu_culture':
-                    normalized_item['연계기관명'] = '대구광역시'
-                elif source_api == 'sema_archive':
-                    normalized_item['연계기관명'] = '서울시립미술관'
-                else:
-                    normalized_item['연계기관명'] = config['name']
-            
-            normalized_data.append(normalized_item)
-        
-        return normalized_data
+        """문화예술 데이터 표준화 (소스별 매퍼로 페이지 단위 일괄 변환)"""
+        adapter = self.get_source_adapter(source_api, config)
+        return get_source_mapper(adapter, self.cultural_standard_columns).normalize(raw_data)
     
     def run_cultural_hub_integration(self, max_pages: int = DEFAULT_MAX_PAGES, use_sequential: bool = False, progress_callback=None, cancel_check=None) -> Dict[str, Any]:
         
@@ -1289,18 +539,7 @@ class CulturalHubAPISystem:
                         priority_info = f"[P{config.get('priority', '?')}]"
                         institution_info = f"({config.get('institution_type', '기타')} / {config.get('location', '미상')})"
                         
-                        if api_key == 'museum_catalog':
-                            label = " (SAFE MODE)"
-                        elif api_key in ['mmca', 'integrated_exhibition', 'barrier_free']:
-                            label = " (FIXED)"
-                        elif api_key == 'mapo_art':
-                            label = " (NEW)"
-                        elif api_key == 'jeju_culture':
-                            label = " (JEJU)"
-                        elif api_key == 'daegu_culture':
-                            label = " (DAEGU)"
-                        else:
-                            label = ""
+                        label = self.get_source_adapter(api_key, config).label
                         
                         print(f"SUCCESS ({i}/{len(working_sorted)}) {priority_info} {config['name']} {institution_info}: {len(normalized_data)}개 데이터 ({collection_time:.1f}초, {rate:.1f}개/초){label}")
                         
@@ -1392,18 +631,7 @@ class CulturalHubAPISystem:
                         
                         rate = len(normalized_data) / collection_time if collection_time > 0 else 0
                         
-                        if api_key == 'museum_catalog':
-                            label = " (SAFE MODE)"
-                        elif api_key in ['mmca', 'integrated_exhibition', 'barrier_free']:
-                            label = " (FIXED)"
-                        elif api_key == 'mapo_art':
-                            label = " (NEW)"
-                        elif api_key == 'jeju_culture':
-                            label = " (JEJU)"
-                        elif api_key == 'daegu_culture':
-                            label = " (DAEGU)"
-                        else:
-                            label = ""
+                        label = self.get_source_adapter(api_key, config).label
                         
                         print(f"SUCCESS ({i}/{len(working_sorted)}) {priority_info} {config['name']} {institution_info}: {len(normalized_data)}개 데이터 ({collection_time:.1f}초, {rate:.1f}개/초){label}")
                     else:
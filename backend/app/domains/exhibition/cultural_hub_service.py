@@ -20,6 +20,11 @@ sys.path.append(str(Path(__file__).parent))
 from cultural_hub_ai_system import CulturalHubAPISystem, DEFAULT_MAX_PAGES
 
 from app.domains.exhibition.models import CultureHub, ApiSource
+from app.domains.exhibition.fingerprint import compute_content_hash
+from app.domains.exhibition.entity_resolution import EventResolver
+from app.domains.exhibition.active_events import refresh_active_events
+from app.domains.exhibition.geosearch import geocode_pending_events
+from app.domains.exhibition.batch_normalizer import map_culture_hub_fields
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -38,7 +43,8 @@ class CulturalHubExhibitionService:
         use_sequential: bool = True,
         incremental: bool = True,
         progress_callback: Optional[Callable[[int, str, Optional[Dict]], None]] = None,
-        cancel_check: Optional[Callable[[], bool]] = None
+        cancel_check: Optional[Callable[[], bool]] = None,
+        heartbeat: Optional[Callable[[], None]] = None
     ) -> Dict[str, Any]:
         """16개 문화기관 API 모두에서 안전하게 전시 데이터 수집 (중복 제거)"""
         try:
@@ -75,7 +81,8 @@ class CulturalHubExhibitionService:
                 # 증분 수집 모드로 DB에 저장
                 save_results = await self._save_to_database_incremental(
                     results['integrated_data'], 
-                    incremental=incremental
+                    incremental=incremental,
+                    heartbeat=heartbeat
                 )
                 
                 if progress_callback:
@@ -89,8 +96,9 @@ class CulturalHubExhibitionService:
                 total_new = save_results['new_count']
                 total_updated = save_results['updated_count'] 
                 total_skipped = save_results['skipped_count']
+                total_unchanged = save_results['unchanged_count']
                 
-                logger.info(f"CulturalHub 증분 수집 완료: 신규 {total_new}개, 업데이트 {total_updated}개, 중복 스킵 {total_skipped}개")
+                logger.info(f"CulturalHub 증분 수집 완료: 신규 {total_new}개, 업데이트 {total_updated}개, 중복 스킵 {total_skipped}개 (변경 없음 {total_unchanged}개)")
                 
                 return {
                     'success': True,
@@ -98,6 +106,7 @@ class CulturalHubExhibitionService:
                     'total_new': total_new,
                     'total_updated': total_updated,
                     'total_skipped': total_skipped,
+                    'total_unchanged': total_unchanged,
                     'working_apis': results['successful_apis'],
                     'total_apis': results['total_apis'],
                     'success_rate': (results['successful_apis']/results['total_apis'])*100,
@@ -140,7 +149,8 @@ class CulturalHubExhibitionService:
         use_sequential: bool = True,
         incremental: bool = True,
         progress_callback: Optional[Callable[[int, str, Optional[Dict]], None]] = None,
-        cancel_check: Optional[Callable[[], bool]] = None
+        cancel_check: Optional[Callable[[], bool]] = None,
+        heartbeat: Optional[Callable[[], None]] = None
     ) -> Dict[str, Any]:
         """개별 API에서 안전하게 데이터 수집"""
         try:
@@ -214,7 +224,7 @@ class CulturalHubExhibitionService:
                     return {"success": False, "message": "사용자에 의해 취소됨", "cancelled": True}
             
             # 데이터베이스 저장
-            save_results = await self._save_to_database_incremental(normalized_data, incremental)
+            save_results = await self._save_to_database_incremental(normalized_data, incremental, heartbeat)
             
             logger.info(f"{config['name']} 개별 수집 완료: 신규 {save_results['new_count']}개, 업데이트 {save_results['updated_count']}개")
             
@@ -226,6 +236,7 @@ class CulturalHubExhibitionService:
                 "total_new": save_results['new_count'],
                 "total_updated": save_results['updated_count'],
                 "total_skipped": save_results['skipped_count'],
+                "total_unchanged": save_results['unchanged_count'],
                 "total_collected": len(normalized_data)
             }
             
@@ -238,15 +249,21 @@ class CulturalHubExhibitionService:
                 "api_key": api_key
             }
     
-    async def _save_to_database_incremental(self, integrated_data: List[Dict], incremental: bool = True) -> Dict[str, Any]:
-        """증분 모드로 데이터베이스에 저장 (중복 제거)"""
+    async def _save_to_database_incremental(self, integrated_data: List[Dict], incremental: bool = True,
+                                            heartbeat: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        """증분 모드로 데이터베이스에 저장 (중복 제거, heartbeat는 행/단계마다 호출 - 간격 조절은 호출 측)"""
+        heartbeat = heartbeat or (lambda: None)
         save_stats = {
             'new_count': 0,
             'updated_count': 0,
             'skipped_count': 0,
+            'unchanged_count': 0,
             'api_details': {}
         }
         
+        # api_source별 (culture_code/title -> content_hash) 인덱스 - 변경 없는 레코드는 ORM 로딩 없이 스킵
+        hash_index: Dict[str, Dict[str, Dict]] = {}
+        
         # API 소스별로 데이터 그룹화
         data_by_source = {}
         source_field_debug = {}  # 디버깅용
@@ -289,7 +306,7 @@ class CulturalHubExhibitionService:
                 logger.info(f"  - 장소 관련: {first_item.get('장소', first_item.get('venue', first_item.get('place', '없음')))}")
                 logger.info(f"  - 기관 관련: {first_item.get('연계기관명', first_item.get('기관명', first_item.get('장소', '없음')))}")
             
-            source_stats = {'new': 0, 'updated': 0, 'skipped': 0}
+            source_stats = {'new': 0, 'updated': 0, 'skipped': 0, 'unchanged': 0}
             
             # 배치 내 중복 제거 - culture_code 기준
             seen_culture_codes = set()
@@ -335,14 +352,20 @@ class CulturalHubExhibitionService:
             
             logger.info(f"{api_source}: 배치 내 중복 제거 후 {len(unique_items)}개 (원본: {len(items)}개)")
             
-            for item_data in unique_items:
+            # 소스 배치 전체를 한 번에 정규화 (content_hash 포함)
+            normalized_items = self._normalize_cultural_batch(unique_items)
+            # 신규 레코드는 모아서 한 번에 INSERT
+            pending_rows: List[Dict[str, Any]] = []
+            
+            for normalized_data in normalized_items:
+                heartbeat()
                 try:
                     # 디버그: 처리 전 데이터 확인
-                    logger.info(f"처리할 데이터: title='{item_data.get('제목')}', api_source='{item_data.get('api_source')}'")
+                    logger.debug(f"처리할 데이터: title='{normalized_data.get('title')}', api_source='{normalized_data.get('api_source')}'")
                     
                     # 중복 검사 및 저장 (Institution 없이 직접 처리)
                     action = await self._process_exhibition_incremental(
-                        item_data, incremental
+                        normalized_data, incremental, hash_index, pending_rows
                     )
                     
                     if action == 'added':
@@ -354,10 +377,17 @@ class CulturalHubExhibitionService:
                     elif action == 'skipped':
                         source_stats['skipped'] += 1
                         save_stats['skipped_count'] += 1
+                    elif action == 'unchanged':
+                        # 콘텐츠 지문이 같은 레코드 - 쓰기 없이 스킵
+                        source_stats['skipped'] += 1
+                        source_stats['unchanged'] += 1
+                        save_stats['skipped_count'] += 1
+                        save_stats['unchanged_count'] += 1
                         
                 except Exception as e:
                     logger.error(f"데이터 처리 오류 ({api_source}): {str(e)}")
-                    # 트랜잭션 오류 시 롤백 후 재시작
+                    # 트랜잭션 오류 시 롤백 후 재시작 (롤백된 신규 객체가 남지 않도록 지문 인덱스도 초기화)
+                    hash_index.clear()
                     try:
                         self.db.rollback()
                         self.db.begin()
@@ -366,6 +396,23 @@ class CulturalHubExhibitionService:
                     source_stats['skipped'] += 1
                     save_stats['skipped_count'] += 1
             
+            if pending_rows:
+                # 이 소스의 일괄 INSERT만 savepoint로 감싸 실패해도 앞선 소스의 저장분은 유지
+                savepoint = self.db.begin_nested()
+                try:
+                    self.db.bulk_insert_mappings(CultureHub, pending_rows)
+                    savepoint.commit()
+                except Exception as e:
+                    logger.error(f"신규 데이터 일괄 저장 실패 ({api_source}): {str(e)}")
+                    savepoint.rollback()
+                    # 저장되지 않은 신규 행이 지문 인덱스에 남지 않도록 해당 소스만 다시 로딩하게 함
+                    for row_source in {(row.get('api_source') or '').strip() for row in pending_rows}:
+                        hash_index.pop(row_source, None)
+                    source_stats['new'] -= len(pending_rows)
+                    source_stats['skipped'] += len(pending_rows)
+                    save_stats['new_count'] -= len(pending_rows)
+                    save_stats['skipped_count'] += len(pending_rows)
+            
             # api_details에 success 필드 추가 (스킵된 데이터도 성공으로 처리)
             total_processed = source_stats['new'] + source_stats['updated'] + source_stats['skipped']
             save_stats['api_details'][api_source] = {
@@ -373,9 +420,11 @@ class CulturalHubExhibitionService:
                 'new_count': source_stats['new'],
                 'updated_count': source_stats['updated'],
                 'skipped_count': source_stats['skipped'],
+                'unchanged_count': source_stats['unchanged'],
+                'changed_count': source_stats['new'] + source_stats['updated'],  # 실제 쓰기가 발생한 레코드 수
                 'name': api_source
             }
-            logger.info(f"{api_source} 완료: 신규 {source_stats['new']}개, 업데이트 {source_stats['updated']}개, 스킵 {source_stats['skipped']}개")
+            logger.info(f"{api_source} 완료: 신규 {source_stats['new']}개, 업데이트 {source_stats['updated']}개, 스킵 {source_stats['skipped']}개 (변경 없음 {source_stats['unchanged']}개)")
         
         # 트랜잭션 커밋
         try:
@@ -386,223 +435,180 @@ class CulturalHubExhibitionService:
             logger.error(f"데이터베이스 저장 실패: {str(e)}")
             raise
         
+        # 새로 저장/변경된 행만 소스 간 중복 판별 (실패해도 수집 결과는 유지)
+        heartbeat()
+        resolution = {}
+        try:
+            resolution = EventResolver(self.db).resolve_pending()
+            save_stats['resolution'] = resolution
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"소스 간 중복 판별 실패: {str(e)}")
+        
+        # 중복 판별에서 정해진 장소 키로 새 행사 좌표 연결
+        heartbeat()
+        try:
+            geocoding = geocode_pending_events(self.db)
+            self.db.commit()
+            save_stats['geocoding'] = geocoding
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"문화행사 좌표 연결 실패: {str(e)}")
+        
+        # 진행 중 행사 뷰 갱신 (바뀐 행이 있을 때만)
+        if save_stats['new_count'] or save_stats['updated_count'] or resolution.get('changed'):
+            heartbeat()
+            refresh_active_events(self.db)
+        
         return save_stats
     
     async def _process_exhibition_incremental(
         self, 
-        data: Dict, 
-        incremental: bool = True
+        normalized_data: Dict, 
+        incremental: bool = True,
+        hash_index: Optional[Dict[str, Dict]] = None,
+        pending_rows: Optional[List[Dict[str, Any]]] = None
     ) -> str:
-        """전시 데이터 증분 처리 (중복 검사 및 업데이트)"""
+        """정규화된 전시 데이터 증분 처리 (콘텐츠 지문 기반 중복 검사 및 업데이트)
+        
+        신규 레코드는 pending_rows에 모아 두고 호출자가 일괄 INSERT한다
+        (pending_rows가 없으면 바로 세션에 추가)
+        """
         
         # 현재 시간 설정
         current_time = datetime.now()
         
-        # 데이터 정규화
-        normalized_data = self._normalize_cultural_data(data)
-        
         # 중복 검사 기준 설정
         title = normalized_data.get('title', '').strip()
-        venue = normalized_data.get('venue', '').strip()
+        venue = (normalized_data.get('venue') or '').strip()
         source = normalized_data.get('api_source', '').strip()  # api_source 사용
         
-        logger.info(f"중복 검사 중: title='{title}', venue='{venue}', source='{source}'")
+        logger.debug(f"중복 검사 중: title='{title}', venue='{venue}', source='{source}'")
         
         if not title:
             logger.info("제목이 없어서 스킵")
             return 'skipped'  # 제목이 없으면 스킵
         
-        # 중복 검사 - culture_code 우선 검사 (더 정확함)
-        culture_code = normalized_data.get('culture_code')
-        existing_exhibition = None
+        # 소스별 지문 인덱스 (소스당 한 번만 조회)
+        if hash_index is None:
+            hash_index = {}
+        source_index = hash_index.get(source)
+        if source_index is None:
+            source_index = self._load_source_hash_index(source)
+            hash_index[source] = source_index
         
-        # 1차 검사: Culture Code가 있으면 우선 검사 (가장 정확)
-        if culture_code:
-            existing_exhibition = self.db.query(CultureHub).filter(
-                CultureHub.culture_code == culture_code,
-                CultureHub.api_source == source
-            ).first()
-        if existing_exhibition:
-                logger.debug(f"Culture Code로 기존 데이터 발견: {culture_code}")
+        culture_code = normalized_data.get('culture_code')
+        content_hash = normalized_data.get('content_hash')
         
-        # 2차 검사: Culture Code가 없거나 발견되지 않은 경우만 Title로 검사
-        if not existing_exhibition:
-            existing_exhibition = self.db.query(CultureHub).filter(
-                CultureHub.api_source == source,  # API 소스 필수
-                CultureHub.title == title
-            ).first()
-        if existing_exhibition:
-                logger.debug(f"Title로 기존 데이터 발견: {title}")
+        # 1차 검사: Culture Code (가장 정확), 2차 검사: Title
+        known = source_index['by_code'].get(culture_code) if culture_code else None
+        if not known:
+            known = source_index['by_title'].get(title)
         
         # 중복 데이터 처리
-        if existing_exhibition:
-            if incremental and self._needs_update(existing_exhibition, normalized_data):
-                # 업데이트 필요한 경우
-                for key, value in normalized_data.items():
-                    if hasattr(existing_exhibition, key):
-                        setattr(existing_exhibition, key, value)
-                
-                existing_exhibition.updated_at = current_time
-                existing_exhibition.collected_at = current_time
-                
-                logger.info(f"기존 데이터 업데이트: {title}")
+        if known:
+            if not incremental:
+                logger.debug(f"증분 모드가 아니므로 스킵: {title}")
+                return 'skipped'
+            
+            if not self._needs_update(known['content_hash'], normalized_data):
+                # 콘텐츠 지문이 같으면 ORM 객체를 로딩하지 않고 스킵
+                logger.debug(f"변경 없음: {title}")
+                return 'unchanged'
+            
+            known['content_hash'] = content_hash
+            
+            # 같은 배치에서 아직 INSERT 전인 신규 행이면 행 데이터만 갱신
+            if known.get('row') is not None:
+                known['row'].update(normalized_data)
+                known['row']['updated_at'] = current_time
                 return 'updated'
-            else:
-                # 업데이트 불필요한 경우
-                logger.debug(f"업데이트 불필요: {title}")
+            
+            existing_exhibition = known['obj'] or self.db.get(CultureHub, known['id'])
+            if not existing_exhibition:
                 return 'skipped'
+            
+            venue_changed = 'venue' in normalized_data and normalized_data['venue'] != existing_exhibition.venue
+            
+            for key, value in normalized_data.items():
+                if hasattr(existing_exhibition, key):
+                    setattr(existing_exhibition, key, value)
+            
+            if venue_changed:
+                # 장소가 바뀌면 이전 좌표를 지워 다음 좌표 연결(geohash IS NULL 대상)에서 다시 찾게 함
+                existing_exhibition.latitude = None
+                existing_exhibition.longitude = None
+                existing_exhibition.geohash = None
+            
+            existing_exhibition.updated_at = current_time
+            existing_exhibition.collected_at = current_time
+            # 내용이 바뀌었으므로 소스 간 중복 판별을 다시 하도록 표시
+            existing_exhibition.canonical_id = None
+            
+            logger.info(f"기존 데이터 업데이트: {title}")
+            return 'updated'
         
         # 새 데이터 생성
         try:
-            # CultureHub 객체 생성
-            new_exhibition = CultureHub(
-                **normalized_data,
+            row = dict(
+                normalized_data,
                 collected_at=current_time,
                 created_at=current_time,
                 updated_at=current_time
             )
             
-            self.db.add(new_exhibition)
-            logger.info(f"새 데이터 추가: {title}")
+            if pending_rows is not None:
+                pending_rows.append(row)
+                entry = {'id': None, 'content_hash': content_hash, 'obj': None, 'row': row}
+            else:
+                new_exhibition = CultureHub(**row)
+                self.db.add(new_exhibition)
+                entry = {'id': None, 'content_hash': content_hash, 'obj': new_exhibition, 'row': None}
+            
+            # 같은 배치에서 다시 만나면 flush 없이 찾을 수 있도록 인덱스에 등록
+            if culture_code:
+                source_index['by_code'][culture_code] = entry
+            source_index['by_title'].setdefault(title, entry)
+            
+            logger.debug(f"새 데이터 추가: {title}")
             return 'added'
             
         except Exception as e:
             logger.error(f"데이터 생성 실패: {title} - {str(e)}")
             return 'error'
     
-    def _needs_update(self, existing: CultureHub, new_data: Dict) -> bool:
-        """업데이트 필요 여부 판단"""
-        # 주요 필드 변경 검사 - 간소화된 모델의 중요한 정보 필드
-        key_fields = [
-            # 기본 정보
-            'title', 'description',
-            # 기간 정보
-            'start_date', 'end_date', 'period',
-            # 장소 정보
-            'venue',
-            # 카테고리
-            'category',
-            # 참여자 정보
-            'artist',
-            # 요금 정보
-            'price',
-            # 웹사이트/URL
-            'website',
-            # 이미지
-            'image_url'
-        ]
+    def _load_source_hash_index(self, source: str) -> Dict[str, Dict]:
+        """소스의 기존 레코드 지문 인덱스 로딩 (ORM 객체 대신 컬럼만 조회)"""
+        rows = self.db.query(
+            CultureHub.id,
+            CultureHub.culture_code,
+            CultureHub.title,
+            CultureHub.content_hash
+        ).filter(CultureHub.api_source == source).all()
         
-        for field in key_fields:
-            new_value = new_data.get(field)
-            existing_value = getattr(existing, field, None)
-            
-            # 새로운 값이 있고 기존 값과 다르면 업데이트 필요
-            if new_value and new_value != existing_value:
-                return True
+        by_code = {}
+        by_title = {}
+        for row_id, culture_code, title, content_hash in rows:
+            entry = {'id': row_id, 'content_hash': content_hash, 'obj': None, 'row': None}
+            if culture_code:
+                by_code.setdefault(culture_code, entry)
+            if title:
+                by_title.setdefault(title, entry)
         
-        # 마지막 수집 시간이 24시간 이상 지났으면 업데이트
-        if existing.collected_at:
-            try:
-                # timezone 문제 해결
-                current_time = datetime.now()
-                if hasattr(existing.collected_at, 'tzinfo') and existing.collected_at.tzinfo is not None:
-                    # collected_at이 timezone-aware인 경우
-                    from datetime import timezone
-                    current_time = current_time.replace(tzinfo=timezone.utc)
-                    # collected_at을 UTC로 변환
-                    collected_at_utc = existing.collected_at.astimezone(timezone.utc).replace(tzinfo=None)
-                    current_time = current_time.replace(tzinfo=None)
-                    time_diff = current_time - collected_at_utc
-                else:
-                    # collected_at이 timezone-naive인 경우
-                    time_diff = current_time - existing.collected_at
-                
-                if time_diff.total_seconds() > 86400:  # 24시간
-                    return True
-            except Exception as e:
-                logger.warning(f"날짜 비교 중 오류 발생: {e}, 업데이트 진행")
-                return True
-        
-        return False
+        logger.info(f"{source}: 기존 지문 {len(rows)}개 로딩")
+        return {'by_code': by_code, 'by_title': by_title}
     
-    def _normalize_cultural_data(self, data: Dict) -> Dict[str, Any]:
-        """CulturalHub 데이터 정규화"""
-        normalized = {}
-        
-        # 기본 필드 매핑
-        field_mapping = {
-            'title': ['제목', 'title', 'subject'],
-            'subtitle': ['부제목', 'subtitle', 'sub_title'],
-            'description': ['소개설명', 'description', 'content'],
-            'venue': ['장소', 'venue', 'place'],
-            'start_date': ['시작일', 'start_date'],
-            'end_date': ['종료일', 'end_date'],
-            'period': ['기간', 'period'],
-            'time': ['시간', 'time_info', 'hour'],
-            'price': ['관람료할인정보', 'price', 'pay'],
-            'contact': ['문의', 'contact', 'tel'],
-            'website': ['홈페이지주소', 'website', 'homepage'],
-            'image_url': ['이미지주소', 'image_url', 'cover'],
-            'category': ['장르', 'category', 'event_gubun'],
-            'genre': ['분류', 'genre', 'classification'],
-            'artist': ['작가', 'artist', 'author'],
-            'creator': ['작가', 'creator', 'artist_name'],
-            'host': ['주최', 'organizer', 'host', '수집처'],
-            'culture_code': ['전시ID', 'external_id', 'event_seq', 'LOCAL_ID', 'I_ID', 'rowid', 'seq']
-        }
-        
-        for target_field, source_fields in field_mapping.items():
-            for source_field in source_fields:
-                if source_field in data and data[source_field]:
-                    value = data[source_field]
-                    
-                    # 날짜 필드 특별 처리
-                    if target_field in ['start_date', 'end_date'] and isinstance(value, str):
-                        try:
-                            # 다양한 날짜 형식 처리
-                            value = value.replace('.', '-').replace('/', '-')
-                            if len(value) >= 10:
-                                normalized[target_field] = datetime.strptime(value[:10], "%Y-%m-%d").date()
-                        except ValueError:
-                            normalized[target_field] = None
-                    else:
-                        # 문자열로 저장 (길이 제한 적용)
-                        if value:
-                            value_str = str(value).strip()
-                            # 필드별 최대 길이 제한
-                            max_lengths = {
-                                'title': 200,
-                                'subtitle': 200,
-                                'venue': 200,
-                                'category': 100,
-                                'genre': 100,
-                                'artist': 200,
-                                'creator': 200,
-                                'host': 200,
-                                'contact': 100,
-                                'website': 500,
-                                'image_url': 500,
-                                'url': 500,
-                                'price': 100,
-                                'address': 200,
-                                'phone': 50,
-                                'time': 100,
-                                'period': 100,
-                                'audience': 100,
-                                'status': 50,
-                                'keywords': 200,
-                                'charge': 100,
-                                'cover': 500
-                            }
-                            max_len = max_lengths.get(target_field, 200)
-                            if len(value_str) > max_len:
-                                logger.warning(f"필드 '{target_field}' 값이 {max_len}자를 초과하여 잘림: {value_str[:50]}...")
-                                value_str = value_str[:max_len]
-                            normalized[target_field] = value_str
-                        else:
-                            normalized[target_field] = None
-                    break
-        
+    def _needs_update(self, existing_hash: Optional[str], new_data: Dict) -> bool:
+        """업데이트 필요 여부 판단 - 콘텐츠 지문 비교 (지문이 없는 기존 행은 한 번 갱신)"""
+        return existing_hash != new_data.get('content_hash')
+    
+    def _normalize_cultural_batch(self, items: List[Dict]) -> List[Dict[str, Any]]:
+        """CulturalHub 데이터 일괄 정규화 (공통 필드 매핑은 컬럼 단위, 기관별 보정은 레코드 단위)"""
+        mapped = map_culture_hub_fields(items)
+        return [self._finish_normalization(normalized, data) for data, normalized in zip(items, mapped)]
+    
+    def _finish_normalization(self, normalized: Dict[str, Any], data: Dict) -> Dict[str, Any]:
+        """공통 매핑이 끝난 레코드의 기관별 보정, 모델 필드 정리, 콘텐츠 지문 계산"""
         # 필수 필드 기본값 설정
         if not normalized.get('title'):
             normalized['title'] = normalized.get('venue', '제목 없음')
@@ -1194,7 +1200,7 @@ class CulturalHubExhibitionService:
         model_fields = {
             'title', 'description', 'start_date', 'end_date', 'period',
             'venue', 'category', 'artist', 'price', 'website', 'image_url',
-            'api_source', 'culture_code', 'collected_at', 'is_active', 'created_at', 'updated_at'
+            'api_source', 'culture_code', 'content_hash', 'collected_at', 'is_active', 'created_at', 'updated_at'
         }
         
         # 모델에 없는 필드 제거
@@ -1213,6 +1219,9 @@ class CulturalHubExhibitionService:
             normalized['culture_code'] = hashlib.md5(unique_string.encode()).hexdigest()[:16]
             logger.info(f"culture_code 자동 생성: {normalized['culture_code']} (from: {unique_string})")
         
+        # 콘텐츠 지문 - 정규화가 끝난 필드 기준으로 계산
+        normalized['content_hash'] = compute_content_hash(normalized)
+        
         logger.debug(f"정규화된 데이터: title='{normalized.get('title')}', api_source='{normalized.get('api_source')}', culture_code='{normalized.get('culture_code')}'")
         
         return normalized
@@ -0,0 +1,170 @@
+"""
+문화행사 날짜/기간 문자열 파서
+"2024.03.01", "2024년 3월 1일", "20240301", "2024.03.01 ~ 05.31", "2024년 3월", "상시" 등
+기관마다 다른 표기를 미리 컴파일한 정규식 하나로 훑어 시작일/종료일을 구한다
+같은 기간 문자열이 많으므로 결과는 LRU 캐시에 둔다
+"""
+
+import calendar
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+PARSE_CACHE_SIZE = 4096
+
+# 날짜 토큰 (앞에서부터 먼저 맞는 형식 사용)
+# - ymd: 2024.03.01 / 2024-3-1 / 2024/03/01 / 2024년 3월 1일
+# - compact: 20240301
+# - ym: 2024.03 / 2024년 3월 (일 없음 → 월 전체)
+# - md: 05.31 / 5월 31일 (연도는 앞 날짜에서 이어받음)
+DATE_TOKEN_PATTERN = re.compile(
+    r'(?P<ymd>(?<!\d)(?P<y1>\d{4})\s*(?:[.\-/]|년)\s*(?P<m1>\d{1,2})\s*(?:[.\-/]|월)\s*(?P<d1>\d{1,2})(?!\d)\s*일?)'
+    r'|(?P<compact>(?<!\d)(?P<y2>\d{4})(?P<m2>\d{2})(?P<d2>\d{2})(?!\d))'
+    r'|(?P<ym>(?<!\d)(?P<y3>\d{4})\s*(?:[.\-/]|년)\s*(?P<m3>\d{1,2})(?![\d:])\s*월?)'
+    r'|(?P<md>(?<![\d.:])(?P<m4>\d{1,2})\s*(?:[./]|월)\s*(?P<d4>\d{1,2})(?![\d:])\s*일?)'
+)
+
+# 기간이 정해지지 않은 상설/상시 행사
+PERMANENT_PATTERN = re.compile(r'상시|상설|연중|무기한')
+# 기간 구분자 ("시작 ~ 종료", "시작부터")
+RANGE_SEPARATOR_PATTERN = re.compile(r'[~∼〜]|부터|까지')
+# 기간 구분자 뒤에 시간만 있는 경우 ("2024-03-01 10:00 ~ 18:00" - 하루 행사)
+TIME_ONLY_PATTERN = re.compile(r'\s*(?:(?:오전|오후)\s*)?\d{1,2}\s*(?::\s*\d{2}|시(?:\s*\d{1,2}\s*분)?)\s*(?:까지)?\s*')
+
+
+class Period(NamedTuple):
+    start: Optional[date]
+    end: Optional[date]
+    permanent: bool = False
+
+
+EMPTY_PERIOD = Period(None, None)
+
+
+def _safe_date(year: int, month: int, day: int) -> Optional[date]:
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _month_range(year: int, month: int) -> Tuple[Optional[date], Optional[date]]:
+    if not 1 <= month <= 12:
+        return None, None
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _scan(text: str, limit: int = 2) -> List[Tuple[date, date, int, int]]:
+    """문자열 안의 날짜 토큰 → (범위 시작, 범위 끝, 토큰 시작 위치, 토큰 끝 위치) 목록
+
+    하루짜리 날짜는 범위 시작과 끝이 같다
+    """
+    found = []
+    last_year = None
+    for match in DATE_TOKEN_PATTERN.finditer(text):
+        if match.group('ymd'):
+            value = _safe_date(int(match.group('y1')), int(match.group('m1')), int(match.group('d1')))
+            span = (value, value)
+        elif match.group('compact'):
+            value = _safe_date(int(match.group('y2')), int(match.group('m2')), int(match.group('d2')))
+            span = (value, value)
+        elif match.group('ym'):
+            span = _month_range(int(match.group('y3')), int(match.group('m3')))
+        else:
+            # 연도 없는 월.일은 앞 날짜가 있을 때만 (시간/번호와 구분)
+            if last_year is None:
+                continue
+            value = _safe_date(last_year, int(match.group('m4')), int(match.group('d4')))
+            if value is not None and found and found[-1][0] and value < found[-1][0]:
+                # "2024.12.01 ~ 01.31" 처럼 해를 넘기는 기간
+                value = _safe_date(last_year + 1, value.month, value.day)
+            span = (value, value)
+
+        if span[0] is None:
+            continue
+        last_year = span[1].year
+        found.append((span[0], span[1], match.start(), match.end()))
+        if len(found) >= limit:
+            break
+    return found
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_text(text: str) -> Optional[date]:
+    found = _scan(text, limit=1)
+    return found[0][0] if found else None
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """단일 날짜 값 → date (해석할 수 없으면 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    return _parse_date_text(text)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_period_text(text: str) -> Period:
+    found = _scan(text)
+    permanent = bool(PERMANENT_PATTERN.search(text))
+    if not found:
+        return Period(None, None, True) if permanent else EMPTY_PERIOD
+
+    if len(found) > 1:
+        start, end = found[0][0], found[1][1]
+        if end < start:
+            end = None
+        return Period(start, end)
+
+    range_start, range_end, token_start, token_end = found[0]
+    if text[:token_start].strip() in ('~', '∼', '〜'):
+        # "~ 2024.05.31" - 종료일만 있음
+        return Period(None, range_end)
+    separator = RANGE_SEPARATOR_PATTERN.search(text, token_end)
+    if separator and not permanent and TIME_ONLY_PATTERN.fullmatch(text, separator.end()):
+        # "2024.03.01 10:00 ~ 18:00" - 구분자 뒤가 시간뿐이면 그날 하루
+        return Period(range_start, range_end)
+    if permanent or separator:
+        # "2024.03.01 ~", "2024.03.01 ~ 상시" - 종료일 미정
+        return Period(range_start, None, permanent)
+    return Period(range_start, range_end)
+
+
+def parse_period(value: Any) -> Period:
+    """기간 문자열 → Period(시작일, 종료일, 상시 여부)"""
+    if value is None:
+        return EMPTY_PERIOD
+    text = str(value).strip()
+    if not text:
+        return EMPTY_PERIOD
+    return _parse_period_text(text)
+
+
+def resolve_dates(start_value: Any, end_value: Any, period: Any) -> Tuple[Optional[date], Optional[date]]:
+    """시작일/종료일 필드를 우선 사용하고, 비어 있는 쪽은 기간 문자열에서 보완"""
+    start = parse_date(start_value)
+    end = parse_date(end_value)
+    if (start is None or end is None) and period:
+        parsed = parse_period(period)
+        start = start or parsed.start
+        end = end or parsed.end
+    if start is not None and end is not None and end < start:
+        end = None
+    return start, end
+
+
+def cache_info():
+    """파서 캐시 적중 통계 (백필/벤치마크 로그용)"""
+    return {'date': _parse_date_text.cache_info(), 'period': _parse_period_text.cache_info()}
+
+
+def clear_cache() -> None:
+    _parse_date_text.cache_clear()
+    _parse_period_text.cache_clear()
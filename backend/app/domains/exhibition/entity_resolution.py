@@ -0,0 +1,250 @@
+"""
+문화행사 소스 간 중복 판별 (entity resolution)
+같은 전시가 integrated_exhibition, sema, mmca 등 여러 소스로 들어오므로
+정규화한 장소(venue_key)와 겹치는 월 단위 기간으로 후보 블록을 나누고,
+블록 안에서만 정규화한 제목의 2-gram 유사도로 같은 행사인지 판단한다
+같은 행사 묶음에서 가장 작은 id를 대표(canonical) id로 쓴다
+
+증분 처리: 새로 들어오거나 바뀐 행(canonical_id IS NULL)의 venue_key 그룹만 다시 계산하므로
+전체 행 쌍을 비교하지 않는다 (장소가 바뀐 행은 떠나온 그룹도 다시 계산)
+"""
+
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.domains.exhibition.models import CultureHub
+
+logger = logging.getLogger(__name__)
+
+# 제목 2-gram Jaccard 유사도가 이 값 이상이면 같은 행사
+TITLE_SIMILARITY_THRESHOLD = 0.75
+# 짧은 제목이 긴 제목에 포함되는 경우 ("[특별전] 제목" ↔ "제목") 같은 행사로 보는 최소 길이
+TITLE_CONTAINMENT_MIN_LENGTH = 6
+# 기간이 아주 긴 상설전은 앞쪽 몇 달만 블록 키로 사용
+MAX_MONTH_BUCKETS = 24
+VENUE_KEY_LENGTH = 100
+RESOLVE_BATCH_SIZE = 500
+
+# 제목 앞뒤의 말머리/괄호 ("[기획전]", "(연장)", "<...>" 등)
+_BRACKET_PATTERN = re.compile(r'[\[\(<〈《「『【][^\]\)>〉》」』】]*[\]\)>〉》」』】]')
+_NON_WORD_PATTERN = re.compile(r'[^0-9a-z가-힣]+')
+# 장소 뒤의 층/호실/전시실 표기는 소스마다 달라서 블록 키에서 제외
+_VENUE_DETAIL_PATTERN = re.compile(r'\s*(\d+\s*(층|호|관)|[a-z]?\d*\s*전시실|제\s*\d+\s*전시실).*$')
+
+
+def _fold(text: str) -> str:
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """비교용 제목 (말머리/괄호/기호/공백 제거)"""
+    if not title:
+        return ''
+    text = _fold(title)
+    stripped = _BRACKET_PATTERN.sub(' ', text)
+    # 괄호를 지우고 남는 게 없으면 괄호 안 내용이 제목
+    if _NON_WORD_PATTERN.sub('', stripped):
+        text = stripped
+    return _NON_WORD_PATTERN.sub('', text)
+
+
+def venue_key(venue: Optional[str]) -> str:
+    """블록 키용 장소 (괄호/층·전시실 표기/기호/공백 제거)"""
+    if not venue:
+        return ''
+    text = _BRACKET_PATTERN.sub(' ', _fold(venue))
+    text = _VENUE_DETAIL_PATTERN.sub('', text)
+    return _NON_WORD_PATTERN.sub('', text)[:VENUE_KEY_LENGTH]
+
+
+def title_shingles(normalized_title: str) -> FrozenSet[str]:
+    if len(normalized_title) < 2:
+        return frozenset((normalized_title,)) if normalized_title else frozenset()
+    return frozenset(normalized_title[i:i + 2] for i in range(len(normalized_title) - 1))
+
+
+def titles_match(title_a: str, shingles_a: FrozenSet[str], title_b: str, shingles_b: FrozenSet[str]) -> bool:
+    if not title_a or not title_b:
+        return False
+    if title_a == title_b:
+        return True
+    shorter, longer = (title_a, title_b) if len(title_a) <= len(title_b) else (title_b, title_a)
+    if len(shorter) >= TITLE_CONTAINMENT_MIN_LENGTH and shorter in longer:
+        return True
+    union = len(shingles_a | shingles_b)
+    return bool(union) and len(shingles_a & shingles_b) / union >= TITLE_SIMILARITY_THRESHOLD
+
+
+def month_buckets(start: Optional[date], end: Optional[date]) -> List[Any]:
+    """기간이 걸친 월 목록 (기간이 겹치는 행사는 최소 한 달을 공유)"""
+    if start is None and end is None:
+        return ['undated']
+    start = start or end
+    end = end or start
+    if end < start:
+        end = start
+    buckets = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month) and len(buckets) < MAX_MONTH_BUCKETS:
+        buckets.append((year, month))
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return buckets
+
+
+def _periods_overlap(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    a_start, a_end = a.get('start_date'), a.get('end_date')
+    b_start, b_end = b.get('start_date'), b.get('end_date')
+    if not (a_start or a_end) or not (b_start or b_end):
+        return not (a_start or a_end) and not (b_start or b_end)
+    a_start, a_end = a_start or a_end, a_end or a_start
+    b_start, b_end = b_start or b_end, b_end or b_start
+    return a_start <= b_end and b_start <= a_end
+
+
+class _UnionFind:
+    def __init__(self, items: Iterable[int]):
+        self.parent = {item: item for item in items}
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # 작은 id가 루트 (대표 id)
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            self.parent[root_b] = root_a
+
+
+def cluster_events(records: Sequence[Dict[str, Any]]) -> Dict[int, int]:
+    """행사 레코드 목록 → {id: 대표 id}
+
+    records: id, api_source, title, venue, start_date, end_date
+    같은 소스끼리는 culture_code로 이미 구분되므로 서로 다른 소스 사이에서만 묶는다
+    """
+    union_find = _UnionFind(record['id'] for record in records)
+    blocks: Dict[Tuple[str, Any], List[int]] = defaultdict(list)
+    prepared = []
+    for index, record in enumerate(records):
+        key = record.get('venue_key')
+        if key is None:
+            key = venue_key(record.get('venue'))
+        title = normalize_title(record.get('title'))
+        prepared.append((title, title_shingles(title)))
+        if not key or not title:
+            continue
+        for bucket in month_buckets(record.get('start_date'), record.get('end_date')):
+            blocks[(key, bucket)].append(index)
+
+    compared: Set[Tuple[int, int]] = set()
+    for members in blocks.values():
+        for position, i in enumerate(members):
+            a = records[i]
+            for j in members[position + 1:]:
+                b = records[j]
+                if a.get('api_source') == b.get('api_source'):
+                    continue
+                pair = (i, j)
+                if pair in compared:
+                    continue
+                compared.add(pair)
+                if not _periods_overlap(a, b):
+                    continue
+                if titles_match(prepared[i][0], prepared[i][1], prepared[j][0], prepared[j][1]):
+                    union_find.union(a['id'], b['id'])
+
+    return {record['id']: union_find.find(record['id']) for record in records}
+
+
+class EventResolver:
+    """culture_hubs 증분 중복 판별 (대표 id/중복 표시 갱신)"""
+
+    def __init__(self, db: Session, batch_size: int = RESOLVE_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def _load_columns(self):
+        return (
+            CultureHub.id, CultureHub.api_source, CultureHub.title, CultureHub.venue,
+            CultureHub.start_date, CultureHub.end_date,
+            CultureHub.canonical_id, CultureHub.is_duplicate, CultureHub.venue_key
+        )
+
+    def resolve_pending(self) -> Dict[str, int]:
+        """canonical_id가 없는 행을 batch_size개씩 판별 (배치마다 커밋)"""
+        summary = {'resolved': 0, 'groups': 0, 'changed': 0, 'duplicates': 0}
+        while True:
+            pending = self.db.query(*self._load_columns()).filter(
+                CultureHub.canonical_id.is_(None)
+            ).order_by(CultureHub.id).limit(self.batch_size).all()
+            if not pending:
+                break
+            batch = self.resolve_rows([dict(row._mapping) for row in pending])
+            self.db.commit()
+            for key in summary:
+                summary[key] += batch[key]
+        if summary['resolved']:
+            logger.info(
+                f"중복 판별: {summary['resolved']}행 (장소 그룹 {summary['groups']}개), "
+                f"갱신 {summary['changed']}행, 중복 표시 {summary['duplicates']}행"
+            )
+        return summary
+
+    def resolve_rows(self, pending: List[Dict[str, Any]]) -> Dict[str, int]:
+        """대상 행이 속한 장소 그룹 전체를 다시 묶어 바뀐 행만 갱신 (커밋은 호출자가)"""
+        updates: Dict[int, Dict[str, Any]] = {}
+        keys: Set[str] = set()
+        for record in pending:
+            key = venue_key(record['venue'])
+            if key != (record['venue_key'] or ''):
+                updates[record['id']] = {'id': record['id'], 'venue_key': key or None}
+                # 장소를 옮긴 행을 대표로 가리키던 이전 그룹의 행도 다시 묶음
+                if record['venue_key']:
+                    keys.add(record['venue_key'])
+            record['venue_key'] = key
+            if key:
+                keys.add(key)
+
+        pending_ids = [record['id'] for record in pending]
+        group_rows: Dict[int, Dict[str, Any]] = {}
+        conditions = [CultureHub.canonical_id.in_(pending_ids)]
+        if keys:
+            conditions.append(CultureHub.venue_key.in_(keys))
+        for row in self.db.query(*self._load_columns()).filter(
+            or_(*conditions),
+            CultureHub.is_active == True
+        ):
+            group_rows[row.id] = dict(row._mapping)
+        # 이번 배치 값이 우선 (venue_key가 아직 저장 전인 행 포함)
+        for record in pending:
+            group_rows[record['id']] = record
+
+        canonical = cluster_events(list(group_rows.values()))
+        duplicates = 0
+        for row_id, canonical_id in canonical.items():
+            record = group_rows[row_id]
+            is_duplicate = canonical_id != row_id
+            duplicates += is_duplicate
+            if record['canonical_id'] != canonical_id or bool(record['is_duplicate']) != is_duplicate:
+                update = updates.setdefault(row_id, {'id': row_id})
+                update['canonical_id'] = canonical_id
+                update['is_duplicate'] = is_duplicate
+
+        if updates:
+            self.db.bulk_update_mappings(CultureHub, list(updates.values()))
+        return {'resolved': len(pending), 'groups': len(keys), 'changed': len(updates), 'duplicates': duplicates}
@@ -3,19 +3,12 @@
 """
 
 import os
+import re
 import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
-# PDF 처리
-try:
-    import PyPDF2
-    PDF_PROCESSING_AVAILABLE = True
-except ImportError:
-    PDF_PROCESSING_AVAILABLE = False
-    PyPDF2 = None
-
 # AI
 try:
     from openai import OpenAI
@@ -28,36 +21,15 @@ except ImportError:
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.domains.exhibition.models import SmartFile
+from app.domains.exhibition.page_store import SmartFilePageStore, preview_text
+from app.domains.exhibition.pdf_extractor import ExtractionError, extract_pdf_pages, open_document
+from app.domains.exhibition.text_chunker import chunk_texts
 
-# 텍스트 분할을 위한 유틸리티
-def split_text_into_chunks(text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
-    """텍스트를 청크로 분할"""
-    if len(text) <= chunk_size:
-        return [text]
-    
-    chunks = []
-    start = 0
-    while start < len(text):
-        end = start + chunk_size
-        
-        # 문장 경계에서 자르기 시도
-        if end < len(text):
-            last_sentence = text[start:end].rfind('.')
-            last_newline = text[start:end].rfind('\n')
-            if last_sentence > start + chunk_size // 2:
-                end = start + last_sentence + 1
-            elif last_newline > start + chunk_size // 2:
-                end = start + last_newline + 1
-        
-        chunk = text[start:end].strip()
-        if chunk:
-            chunks.append(chunk)
-        
-        start = end - overlap
-        if start >= len(text):
-            break
-    
-    return chunks
+# 추출 텍스트 정제용 패턴
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+MULTI_SPACE_PATTERN = re.compile(r' +')
+PAGE_NUMBER_LINE_PATTERN = re.compile(r'\n\d+\s*\n')
+PAGE_NUMBER_ONLY_PATTERN = re.compile(r'^\d+\s*$', flags=re.MULTILINE)
 
 
 class FileProcessor:
@@ -91,18 +63,9 @@ class FileProcessor:
             smart_file.processing_status = "processing"
             self.db.commit()
             
-            # 텍스트 추출
+            # 텍스트 추출 (파일은 한 번만 받고, 전체 텍스트는 페이지별로 smart_file_pages에 저장)
             if smart_file.file_type in ['pdf', 'institution_document']:
-                extracted_text = self._extract_text_from_file(smart_file.file_path)
-                smart_file.extracted_text = extracted_text[:5000] if extracted_text else None
-                
-                # PDF 페이지 수 계산
-                if smart_file.file_path.lower().endswith('.pdf'):
-                    try:
-                        page_count = self._get_pdf_page_count(smart_file.file_path)
-                        smart_file.total_pages = page_count
-                    except:
-                        pass
+                self._extract_document(smart_file)
             
             # AI 요약 및 분류 (OpenAI 사용 가능한 경우)
             if self.client and smart_file.extracted_text:
@@ -123,7 +86,7 @@ class FileProcessor:
             # 임베딩 생성
             if self.client and smart_file.extracted_text and len(smart_file.extracted_text) > 50:
                 try:
-                    embedding_count = self._create_document_embeddings_sync(smart_file.id, smart_file.extracted_text)
+                    embedding_count = self._create_document_embeddings_sync(smart_file.id)
                     print(f"임베딩 생성 완료: {embedding_count}개")
                 except Exception as e:
                     print(f"임베딩 생성 실패: {e}")
@@ -146,140 +109,38 @@ class FileProcessor:
             except:
                 pass
     
-    def _extract_text_from_file(self, file_path: str) -> str:
-        """파일에서 텍스트 추출"""
+    def _extract_document(self, smart_file: SmartFile) -> Optional[Dict[str, Any]]:
+        """파일에서 페이지별 텍스트 추출 후 저장 (S3 URL/로컬 파일 공통)"""
+        page_store = SmartFilePageStore(self.db)
         try:
-            # S3 URL인지 확인
-            if file_path.startswith('https://'):
-                return self._extract_text_from_s3_url(file_path)
-            
-            # 로컬 파일 처리 (기존 로직)
-            if not os.path.exists(file_path):
-                return "파일을 찾을 수 없습니다."
-            
-            if file_path.lower().endswith('.pdf'):
-                return self._extract_pdf_text_simple(file_path)
-            elif file_path.lower().endswith(('.txt', '.md')):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            else:
-                return "지원하지 않는 파일 형식입니다."
+            with open_document(smart_file.file_path) as source:
+                if source.is_pdf:
+                    # 같은 파일 재처리면 저장된 페이지로 캐시를 채워 다시 파싱하지 않음
+                    if smart_file.content_hash == source.digest:
+                        page_store.seed_cache(smart_file.id, source.digest)
+                    extraction = extract_pdf_pages(source)
+                    pages, method = extraction.pages, extraction.method
+                    smart_file.total_pages = extraction.page_count
+                    print(f"PDF 텍스트 추출 완료: {extraction.page_count}페이지 "
+                          f"({extraction.method}, 캐시 {extraction.cached_pages}페이지)")
+                elif source.is_text:
+                    pages, method = [source.read_text()], 'text'
+                else:
+                    smart_file.extracted_text = "지원하지 않는 파일 형식입니다."
+                    return None
                 
-        except Exception as e:
-            return f"텍스트 추출 실패: {str(e)}"
-    
-    def _extract_text_from_s3_url(self, s3_url: str) -> str:
-        """S3 URL에서 파일을 다운로드하여 텍스트 추출"""
-        import tempfile
-        import requests
-        
-        try:
-            # S3 URL에서 파일 다운로드
-            response = requests.get(s3_url, timeout=30)
-            response.raise_for_status()
-            
-            # 파일 확장자 추출
-            if '.pdf' in s3_url.lower():
-                file_ext = '.pdf'
-            elif '.txt' in s3_url.lower():
-                file_ext = '.txt'
-            elif '.md' in s3_url.lower():
-                file_ext = '.md'
-            else:
-                return "지원하지 않는 파일 형식입니다."
-            
-            # 임시 파일에 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as temp_file:
-                temp_file.write(response.content)
-                temp_file_path = temp_file.name
-            
-            try:
-                # 임시 파일에서 텍스트 추출
-                if file_ext == '.pdf':
-                    text = self._extract_pdf_text_simple(temp_file_path)
-                else:  # .txt, .md
-                    with open(temp_file_path, 'r', encoding='utf-8') as f:
-                        text = f.read()
+                stats = page_store.save_pages(smart_file.id, pages, method)
+                smart_file.content_hash = source.digest
+                smart_file.extracted_text = preview_text(pages) or "텍스트를 추출할 수 없습니다."
+                print(f"페이지 저장: 신규 {stats['inserted']}, 변경 {stats['updated']}, "
+                      f"유지 {stats['unchanged']}, 삭제 {stats['deleted']}")
+                return stats
                 
-                return text
-            finally:
-                # 임시 파일 정리
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
-                    
-        except Exception as e:
-            return f"S3 파일 처리 실패: {str(e)}"
-    
-    def _extract_pdf_text_simple(self, file_path: str) -> str:
-        """PDF에서 간단한 텍스트 추출"""
-        try:
-            if not PDF_PROCESSING_AVAILABLE:
-                return "PDF 처리 라이브러리가 설치되지 않았습니다."
-            
-            text = ""
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num, page in enumerate(pdf_reader.pages):
-                    if page_num >= 20:  # 최대 20페이지만 처리
-                        break
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            
-            return text.strip() if text.strip() else "텍스트를 추출할 수 없습니다."
-            
-        except Exception as e:
-            return f"PDF 텍스트 추출 실패: {str(e)}"
-    
-    def _get_pdf_page_count(self, file_path: str) -> int:
-        """PDF 페이지 수 계산"""
-        try:
-            if not PDF_PROCESSING_AVAILABLE:
-                return 0
-            
-            # S3 URL인지 확인
-            if file_path.startswith('https://'):
-                return self._get_pdf_page_count_from_s3(file_path)
-            
-            # 로컬 파일 처리
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                return len(pdf_reader.pages)
-        except:
-            return 0
-    
-    def _get_pdf_page_count_from_s3(self, s3_url: str) -> int:
-        """S3 URL에서 PDF 페이지 수 계산"""
-        import tempfile
-        import requests
-        
-        try:
-            # S3 URL에서 파일 다운로드
-            response = requests.get(s3_url, timeout=30)
-            response.raise_for_status()
-            
-            # 임시 파일에 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-                temp_file.write(response.content)
-                temp_file_path = temp_file.name
-            
-            try:
-                # 임시 파일에서 페이지 수 계산
-                with open(temp_file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    return len(pdf_reader.pages)
-            finally:
-                # 임시 파일 정리
-                try:
-                    os.unlink(temp_file_path)
-                except:
-                    pass
-                    
+        except ExtractionError as e:
+            smart_file.extracted_text = str(e)
         except Exception as e:
-            print(f"S3 PDF 페이지 수 계산 실패: {e}")
-            return 0
+            smart_file.extracted_text = f"텍스트 추출 실패: {str(e)}"
+        return None
     
     def _classify_document_simple(self, text: str, filename: str) -> dict:
         """간단한 문서 분류"""
@@ -326,11 +187,12 @@ class FileProcessor:
                 "confidence": 0.5
             }
     
-    def _create_document_embeddings_sync(self, file_id: int, text_content: str) -> int:
+    def _create_document_embeddings_sync(self, file_id: int) -> int:
         """문서 임베딩 생성 (동기 버전)"""
         try:
-            # 텍스트를 청크로 분할
-            chunks = split_text_into_chunks(text_content, chunk_size=1000, overlap=200)
+            # 저장된 페이지를 차례로 읽으며 청크로 분할 (전체 텍스트를 합치지 않음)
+            page_texts = (page_text for _, page_text in SmartFilePageStore(self.db).iter_page_texts(file_id))
+            chunks = chunk_texts(page_texts)
             
             embeddings_created = 0
             
@@ -380,7 +242,7 @@ class EmbeddingProcessor:
             
             # PDF 텍스트 추출
             if smart_file.file_type == 'pdf':
-                text_chunks = await self._extract_pdf_text_chunks(smart_file.file_path)
+                text_chunks = await self._extract_pdf_text_chunks(smart_file, db)
             else:
                 print(f"{smart_file.file_type} 파일은 아직 지원되지 않음")
                 return False
@@ -414,110 +276,56 @@ class EmbeddingProcessor:
             db.rollback()
             return False
     
-    async def _extract_pdf_text_chunks(self, file_path: str) -> List[str]:
-        """PDF에서 텍스트를 추출하고 청크로 분할"""
+    async def _extract_pdf_text_chunks(self, smart_file, db) -> List[str]:
+        """저장된 페이지 텍스트를 읽어 청크로 분할 (페이지가 없을 때만 PDF 파싱)"""
+        filename = Path(smart_file.filename or smart_file.file_path).stem
         try:
-            print(f"PDF 텍스트 추출 시작: {Path(file_path).name}")
+            page_store = SmartFilePageStore(db)
+            if page_store.page_count(smart_file.id) == 0:
+                print(f"저장된 페이지 없음, PDF 텍스트 추출: {smart_file.filename}")
+                with open_document(smart_file.file_path) as source:
+                    extraction = extract_pdf_pages(source)
+                    page_store.save_pages(smart_file.id, extraction.pages, extraction.method)
+                    smart_file.content_hash = source.digest
+                    smart_file.total_pages = extraction.page_count
+                    db.commit()
+            
+            # 페이지 표시를 붙여 정제한 텍스트를 차례로 청커에 전달
+            page_texts = (
+                f"[페이지 {page_number}]\n{self._clean_extracted_text(page_text)}"
+                for page_number, page_text in page_store.iter_page_texts(smart_file.id)
+                if page_text.strip()
+            )
             
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                total_pages = len(pdf_reader.pages)
-                
-                print(f"총 페이지: {total_pages}")
-                
-                # 샘플링 (처음 10페이지만)
-                sample_pages = min(10, total_pages)
-                sample_text = ""
-                
-                for page_num in range(sample_pages):
-                    page_text = pdf_reader.pages[page_num].extract_text().strip()
-                    if page_text:
-                        sample_text += f"\n[페이지 {page_num + 1}]\n{page_text}\n"
-                
-                print(f"샘플 추출 텍스트: {len(sample_text)}자")
-                
-                if sample_text and len(sample_text) > 100:
-                    # 텍스트 정제 및 청크 분할
-                    clean_text = self._clean_extracted_text(sample_text)
-                    chunks = self._smart_text_chunking(clean_text, chunk_size=1200, overlap=300)
-                    
-                    # 의미있는 청크만 필터링
-                    meaningful_chunks = []
-                    for chunk in chunks:
-                        if self._is_meaningful_chunk(chunk):
-                            meaningful_chunks.append(chunk)
-                    
-                    print(f"최종 의미있는 청크: {len(meaningful_chunks)}개")
-                    return meaningful_chunks
-                else:
-                    print("텍스트 추출 실패, 기본 컨텍스트 생성")
-                    filename = Path(file_path).stem
-                    return [f"문서: {filename} - PDF 파일 ({total_pages}페이지)"]
+            # 의미있는 청크만 필터링
+            meaningful_chunks = [
+                chunk for chunk in chunk_texts(page_texts, max_tokens=600, overlap_tokens=150)
+                if self._is_meaningful_chunk(chunk)
+            ]
+            
+            if meaningful_chunks:
+                print(f"최종 의미있는 청크: {len(meaningful_chunks)}개")
+                return meaningful_chunks
+            else:
+                print("텍스트 추출 실패, 기본 컨텍스트 생성")
+                return [f"문서: {filename} - PDF 파일 ({smart_file.total_pages or 0}페이지)"]
             
         except Exception as e:
             print(f"PDF 텍스트 추출 실패: {str(e)}")
-            filename = Path(file_path).stem
             return [f"문서: {filename} - 텍스트 추출에 실패했지만 임베딩을 위한 기본 내용입니다."]
     
     def _clean_extracted_text(self, text: str) -> str:
         """추출된 텍스트 정제"""
-        import re
-        
         # 연속된 공백 및 줄바꿈 정리
-        text = re.sub(r'\n\s*\n', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        text = BLANK_LINES_PATTERN.sub('\n\n', text)
+        text = MULTI_SPACE_PATTERN.sub(' ', text)
         
         # 페이지 번호만 있는 줄 제거
-        text = re.sub(r'\n\d+\s*\n', '\n', text)
-        text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
+        text = PAGE_NUMBER_LINE_PATTERN.sub('\n', text)
+        text = PAGE_NUMBER_ONLY_PATTERN.sub('', text)
         
         return text.strip()
     
-    def _smart_text_chunking(self, text: str, chunk_size: int = 1200, overlap: int = 300) -> List[str]:
-        """스마트한 텍스트 청킹"""
-        if len(text) <= chunk_size:
-            return [text]
-        
-        chunks = []
-        start = 0
-        
-        while start < len(text):
-            end = start + chunk_size
-            
-            if end >= len(text):
-                chunks.append(text[start:].strip())
-                break
-            
-            # 문장 경계에서 자르기 시도
-            chunk_text = text[start:end]
-            
-            # 문장 끝 찾기
-            sentence_ends = []
-            for i, char in enumerate(chunk_text):
-                if char in '.!?。':
-                    sentence_ends.append(start + i + 1)
-            
-            if sentence_ends:
-                ideal_end = start + chunk_size * 0.8
-                best_end = min(sentence_ends, key=lambda x: abs(x - ideal_end))
-                chunk = text[start:best_end].strip()
-            else:
-                words = chunk_text.split()
-                if len(words) > 10:
-                    chunk = ' '.join(words[:-3])
-                    end = start + len(chunk)
-                else:
-                    chunk = chunk_text
-            
-            if chunk.strip():
-                chunks.append(chunk.strip())
-            
-            start = end - overlap
-            if start >= len(text):
-                break
-        
-        return chunks
-    
     def _is_meaningful_chunk(self, chunk: str) -> bool:
         """청크가 의미있는 내용인지 판단"""
         chunk = chunk.strip()
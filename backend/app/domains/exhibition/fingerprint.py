@@ -0,0 +1,42 @@
+"""
+문화행사 레코드 콘텐츠 지문(content hash)
+정규화된 필드만으로 안정적인 해시를 만들어 변경 여부를 ORM 로딩 없이 판단한다
+"""
+
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Iterable
+
+# CultureHub 변경 감지 대상 필드 (순서 고정 - 바꾸면 모든 해시가 바뀜)
+CULTURE_HUB_HASH_FIELDS = (
+    'title', 'description',
+    'start_date', 'end_date', 'period',
+    'venue', 'category', 'artist', 'price',
+    'website', 'image_url',
+)
+
+# Exhibition 변경 감지 대상 필드
+EXHIBITION_HASH_FIELDS = (
+    'title', 'subtitle', 'description',
+    'start_date', 'end_date',
+    'venue', 'address', 'category', 'genre',
+    'artist', 'host', 'contact', 'price',
+    'website', 'image_url', 'keywords',
+)
+
+
+def _canonical_value(value: Any) -> str:
+    """해시 입력용 값 표준화 (None/공백 차이로 해시가 흔들리지 않도록)"""
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value).strip()
+
+
+def compute_content_hash(data: Dict[str, Any], fields: Iterable[str] = CULTURE_HUB_HASH_FIELDS) -> str:
+    """정규화된 데이터의 SHA-256 콘텐츠 지문 (64자 hex)"""
+    payload = [_canonical_value(data.get(field)) for field in fields]
+    encoded = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
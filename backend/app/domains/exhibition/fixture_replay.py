@@ -0,0 +1,228 @@
+"""
+문화기관 API 응답 녹화/재생 하네스
+실제 응답을 디스크에 녹화한 뒤, 지연/오류 주입이 가능한 로컬 대체 서버로 재생한다
+(속도 제한이 있는 16개 실서버를 호출하지 않고 수집 파이프라인을 측정/테스트하기 위함)
+"""
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = 'index.json'
+
+
+def canonical_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """URL + 파라미터를 쿼리 순서와 무관한 표준 형태로 변환"""
+    prepared = requests.Request('GET', url, params=params or {}).prepare().url
+    parts = urlsplit(prepared)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    base = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return f"{base}?{query}" if query else base
+
+
+def fixture_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    return hashlib.sha1(canonical_url(url, params).encode('utf-8')).hexdigest()
+
+
+class FixtureStore:
+    """녹화된 응답 저장소 (index.json + 응답 본문 파일)"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.index_path = self.directory / INDEX_FILE
+        self._lock = threading.Lock()
+        self.index: Dict[str, Dict[str, Any]] = {}
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text(encoding='utf-8'))
+
+    def save(self, url: str, params: Optional[Dict[str, Any]], response: requests.Response) -> str:
+        key = fixture_key(url, params)
+        body_file = f"{key}.body"
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / body_file).write_bytes(response.content)
+            self.index[key] = {
+                'url': canonical_url(url, params),
+                'status': response.status_code,
+                'content_type': response.headers.get('Content-Type', 'application/octet-stream'),
+                'encoding': response.encoding,
+                'body_file': body_file,
+                'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            self.index_path.write_text(json.dumps(self.index, ensure_ascii=False, indent=2), encoding='utf-8')
+        return key
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        meta = self.index.get(key)
+        if meta is None:
+            return None
+        return meta, (self.directory / meta['body_file']).read_bytes()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+
+class RecordingSession(requests.Session):
+    """실제 요청을 보내면서 GET 응답을 FixtureStore에 녹화하는 세션"""
+
+    def __init__(self, store: FixtureStore):
+        super().__init__()
+        self.store = store
+
+    def request(self, method, url, params=None, **kwargs):
+        response = super().request(method, url, params=params, **kwargs)
+        if method.upper() == 'GET':
+            self.store.save(url, params, response)
+        return response
+
+
+class ReplaySession(requests.Session):
+    """모든 요청을 로컬 재생 서버로 보내는 세션 (원래 scheme/host는 경로 앞에 붙임)"""
+
+    def __init__(self, replay_base_url: str):
+        super().__init__()
+        self.replay_base_url = replay_base_url.rstrip('/')
+
+    def request(self, method, url, params=None, **kwargs):
+        parts = urlsplit(url)
+        local_url = f"{self.replay_base_url}/{parts.scheme}/{parts.netloc}{parts.path}"
+        if parts.query:
+            local_url = f"{local_url}?{parts.query}"
+        return super().request(method, local_url, params=params, **kwargs)
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """/{scheme}/{host}/{path}?query 요청을 녹화된 응답으로 재생"""
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        segments = parts.path.lstrip('/').split('/', 2)
+        if len(segments) < 2:
+            self._send(400, b'bad replay path', 'text/plain')
+            return
+
+        scheme, host = segments[0], segments[1]
+        path = '/' + segments[2] if len(segments) > 2 else ''
+        original_url = f"{scheme}://{host}{path}"
+        params = parse_qsl(parts.query, keep_blank_values=True)
+
+        # 지연도 seed를 따르도록 서버 전용 난수 생성기 사용
+        if server.latency or server.jitter:
+            time.sleep(server.latency + server.rng.uniform(0, server.jitter))
+
+        # 오류 주입 (재시도/실패 처리 경로 측정용)
+        if server.error_rate and server.rng.random() < server.error_rate:
+            server.injected_errors += 1
+            self._send(server.error_status, b'injected error', 'text/plain')
+            return
+
+        fixture = server.store.load(fixture_key(original_url, params))
+        if fixture is None:
+            server.misses += 1
+            logger.warning(f"녹화되지 않은 요청: {canonical_url(original_url, params)}")
+            self._send(404, b'fixture not found', 'text/plain')
+            return
+
+        meta, body = fixture
+        server.hits += 1
+        self._send(meta['status'], body, meta['content_type'])
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug("replay: " + format % args)
+
+
+class ReplayServer:
+    """녹화된 응답을 제공하는 로컬 대체 서버 (백그라운드 스레드)
+
+    latency: 요청당 지연(초), jitter: 추가 랜덤 지연 상한(초)
+    error_rate: 오류 응답 비율(0~1), error_status: 주입할 HTTP 상태 코드
+    """
+
+    def __init__(self, store: FixtureStore, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: Optional[int] = None):
+        self.httpd = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = store
+        self.httpd.latency = latency
+        self.httpd.jitter = jitter
+        self.httpd.error_rate = error_rate
+        self.httpd.error_status = error_status
+        self.httpd.rng = random.Random(seed)
+        self.httpd.hits = 0
+        self.httpd.misses = 0
+        self.httpd.injected_errors = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.httpd.hits,
+            'misses': self.httpd.misses,
+            'injected_errors': self.httpd.injected_errors,
+        }
+
+    def start(self) -> 'ReplayServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def _copy_session_settings(source: requests.Session, target: requests.Session) -> requests.Session:
+    target.headers.update(source.headers)
+    for prefix, adapter in source.adapters.items():
+        target.mount(prefix, adapter)
+    return target
+
+
+def install_recorder(system, store: FixtureStore) -> RecordingSession:
+    """CulturalHubAPISystem 세션을 녹화 세션으로 교체"""
+    session = _copy_session_settings(system.session, RecordingSession(store))
+    system.session = session
+    return session
+
+
+def install_replay(system, replay_base_url: str, base_delay: Optional[float] = None) -> ReplaySession:
+    """CulturalHubAPISystem 세션을 재생 세션으로 교체 (base_delay로 호출 간 대기 조정)"""
+    session = ReplaySession(replay_base_url)
+    session.headers.update(system.session.headers)
+    system.session = session
+    if base_delay is not None:
+        system.safe_config['base_delay'] = base_delay
+    return session
@@ -0,0 +1,255 @@
+"""
+문화행사 주변 검색
+장소 문자열을 장소 좌표 사전(venue_gazetteer)으로 좌표에 연결하고 geohash를 저장해 두면,
+주변 검색은 반경을 덮는 geohash 셀(중심 + 이웃 8칸) 접두어 범위만 인덱스로 읽고,
+반경의 위경도 경계 상자로 한 번 더 좁힌 뒤 DB에서 가까운 순으로 limit개만 가져와
+실제 거리로 거른다 (PostGIS 없이 B-tree 인덱스만 사용)
+반경이 커서 셀이 넓어져도(정밀도 3이면 한 칸이 약 156km) 가져오는 행은 limit개를 넘지 않는다
+"""
+
+import logging
+import math
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, or_, text
+from sqlalchemy.orm import Session
+
+from app.domains.exhibition.active_events import OPEN_ENDED_DAYS
+from app.domains.exhibition.entity_resolution import venue_key
+from app.domains.exhibition.models import CultureHub, Institution, VenueGazetteer
+
+logger = logging.getLogger(__name__)
+
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_PRECISION = 9          # 저장 정밀도 (약 5m)
+EARTH_RADIUS_M = 6371000.0
+METERS_PER_DEGREE = 111320.0
+
+MAX_RADIUS_M = 50000
+DEFAULT_LIMIT = 50
+# 부분 일치로 장소를 찾을 때 사전 키의 최소 길이 (너무 짧은 키로 엉뚱한 장소에 붙지 않도록)
+MIN_PREFIX_KEY_LENGTH = 4
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # 짝수 번째 비트는 경도
+    while len(chars) < precision:
+        target, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (target[0] + target[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            target[0] = mid
+        else:
+            target[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def cell_size_degrees(precision: int) -> Tuple[float, float]:
+    """geohash 셀 크기 (위도 각도, 경도 각도)"""
+    total_bits = precision * 5
+    lat_bits = total_bits // 2
+    lng_bits = total_bits - lat_bits
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def covering_precision(latitude: float, radius_m: float) -> int:
+    """셀 한 칸이 반경보다 큰 가장 세밀한 정밀도 (중심 + 이웃 8칸이 원을 덮음)"""
+    cos_lat = max(math.cos(math.radians(latitude)), 0.01)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_deg, lng_deg = cell_size_degrees(precision)
+        if min(lat_deg * METERS_PER_DEGREE, lng_deg * METERS_PER_DEGREE * cos_lat) >= radius_m:
+            return precision
+    return 1
+
+
+def covering_cells(latitude: float, longitude: float, radius_m: float) -> Set[str]:
+    """반경 원을 덮는 geohash 접두어 (중심 셀과 이웃 셀)"""
+    precision = covering_precision(latitude, radius_m)
+    lat_deg, lng_deg = cell_size_degrees(precision)
+    cells = set()
+    for d_lat in (-1, 0, 1):
+        for d_lng in (-1, 0, 1):
+            lat = min(max(latitude + d_lat * lat_deg, -90.0), 90.0)
+            lng = (longitude + d_lng * lng_deg + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(lat, lng, precision))
+    return cells
+
+
+def bounding_box(latitude: float, longitude: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """반경 원을 감싸는 (최소 위도, 최대 위도, 최소 경도, 최대 경도)"""
+    lat_delta = radius_m / METERS_PER_DEGREE
+    lng_delta = radius_m / (METERS_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01))
+    return latitude - lat_delta, latitude + lat_delta, longitude - lng_delta, longitude + lng_delta
+
+
+def distance_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이 거리 (haversine, 미터)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class VenueGeocoder:
+    """장소 키 → 좌표 (사전 전체를 한 번 읽어 메모리에서 찾음)"""
+
+    def __init__(self, entries: Dict[str, Tuple[float, float, str]]):
+        self.entries = entries
+        # 부분 일치용 - 긴 키부터 확인
+        self._prefix_keys = sorted(
+            (key for key in entries if len(key) >= MIN_PREFIX_KEY_LENGTH),
+            key=len, reverse=True
+        )
+
+    @classmethod
+    def load(cls, db: Session) -> 'VenueGeocoder':
+        rows = db.query(
+            VenueGazetteer.venue_key, VenueGazetteer.latitude, VenueGazetteer.longitude, VenueGazetteer.geohash
+        ).all()
+        return cls({row.venue_key: (row.latitude, row.longitude, row.geohash) for row in rows})
+
+    def lookup(self, key: Optional[str]) -> Optional[Tuple[float, float, str]]:
+        """정확히 같은 키, 없으면 사전 키로 시작하는 장소 ("국립현대미술관서울" → "국립현대미술관")"""
+        if not key:
+            return None
+        found = self.entries.get(key)
+        if found is not None:
+            return found
+        for candidate in self._prefix_keys:
+            if len(candidate) < len(key) and key.startswith(candidate):
+                return self.entries[candidate]
+        return None
+
+    def geocode(self, venue: Optional[str]) -> Optional[Tuple[float, float, str]]:
+        return self.lookup(venue_key(venue))
+
+
+def sync_institution_gazetteer(db: Session) -> int:
+    """좌표가 있는 기관을 장소 좌표 사전에 반영 (커밋은 호출자가)"""
+    existing = {entry.venue_key: entry for entry in db.query(VenueGazetteer).all()}
+    changed = 0
+    for institution in db.query(Institution).filter(
+        Institution.is_deleted == False,
+        Institution.latitude.isnot(None),
+        Institution.longitude.isnot(None)
+    ):
+        key = venue_key(institution.name)
+        if not key:
+            continue
+        geohash = encode_geohash(institution.latitude, institution.longitude)
+        entry = existing.get(key)
+        if entry is None:
+            entry = VenueGazetteer(venue_key=key, name=institution.name, source='institution')
+            db.add(entry)
+            existing[key] = entry
+        elif entry.source != 'institution' or entry.geohash == geohash:
+            # 수동 등록 좌표는 기관 정보로 덮어쓰지 않음
+            continue
+        entry.institution_id = institution.id
+        entry.latitude = institution.latitude
+        entry.longitude = institution.longitude
+        entry.geohash = geohash
+        changed += 1
+    return changed
+
+
+def geocode_pending_events(db: Session, geocoder: Optional[VenueGeocoder] = None,
+                           regeocode: bool = False) -> Dict[str, int]:
+    """좌표가 없는 문화행사를 장소 키 단위로 한 번에 연결 (커밋은 호출자가)"""
+    geocoder = geocoder or VenueGeocoder.load(db)
+    query = db.query(CultureHub.venue_key).filter(CultureHub.venue_key.isnot(None))
+    if not regeocode:
+        query = query.filter(CultureHub.geohash.is_(None))
+    keys = [row[0] for row in query.distinct()]
+
+    updates = []
+    for key in keys:
+        found = geocoder.lookup(key)
+        if found is not None:
+            latitude, longitude, geohash = found
+            updates.append({'key': key, 'latitude': latitude, 'longitude': longitude, 'geohash': geohash})
+
+    updated_rows = 0
+    if updates:
+        result = db.execute(text(
+            "UPDATE culture_hubs SET latitude = :latitude, longitude = :longitude, geohash = :geohash "
+            "WHERE venue_key = :key" + ("" if regeocode else " AND geohash IS NULL")
+        ), updates)
+        updated_rows = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else 0
+
+    return {'venue_keys': len(keys), 'matched_keys': len(updates), 'updated_rows': updated_rows}
+
+
+def find_nearby_events(db: Session, latitude: float, longitude: float, radius_m: float,
+                       on_date: Optional[date] = None, limit: int = DEFAULT_LIMIT,
+                       category: Optional[str] = None) -> List[Dict[str, Any]]:
+    """반경 안에서 해당 날짜에 진행 중인 행사를 가까운 순으로 limit개"""
+    radius_m = min(max(radius_m, 1.0), MAX_RADIUS_M)
+    on_date = on_date or date.today()
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_m)
+    # 정렬용 평면 근사 거리 (반경 50km 안에서는 실제 거리와 순서가 같음)
+    cos_lat = math.cos(math.radians(latitude))
+    approx_distance = (
+        (CultureHub.latitude - latitude) * (CultureHub.latitude - latitude)
+        + (CultureHub.longitude - longitude) * (CultureHub.longitude - longitude) * (cos_lat * cos_lat)
+    )
+
+    query = db.query(
+        CultureHub.id, CultureHub.title, CultureHub.venue, CultureHub.category,
+        CultureHub.start_date, CultureHub.end_date, CultureHub.image_url,
+        CultureHub.api_source, CultureHub.latitude, CultureHub.longitude
+    ).filter(
+        or_(*[CultureHub.geohash.like(f"{cell}%") for cell in sorted(covering_cells(latitude, longitude, radius_m))]),
+        CultureHub.latitude.between(min_lat, max_lat),
+        CultureHub.longitude.between(min_lng, max_lng),
+        CultureHub.is_active == True,
+        or_(CultureHub.is_duplicate == False, CultureHub.is_duplicate.is_(None)),
+        or_(CultureHub.start_date.is_(None), CultureHub.start_date <= on_date),
+        # 종료일이 없는 행사는 시작일부터 OPEN_ENDED_DAYS일 동안만 (진행 중 행사 뷰와 같은 기준)
+        or_(
+            CultureHub.end_date >= on_date,
+            and_(CultureHub.end_date.is_(None),
+                 CultureHub.start_date >= on_date - timedelta(days=OPEN_ENDED_DAYS))
+        )
+    )
+    if category:
+        query = query.filter(CultureHub.category == category)
+
+    # 가까운 순 limit개만 (경계 상자 모서리는 반경 밖이므로 아래에서 거름)
+    nearby = []
+    for row in query.order_by(approx_distance, CultureHub.id).limit(limit):
+        distance = distance_m(latitude, longitude, row.latitude, row.longitude)
+        if distance <= radius_m:
+            nearby.append((distance, row))
+    nearby.sort(key=lambda item: (item[0], item[1].id))
+
+    return [
+        {
+            'id': row.id,
+            'title': row.title,
+            'venue': row.venue,
+            'category': row.category,
+            'start_date': row.start_date.isoformat() if row.start_date else None,
+            'end_date': row.end_date.isoformat() if row.end_date else None,
+            'image_url': row.image_url,
+            'api_source': row.api_source,
+            'latitude': row.latitude,
+            'longitude': row.longitude,
+            'distance_m': round(distance)
+        }
+        for distance, row in nearby
+    ]
@@ -0,0 +1,285 @@
+"""
+문화 데이터 증분 수집 스케줄러
+ApiSource별 수집 주기(관측된 변경 빈도에 따라 자동 조정)에 맞춰 별도 워커 프로세스에서 수집한다
+여러 노드에서 실행해도 Postgres advisory lock을 잡은 한 노드만 수집하고,
+API 프로세스가 대기열에 등록한 수동 수집 요청도 이 워커가 처리한다
+"""
+
+import logging
+import threading
+import uuid
+import zlib
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import func, nullsfirst, or_, text
+
+from app.domains.exhibition.active_events import refresh_active_events
+from app.domains.exhibition.collection_jobs import collection_job_store
+from app.domains.exhibition.models import ApiSource
+from app.domains.exhibition.source_adapters import CULTURAL_API_CONFIG, SOURCE_ADAPTERS
+
+logger = logging.getLogger(__name__)
+
+# 노드 간 수집 리더 선출용 advisory lock 키
+INGESTION_LOCK_KEY = zlib.crc32(b'culf:cultural-hub-ingestion')
+
+# 수집 주기 범위 (분)
+DEFAULT_INTERVAL_MINUTES = 24 * 60
+MIN_INTERVAL_MINUTES = 60
+MAX_INTERVAL_MINUTES = 7 * 24 * 60
+FAILURE_RETRY_MINUTES = 6 * 60  # 실패한 소스는 주기보다 길게 기다리지 않음
+
+
+def next_interval(current_minutes: Optional[int], changed_count: int) -> int:
+    """다음 수집 주기 계산 - 변경이 있으면 절반으로 줄이고, 없으면 1.5배로 늘림"""
+    current = current_minutes or DEFAULT_INTERVAL_MINUTES
+    if changed_count > 0:
+        interval = current // 2
+    else:
+        interval = int(current * 1.5)
+    return max(MIN_INTERVAL_MINUTES, min(MAX_INTERVAL_MINUTES, interval))
+
+
+def retry_interval(current_minutes: Optional[int]) -> int:
+    """실패 시 재시도까지의 대기 (분)"""
+    return min(current_minutes or DEFAULT_INTERVAL_MINUTES, FAILURE_RETRY_MINUTES)
+
+
+class LeaderLock:
+    """Postgres 세션 advisory lock 기반 리더 선출
+
+    잠금을 잡은 연결을 계속 유지하며, 프로세스가 죽어 연결이 끊기면
+    잠금이 자동으로 풀려 다른 노드가 이어받는다
+    """
+
+    def __init__(self, engine, key: int = INGESTION_LOCK_KEY):
+        self.engine = engine
+        self.key = key
+        self._conn = None
+
+    def acquire(self) -> bool:
+        if self._conn is not None:
+            if self.is_held():
+                return True
+            self.release()
+
+        conn = self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {'key': self.key}).scalar()
+        if not acquired:
+            conn.close()
+            return False
+
+        self._conn = conn
+        logger.info(f"수집 리더 잠금 획득 (key={self.key})")
+        return True
+
+    def is_held(self) -> bool:
+        if self._conn is None:
+            return False
+        try:
+            self._conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"수집 리더 잠금 연결 끊김: {str(e)}")
+            self._conn = None
+            return False
+
+    def release(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': self.key})
+        except Exception:
+            pass
+        finally:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+
+class IngestionScheduler:
+    """ApiSource별 주기에 맞춰 증분 수집을 실행하는 스케줄러"""
+
+    def __init__(self, session_factory: Callable, engine, max_pages: int = 1,
+                 poll_interval: float = 60.0, sources: Optional[Iterable[str]] = None):
+        self.session_factory = session_factory
+        self.lock = LeaderLock(engine)
+        self.max_pages = max_pages
+        self.poll_interval = poll_interval
+        self.sources = set(sources) if sources else None
+        self._stop = threading.Event()
+        self._active_events_date: Optional[date] = None
+
+    @contextmanager
+    def _session(self):
+        db = self.session_factory()
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def _configured_keys(self) -> List[str]:
+        keys = list(CULTURAL_API_CONFIG.keys())
+        if self.sources is not None:
+            keys = [key for key in keys if key in self.sources]
+        return keys
+
+    def ensure_sources(self) -> int:
+        """설정된 문화기관 중 api_sources에 없는 것을 등록 (바로 수집 대상이 됨)"""
+        with self._session() as db:
+            existing = {row[0] for row in db.query(ApiSource.api_key).all()}
+            created = 0
+            for api_key in self._configured_keys():
+                if api_key in existing:
+                    continue
+                config = CULTURAL_API_CONFIG[api_key]
+                db.add(ApiSource(
+                    api_key=api_key,
+                    name=config['name'],
+                    base_url=SOURCE_ADAPTERS[api_key].url,
+                    location=config.get('location'),
+                    is_active=True,
+                    total_collected=0,
+                    collect_interval_minutes=DEFAULT_INTERVAL_MINUTES
+                ))
+                created += 1
+        if created:
+            logger.info(f"수집 대상 API 소스 {created}개 등록")
+        return created
+
+    def due_sources(self) -> List[str]:
+        """수집 시각이 된 API 소스 (오래 기다린 순)"""
+        with self._session() as db:
+            rows = db.query(ApiSource.api_key).filter(
+                ApiSource.is_active == True,
+                ApiSource.api_key.in_(self._configured_keys()),
+                or_(
+                    ApiSource.next_collection_at.is_(None),
+                    ApiSource.next_collection_at <= func.now()
+                )
+            ).order_by(nullsfirst(ApiSource.next_collection_at)).all()
+            return [row[0] for row in rows]
+
+    def run_queued_jobs(self) -> int:
+        """API 프로세스가 대기열에 등록한 수동 수집 요청 실행"""
+        from app.domains.exhibition.collection_runner import run_collection_job
+
+        processed = 0
+        while not self.stopped and self.lock.is_held():
+            job = collection_job_store.claim_next_queued()
+            if job is None:
+                break
+            logger.info(f"대기열 수집 작업 실행: {job['progress_id']} ({job.get('api_key') or '전체'})")
+            run_collection_job(job)
+            processed += 1
+        return processed
+
+    def run_source(self, api_key: str) -> Optional[Dict[str, Any]]:
+        """한 소스 증분 수집 후 다음 수집 시각 조정"""
+        from app.domains.exhibition.collection_runner import run_single_api_collection_sync
+
+        progress_id = str(uuid.uuid4())
+        params = {'max_pages': self.max_pages, 'use_sequential': True, 'incremental': True}
+        collection_job_store.create(
+            progress_id,
+            job_type='scheduled',
+            api_key=api_key,
+            message=f'{api_key} 정기 증분 수집을 시작합니다...',
+            params=params
+        )
+
+        result = run_single_api_collection_sync(progress_id, api_key, self.max_pages, True, True)
+        self.reschedule(api_key, result)
+        return result
+
+    def reschedule(self, api_key: str, result: Optional[Dict[str, Any]]) -> None:
+        with self._session() as db:
+            api_source = db.query(ApiSource).filter(ApiSource.api_key == api_key).first()
+            if api_source is None:
+                return
+
+            current = api_source.collect_interval_minutes or DEFAULT_INTERVAL_MINUTES
+            if result and result.get('success'):
+                changed = result.get('total_new', 0) + result.get('total_updated', 0)
+                interval = next_interval(current, changed)
+                api_source.total_collected = (api_source.total_collected or 0) + result.get('total_collected', 0)
+                api_source.last_collection_at = func.now()
+                api_source.last_change_count = changed
+                api_source.collect_interval_minutes = interval
+                wait_minutes = interval
+                logger.info(f"{api_key}: 변경 {changed}개 → 다음 주기 {interval}분")
+            else:
+                wait_minutes = retry_interval(current)
+                message = result.get('message') if result else '취소 또는 오류'
+                logger.warning(f"{api_key}: 수집 실패 ({message}) → {wait_minutes}분 후 재시도")
+
+            api_source.next_collection_at = func.now() + timedelta(minutes=wait_minutes)
+
+    def refresh_daily_views(self) -> bool:
+        """날짜가 바뀌면(자정 이후 첫 주기) 진행 중 행사 뷰 갱신"""
+        today = date.today()
+        if self._active_events_date == today:
+            return False
+        db = self.session_factory()
+        try:
+            refreshed = refresh_active_events(db)
+        finally:
+            db.close()
+        if refreshed:
+            self._active_events_date = today
+            logger.info(f"진행 중 행사 뷰 갱신 ({today.isoformat()})")
+        return refreshed
+
+    def run_once(self) -> Dict[str, Any]:
+        """리더일 때 한 번의 스케줄링 주기 실행"""
+        summary = {'leader': False, 'queued_jobs': 0, 'collected_sources': []}
+        if not self.lock.acquire():
+            return summary
+        summary['leader'] = True
+
+        collection_job_store.purge_expired()
+        self.refresh_daily_views()
+        summary['queued_jobs'] = self.run_queued_jobs()
+
+        self.ensure_sources()
+        for api_key in self.due_sources():
+            if self.stopped or not self.lock.is_held():
+                break
+            # 정기 수집 사이에도 수동 요청이 오래 기다리지 않도록 처리
+            summary['queued_jobs'] += self.run_queued_jobs()
+            self.run_source(api_key)
+            summary['collected_sources'].append(api_key)
+
+        return summary
+
+    def run_forever(self) -> None:
+        logger.info(f"문화 데이터 수집 스케줄러 시작 (확인 간격 {self.poll_interval}초)")
+        try:
+            while not self.stopped:
+                try:
+                    summary = self.run_once()
+                    if not summary['leader']:
+                        logger.debug("다른 노드가 수집 리더 - 대기")
+                    elif summary['collected_sources'] or summary['queued_jobs']:
+                        logger.info(f"수집 주기 완료: {summary}")
+                except Exception as e:
+                    logger.error(f"수집 스케줄러 오류: {str(e)}")
+                self._stop.wait(self.poll_interval)
+        finally:
+            self.lock.release()
+            logger.info("문화 데이터 수집 스케줄러 종료")
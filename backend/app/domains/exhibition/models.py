@@ -3,6 +3,7 @@
 
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, Float, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -46,6 +47,17 @@ class CultureHub(Base):
     # API 메타데이터
     api_source = Column(String(100), nullable=False, index=True)
     culture_code = Column(String(200), nullable=True, index=True)  # 문화 콘텐츠 고유 코드
+    content_hash = Column(String(64), nullable=True)  # 정규화 필드 기반 콘텐츠 지문 (변경 감지용)
+    
+    # 소스 간 중복 판별 (entity_resolution)
+    venue_key = Column(String(100), nullable=True)        # 블록 키용 정규화 장소
+    canonical_id = Column(Integer, nullable=True)         # 같은 행사 묶음의 대표 id (미판별이면 NULL)
+    is_duplicate = Column(Boolean, default=False)         # 대표가 아닌 중복 행사
+    
+    # 위치 (venue_gazetteer에서 장소 키로 찾은 좌표)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True)           # 주변 검색용 (접두어 범위 조회)
     
     # 시스템
     collected_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -59,9 +71,31 @@ class CultureHub(Base):
         Index('idx_culture_hub_venue', 'venue'),
         Index('idx_culture_hub_category', 'category'),
         Index('idx_culture_hub_api_source', 'api_source'),
+        Index('idx_culture_hub_source_hash', 'api_source', 'culture_code', 'content_hash'),
+        Index('idx_culture_hub_venue_key', 'venue_key'),
+        Index('idx_culture_hub_canonical', 'canonical_id'),
+        Index('idx_culture_hub_geohash', 'geohash', postgresql_ops={'geohash': 'varchar_pattern_ops'}),
     )
 
 
+class VenueGazetteer(Base):
+    """장소 좌표 사전 (문화행사 venue 문자열 → 좌표)"""
+    __tablename__ = "venue_gazetteer"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    venue_key = Column(String(100), nullable=False, unique=True)  # entity_resolution.venue_key로 정규화한 장소
+    name = Column(String(300), nullable=False)                    # 표시용 장소명
+    institution_id = Column(Integer, ForeignKey("institutions.id", ondelete="SET NULL"), nullable=True)
+    
+    latitude = Column(Float, nullable=False)
+    longitude = Column(Float, nullable=False)
+    geohash = Column(String(12), nullable=False)
+    source = Column(String(30), default='manual')                 # manual, institution
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
 # ================================
 # 관리자 관리 데이터 모델
 # ================================
@@ -147,6 +181,7 @@ class Exhibition(Base):
     
     # 기타
     keywords = Column(String(500))
+    content_hash = Column(String(64), nullable=True)  # 정규화 필드 기반 콘텐츠 지문 (변경 감지용)
     
     # 상태
     status = Column(String(30), default='active', index=True)
@@ -201,7 +236,8 @@ class SmartFile(Base):
     
     # 추출 정보
     total_pages = Column(Integer)
-    extracted_text = Column(Text)
+    extracted_text = Column(Text)        # 미리보기용 앞부분 (전체 텍스트는 smart_file_pages)
+    content_hash = Column(String(64))    # 원본 파일 SHA-256 (같은 파일 재처리 시 파싱 생략)
     
     # 시스템
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -215,6 +251,30 @@ class SmartFile(Base):
     )
 
 
+class SmartFilePage(Base):
+    """업로드 파일의 페이지별 추출 텍스트"""
+    __tablename__ = "smart_file_pages"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    smart_file_id = Column(Integer, ForeignKey("smart_files.id", ondelete="CASCADE"), nullable=False)
+    page_number = Column(Integer, nullable=False)   # 1부터 시작
+    
+    # 추출 텍스트 및 전체 문서 내 위치 (페이지는 줄바꿈 하나로 이어 붙임)
+    text = Column(Text)
+    char_start = Column(Integer, nullable=False, default=0)
+    char_end = Column(Integer, nullable=False, default=0)
+    
+    extraction_method = Column(String(30))          # serial, parallel, cache, text
+    text_hash = Column(String(64), nullable=False)  # 페이지 텍스트 SHA-256 (변경 감지)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint('smart_file_id', 'page_number', name='uq_smart_file_page'),
+    )
+
+
 # ================================
 # 임베딩 및 검색 모델
 # ================================
@@ -270,13 +330,61 @@ class ApiSource(Base):
     total_collected = Column(Integer, default=0)
     last_collection_at = Column(DateTime(timezone=True))
     
+    # 수집 주기 (변경 빈도에 따라 수집 워커가 조정)
+    collect_interval_minutes = Column(Integer, default=1440)
+    next_collection_at = Column(DateTime(timezone=True))
+    last_change_count = Column(Integer, default=0)  # 직전 수집의 신규+업데이트 수
+    
     # 시스템
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     __table_args__ = (
         Index('idx_api_source_active', 'is_active'),
+        Index('idx_api_source_next_collection', 'next_collection_at'),
     )
 
 
- 
\ No newline at end of file
+ 
+
+
+# ================================
+# 수집 작업 관리 모델
+# ================================
+
+class CollectionJob(Base):
+    """문화 데이터 수집 작업 (여러 워커가 공유하는 진행 상황/취소 요청)"""
+    __tablename__ = "collection_jobs"
+    
+    id = Column(String(36), primary_key=True)  # progress_id (UUID)
+    
+    # 작업 정보
+    job_type = Column(String(20), nullable=False, default='all')  # all, single
+    api_key = Column(String(200))  # 개별 API 수집 대상
+    params = Column(JSONB)  # max_pages, use_sequential, incremental
+    
+    # 진행 상태
+    status = Column(String(20), nullable=False, default='running')  # running, completed, cancelled, failed
+    step = Column(Integer, default=1)
+    message = Column(Text)
+    percentage = Column(Integer, default=0)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    error = Column(Text)
+    
+    # 기관별 카운터 및 결과
+    source_counters = Column(JSONB)
+    results = Column(JSONB)
+    
+    # 실행 워커
+    worker_id = Column(String(100))  # hostname:pid
+    heartbeat_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    
+    # 시스템
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        Index('idx_collection_job_status', 'status'),
+        Index('idx_collection_job_finished', 'finished_at'),
+    )
@@ -0,0 +1,152 @@
+"""
+업로드 파일 페이지별 텍스트 저장소 (smart_file_pages)
+추출한 텍스트를 페이지 단위로 저장하고 필요한 페이지만 지연 로딩한다
+페이지 텍스트 해시로 바뀐 페이지만 다시 쓰고, 같은 파일을 재처리할 때는
+저장된 페이지로 추출 캐시를 채워 PDF를 다시 파싱하지 않는다
+"""
+
+import hashlib
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.domains.exhibition.models import SmartFilePage
+from app.domains.exhibition.pdf_extractor import PageTextCache, page_text_cache
+
+# SmartFile.extracted_text에 남기는 미리보기 길이
+EXTRACTED_TEXT_PREVIEW_CHARS = 5000
+# 지연 로딩 시 한 번에 읽는 페이지 수
+PAGE_BATCH_SIZE = 20
+# 페이지를 이어 붙일 때 쓰는 구분자 (char_start/char_end 기준)
+PAGE_SEPARATOR = "\n"
+
+
+def text_hash(text: Optional[str]) -> str:
+    return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+
+def build_page_rows(pages: Sequence[str], method: str) -> List[Dict[str, Any]]:
+    """페이지 텍스트 목록 → smart_file_pages 행 (전체 문서 기준 문자 위치 포함)"""
+    rows = []
+    offset = 0
+    for index, text in enumerate(pages):
+        text = text or ''
+        rows.append({
+            'page_number': index + 1,
+            'text': text,
+            'char_start': offset,
+            'char_end': offset + len(text),
+            'extraction_method': method,
+            'text_hash': text_hash(text),
+        })
+        offset += len(text) + len(PAGE_SEPARATOR)
+    return rows
+
+
+def preview_text(pages: Sequence[str], limit: int = EXTRACTED_TEXT_PREVIEW_CHARS) -> str:
+    """앞쪽 페이지만 이어 붙여 미리보기 생성 (전체를 합치지 않음)"""
+    parts = []
+    length = 0
+    for text in pages:
+        if not text:
+            continue
+        parts.append(text)
+        length += len(text) + len(PAGE_SEPARATOR)
+        if length >= limit:
+            break
+    return PAGE_SEPARATOR.join(parts)[:limit].strip()
+
+
+class SmartFilePageStore:
+    """smart_file_pages 조회/저장"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save_pages(self, smart_file_id: int, pages: Sequence[str], method: str) -> Dict[str, Any]:
+        """페이지 저장 - 해시가 같은 페이지는 텍스트를 다시 쓰지 않음 (커밋은 호출자가)"""
+        existing = {
+            row.page_number: row
+            for row in self.db.query(
+                SmartFilePage.id,
+                SmartFilePage.page_number,
+                SmartFilePage.text_hash,
+                SmartFilePage.char_start,
+                SmartFilePage.char_end
+            ).filter(SmartFilePage.smart_file_id == smart_file_id)
+        }
+
+        inserts, updates, changed_pages = [], [], []
+        unchanged = 0
+        for row in build_page_rows(pages, method):
+            current = existing.get(row['page_number'])
+            if current is None:
+                inserts.append(dict(row, smart_file_id=smart_file_id))
+                changed_pages.append(row['page_number'])
+            elif current.text_hash != row['text_hash']:
+                updates.append(dict(row, id=current.id))
+                changed_pages.append(row['page_number'])
+            else:
+                unchanged += 1
+                # 앞 페이지가 바뀌어 위치만 밀린 경우 위치만 갱신
+                if (current.char_start, current.char_end) != (row['char_start'], row['char_end']):
+                    updates.append({'id': current.id, 'char_start': row['char_start'], 'char_end': row['char_end']})
+
+        if inserts:
+            self.db.bulk_insert_mappings(SmartFilePage, inserts)
+        if updates:
+            self.db.bulk_update_mappings(SmartFilePage, updates)
+
+        deleted = 0
+        if len(existing) > len(pages):
+            deleted = self.db.query(SmartFilePage).filter(
+                SmartFilePage.smart_file_id == smart_file_id,
+                SmartFilePage.page_number > len(pages)
+            ).delete(synchronize_session=False)
+
+        return {
+            'inserted': len(inserts),
+            'updated': len(changed_pages) - len(inserts),
+            'unchanged': unchanged,
+            'deleted': deleted,
+            'changed_pages': changed_pages,
+        }
+
+    def page_count(self, smart_file_id: int) -> int:
+        return self.db.query(SmartFilePage.id).filter(SmartFilePage.smart_file_id == smart_file_id).count()
+
+    def get_pages(self, smart_file_id: int, start: int = 1, limit: int = PAGE_BATCH_SIZE) -> List[SmartFilePage]:
+        return self.db.query(SmartFilePage).filter(
+            SmartFilePage.smart_file_id == smart_file_id,
+            SmartFilePage.page_number >= start
+        ).order_by(SmartFilePage.page_number).limit(limit).all()
+
+    def get_page(self, smart_file_id: int, page_number: int) -> Optional[SmartFilePage]:
+        return self.db.query(SmartFilePage).filter(
+            SmartFilePage.smart_file_id == smart_file_id,
+            SmartFilePage.page_number == page_number
+        ).first()
+
+    def iter_page_texts(self, smart_file_id: int, batch_size: int = PAGE_BATCH_SIZE) -> Iterator[Tuple[int, str]]:
+        """(페이지 번호, 텍스트)를 batch_size 페이지씩 지연 로딩"""
+        last_page = 0
+        while True:
+            rows = self.db.query(SmartFilePage.page_number, SmartFilePage.text).filter(
+                SmartFilePage.smart_file_id == smart_file_id,
+                SmartFilePage.page_number > last_page
+            ).order_by(SmartFilePage.page_number).limit(batch_size).all()
+            if not rows:
+                return
+            for page_number, text in rows:
+                yield page_number, text or ''
+            last_page = rows[-1][0]
+
+    def document_text(self, smart_file_id: int) -> str:
+        return PAGE_SEPARATOR.join(text for _, text in self.iter_page_texts(smart_file_id)).strip()
+
+    def seed_cache(self, smart_file_id: int, digest: str, cache: PageTextCache = page_text_cache) -> int:
+        """저장된 페이지로 추출 캐시 채우기 (같은 파일 재처리 시 파싱 생략)"""
+        pages = {page_number - 1: text for page_number, text in self.iter_page_texts(smart_file_id)}
+        if pages:
+            cache.put_many(digest, pages)
+        return len(pages)
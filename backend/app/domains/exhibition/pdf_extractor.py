@@ -0,0 +1,261 @@
+"""
+업로드 문서 텍스트 추출 엔진
+파일을 한 번만 받아 임시 파일에 두고 mmap으로 읽으며, 페이지 수는 같은 리더에서 구한다
+페이지가 많은 PDF는 프로세스 풀에서 페이지 묶음 단위로 병렬 추출하고,
+추출 결과는 (문서 해시, 페이지 번호) 단위로 캐시해 재처리 시 다시 파싱하지 않는다
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import get_context
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import PyPDF2
+    PDF_PROCESSING_AVAILABLE = True
+except ImportError:
+    PDF_PROCESSING_AVAILABLE = False
+    PyPDF2 = None
+
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 이 페이지 수 미만이면 프로세스 풀 기동 비용이 더 커서 직렬로 추출
+PARALLEL_PAGE_THRESHOLD = 8
+PAGES_PER_TASK = 4
+DEFAULT_MAX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+TEXT_EXTENSIONS = ('.txt', '.md')
+
+
+class ExtractionError(Exception):
+    """문서를 열거나 읽을 수 없을 때"""
+
+
+class DocumentSource:
+    """한 번 받아 둔 문서 (임시/로컬 파일 경로 + mmap 버퍼 + 내용 해시)"""
+
+    def __init__(self, path: str, extension: str, buffer, digest: str):
+        self.path = path
+        self.extension = extension
+        self.buffer = buffer
+        self.digest = digest
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.extension == '.pdf'
+
+    @property
+    def is_text(self) -> bool:
+        return self.extension in TEXT_EXTENSIONS
+
+    def read_text(self) -> str:
+        return bytes(self.buffer).decode('utf-8', errors='replace')
+
+
+class PdfExtraction:
+    """PDF 페이지별 추출 결과"""
+
+    def __init__(self, digest: str, pages: List[str], method: str, cached_pages: int = 0):
+        self.digest = digest
+        self.pages = pages
+        self.method = method          # serial, parallel, cache
+        self.cached_pages = cached_pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    @property
+    def text(self) -> str:
+        return "\n".join(page for page in self.pages if page).strip()
+
+
+class PageTextCache:
+    """(문서 해시, 페이지 번호) → 추출 텍스트 LRU 캐시"""
+
+    def __init__(self, max_pages: int = 5000):
+        self.max_pages = max_pages
+        self._pages: 'OrderedDict[Tuple[str, int], str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, digest: str, page_count: int) -> Dict[int, str]:
+        found = {}
+        with self._lock:
+            for page_index in range(page_count):
+                key = (digest, page_index)
+                if key in self._pages:
+                    self._pages.move_to_end(key)
+                    found[page_index] = self._pages[key]
+        return found
+
+    def put_many(self, digest: str, pages: Dict[int, str]) -> None:
+        with self._lock:
+            for page_index, text in pages.items():
+                key = (digest, page_index)
+                self._pages[key] = text
+                self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+
+page_text_cache = PageTextCache()
+
+
+def file_extension(file_path: str) -> str:
+    """URL 쿼리스트링을 무시한 소문자 확장자"""
+    path = file_path.split('?', 1)[0].split('#', 1)[0]
+    return os.path.splitext(path)[1].lower()
+
+
+def _download_to_tempfile(url: str, suffix: str) -> Tuple[str, str]:
+    """URL을 스트리밍으로 임시 파일에 저장하면서 해시 계산 (메모리에 전체를 올리지 않음)"""
+    import requests
+
+    digest = hashlib.sha256()
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            with requests.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        temp_file.write(chunk)
+                        digest.update(chunk)
+    except Exception:
+        os.unlink(temp_path)
+        raise
+    return temp_path, digest.hexdigest()
+
+
+def _map_file(path: str):
+    """빈 파일은 mmap할 수 없으므로 빈 bytes로 대체"""
+    if os.path.getsize(path) == 0:
+        return None, b''
+    handle = open(path, 'rb')
+    try:
+        return handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception:
+        handle.close()
+        raise
+
+
+@contextmanager
+def open_document(file_path: str) -> Iterator[DocumentSource]:
+    """S3 URL이나 로컬 경로의 문서를 한 번만 읽어 DocumentSource로 제공"""
+    extension = file_extension(file_path)
+    temp_path = None
+
+    if file_path.startswith(('https://', 'http://')):
+        temp_path, digest = _download_to_tempfile(file_path, extension)
+        path = temp_path
+    else:
+        if not os.path.exists(file_path):
+            raise ExtractionError("파일을 찾을 수 없습니다.")
+        path = file_path
+        digest = None
+
+    handle, buffer = None, b''
+    try:
+        handle, buffer = _map_file(path)
+        if digest is None:
+            digest = hashlib.sha256(buffer).hexdigest()
+        yield DocumentSource(path, extension, buffer, digest)
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+        if handle is not None:
+            handle.close()
+        if temp_path:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+
+def _extract_page(reader, page_index: int) -> str:
+    try:
+        return (reader.pages[page_index].extract_text() or '').strip()
+    except Exception as e:
+        print(f"PDF 페이지 {page_index + 1} 텍스트 추출 실패: {e}")
+        return ''
+
+
+# ---- 프로세스 풀 워커 (프로세스마다 리더를 한 번만 연다) ----
+
+_worker_state = {}
+
+
+def _init_worker(path: str) -> None:
+    handle, buffer = _map_file(path)
+    _worker_state['handle'] = handle
+    _worker_state['buffer'] = buffer
+    _worker_state['reader'] = PyPDF2.PdfReader(buffer)
+
+
+def _extract_page_batch(page_indexes: Sequence[int]) -> Dict[int, str]:
+    reader = _worker_state['reader']
+    return {page_index: _extract_page(reader, page_index) for page_index in page_indexes}
+
+
+def _batches(items: List[int], size: int) -> List[List[int]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def extract_pdf_pages(source: DocumentSource, max_workers: Optional[int] = None,
+                      cache: Optional[PageTextCache] = page_text_cache) -> PdfExtraction:
+    """PDF 전체 페이지 텍스트 추출 (캐시에 없는 페이지만, 많으면 병렬로)"""
+    if not PDF_PROCESSING_AVAILABLE:
+        raise ExtractionError("PDF 처리 라이브러리가 설치되지 않았습니다.")
+
+    try:
+        reader = PyPDF2.PdfReader(source.buffer)
+        page_count = len(reader.pages)
+    except Exception as e:
+        raise ExtractionError(f"PDF를 열 수 없습니다: {e}")
+
+    pages: Dict[int, str] = cache.get_many(source.digest, page_count) if cache is not None else {}
+    cached_pages = len(pages)
+    missing = [page_index for page_index in range(page_count) if page_index not in pages]
+
+    workers = DEFAULT_MAX_WORKERS if max_workers is None else max_workers
+    if not missing:
+        method = 'cache'
+    elif workers > 1 and len(missing) >= PARALLEL_PAGE_THRESHOLD:
+        method = 'parallel'
+        # API 프로세스의 스레드/DB 연결을 복제하지 않도록 spawn으로 기동
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(missing)),
+            mp_context=get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(source.path,)
+        ) as executor:
+            for batch_result in executor.map(_extract_page_batch, _batches(missing, PAGES_PER_TASK)):
+                pages.update(batch_result)
+    else:
+        method = 'serial'
+        for page_index in missing:
+            pages[page_index] = _extract_page(reader, page_index)
+
+    if cache is not None and missing:
+        cache.put_many(source.digest, {page_index: pages[page_index] for page_index in missing})
+
+    return PdfExtraction(
+        source.digest,
+        [pages[page_index] for page_index in range(page_count)],
+        method,
+        cached_pages=cached_pages
+    )
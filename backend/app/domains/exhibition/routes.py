@@ -2,16 +2,25 @@
 전시 데이터 수집 API 라우터
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, text, func
 from app.db.session import get_db
 from app.core.config import settings
 from .models import Exhibition, Institution, CultureHub, ApiSource, SmartFile
+from .fingerprint import compute_content_hash, EXHIBITION_HASH_FIELDS
+from .collection_jobs import collection_job_store, NOT_FOUND_PROGRESS
+from .entity_resolution import EventResolver
+from .active_events import query_active_events
+from .geosearch import MAX_RADIUS_M, find_nearby_events, geocode_pending_events, sync_institution_gazetteer
+from .collection_runner import run_collection_with_progress_sync, run_single_api_collection_sync
 from .schemas import ExhibitionCreate, InstitutionCreate, InstitutionUpdate, CulturalHubCollectionRequest, CulturalHubCollectionResponse, CulturalHubStatusResponse, CulturalHubTestResponse, CulturalHubSyncRequest, CulturalHubSyncResponse
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import date, datetime
 import asyncio
+import json
 import uuid
 import logging
 import threading
@@ -22,14 +31,27 @@ from .cultural_hub_service import CulturalHubExhibitionService
 
 router = APIRouter()
 
-# 진행 상황 저장소
-progress_store = {}
+# 이 워커에서 실행 중인 스레드 (진행 상황/취소 요청은 collection_jobs 테이블에서 공유)
+running_threads = {}
 
-# 취소 요청 저장소
-cancellation_requests = set()
+def _run_collection_thread(progress_id: str, target, *args):
+    """수집 실행 후 이 워커의 스레드 목록에서 정리"""
+    try:
+        target(progress_id, *args)
+    finally:
+        if running_threads.pop(progress_id, None) is not None:
+            logging.info(f"스레드 정리 완료: {progress_id}")
 
-# 실행 중인 스레드 저장소
-running_threads = {}
+# SSE 진행 상황 스트림 설정 (초)
+PROGRESS_STREAM_INTERVAL = 1.0
+PROGRESS_STREAM_KEEPALIVE = 15.0
+
+def _exhibition_content_hash(exhibition: Exhibition) -> str:
+    """Exhibition 현재 필드 기준 콘텐츠 지문"""
+    return compute_content_hash(
+        {field: getattr(exhibition, field, None) for field in EXHIBITION_HASH_FIELDS},
+        EXHIBITION_HASH_FIELDS
+    )
 
 # 기존 전시 관리 엔드포인트들
 @router.get("/exhibitions", response_model=List[Dict[str, Any]])
@@ -123,6 +145,7 @@ def create_exhibition(exhibition_data: ExhibitionCreate, db: Session = Depends(g
             is_active=getattr(exhibition_data, 'is_active', True),
             created_by='admin'  # 실제로는 세션에서 가져와야 함
         )
+        new_exhibition.content_hash = _exhibition_content_hash(new_exhibition)
         
         db.add(new_exhibition)
         db.commit()
@@ -169,6 +192,7 @@ def update_exhibition(exhibition_id: int, exhibition_data: ExhibitionCreate, db:
         exhibition.keywords = getattr(exhibition_data, 'keywords', exhibition.keywords)
         exhibition.status = getattr(exhibition_data, 'status', exhibition.status)
         exhibition.is_active = getattr(exhibition_data, 'is_active', exhibition.is_active)
+        exhibition.content_hash = _exhibition_content_hash(exhibition)
         
         db.commit()
         db.refresh(exhibition)
@@ -509,6 +533,7 @@ def get_file_info(file_id: int, db: Session = Depends(get_db)):
         'file_size': smart_file.file_size,
         'file_type': smart_file.file_type,
         'processing_status': smart_file.processing_status,
+        'total_pages': smart_file.total_pages,
         'ai_summary': smart_file.ai_summary,
         'uploaded_at': smart_file.uploaded_at
     }
@@ -609,6 +634,77 @@ def download_file(file_id: int, db: Session = Depends(get_db)):
         media_type=smart_file.mime_type or 'application/octet-stream'
     )
 
+@router.get("/files/{file_id}/pages", response_model=Dict[str, Any])
+def get_file_pages(
+    file_id: int,
+    start: int = Query(1, ge=1, description="시작 페이지"),
+    limit: int = Query(20, ge=1, le=100, description="가져올 페이지 수"),
+    db: Session = Depends(get_db)
+):
+    """파일 페이지별 텍스트 미리보기 (요청한 페이지만 조회)"""
+    from .page_store import SmartFilePageStore
+    
+    smart_file = db.query(SmartFile).filter(
+        SmartFile.id == file_id,
+        SmartFile.is_active == True
+    ).first()
+    
+    if not smart_file:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    pages = SmartFilePageStore(db).get_pages(file_id, start=start, limit=limit)
+    
+    return {
+        'file_id': file_id,
+        'total_pages': smart_file.total_pages,
+        'processing_status': smart_file.processing_status,
+        'pages': [
+            {
+                'page_number': page.page_number,
+                'text': page.text,
+                'char_start': page.char_start,
+                'char_end': page.char_end,
+                'extraction_method': page.extraction_method
+            }
+            for page in pages
+        ],
+        'next_start': pages[-1].page_number + 1 if len(pages) == limit else None
+    }
+
+@router.get("/files/{file_id}/text")
+def download_file_text(file_id: int, db: Session = Depends(get_db)):
+    """추출된 전체 텍스트 다운로드 (페이지를 나눠 읽으며 스트리밍)"""
+    from pathlib import Path
+    from urllib.parse import quote
+    from .page_store import PAGE_SEPARATOR, SmartFilePageStore
+    
+    smart_file = db.query(SmartFile).filter(
+        SmartFile.id == file_id,
+        SmartFile.is_active == True
+    ).first()
+    
+    if not smart_file:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    
+    filename = quote(f"{Path(smart_file.filename).stem}.txt")
+    
+    def stream_pages():
+        # 응답 스트리밍 중에는 요청 세션이 이미 닫혀 있으므로 별도 세션 사용
+        from app.db.session import SessionLocal
+        stream_db = SessionLocal()
+        try:
+            for page_number, text in SmartFilePageStore(stream_db).iter_page_texts(file_id):
+                prefix = PAGE_SEPARATOR if page_number > 1 else ''
+                yield (prefix + text).encode('utf-8')
+        finally:
+            stream_db.close()
+    
+    return StreamingResponse(
+        stream_pages(),
+        media_type='text/plain; charset=utf-8',
+        headers={'Content-Disposition': f"attachment; filename*=UTF-8''{filename}"}
+    )
+
 @router.delete("/files/{file_id}", response_model=Dict[str, Any])
 def delete_file(
     file_id: int,
@@ -671,6 +767,7 @@ def get_events(
     search: Optional[str] = Query(None, description="검색어 (제목, 장소, 작가)"),
     source: Optional[str] = Query(None, description="API 소스"),
     include_inactive: bool = Query(False, description="비활성 이벤트 포함 여부"),
+    include_duplicates: bool = Query(False, description="다른 소스와 중복된 이벤트 포함 여부"),
     sort_by: str = Query("created_at", description="정렬 기준"),
     sort_order: str = Query("desc", description="정렬 순서 (asc/desc)")
 ):
@@ -680,6 +777,9 @@ def get_events(
         query = db.query(CultureHub)
         if not include_inactive:
             query = query.filter(CultureHub.is_active == True)
+        if not include_duplicates:
+            # 여러 소스로 들어온 같은 행사는 대표 행만
+            query = query.filter(or_(CultureHub.is_duplicate == False, CultureHub.is_duplicate.is_(None)))
         
         # 검색 조건
         if search:
@@ -736,6 +836,8 @@ def get_events(
                 'website': event.website,
                 'image_url': event.image_url,
                     'api_source': event.api_source,
+                'canonical_id': event.canonical_id,
+                'is_duplicate': bool(event.is_duplicate),
                 'is_active': event.is_active,
     
                     'collected_at': event.collected_at.isoformat() if event.collected_at else None,
@@ -752,6 +854,103 @@ def get_events(
         logging.error(f"문화행사 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"문화행사 조회 실패: {str(e)}")
 
+@router.get("/events/now", response_model=Dict[str, Any])
+def get_events_now(
+    db: Session = Depends(get_db),
+    category: Optional[str] = Query(None, description="카테고리"),
+    region: Optional[str] = Query(None, description="지역 (예: 서울, 제주) - 전국 단위 행사 포함"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    sort_by: str = Query("end_date", description="정렬 기준 (end_date: 곧 끝나는 순, start_date, title)")
+):
+    """오늘 진행 중인 문화행사 목록 (active_culture_events 구체화 뷰에서 조회)"""
+    try:
+        return query_active_events(db, category=category, region=region, page=page, size=size, sort_by=sort_by)
+    except Exception as e:
+        db.rollback()
+        logging.error(f"진행 중 문화행사 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"진행 중 문화행사 조회 실패: {str(e)}")
+
+@router.get("/events/nearby", response_model=Dict[str, Any])
+def get_events_nearby(
+    db: Session = Depends(get_db),
+    lat: float = Query(..., ge=-90, le=90, description="위도"),
+    lng: float = Query(..., ge=-180, le=180, description="경도"),
+    radius: float = Query(3000, gt=0, le=MAX_RADIUS_M, description="반경 (미터)"),
+    on_date: Optional[date] = Query(None, alias="date", description="진행 기준 날짜 (기본: 오늘)"),
+    category: Optional[str] = Query(None, description="카테고리"),
+    limit: int = Query(50, ge=1, le=200, description="최대 개수 (가까운 순)")
+):
+    """주변에서 진행 중인 문화행사 (가까운 순)"""
+    try:
+        items = find_nearby_events(db, lat, lng, radius, on_date=on_date, limit=limit, category=category)
+        return {
+            'items': items,
+            'total': len(items),
+            'center': {'lat': lat, 'lng': lng},
+            'radius': radius
+        }
+    except Exception as e:
+        logging.error(f"주변 문화행사 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"주변 문화행사 조회 실패: {str(e)}")
+
+@router.get("/events/{event_id}/duplicates")
+def get_event_duplicates(event_id: int, db: Session = Depends(get_db)):
+    """같은 행사로 묶인 다른 소스의 이벤트 목록"""
+    event = db.query(CultureHub).filter(CultureHub.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="문화행사를 찾을 수 없습니다.")
+    
+    canonical_id = event.canonical_id or event.id
+    members = db.query(
+        CultureHub.id, CultureHub.title, CultureHub.venue, CultureHub.api_source,
+        CultureHub.start_date, CultureHub.end_date
+    ).filter(
+        or_(CultureHub.canonical_id == canonical_id, CultureHub.id == canonical_id)
+    ).order_by(CultureHub.id).all()
+    
+    return {
+        'canonical_id': canonical_id,
+        'items': [
+            {
+                'id': member.id,
+                'title': member.title,
+                'venue': member.venue,
+                'api_source': member.api_source,
+                'start_date': member.start_date.isoformat() if member.start_date else None,
+                'end_date': member.end_date.isoformat() if member.end_date else None,
+                'is_canonical': member.id == canonical_id
+            }
+            for member in members
+        ]
+    }
+
+@router.post("/cultural-hub/resolve-duplicates")
+def resolve_duplicate_events(db: Session = Depends(get_db)):
+    """아직 판별하지 않은 이벤트의 소스 간 중복 판별 (기존 데이터 초기 판별용)"""
+    try:
+        summary = EventResolver(db).resolve_pending()
+        return {'success': True, **summary}
+    except Exception as e:
+        db.rollback()
+        logging.error(f"중복 판별 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"중복 판별 실패: {str(e)}")
+
+@router.post("/cultural-hub/geocode")
+def geocode_events(db: Session = Depends(get_db)):
+    """기관 좌표를 장소 좌표 사전에 반영하고 문화행사 좌표 연결"""
+    try:
+        changed_entries = sync_institution_gazetteer(db)
+        db.flush()
+        # 사전이 바뀌었으면 이미 연결된 행사도 다시 연결
+        summary = geocode_pending_events(db, regeocode=changed_entries > 0)
+        db.commit()
+        return {'success': True, 'gazetteer_changed': changed_entries, **summary}
+    except Exception as e:
+        db.rollback()
+        logging.error(f"문화행사 좌표 연결 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"문화행사 좌표 연결 실패: {str(e)}")
+
 # API 상태 관리 엔드포인트들
 @router.get("/cultural-hub/status")
 def get_cultural_hub_status(db: Session = Depends(get_db)):
@@ -880,7 +1079,7 @@ def test_single_api(api_key: str, db: Session = Depends(get_db)):
 
 # 데이터 수집 엔드포인트들
 @router.post("/cultural-hub/collect")
-async def collect_cultural_data(
+def collect_cultural_data(
     config: Optional[CulturalHubCollectionRequest] = None,
     background_tasks: BackgroundTasks = BackgroundTasks(),
     db: Session = Depends(get_db)
@@ -900,21 +1099,33 @@ async def collect_cultural_data(
             use_sequential = config.use_sequential if config.use_sequential is not None else True
             incremental = config.incremental if config.incremental is not None else True
         
-        # 초기 진행 상황 설정
-        progress_store[progress_id] = {
-            'step': 1,
-            'message': '데이터 수집을 시작합니다...',
-            'percentage': 5,
-            'completed': False,
-            'error': None
-        }
+        # 끝난 작업 정리 후 작업 등록 (어느 워커에서든 조회/취소 가능)
+        # 작업 저장소가 동기 DB 쓰기라 일반 def 라우트로 두어 스레드풀에서 실행
+        collection_job_store.purge_expired()
+        collection_job_store.create(
+            progress_id,
+            job_type='all',
+            message='데이터 수집을 시작합니다...',
+            params={'max_pages': max_pages, 'use_sequential': use_sequential, 'incremental': incremental},
+            queued=settings.CULTURAL_HUB_COLLECT_IN_WORKER
+        )
+        
+        # 별도 수집 워커 사용 시 대기열에만 등록 (API 프로세스에서 수집하지 않음)
+        if settings.CULTURAL_HUB_COLLECT_IN_WORKER:
+            logging.info(f"데이터 수집 대기열 등록: {progress_id}")
+            return {
+                'success': True,
+                'progress_id': progress_id,
+                'queued': True,
+                'message': '데이터 수집이 대기열에 등록되었습니다'
+            }
         
         logging.info(f"데이터 수집 시작: max_pages={max_pages}, sequential={use_sequential}, incremental={incremental}")
         
         # 스레드에서 실행 (즉시 응답 가능)
         thread = threading.Thread(
-            target=run_collection_with_progress_sync,
-            args=(progress_id, max_pages, use_sequential, incremental),
+            target=_run_collection_thread,
+            args=(progress_id, run_collection_with_progress_sync, max_pages, use_sequential, incremental),
             daemon=True
         )
         running_threads[progress_id] = thread
@@ -931,7 +1142,7 @@ async def collect_cultural_data(
         raise HTTPException(status_code=500, detail=f"데이터 수집 시작 실패: {str(e)}")
 
 @router.post("/cultural-hub/collect/{api_key}")
-async def collect_single_api(
+def collect_single_api(
     api_key: str,
     config: Optional[CulturalHubCollectionRequest] = None,
     background_tasks: BackgroundTasks = BackgroundTasks(),
@@ -952,21 +1163,34 @@ async def collect_single_api(
             use_sequential = config.use_sequential if config.use_sequential is not None else True
             incremental = config.incremental if config.incremental is not None else True
         
-        # 초기 진행 상황 설정
-        progress_store[progress_id] = {
-            'step': 1,
-            'message': f'{api_key} API 데이터 수집을 시작합니다...',
-            'percentage': 5,
-            'completed': False,
-            'error': None
-        }
+        # 끝난 작업 정리 후 작업 등록 (어느 워커에서든 조회/취소 가능)
+        # 작업 저장소가 동기 DB 쓰기라 일반 def 라우트로 두어 스레드풀에서 실행
+        collection_job_store.purge_expired()
+        collection_job_store.create(
+            progress_id,
+            job_type='single',
+            api_key=api_key,
+            message=f'{api_key} API 데이터 수집을 시작합니다...',
+            params={'max_pages': max_pages, 'use_sequential': use_sequential, 'incremental': incremental},
+            queued=settings.CULTURAL_HUB_COLLECT_IN_WORKER
+        )
+        
+        # 별도 수집 워커 사용 시 대기열에만 등록 (API 프로세스에서 수집하지 않음)
+        if settings.CULTURAL_HUB_COLLECT_IN_WORKER:
+            logging.info(f"개별 API 수집 대기열 등록: {api_key} ({progress_id})")
+            return {
+                'success': True,
+                'progress_id': progress_id,
+                'queued': True,
+                'message': f'{api_key} API 데이터 수집이 대기열에 등록되었습니다'
+            }
         
         logging.info(f"개별 API 수집 시작: {api_key}, max_pages={max_pages}, sequential={use_sequential}, incremental={incremental}")
         
         # 스레드에서 실행 (즉시 응답 가능)
         thread = threading.Thread(
-            target=run_single_api_collection_sync,
-            args=(progress_id, api_key, max_pages, use_sequential, incremental),
+            target=_run_collection_thread,
+            args=(progress_id, run_single_api_collection_sync, api_key, max_pages, use_sequential, incremental),
             daemon=True
         )
         running_threads[progress_id] = thread
@@ -983,33 +1207,52 @@ async def collect_single_api(
         raise HTTPException(status_code=500, detail=f"개별 API 수집 시작 실패: {str(e)}")
 
 @router.get("/cultural-hub/collect/progress/{progress_id}")
-async def get_progress(progress_id: str):
+def get_progress(progress_id: str):
     """진행 상황 조회"""
-    if progress_id in progress_store:
-        return progress_store[progress_id]
-    return {
-        'step': 0,
-        'message': '진행 상황을 찾을 수 없습니다',
-        'percentage': 0,
-        'completed': True,
-        'error': '진행 상황을 찾을 수 없습니다'
-    }
+    progress = collection_job_store.get(progress_id)
+    if progress is not None:
+        return progress
+    return dict(NOT_FOUND_PROGRESS)
+
+@router.get("/cultural-hub/collect/progress/{progress_id}/stream")
+async def stream_progress(progress_id: str, request: Request):
+    """진행 상황 SSE 스트림 - 상태가 바뀔 때만 전송하고 작업이 끝나면 종료"""
+    async def event_stream():
+        last_payload = None
+        last_sent_at = time.monotonic()
+        
+        while not await request.is_disconnected():
+            progress = await run_in_threadpool(collection_job_store.get, progress_id)
+            if progress is None:
+                yield f"event: progress\ndata: {json.dumps(NOT_FOUND_PROGRESS, ensure_ascii=False)}\n\n"
+                return
+            
+            payload = json.dumps(progress, ensure_ascii=False, default=str)
+            if payload != last_payload:
+                yield f"event: progress\ndata: {payload}\n\n"
+                last_payload = payload
+                last_sent_at = time.monotonic()
+            elif time.monotonic() - last_sent_at >= PROGRESS_STREAM_KEEPALIVE:
+                yield ": keep-alive\n\n"
+                last_sent_at = time.monotonic()
+            
+            if progress['completed']:
+                return
+            
+            await asyncio.sleep(PROGRESS_STREAM_INTERVAL)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @router.post("/cultural-hub/collect/cancel/{progress_id}")
-async def cancel_collection(progress_id: str):
+def cancel_collection(progress_id: str):
     """데이터 수집 취소"""
     try:
-        # 취소 요청 등록
-        cancellation_requests.add(progress_id)
-        
-        # 진행 상황 업데이트 (있는 경우)
-        if progress_id in progress_store:
-            progress_store[progress_id].update({
-                'cancelled': True,
-                'completed': True,
-                'message': '사용자에 의해 취소되었습니다',
-                'percentage': 100
-            })
+        # 취소 요청 등록 (작업을 실행 중인 워커가 다음 취소 확인 때 감지)
+        collection_job_store.request_cancel(progress_id)
         
         logging.info(f"데이터 수집 취소 요청: {progress_id}")
         
@@ -1030,29 +1273,17 @@ async def cancel_collection(progress_id: str):
 
 
 @router.delete("/cultural-hub/collect/force-stop")
-async def force_stop_all_collections():
+def force_stop_all_collections():
     """모든 진행 중인 수집 작업 강제 중단"""
     try:
-        stopped_count = 0
-        
-        # 모든 진행 중인 작업을 취소로 마킹
-        for progress_id, progress_data in progress_store.items():
-            if not progress_data.get('completed', False):
-                cancellation_requests.add(progress_id)
-                progress_store[progress_id].update({
-                    'cancelled': True,
-                    'completed': True,
-                    'message': '관리자에 의해 강제 중단되었습니다',
-                    'percentage': 100
-                })
-                stopped_count += 1
-        
-        # 진행 중인 스레드들도 정리
+        # 모든 워커의 진행 중인 작업을 취소로 마킹
+        stopped_count = collection_job_store.cancel_all_running()
+        
+        # 이 워커의 스레드 상태 로그 (스레드는 취소 플래그를 보고 스스로 종료)
         for progress_id in list(running_threads.keys()):
-            thread = running_threads[progress_id]
-            if thread.is_alive():
+            thread = running_threads.get(progress_id)
+            if thread is not None and thread.is_alive():
                 logging.info(f"스레드 {progress_id} 강제 종료 대기 중...")
-            del running_threads[progress_id]
         
         logging.info(f"강제 중단된 작업 수: {stopped_count}")
         
@@ -1065,246 +1296,3 @@ async def force_stop_all_collections():
     except Exception as e:
         logging.error(f"강제 중단 처리 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"강제 중단 실패: {str(e)}")
-
-def run_collection_with_progress_sync(progress_id: str, max_pages: int, use_sequential: bool, incremental: bool):
-    """진행 상황을 업데이트하면서 데이터 수집 실행"""
-    try:
-        from ...db.session import SessionLocal
-        
-        def update_progress(step: int, message: str, percentage: int):
-            # 취소 요청 확인
-            if progress_id in cancellation_requests:
-                if progress_id in progress_store:
-                    progress_store[progress_id].update({
-                        'step': step,
-                        'message': '사용자에 의해 취소되었습니다',
-                        'percentage': 100,
-                        'completed': True,
-                        'cancelled': True
-                    })
-                return False
-            
-            if progress_id in progress_store:
-                progress_store[progress_id].update({
-                    'step': step,
-                    'message': message,
-                    'percentage': percentage,
-                    'completed': False
-                })
-                return True
-            return False
-        
-        # 새로운 DB 세션 생성
-        db = SessionLocal()
-        
-        try:
-            cultural_service = CulturalHubExhibitionService(db)
-            
-            # 단계별 진행 상황 업데이트 (각 단계에서 취소 확인)
-            if not update_progress(2, 'API 연결을 확인하는 중...', 10):
-                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            if not update_progress(3, '데이터 소스를 초기화하는 중...', 20):
-                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            if not update_progress(4, '문화 데이터를 수집하는 중...', 30):
-                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
-                return
-            
-            # 데이터 수집 실행 (취소 확인 콜백 포함)
-            def collection_progress_callback(step, message, api_info=None):
-                # 취소 확인
-                if progress_id in cancellation_requests:
-                    logging.info(f"수집 중 취소 감지: {progress_id}")
-                    return False
-                # 진행 상황 업데이트
-                return update_progress(4, f"API 수집 중: {message}", min(30 + (step * 10), 80))
-            
-            def cancel_check():
-                return progress_id in cancellation_requests
-            
-            # 동기 버전으로 호출
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(cultural_service.collect_all_exhibitions_safely(
-                    max_pages=max_pages, 
-                    use_sequential=use_sequential,
-                    incremental=incremental,
-                    progress_callback=collection_progress_callback,
-                    cancel_check=cancel_check
-                ))
-            finally:
-                loop.close()
-            
-            if not update_progress(6, '수집된 데이터를 검증하는 중...', 85):
-                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            if not update_progress(7, '데이터베이스에 저장하는 중...', 95):
-                logging.info(f"데이터 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            # 완료 (취소되지 않은 경우만)
-            if progress_id not in cancellation_requests:
-                progress_store[progress_id].update({
-                    'step': 8,
-                    'message': '데이터 수집이 완료되었습니다',
-                    'percentage': 100,
-                    'completed': True,
-                    'results': result
-                })
-                
-                logging.info(f"수집 완료: success={result['success']}")
-                if result['success']:
-                    logging.info(f"총 데이터 수: {result.get('total_collected', 0)}")
-                
-        finally:
-            # 취소 요청 정리
-            if progress_id in cancellation_requests:
-                cancellation_requests.remove(progress_id)
-                logging.info(f"취소 요청 정리 완료: {progress_id}")
-            
-            # 스레드 정리
-            if progress_id in running_threads:
-                del running_threads[progress_id]
-                logging.info(f"스레드 정리 완료: {progress_id}")
-            
-            db.close()
-
-    except Exception as e:
-        logging.error(f"수집 작업 오류: {str(e)}")
-        if progress_id in progress_store:
-            progress_store[progress_id].update({
-                'step': 8,
-                'message': f'오류 발생: {str(e)}',
-                'percentage': 100,
-                'completed': True,
-                'error': str(e)
-            })
-
-
-def run_single_api_collection_sync(progress_id: str, api_key: str, max_pages: int, use_sequential: bool, incremental: bool):
-    """개별 API 데이터 수집 실행"""
-    try:
-        from ...db.session import SessionLocal
-        
-        def update_progress(step: int, message: str, percentage: int):
-            # 취소 요청 확인
-            if progress_id in cancellation_requests:
-                if progress_id in progress_store:
-                    progress_store[progress_id].update({
-                        'step': step,
-                        'message': '사용자에 의해 취소되었습니다',
-                        'percentage': 100,
-                        'completed': True,
-                        'cancelled': True
-                    })
-                return False
-            
-            if progress_id in progress_store:
-                progress_store[progress_id].update({
-                    'step': step,
-                    'message': message,
-                    'percentage': percentage,
-                    'completed': False
-                })
-                return True
-            return False
-        
-        # 새로운 DB 세션 생성
-        db = SessionLocal()
-        
-        try:
-            cultural_service = CulturalHubExhibitionService(db)
-            
-            # 단계별 진행 상황 업데이트
-            if not update_progress(2, f'{api_key} API 연결을 확인하는 중...', 10):
-                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            if not update_progress(3, f'{api_key} API 데이터를 수집하는 중...', 30):
-                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
-                return
-            
-            # 개별 API 수집 실행
-            def collection_progress_callback(step, message, api_info=None):
-                # 취소 확인
-                if progress_id in cancellation_requests:
-                    logging.info(f"개별 수집 중 취소 감지: {progress_id}")
-                    return False
-                # 진행 상황 업데이트
-                return update_progress(4, f"{api_key}: {message}", min(40 + (step * 15), 80))
-            
-            def cancel_check():
-                return progress_id in cancellation_requests
-            
-            # 개별 API 수집 (동기 버전으로 호출)
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(cultural_service.collect_single_api_safely(
-                    api_key=api_key,
-                    max_pages=max_pages,
-                    use_sequential=use_sequential,
-                    incremental=incremental,
-                    progress_callback=collection_progress_callback,
-                    cancel_check=cancel_check
-                ))
-            finally:
-                loop.close()
-            
-            if not update_progress(6, f'{api_key} 수집된 데이터를 검증하는 중...', 85):
-                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            if not update_progress(7, f'{api_key} 데이터베이스에 저장하는 중...', 95):
-                logging.info(f"개별 API 수집이 취소되었습니다: {progress_id}")
-                return
-            time.sleep(0.5)
-            
-            # 완료 (취소되지 않은 경우만)
-            if progress_id not in cancellation_requests:
-                progress_store[progress_id].update({
-                    'step': 8,
-                    'message': f'{api_key} API 수집이 완료되었습니다',
-                    'percentage': 100,
-                    'completed': True,
-                    'results': result
-                })
-                
-                logging.info(f"개별 API 수집 완료: {api_key}, success={result.get('success', False)}")
-                
-        finally:
-            # 취소 요청 정리
-            if progress_id in cancellation_requests:
-                cancellation_requests.remove(progress_id)
-                logging.info(f"개별 수집 취소 요청 정리 완료: {progress_id}")
-            
-            # 스레드 정리
-            if progress_id in running_threads:
-                del running_threads[progress_id]
-                logging.info(f"개별 수집 스레드 정리 완료: {progress_id}")
-            
-            db.close()
-        
-    except Exception as e:
-        logging.error(f"개별 API 수집 오류: {str(e)}")
-        if progress_id in progress_store:
-            progress_store[progress_id].update({
-                'step': 8,
-                'message': f'{api_key} 수집 중 오류 발생: {str(e)}',
-                'percentage': 100,
-                'completed': True,
-                'error': str(e)
-            })
\ No newline at end of file
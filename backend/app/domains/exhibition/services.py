@@ -12,6 +12,8 @@ import httpx
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_
 from app.domains.exhibition.models import Institution, Exhibition, DataSource
+from app.domains.exhibition.fingerprint import compute_content_hash, EXHIBITION_HASH_FIELDS
+from app.domains.exhibition.date_parser import parse_date
 from app.core.config import settings
 import json
 
@@ -150,7 +152,7 @@ class ExhibitionDataCollector:
 
     async def _collect_from_api(self, institution_name: str, config: Dict) -> Dict[str, Any]:
         """개별 API에서 데이터 수집"""
-        result = {"processed": 0, "created": 0, "updated": 0, "failed": 0}
+        result = {"processed": 0, "created": 0, "updated": 0, "unchanged": 0, "failed": 0}
         
         # 기관 정보 확인/생성
         institution = await self._get_or_create_institution(institution_name)
@@ -167,6 +169,8 @@ class ExhibitionDataCollector:
                         result["created"] += 1
                     elif processed == "updated":
                         result["updated"] += 1
+                    elif processed == "unchanged":
+                        result["unchanged"] += 1
                     result["processed"] += 1
                     
                 except Exception as e:
@@ -369,7 +373,13 @@ class ExhibitionDataCollector:
             else:
                 existing_exhibition = None
         
+        normalized_data["content_hash"] = compute_content_hash(normalized_data, EXHIBITION_HASH_FIELDS)
+        
         if existing_exhibition:
+            # 콘텐츠 지문이 같으면 쓰기 없이 스킵
+            if existing_exhibition.content_hash == normalized_data["content_hash"]:
+                return "unchanged"
+            
             # 기존 전시가 있으면 업데이트
             for key, value in normalized_data.items():
                 if hasattr(existing_exhibition, key) and value is not None:
@@ -422,13 +432,11 @@ class ExhibitionDataCollector:
                     
                     # 날짜 필드 처리
                     if target_field in ["start_date", "end_date"] and isinstance(value, str):
-                        try:
-                            # YYYY.MM.DD 또는 YYYY-MM-DD 형식 변환
-                            value = value.replace(".", "-")
-                            if len(value) == 10:
-                                normalized[target_field] = datetime.strptime(value, "%Y-%m-%d").date()
-                        except ValueError:
+                        # YYYY.MM.DD, YYYY-MM-DD, YYYY년 M월 D일, YYYYMMDD 등 (캐시된 파서)
+                        parsed_date = parse_date(value)
+                        if parsed_date is None:
                             continue
+                        normalized[target_field] = parsed_date
                     elif target_field == "image_url" and source_field == "IMG_URL":
                         # 서울시립미술관 이미지 URL 처리
                         if value and not value.startswith('http'):
@@ -0,0 +1,758 @@
+"""
+문화기관 API 소스 어댑터 레지스트리
+기관별 URL 구성, 요청 파라미터, 응답 파싱, 페이징, 컬럼 매핑을 어댑터로 선언하고
+모듈 임포트 시 한 번만 구성한다 (새 기관은 설정 + 어댑터 등록만으로 추가)
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import xmltodict
+
+# 문화공공데이터 광장 기본 URL
+KCISA_BASE_URL = "https://api.kcisa.kr/openapi"
+KCISA_DIRECT_BASE_URL = "https://api.kcisa.kr"  # 국립중앙박물관용 직접 URL
+
+# 서울시립미술관 아카이브 HTML 응답의 {result=...} 패턴
+SEMA_RESULT_PATTERN = re.compile(
+    r'\{result=(\{.*?\}), totCnt=(\d+), message=(.*?), list=(.*?), status=(\w+)\}',
+    re.DOTALL
+)
+
+# 16개 문화기관 API 완전 검증된 허브 설정
+# - adapter: 응답 형식별 어댑터 타입 (기본값 kcisa)
+# - log_label: 수집 로그에 붙는 표시
+CULTURAL_API_CONFIG: Dict[str, Dict[str, Any]] = {
+    'arts_center': {
+        'endpoint': 'API_CCA_149/request',
+        'service_key': '67a7bb34-331e-4136-a32d-61d663c1f902',
+        'name': '예술의전당 전시정보',
+        'category': '전시',
+        'priority': 1,  # 우선순위 (낮을수록 먼저 처리)
+        'institution_type': '공연장',
+        'location': '서울',
+        'column_mapping': {
+            'TITLE': '제목',
+            'CNTC_INSTT_NM': '연계기관명',
+            'COLLECTED_DATE': '수집일',
+            'ISSUED_DATE': '자료생성일자',
+            'DESCRIPTION': '소개설명',
+            'IMAGE_OBJECT': '이미지주소',
+            'LOCAL_ID': '전시ID',
+            'URL': '홈페이지주소',
+            'EVENT_SITE': '장소',
+            'GENRE': '장르',
+            'PERIOD': '기간',
+            'EVENT_PERIOD': '시간',
+            'AUTHOR': '작가',
+            'CONTACT_POINT': '문의',
+            'CHARGE': '관람료할인정보'
+        }
+    },
+
+    'history_museum': {
+        'endpoint': 'service/rest/meta2020/getMCHBspecial',
+        'service_key': '2be9e796-ad86-4052-a35a-cbbfc690dd98',
+        'name': '대한민국역사박물관 특별전시',
+        'category': '특별전시',
+        'priority': 2,
+        'institution_type': '국립박물관',
+        'location': '서울',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'url': '홈페이지주소',
+            'collectionDb': '장르',
+            'eventPeriod': '기간',
+            'venue': '장소',
+            'publisher': '발행처',
+        }
+    },
+
+    'hangeul_museum': {
+        'endpoint': 'service/rest/meta2020/getNHMBex',
+        'service_key': '61bd783c-310d-446f-b954-474c7e5e5786',
+        'name': '국립한글박물관 전시정보',
+        'category': '전시',
+        'priority': 3,
+        'institution_type': '국립박물관',
+        'location': '서울',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'url': '홈페이지주소',
+            'collectionDb': '장르',
+            'publisher': '발행처',
+            'subDescription': '부가설명',
+        }
+    },
+
+    'kocaca': {
+        'endpoint': 'service/rest/meta2020/getKOCAperf',
+        'service_key': 'e0511ad1-e637-44dc-a2ad-608a0562417a',
+        'name': '한국문화예술회관연합회 공연전시정보',
+        'category': '공연전시',
+        'priority': 4,
+        'institution_type': '문화예술회관',
+        'location': '전국',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'referenceIdentifier': '이미지주소',
+            'url': '홈페이지주소',
+            'venue': '장소',
+            'collectionDb': '장르',
+            'eventPeriod': '기간',
+            'charge': '관람료할인정보',
+            'publisher': '발행처',
+            'sourceTitle': '원본제목',
+            'rights': '문의',
+        }
+    },
+
+    'kcdf': {
+        'endpoint': 'service/rest/meta8/getKCDA1503',
+        'service_key': 'e77c4454-1197-4856-8003-d9a4af692cf1',
+        'name': '한국공예디자인문화진흥원 전시도록',
+        'category': '전시도록',
+        'priority': 5,
+        'institution_type': '진흥원',
+        'location': '서울',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'referenceIdentifier': '이미지주소',
+            'url': '홈페이지주소',
+            'collectionDb': '장르',
+            'alternativeTitle': '부제목',
+            'extent': '크기정보',
+            'language': '언어',
+            'contributor': '기여자',
+            'copyrightOthers': '저작권정보',
+        }
+    },
+
+    'arko': {
+        'endpoint': 'service/rest/meta4/getARKA1202',
+        'service_key': '52dd795c-83cb-46fc-bbf8-d09e078c7a55',
+        'name': '한국문화예술위원회 아르코미술관전시',
+        'category': '미술관전시',
+        'priority': 6,
+        'institution_type': '미술관',
+        'location': '서울',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'url': '홈페이지주소',
+            'collectionDb': '장르',
+            'subjectKeyword': '키워드',
+            'alternativeTitle': '부제목',
+            'extent': '크기정보',
+            'language': '언어',
+            'contributor': '기여자',
+            'copyrightOthers': '저작권정보',
+            'sourceTitle': '원본제목',
+        }
+    },
+
+    'jeonju_culture': {
+        'endpoint': 'service/rest/other/getJEON5201',
+        'service_key': '9fe0e24d-ba40-470c-bd06-79147e932871',
+        'name': '전주시 공연전시정보',
+        'category': '지역공연전시',
+        'priority': 7,
+        'institution_type': '지방자치단체',
+        'location': '전주',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'url': '홈페이지주소',
+            'spatialCoverage': '장소',
+            'collectionDb': '장르',
+            'temporalCoverage': '기간',
+            'charge': '관람료할인정보',
+            'grade': '등급정보',
+            'alternativeTitle': '부제목',
+            'extent': '크기정보',
+            'language': '언어',
+            'contributor': '기여자',
+            'copyrightOthers': '저작권정보',
+            'rights': '문의',
+        }
+    },
+
+    'sema': {
+        'endpoint': 'service/rest/other/getSEMN5601',
+        'service_key': 'feb3f330-c7e3-41e6-ac1f-2aa79ca17078',
+        'name': '서울시립미술관 전시정보',
+        'category': '시립미술관전시',
+        'priority': 8,
+        'institution_type': '시립미술관',
+        'location': '서울',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'url': '홈페이지주소',
+            'venue': '장소',
+            'collectionDb': '장르',
+            'eventPeriod': '기간',
+            'charge': '관람료할인정보',
+            'grade': '등급정보',
+            'referenceIdentifier': '이미지주소',
+            'alternativeTitle': '부제목',
+            'extent': '크기정보',
+            'language': '언어',
+            'contributor': '기여자',
+            'copyrightOthers': '저작권정보',
+            'sourceTitle': '원본제목',
+            'rights': '문의',
+        }
+    },
+
+    'mapo_art': {
+        'endpoint': 'service/rest/other/getMAPN0701',
+        'service_key': 'bf972437-adb8-432b-90f9-4aa739fe61f8',
+        'name': '마포문화재단 마포아트센터공연전시',
+        'category': '지역아트센터',
+        'priority': 9,
+        'institution_type': '문화재단',
+        'location': '서울 마포',
+        'log_label': 'NEW',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'regDate': '수집일',
+            'description': '소개설명',
+            'url': '홈페이지주소',
+            'venue': '장소',
+            'collectionDb': '장르',
+            'eventPeriod': '기간',
+            'charge': '관람료할인정보',
+            'grade': '등급정보',
+            'rights': '문의',
+            'alternativeTitle': '부제목',
+            'extent': '크기정보',
+            'language': '언어',
+            'contributor': '기여자',
+            'copyrightOthers': '저작권정보',
+            'sourceTitle': '원본제목',
+        }
+    },
+
+    'mmca': {
+        'endpoint': 'service/rest/moca/docMeta',
+        'service_key': '1851aea9-303e-4df4-ab29-903227afd400',
+        'name': '국립현대미술관 전시정보',
+        'category': '국립미술관전시',
+        'priority': 10,
+        'institution_type': '국립미술관',
+        'location': '서울/과천/덕수궁/청주',
+        'log_label': 'FIXED',
+        'column_mapping': {
+            'title': '제목',
+            'creator': '연계기관명',
+            'subDescription': '소개설명',
+            'venue': '장소',
+            'collectionDb': '장르',
+            'eventPeriod': '기간',
+            'person': '작가',
+            'charge': '관람료할인정보',
+            'rights': '문의',
+            'subjectCategory': '카테고리',
+            'publisher': '발행처',
+        }
+    },
+
+    'integrated_exhibition': {
+        'endpoint': 'API_CCA_145/request',
+        'service_key': '7daab567-98f0-463a-83f7-2daf3708699b',
+        'name': '한국문화정보원 외 전시정보(통합)',
+        'category': '통합전시정보',
+        'priority': 11,
+        'institution_type': '통합정보원',
+        'location': '전국',
+        'log_label': 'FIXED',
+        'column_mapping': {
+            'TITLE': '제목',
+            'CNTC_INSTT_NM': '연계기관명',
+            'COLLECTED_DATE': '수집일',
+            'ISSUED_DATE': '자료생성일자',
+            'DESCRIPTION': '소개설명',
+            'IMAGE_OBJECT': '이미지주소',
+            'LOCAL_ID': '전시ID',
+            'URL': '홈페이지주소',
+            'EVENT_SITE': '장소',
+            'GENRE': '장르',
+            'PERIOD': '기간',
+            'EVENT_PERIOD': '시간',
+            'AUTHOR': '작가',
+            'CONTACT_POINT': '문의',
+            'CHARGE': '관람료할인정보',
+            'CONTRIBUTOR': '기여기관',
+            'AUDIENCE': '관람대상',
+            'SUB_DESCRIPTION': '부가설명',
+            'VIEW_COUNT': '조회수',
+        }
+    },
+
+    'barrier_free': {
+        'endpoint': 'API_TOU_049/request',
+        'service_key': '1c0b4f33-9d42-43f2-afea-ce63933132b0',
+        'name': '한국문화정보원 전국 문화예술관광지 배리어프리 정보',
+        'category': '배리어프리정보',
+        'priority': 12,
+        'institution_type': '정보원',
+        'location': '전국',
+        'log_label': 'FIXED',
+        'column_mapping': {
+            'title': '제목',
+            'category1': '카테고리1',
+            'issuedDate': '수집일',
+            'description': '소개설명',
+            'url': '홈페이지주소',
+            'address': '장소',
+            'category2': '카테고리2',
+            'subDescription': '시설정보',
+            'coordinates': '좌표정보',
+            'tel': '문의전화',
+            'category3': '세부카테고리'
+        }
+    },
+
+    # 특별 처리가 필요한 문화기관
+    'museum_catalog': {
+        'endpoint': 'API_CNV_049/request',
+        'service_key': '82050181-5c55-4adb-9232-310ba3b625c7',
+        'name': '국립중앙박물관 외 전시도록',
+        'category': '박물관전시도록',
+        'priority': 13,
+        'institution_type': '국립박물관',
+        'location': '서울',
+        'sensitive': True,  # 민감한 API 표시
+        'base_url': KCISA_DIRECT_BASE_URL,  # 직접 URL 사용
+        'log_label': 'SAFE MODE',
+        'column_mapping': {
+            'title': '제목',
+            'alternativeTitle': '부제목',
+            'createdDate': '수집일',
+            'description': '소개설명',
+            'imageObject': '이미지주소',
+            'url': '홈페이지주소',
+            'subjectKeyword': '키워드',
+            'period': '기간',
+            'subDescription': '부가설명',
+            'sizing': '크기정보',
+            'charge': '유료무료정보',
+            'localId': '원천기관자료식별자',
+            'viewCount': '조회수'
+        }
+    },
+
+    # 지역 문화기관: 제주문화예술진흥원
+    'jeju_culture': {
+        'endpoint': 'rest/JejuExhibitionService/getJejucultureExhibitionList',
+        'service_key': None,  # 키 불필요
+        'name': '제주문화예술진흥원 공연/전시 정보',
+        'category': '지역문화예술',
+        'priority': 14,
+        'institution_type': '지역진흥원',
+        'location': '제주',
+        'base_url': 'http://www.jeju.go.kr',  # 특별한 베이스 URL
+        'response_format': 'xml',  # XML 응답
+        'adapter': 'jeju',
+        'log_label': 'JEJU',
+        'institution_name': '제주문화예술진흥원',
+        'stored_source_name': '제주문화예술진흥원 공연전시정보',  # DB 조인 조건에 맞춤 (제주%로 매칭됨)
+        'id_field': 'seq',
+        'date_fields': ('start', 'end'),  # start와 end 필드가 같은 값을 가질 수 있음
+        'column_mapping': {
+            'title': '제목',
+            'owner': '연계기관명',
+            'start': '시작일',
+            'end': '종료일',
+            'hour': '시간',
+            'cover': '이미지주소',
+            'coverThumb': '썸네일이미지',
+            'locNames': '장소',
+            'categoryName': '장르',
+            'pay': '관람료정보',
+            'tel': '문의전화',
+            'stat': '상태정보',
+            'seq': '일련번호',
+            'divName': '상세장르',
+            'category': '카테고리코드',
+            'locs': '장소코드',
+        }
+    },
+
+    # 지역 문화기관: 대구광역시
+    'daegu_culture': {
+        'endpoint': 'api/daegu/cultural-events',
+        'service_key': None,  # 키 불필요
+        'name': '대구광역시 공연·전시 정보',
+        'category': '지역문화행사',
+        'priority': 15,
+        'institution_type': '광역시',
+        'location': '대구',
+        'base_url': 'https://dgfca.or.kr',  # 특별한 베이스 URL
+        'response_format': 'json',  # JSON 응답
+        'adapter': 'daegu',
+        'log_label': 'DAEGU',
+        'institution_name': '대구광역시',
+        'stored_source_name': '대구광역시 공연전시정보',  # DB 조인 조건에 맞춤 (대구%로 매칭됨)
+        'id_field': 'event_seq',
+        'date_fields': ('start_date', 'end_date'),
+        'column_mapping': {
+            'subject': '제목',
+            'event_gubun': '구분',
+            'start_date': '시작일',
+            'end_date': '종료일',
+            'place': '장소',
+            'event_area': '지역',
+            'host': '주최',
+            'contact': '문의',
+            'pay_gubun': '유료무료',
+            'pay': '관람료할인정보',
+            'homepage': '홈페이지주소',
+            'content': '소개설명',
+            'event_seq': '전시ID'
+        }
+    },
+
+    # 서울시립미술관 아카이브
+    'sema_archive': {
+        'endpoint': 'semaaa/front/openapi.do',
+        'service_key': '76f1a6fddd3d4a2d8c6b92f14d414fbb',
+        'name': '서울시립미술관 아카이브',
+        'category': '미술관아카이브',
+        'priority': 16,
+        'institution_type': '시립미술관아카이브',
+        'location': '서울',
+        'base_url': 'https://sema.seoul.go.kr',  # 특별한 베이스 URL
+        'response_format': 'html',  # HTML 응답
+        'adapter': 'sema',
+        'institution_name': '서울시립미술관',
+        'stored_source_name': '서울시립미술관 아카이브',  # DB 조인 조건에 맞춤
+        'column_mapping': {
+            'I_TITLE': '제목',
+            'I_SCOPE': '소개설명',
+            'CP_CLASS_NM': '장르',
+            'I_CREATOR': '작가',
+            'I_DT': '생산일자',
+            'I_DONOR': '수집처',
+            'I_TYPE': '자료유형',
+            'I_TYPE_NM': '자료유형명',
+            'I_TITLE_STR': '부제목',
+            'I_CLSSSUB_SUB': '분류',
+            'BK_VOL_NO': '권호',
+            'I_REGNO': '등록번호',
+            'IMG_URL': '이미지URL',
+            'REG_DT': '등록일자',
+            'I_ID': '아이디',
+            'CP_CLASS': '분류코드',
+            'I_DIGITAL_NM': '전자여부'
+        }
+    }
+}
+
+# 문화예술 표준 컬럼 정의
+CULTURAL_STANDARD_COLUMNS = [
+    '제목', '연계기관명', '수집일', '자료생성일자', '소개설명', 
+    '이미지주소', '홈페이지주소', '장소', '장르', '기간', '시간',
+    '작가', '문의', '관람료할인정보', '전시ID', '부제목', '크기정보',
+    '키워드', '시설정보', '접근성정보', '등급정보', '시간적범위',
+    '공간정보', '좌표정보', '문의전화', '세부카테고리', '부가설명',
+    '유료무료정보', '원천기관자료식별자', '조회수', '카테고리1', 
+    '카테고리2'
+]
+
+
+# ======================================
+# 소스 어댑터
+# ======================================
+_ADAPTER_TYPES: Dict[str, type] = {}
+
+
+def register_adapter_type(name: str):
+    """응답 형식별 어댑터 클래스 등록 데코레이터"""
+    def decorator(cls):
+        cls.adapter_type = name
+        _ADAPTER_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+def _as_item_list(items: Any) -> Optional[List[Dict]]:
+    """{'item': ...} 구조에서 항목 리스트 추출 (단일 항목은 리스트로 변환, 구조가 다르면 None)"""
+    if not isinstance(items, dict) or 'item' not in items:
+        return None
+    item_list = items['item']
+    if isinstance(item_list, dict):
+        return [item_list]
+    if isinstance(item_list, list):
+        return item_list
+    return None
+
+
+def _standard_response(result_code: str, result_msg: str, total_count: int, items: List[Dict]) -> Dict[str, Any]:
+    """표준 API 응답 구조 (header/body) 생성"""
+    return {
+        'header': {
+            'resultCode': result_code,
+            'resultMsg': result_msg
+        },
+        'body': {
+            'totalCount': str(total_count),
+            'items': {
+                'item': items
+            }
+        }
+    }
+
+
+class SourceAdapter(ABC):
+    """문화기관 API 소스 어댑터 기본 클래스
+
+    모든 어댑터의 parse_response는 응답 바이트만으로 동작하므로
+    녹화된 응답(fixture)으로 테스트/벤치마크할 수 있다
+    """
+
+    adapter_type = 'base'
+    paged = True                    # 페이지 단위 수집 여부
+    page_size = 100                 # 수집 시 페이지당 항목 수
+    test_page_size = 5              # 연결 테스트 시 항목 수
+    max_consecutive_failures = 3    # 연속 실패 허용 횟수
+    failure_wait = 3.0              # 실패 후 대기 시간 (초)
+
+    def __init__(self, api_key: str, config: Dict[str, Any]):
+        self.api_key = api_key
+        self.config = config
+        self.name = config['name']
+        self.url = self.build_url()
+        self.column_mapping = tuple(config.get('column_mapping', {}).items())
+        self.base_delay = 2.0 if config.get('sensitive', False) else None  # 민감한 API는 더 긴 대기
+        self.label = f" ({config['log_label']})" if config.get('log_label') else ""
+        self.institution_name = config.get('institution_name') or config['name']
+        self.stored_source_name = config.get('stored_source_name')
+        self.id_field = config.get('id_field')
+        self.date_fields = config.get('date_fields')
+
+    def build_url(self) -> str:
+        return f"{self.config.get('base_url', KCISA_BASE_URL)}/{self.config['endpoint']}"
+
+    @abstractmethod
+    def build_params(self, page: int, page_size: Optional[int] = None) -> Dict[str, Any]:
+        """페이지 요청 파라미터 (page_size가 주어지면 연결 테스트용)"""
+
+    def test_params(self) -> Dict[str, Any]:
+        return self.build_params(1, self.test_page_size)
+
+    @abstractmethod
+    def parse_response(self, content: bytes, encoding: Optional[str] = None) -> Tuple[bool, Optional[Dict], str]:
+        """응답 본문을 표준 구조(header/body)로 변환 → (성공 여부, 데이터, 메시지)"""
+
+    def extract_items(self, data: Optional[Dict]) -> Tuple[Optional[List[Dict]], int]:
+        """표준 구조에서 (항목 리스트, 전체 건수) 추출 - 구조가 다르면 항목은 None"""
+        if not data or 'body' not in data:
+            return None, 0
+        body = data['body'] or {}
+        total_count = int(body.get('totalCount', 0) or 0)
+        return _as_item_list(body.get('items', {})), total_count
+
+    def is_last_page(self, page_items: List[Dict]) -> bool:
+        return len(page_items) < self.page_size
+
+    def item_fields(self, item: Dict) -> Dict:
+        """컬럼 매핑 대상 필드 (기관별로 중첩 구조가 다를 수 있음)"""
+        return item
+
+    def record_id(self, item: Dict) -> Optional[Any]:
+        return item.get(self.id_field) if self.id_field else None
+
+    def normalize_extras(self, item: Dict, normalized: Dict) -> None:
+        """컬럼 매핑 이후 기관별 추가 처리"""
+        if self.config.get('institution_name'):
+            normalized['연계기관명'] = self.institution_name
+        if self.stored_source_name:
+            normalized['api_source'] = self.stored_source_name
+        record_id = self.record_id(item)
+        if record_id is not None:
+            normalized['전시ID'] = str(record_id)
+        if self.date_fields:
+            start_field, end_field = self.date_fields
+            if start_field in item:
+                normalized['시작일'] = item[start_field]
+            if end_field in item:
+                normalized['종료일'] = item[end_field]
+
+
+@register_adapter_type('kcisa')
+class KcisaAdapter(SourceAdapter):
+    """문화공공데이터 광장 API (XML, serviceKey/pageNo 페이징)"""
+
+    def build_params(self, page: int, page_size: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            'serviceKey': self.config['service_key'],
+            'numOfRows': page_size or self.page_size,
+            'pageNo': page
+        }
+
+    def parse_response(self, content: bytes, encoding: Optional[str] = None) -> Tuple[bool, Optional[Dict], str]:
+        xml_data = xmltodict.parse(content)
+
+        if 'response' in xml_data:
+            response_data = xml_data['response']
+
+            if 'header' in response_data:
+                result_code = response_data['header'].get('resultCode', 'UNKNOWN')
+                result_msg = response_data['header'].get('resultMsg', 'Unknown')
+
+                if result_code in ['00', '0000']:
+                    body = response_data.get('body') or {}
+                    total_count = int(body.get('totalCount', 0) or 0)
+                    return True, response_data, f"성공 (코드: {result_code}, 총 데이터: {total_count}개)"
+                return False, None, f"문화기관 API 응답 코드: {result_code} - {result_msg}"
+
+        return False, None, "문화기관 API 응답 구조가 예상과 다릅니다."
+
+    def extract_items(self, data: Optional[Dict]) -> Tuple[Optional[List[Dict]], int]:
+        items, total_count = super().extract_items(data)
+        if items is not None and total_count == 0:
+            return [], 0
+        return items, total_count
+
+
+@register_adapter_type('jeju')
+class JejuAdapter(SourceAdapter):
+    """제주문화예술진흥원 API (XML jejunetApi, 파라미터 없이 전체 반환)"""
+
+    paged = False
+    max_consecutive_failures = 1  # 전체를 한 번에 반환하므로 재시도 없이 한 번만 요청
+
+    def build_params(self, page: int, page_size: Optional[int] = None) -> Dict[str, Any]:
+        return {}
+
+    def parse_response(self, content: bytes, encoding: Optional[str] = None) -> Tuple[bool, Optional[Dict], str]:
+        xml_data = xmltodict.parse(content)
+
+        if 'jejunetApi' not in xml_data:
+            return False, None, "문화기관 API 응답 구조가 예상과 다릅니다."
+
+        jeju_data = xml_data['jejunetApi']
+        result_code = jeju_data.get('resultCode', 'UNKNOWN')
+        result_msg = jeju_data.get('resultMsg', 'Unknown')
+
+        if result_code != '00':
+            return False, None, f"제주 문화기관 API 응답 코드: {result_code} - {result_msg}"
+
+        item_list = _as_item_list(jeju_data.get('items', {})) or []
+        total_count = len(item_list)
+        message = f"성공 (코드: {result_code}, 총 데이터: {total_count}개)"
+        return True, _standard_response(result_code, result_msg, total_count, item_list), message
+
+
+@register_adapter_type('daegu')
+class DaeguAdapter(SourceAdapter):
+    """대구광역시 API (JSON 배열, 파라미터 없이 전체 반환)"""
+
+    paged = False
+    max_consecutive_failures = 1  # 전체를 한 번에 반환하므로 재시도 없이 한 번만 요청
+
+    def build_params(self, page: int, page_size: Optional[int] = None) -> Dict[str, Any]:
+        return {}
+
+    def parse_response(self, content: bytes, encoding: Optional[str] = None) -> Tuple[bool, Optional[Dict], str]:
+        try:
+            json_data = json.loads(content)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return False, None, "대구 API JSON 파싱 오류"
+
+        if not isinstance(json_data, list):
+            return False, None, "대구 API 응답이 예상 형식이 아닙니다."
+
+        total_count = len(json_data)
+        message = f"성공 (JSON 배열, 총 데이터: {total_count}개)"
+        return True, _standard_response('00', 'SUCCESS', total_count, json_data), message
+
+
+@register_adapter_type('sema')
+class SemaArchiveAdapter(SourceAdapter):
+    """서울시립미술관 아카이브 API (HTML 안의 {result=...} 패턴, display/page 페이징)"""
+
+    max_consecutive_failures = 1  # 실패 시 바로 중단
+
+    def build_params(self, page: int, page_size: Optional[int] = None) -> Dict[str, Any]:
+        if page_size is not None:
+            # 연결 테스트는 페이지 지정 없이 요청
+            return {'ApiKey': self.config['service_key'], 'display': str(page_size)}
+        return {
+            'ApiKey': self.config['service_key'],
+            'display': str(self.page_size),
+            'page': str(page)
+        }
+
+    def parse_response(self, content: bytes, encoding: Optional[str] = None) -> Tuple[bool, Optional[Dict], str]:
+        text = content.decode(encoding or 'utf-8', errors='replace')
+        match = SEMA_RESULT_PATTERN.search(text)
+        if not match:
+            return False, None, '패턴 매칭 실패'
+
+        total_count = int(match.group(2))
+        try:
+            result_data = json.loads(match.group(1))
+        except json.JSONDecodeError as e:
+            return False, None, f'JSON 파싱 실패: {str(e)}'
+
+        rows = result_data.get('rows', []) if isinstance(result_data, dict) else []
+        return True, _standard_response('00', 'SUCCESS', total_count, rows), f"성공 (총 {total_count}개)"
+
+    def item_fields(self, item: Dict) -> Dict:
+        # 아카이브 데이터는 fields 안에 있음
+        return item['fields'] if 'fields' in item else item
+
+    def record_id(self, item: Dict) -> Optional[Any]:
+        location = item.get('location')
+        if isinstance(location, dict) and 'rowid' in location:
+            return location['rowid']
+        return None
+
+
+def create_source_adapter(api_key: str, config: Dict[str, Any]) -> SourceAdapter:
+    """설정의 adapter 타입으로 어댑터 생성"""
+    adapter_cls = _ADAPTER_TYPES.get(config.get('adapter', 'kcisa'))
+    if adapter_cls is None:
+        raise ValueError(f"알 수 없는 어댑터 타입: {config.get('adapter')} ({api_key})")
+    return adapter_cls(api_key, config)
+
+
+def build_source_adapters(api_config: Dict[str, Dict[str, Any]]) -> Dict[str, SourceAdapter]:
+    return {api_key: create_source_adapter(api_key, config) for api_key, config in api_config.items()}
+
+
+# 임포트 시 한 번만 구성되는 어댑터 레지스트리
+SOURCE_ADAPTERS: Dict[str, SourceAdapter] = build_source_adapters(CULTURAL_API_CONFIG)
+
+
+def get_source_adapter(api_key: str, config: Optional[Dict[str, Any]] = None) -> SourceAdapter:
+    """등록된 어댑터 조회 (레지스트리와 다른 설정이 주어지면 새로 생성)"""
+    adapter = SOURCE_ADAPTERS.get(api_key)
+    if adapter is not None and (config is None or config is adapter.config):
+        return adapter
+    if config is None:
+        raise KeyError(f"등록되지 않은 문화기관 API: {api_key}")
+    return create_source_adapter(api_key, config)
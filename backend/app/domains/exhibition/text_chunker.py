@@ -0,0 +1,124 @@
+"""
+임베딩용 문장 단위 스트리밍 청커
+문장 경계를 미리 컴파일한 정규식으로 한 번만 훑어 찾고, 토큰 수 기준으로 청크를 채우며
+앞 청크의 끝 문장들을 토큰 한도 안에서 겹쳐 다음 청크를 시작한다
+(문장은 한 번만 잘라 두고, 청크를 내보낼 때 한 번만 이어 붙임)
+"""
+
+import re
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, Tuple
+
+# 토큰 계산: tiktoken이 있으면 임베딩 모델 인코딩 사용, 없으면 정규식 근사치
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")
+    TIKTOKEN_AVAILABLE = True
+except Exception:
+    _ENCODING = None
+    TIKTOKEN_AVAILABLE = False
+
+DEFAULT_MAX_TOKENS = 500
+DEFAULT_OVERLAP_TOKENS = 100
+
+# 문장 끝: 문장부호(+닫는 따옴표/괄호), 마침표 없이 줄바꿈으로 끝나는 한국어 종결어미, 문단 경계
+# 뒤따르는 공백/줄바꿈까지 같은 문장에 포함
+SENTENCE_END_PATTERN = re.compile(
+    r'(?:[.!?。！？…]+["\'”’)\]」』]*(?=\s|$)'
+    r'|[다요죠까음함됨임](?=[ \t]*\n)'
+    r'|\n[ \t]*\n)\s*'
+)
+
+# 근사 토큰: 한글 등 비ASCII 문자 1개, 영단어 1개, 숫자 3자리, 기호 1개
+# 비ASCII 문자는 UTF-8 인코딩 길이로 한 번에 세고, 정규식은 ASCII 토큰만 찾음
+_ASCII_TOKEN_PATTERN = re.compile(r'[A-Za-z]+|\d{1,3}|[!-/:-@\[-`{-~]')
+
+
+def estimate_tokens(text: str) -> int:
+    non_ascii = (len(text.encode('utf-8')) - len(text)) // 2
+    return non_ascii + len(_ASCII_TOKEN_PATTERN.findall(text))
+
+
+def count_tokens(text: str) -> int:
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text, disallowed_special=()))
+    return estimate_tokens(text)
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """문장 단위로 자른 조각 (뒤따르는 공백 포함 - 이어 붙이면 원문과 같음)"""
+    start = 0
+    for match in SENTENCE_END_PATTERN.finditer(text):
+        end = match.end()
+        if end > start:
+            yield text[start:end]
+            start = end
+    if start < len(text):
+        yield text[start:]
+
+
+def _split_long_sentence(sentence: str, tokens: int, max_tokens: int,
+                         counter: Callable[[str], int]) -> Iterator[Tuple[str, int]]:
+    """토큰 한도를 넘는 문장을 공백 위치에서 나눔"""
+    while tokens > max_tokens:
+        limit = max(1, len(sentence) * max_tokens // tokens)
+        cut = sentence.rfind(' ', 0, limit)
+        if cut <= 0:
+            cut = limit
+        piece = sentence[:cut + 1] if sentence[cut:cut + 1] == ' ' else sentence[:cut]
+        sentence = sentence[len(piece):]
+        piece_tokens = counter(piece)
+        yield piece, piece_tokens
+        # 나머지를 다시 세지 않음 (공백에서 잘랐으므로 토큰 수는 거의 합산됨)
+        tokens = max(tokens - piece_tokens, 1 if sentence else 0)
+    if sentence:
+        yield sentence, tokens
+
+
+def chunk_texts(texts: Iterable[str], max_tokens: int = DEFAULT_MAX_TOKENS,
+                overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                counter: Callable[[str], int] = count_tokens) -> Iterator[str]:
+    """여러 텍스트(예: 페이지)를 이어서 토큰 한도 청크로 스트리밍 분할"""
+    if overlap_tokens >= max_tokens:
+        raise ValueError("overlap_tokens는 max_tokens보다 작아야 합니다")
+
+    window: Deque[Tuple[str, int]] = deque()
+    window_tokens = 0
+    emitted = True  # 현재 창의 내용을 이미 청크로 내보냈는지
+
+    for index, text in enumerate(texts):
+        if not text:
+            continue
+        sentences = iter_sentences(text)
+        for position, sentence in enumerate(sentences):
+            if index and position == 0 and window and not window[-1][0].endswith('\n'):
+                sentence = '\n' + sentence
+            tokens = counter(sentence)
+            pieces = (_split_long_sentence(sentence, tokens, max_tokens, counter)
+                      if tokens > max_tokens else ((sentence, tokens),))
+
+            for piece, piece_tokens in pieces:
+                if window and window_tokens + piece_tokens > max_tokens:
+                    if not emitted:
+                        chunk = ''.join(part for part, _ in window).strip()
+                        if chunk:
+                            yield chunk
+                        emitted = True
+                    # 겹침 한도와 새 문장 자리를 맞출 때까지 앞 문장 제거
+                    while window and (window_tokens > overlap_tokens or window_tokens + piece_tokens > max_tokens):
+                        window_tokens -= window.popleft()[1]
+                window.append((piece, piece_tokens))
+                window_tokens += piece_tokens
+                emitted = False
+
+    if window and not emitted:
+        chunk = ''.join(part for part, _ in window).strip()
+        if chunk:
+            yield chunk
+
+
+def chunk_text(text: str, max_tokens: int = DEFAULT_MAX_TOKENS,
+               overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+               counter: Callable[[str], int] = count_tokens) -> Iterator[str]:
+    """한 텍스트를 토큰 한도 청크로 스트리밍 분할"""
+    return chunk_texts((text,), max_tokens=max_tokens, overlap_tokens=overlap_tokens, counter=counter)
@@ -1,19 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from typing import List
 from app.db.session import get_db
 from app.core.deps import get_current_admin_user
+from app.core import response_cache
 from . import schemas, services
 
 router = APIRouter()
 
 @router.get("/footer", response_model=schemas.FooterResponse)
-async def get_footer(db: Session = Depends(get_db)):
+async def get_footer(request: Request, db: Session = Depends(get_db)):
     """현재 활성화된 푸터 정보를 조회합니다."""
-    footer = services.get_active_footer(db)
-    if not footer:
-        raise HTTPException(status_code=404, detail="Footer information not found")
-    return footer
+    def load_footer():
+        footer = services.get_active_footer(db)
+        if not footer:
+            raise HTTPException(status_code=404, detail="Footer information not found")
+        return schemas.FooterResponse.from_orm(footer)
+
+    return response_cache.cached_response(request, response_cache.FOOTER, load_footer)
 
 @router.post("/admin/footer", response_model=schemas.FooterResponse)
 async def create_footer(
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from . import models, schemas
 from fastapi import HTTPException
+from app.core import response_cache
 
 
 def get_active_footer(db: Session):
@@ -20,6 +21,7 @@ def create_footer(db: Session, footer: schemas.FooterCreate):
     db.add(db_footer)
     db.commit()
     db.refresh(db_footer)
+    response_cache.invalidate(response_cache.FOOTER)
     return db_footer
 
 
@@ -34,6 +36,7 @@ def update_footer(db: Session, footer_id: int, footer: schemas.FooterUpdate):
 
     db.commit()
     db.refresh(db_footer)
+    response_cache.invalidate(response_cache.FOOTER)
     return db_footer
 
 
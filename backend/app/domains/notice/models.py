@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Date, ForeignKey, LargeBinary
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -28,4 +28,12 @@ class UserNoticeRead(Base):
     read_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="notice_reads")
-    notice = relationship("Notice")
\ No newline at end of file
+    notice = relationship("Notice")
+
+class UserNoticeReadBitmap(Base):
+    """사용자별 읽은 공지 id 비트맵 (bit i = notice_id i, 안 읽은 공지 수 계산용)"""
+    __tablename__ = "user_notice_read_bitmaps"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.user_id'), primary_key=True)
+    bitmap = Column(LargeBinary, nullable=False, default=b'')
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
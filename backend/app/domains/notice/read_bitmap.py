@@ -0,0 +1,31 @@
+"""
+공지사항 읽음 비트맵
+사용자별 읽은 공지 id를 비트맵 한 행(user_notice_read_bitmaps)으로 들고 있고 (bit i = notice_id i),
+현재 노출 중인 공지 id 비트맵은 응답 캐시(공지 생성/수정/삭제 시 무효화)에 둔다
+안 읽은 공지 수 = popcount(노출 비트맵 & ~읽음 비트맵) 이므로 배지 조회는 기본키 조회 한 번이다
+"""
+
+from typing import Iterable
+
+
+def to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+
+def from_bytes(bitmap: bytes) -> int:
+    return int.from_bytes(bitmap or b'', 'little')
+
+
+def bitmap_from_ids(notice_ids: Iterable[int]) -> bytes:
+    value = 0
+    for notice_id in notice_ids:
+        value |= 1 << notice_id
+    return to_bytes(value)
+
+
+def set_bit(bitmap: bytes, notice_id: int) -> bytes:
+    return to_bytes(from_bytes(bitmap) | (1 << notice_id))
+
+
+def count_unread(visible: bytes, read: bytes) -> int:
+    return bin(from_bytes(visible) & ~from_bytes(read)).count('1')
@@ -1,9 +1,10 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Request
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.core.deps import get_current_active_superuser, get_current_active_user, get_current_user
+from app.core import response_cache
 from app.domains.user.models import User
 from . import schemas, services
 from datetime import date, timedelta
@@ -24,24 +25,50 @@ router = APIRouter()
     """,
 )
 async def get_notices(
+        request: Request,
         page: int = Query(1, ge=1, description="페이지 번호"),
         limit: int = Query(10, ge=1, le=100, description="페이지당 항목 수"),
         current_user: Optional[User] = Depends(get_current_user),
         db: Session = Depends(get_db)
 ) -> schemas.NoticeList:
     user_id = current_user.user_id if current_user else None
-    notices, total = services.get_notices(
-        db,
-        skip=(page - 1) * limit,
-        limit=limit,
-        user_id=user_id
+
+    def load_notices():
+        notices, total = services.get_notices(
+            db,
+            skip=(page - 1) * limit,
+            limit=limit,
+            user_id=user_id
+        )
+        return {
+            "notices": notices,
+            "total_count": total,
+            "page": page,
+            "limit": limit
+        }
+
+    if user_id:
+        # 읽음 여부가 사용자마다 달라 캐시하지 않음
+        return load_notices()
+    return response_cache.cached_response(
+        request,
+        response_cache.NOTICES,
+        lambda: schemas.NoticeList.model_validate(load_notices(), from_attributes=True),
+        params={"date": date.today(), "page": page, "limit": limit},
+        private=True
     )
-    return {
-        "notices": notices,
-        "total_count": total,
-        "page": page,
-        "limit": limit
-    }
+
+
+@router.get(
+    "/notices/unread-count",
+    summary="안 읽은 공지사항 수 조회",
+    description="현재 노출 중인 공지사항 중 로그인한 사용자가 읽지 않은 공지사항 수를 조회합니다.",
+)
+async def get_unread_notice_count(
+        current_user: User = Depends(get_current_active_user),
+        db: Session = Depends(get_db)
+):
+    return {"unread_count": services.get_unread_notice_count(db, current_user.user_id)}
 
 
 @router.get(
@@ -1,10 +1,14 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
-from . import models, schemas
+from sqlalchemy import desc, and_, func
+from app.core import response_cache
+from app.db.locks import insert_statement
+from . import models, schemas, read_bitmap
+import logging
 from typing import List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, date
+import json
 
 
 def get_notices(
@@ -35,17 +39,26 @@ def get_notices(
         models.Notice.created_at.desc()
     )
 
-    total = query.count()
-    notices = query.offset(skip).limit(limit).all()
-
-    # 읽음 상태 확인
-    if user_id:
+    # 전체 건수는 윈도 함수로 같은 쿼리에서 함께 조회
+    rows = query.add_columns(func.count().over().label("total")).offset(skip).limit(limit).all()
+    notices = [row[0] for row in rows]
+    if rows:
+        total = rows[0].total
+    else:
+        total = query.count() if skip else 0
+
+    # 읽음 상태 확인 (페이지 공지 id를 한 번에 조회)
+    if user_id and notices:
+        read_ids = {
+            row.notice_id
+            for row in db.query(models.UserNoticeRead.notice_id).filter(
+                models.UserNoticeRead.user_id == user_id,
+                models.UserNoticeRead.notice_id.in_([notice.notice_id for notice in notices]),
+                models.UserNoticeRead.is_read == True
+            )
+        }
         for notice in notices:
-            read_status = db.query(models.UserNoticeRead).filter(
-                models.UserNoticeRead.notice_id == notice.notice_id,
-                models.UserNoticeRead.user_id == user_id
-            ).first()
-            notice.is_read = bool(read_status and read_status.is_read)
+            notice.is_read = notice.notice_id in read_ids
 
     return notices, total
 
@@ -81,6 +94,7 @@ def create_notice(db: Session, notice: schemas.NoticeCreate) -> models.Notice:
         db.add(db_notice)
         db.commit()
         db.refresh(db_notice)
+        response_cache.invalidate(response_cache.NOTICES)
         return db_notice
     except Exception as e:
         db.rollback()
@@ -103,6 +117,7 @@ def update_notice(
     db.add(db_notice)
     db.commit()
     db.refresh(db_notice)
+    response_cache.invalidate(response_cache.NOTICES)
     return db_notice
 
 
@@ -119,6 +134,7 @@ def delete_notice(db: Session, notice_id: int) -> bool:
         ).delete()
 
         db.commit()
+        response_cache.invalidate(response_cache.NOTICES)
         return result > 0
     except Exception as e:
         db.rollback()
@@ -152,5 +168,79 @@ def mark_notice_as_read(
         db.add(read_status)
         db.commit()
         db.refresh(read_status)
+        _mark_read_bit(db, user_id, notice_id)
+
+    return read_status
+
 
-    return read_status
\ No newline at end of file
+def _ensure_read_bitmap(db: Session, user_id: UUID, for_update: bool = False) -> models.UserNoticeReadBitmap:
+    """사용자 읽음 비트맵 조회 - 없으면 기존 읽음 기록으로 생성 (커밋은 호출자가)
+
+    같은 사용자의 첫 요청이 동시에 들어와도 ON CONFLICT DO NOTHING으로 한 행만 생기고,
+    둘 다 다시 읽은 같은 행을 사용한다
+    """
+    query = db.query(models.UserNoticeReadBitmap).filter(
+        models.UserNoticeReadBitmap.user_id == user_id
+    )
+    if for_update:
+        query = query.with_for_update()
+    user_bitmap = query.first()
+    if user_bitmap is not None:
+        return user_bitmap
+
+    rows = db.query(models.UserNoticeRead.notice_id).filter(
+        models.UserNoticeRead.user_id == user_id,
+        models.UserNoticeRead.is_read == True
+    ).all()
+    db.execute(insert_statement(db, models.UserNoticeReadBitmap).values(
+        user_id=user_id,
+        bitmap=read_bitmap.bitmap_from_ids(row.notice_id for row in rows)
+    ).on_conflict_do_nothing(index_elements=['user_id']))
+    return query.first()
+
+
+def _mark_read_bit(db: Session, user_id: UUID, notice_id: int) -> None:
+    try:
+        user_bitmap = _ensure_read_bitmap(db, user_id, for_update=True)
+        user_bitmap.bitmap = read_bitmap.set_bit(user_bitmap.bitmap, notice_id)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logging.error(f"공지 읽음 비트맵 갱신 실패: {str(e)}")
+        # 비트맵을 지워 두면 다음 조회 때 읽음 기록으로 다시 만들어짐
+        try:
+            db.query(models.UserNoticeReadBitmap).filter(
+                models.UserNoticeReadBitmap.user_id == user_id
+            ).delete()
+            db.commit()
+        except Exception as delete_error:
+            db.rollback()
+            logging.error(f"공지 읽음 비트맵 삭제 실패: {str(delete_error)}")
+
+
+def _visible_notice_ids(db: Session) -> List[int]:
+    today = date.today()
+    rows = db.query(models.Notice.notice_id).filter(
+        models.Notice.is_public == True,
+        models.Notice.start_date <= today,
+        models.Notice.end_date >= today
+    ).all()
+    return [row.notice_id for row in rows]
+
+
+def get_unread_notice_count(db: Session, user_id: UUID) -> int:
+    """현재 노출 중인 공지 중 안 읽은 공지 수"""
+    # 노출 중인 공지 id는 공지 목록과 같은 캐시 네임스페이스에 두어 공지 변경 시 함께 무효화
+    visible = response_cache.get_response_cache().load(
+        response_cache.NOTICES,
+        lambda: _visible_notice_ids(db),
+        params={"date": date.today(), "view": "visible_ids"}
+    )
+    user_bitmap = db.get(models.UserNoticeReadBitmap, user_id)
+    if user_bitmap is None:
+        user_bitmap = _ensure_read_bitmap(db, user_id)
+        db.commit()
+    return read_bitmap.count_unread(
+        read_bitmap.bitmap_from_ids(json.loads(visible.body)),
+        user_bitmap.bitmap
+    )
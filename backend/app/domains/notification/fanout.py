@@ -0,0 +1,231 @@
+"""
+알림 대량 발송 (fan-out)
+전체 사용자 알림은 ORM 객체를 만들지 않고 users를 user_id 순으로 잘라
+INSERT INTO user_notifications SELECT ... 한 문장씩 넣는다 (수신 거부 설정도 같은 문장에서 제외)
+청크마다 커밋하면서 진행 상황(fanout_cursor, recipient_count)을 notifications 행에 함께 저장하므로
+관리자 요청은 바로 반환되고, 중간에 멈춘 발송은 커서부터 이어서 보낼 수 있다
+
+새 전체 알림은 행을 만들지 않는 알림함 방식(inbox.py, audience = 'ALL')으로 보내므로
+fan_out은 그 이전에 대기/진행 상태로 남은 발송을 마무리할 때만 쓰인다
+앱 시작 시 모든 uvicorn 워커가 재개를 시도하지만, 알림별 advisory lock을 잡은 워커만 발송한다
+"""
+
+import logging
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.locks import release_session_lock, try_session_lock
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+FANOUT_CHUNK_SIZE = 5000
+# pg_try_advisory_lock(key, notification_id) 두 인자 형식이라 int4 범위로 자름
+FANOUT_LOCK_KEY = zlib.crc32(b'culf:notification-fanout') & 0x7FFFFFFF
+
+DELIVERY_PENDING = 'PENDING'
+DELIVERY_RUNNING = 'RUNNING'
+DELIVERY_COMPLETED = 'COMPLETED'
+DELIVERY_FAILED = 'FAILED'
+
+# 수신 거부(is_enabled = FALSE) 설정이 있는 사용자는 제외 (설정이 없으면 수신)
+_OPT_OUT_FILTER = """
+    NOT EXISTS (
+        SELECT 1 FROM user_notification_settings s
+        WHERE s.user_id = u.user_id
+          AND s.notification_type = :notification_type
+          AND s.is_enabled = FALSE
+    )"""
+
+_CHUNK_SQL = """
+    WITH batch AS (
+        SELECT u.user_id
+        FROM users u
+        WHERE u.status = 'ACTIVE' {cursor_filter}
+        ORDER BY u.user_id
+        LIMIT :chunk_size
+    ), inserted AS (
+        INSERT INTO user_notifications (user_id, notification_id, is_read)
+        SELECT u.user_id, :notification_id, FALSE
+        FROM batch u
+        WHERE {opt_out_filter}
+        ON CONFLICT DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        (SELECT user_id FROM batch ORDER BY user_id DESC LIMIT 1) AS last_user_id,
+        (SELECT COUNT(*) FROM batch) AS scanned,
+        (SELECT COUNT(*) FROM inserted) AS inserted
+"""
+
+_TARGETED_SQL = """
+    INSERT INTO user_notifications (user_id, notification_id, is_read)
+    SELECT u.user_id, :notification_id, FALSE
+    FROM users u
+    WHERE u.user_id = ANY(CAST(:user_ids AS uuid[])) {opt_out_filter}
+    ON CONFLICT DO NOTHING
+"""
+
+
+def _type_value(notification_type: Any) -> str:
+    return getattr(notification_type, 'value', notification_type)
+
+
+def chunk_statement(has_cursor: bool) -> str:
+    return _CHUNK_SQL.format(
+        cursor_filter="AND u.user_id > CAST(:cursor AS uuid)" if has_cursor else "",
+        opt_out_filter=_OPT_OUT_FILTER
+    )
+
+
+def insert_targeted(db: Session, notification_id: int, notification_type: Any, user_ids: List[str],
+                    respect_settings: bool = True) -> int:
+    """지정 수신자에게 한 문장으로 알림 생성 (커밋은 호출자가)"""
+    statement = _TARGETED_SQL.format(opt_out_filter=("AND" + _OPT_OUT_FILTER) if respect_settings else "")
+    result = db.execute(text(statement), {
+        'notification_id': notification_id,
+        'notification_type': _type_value(notification_type),
+        'user_ids': [str(UUID(str(user_id))) for user_id in user_ids],
+    })
+    return max(result.rowcount or 0, 0)
+
+
+def count_active_users(db: Session) -> int:
+    return db.execute(text("SELECT COUNT(*) FROM users WHERE status = 'ACTIVE'")).scalar() or 0
+
+
+def fan_out(db: Session, notification_id: int, chunk_size: int = FANOUT_CHUNK_SIZE) -> Dict[str, Any]:
+    """전체 활성 사용자에게 청크 단위로 발송 (청크마다 진행 상황과 함께 커밋, 커서부터 재개)
+
+    ON CONFLICT DO NOTHING이라 같은 알림을 다시 실행해도 중복 수신은 생기지 않는다
+    """
+    notification = db.get(Notification, notification_id)
+    if notification is None:
+        raise ValueError(f"알림을 찾을 수 없습니다: {notification_id}")
+
+    notification.delivery_status = DELIVERY_RUNNING
+    if notification.target_count is None:
+        notification.target_count = count_active_users(db)
+    db.commit()
+
+    notification_type = _type_value(notification.type)
+    cursor = notification.fanout_cursor
+    try:
+        while True:
+            params = {
+                'notification_id': notification_id,
+                'notification_type': notification_type,
+                'chunk_size': chunk_size,
+            }
+            if cursor is not None:
+                params['cursor'] = str(cursor)
+            row = db.execute(text(chunk_statement(cursor is not None)), params).one()
+            if not row.scanned:
+                break
+            cursor = row.last_user_id
+            db.query(Notification).filter(Notification.notification_id == notification_id).update({
+                Notification.fanout_cursor: cursor,
+                Notification.recipient_count: Notification.recipient_count + row.inserted,
+            }, synchronize_session=False)
+            db.commit()
+            if row.scanned < chunk_size:
+                break
+
+        db.query(Notification).filter(Notification.notification_id == notification_id).update({
+            Notification.delivery_status: DELIVERY_COMPLETED,
+        }, synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"알림 {notification_id} 발송 실패: {str(e)}")
+        db.query(Notification).filter(Notification.notification_id == notification_id).update({
+            Notification.delivery_status: DELIVERY_FAILED,
+        }, synchronize_session=False)
+        db.commit()
+        raise
+
+    db.refresh(notification)
+    logger.info(f"알림 {notification_id} 발송 완료: {notification.recipient_count}명")
+    return delivery_progress(notification)
+
+
+def delivery_progress(notification: Notification) -> Dict[str, Any]:
+    target = notification.target_count or 0
+    delivered = notification.recipient_count or 0
+    if notification.delivery_status == DELIVERY_COMPLETED:
+        percentage = 100
+    else:
+        percentage = min(99, int(delivered * 100 / target)) if target else 0
+    return {
+        'notification_id': notification.notification_id,
+        'delivery_status': notification.delivery_status,
+        'target_count': target,
+        'recipient_count': delivered,
+        'percentage': percentage,
+    }
+
+
+def run_fan_out(db: Session, notification_id: int) -> Optional[Dict[str, Any]]:
+    """잠금을 잡은 경우에만 발송 - 다른 워커가 발송 중이거나 이미 끝난 알림이면 None
+
+    db는 한 연결에 고정된 세션이어야 한다 (청크마다 커밋해도 잠금이 같은 연결에 남도록)
+    """
+    # 알림별 세션 단위 잠금 (발송이 끝날 때까지 유지 - 같은 연결에서 해제해야 함)
+    if not try_session_lock(db, FANOUT_LOCK_KEY, notification_id):
+        db.rollback()
+        logger.info(f"알림 {notification_id}: 다른 워커에서 발송 중 - 건너뜀")
+        return None
+    try:
+        # 잠금을 기다리는 사이 다른 워커가 발송을 끝냈을 수 있음
+        notification = db.get(Notification, notification_id)
+        if notification is None or notification.delivery_status not in (DELIVERY_PENDING, DELIVERY_RUNNING):
+            return None
+        return fan_out(db, notification_id)
+    finally:
+        db.rollback()
+        release_session_lock(db, FANOUT_LOCK_KEY, notification_id)
+        db.commit()
+
+
+def start_fan_out(notification_id: int,
+                  session_factory: Optional[Callable[[], Session]] = None) -> threading.Thread:
+    """별도 세션/스레드에서 발송 (요청은 바로 반환)"""
+    def run():
+        connection = None
+        if session_factory is None:
+            from app.db.session import SessionLocal, engine
+            # 세션 단위 advisory lock을 발송 내내 유지하도록 연결 하나에 고정
+            connection = engine.connect()
+            db = SessionLocal(bind=connection)
+        else:
+            db = session_factory()
+        try:
+            run_fan_out(db, notification_id)
+        except Exception:
+            logger.exception(f"알림 {notification_id} 백그라운드 발송 오류")
+        finally:
+            db.close()
+            if connection is not None:
+                connection.close()
+
+    thread = threading.Thread(target=run, name=f"notification-fanout-{notification_id}", daemon=True)
+    thread.start()
+    return thread
+
+
+def resume_unfinished(db: Session) -> List[int]:
+    """대기/진행 중에 멈춘 발송을 이어서 시작 (앱 시작 시 - 워커마다 호출돼도 알림별 잠금으로 한 번만 발송)"""
+    notification_ids = [
+        row.notification_id
+        for row in db.query(Notification.notification_id).filter(
+            Notification.delivery_status.in_([DELIVERY_PENDING, DELIVERY_RUNNING])
+        )
+    ]
+    for notification_id in notification_ids:
+        start_fan_out(notification_id)
+    return notification_ids
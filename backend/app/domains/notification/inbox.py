@@ -0,0 +1,243 @@
+"""
+사용자 알림함 (지정 알림 + 전체 알림)
+전체 알림(audience = 'ALL')은 notifications에 한 행만 저장하고, user_notifications 행은
+사용자가 읽거나 지울 때만 만든다. "모두 읽음"은 사용자별 기준 id(user_notification_marks)만 올린다
+목록은 지정 알림(user_notifications.user_id 인덱스)과 전체 알림(audience 부분 인덱스)을
+UNION ALL 한 문장으로 합쳐 최신순으로 읽는다 (전체 알림은 활성 사용자에게만 보임)
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import String, and_, cast, false, func, or_, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core import push
+from app.db.locks import insert_statement
+from app.domains.user.models import User
+from .models import Notification, UserNotification, UserNotificationMark, UserNotificationSetting
+
+BROADCAST_ALL = 'ALL'
+ACTIVE_USER_STATUS = 'ACTIVE'
+
+
+def _read_through(user_id: UUID):
+    """전체 알림을 이 id까지 읽은 것으로 보는 기준 (없으면 0)"""
+    return select(func.coalesce(func.max(UserNotificationMark.broadcast_read_through), 0)).where(
+        UserNotificationMark.user_id == user_id
+    ).scalar_subquery()
+
+
+def _joined_at(user_id: UUID):
+    """전체 알림을 받기 시작한 시각 - 활성 사용자가 아니면 NULL이라 전체 알림이 보이지 않음"""
+    return select(User.created_at).where(
+        User.user_id == user_id,
+        User.status == ACTIVE_USER_STATUS
+    ).scalar_subquery()
+
+
+def _disabled_types(user_id: UUID):
+    return select(cast(UserNotificationSetting.notification_type, String)).where(
+        UserNotificationSetting.user_id == user_id,
+        UserNotificationSetting.is_enabled == False
+    )
+
+
+def inbox_select(user_id: UUID, notification_id: Optional[int] = None):
+    """사용자에게 보이는 알림 (notification_id, type, message, created_at, is_read, read_at)"""
+    targeted = select(
+        Notification.notification_id,
+        Notification.type,
+        Notification.message,
+        Notification.created_at,
+        func.coalesce(UserNotification.is_read, false()).label('is_read'),
+        UserNotification.read_at,
+    ).join(
+        UserNotification, UserNotification.notification_id == Notification.notification_id
+    ).where(
+        UserNotification.user_id == user_id,
+        Notification.audience.is_(None),
+        or_(UserNotification.is_dismissed.is_(None), UserNotification.is_dismissed == False)
+    )
+
+    # 가입 이후의 전체 알림 중 수신 거부하지 않은 유형 (활성 사용자만, 읽음/삭제 기록은 있을 때만 조인)
+    broadcast = select(
+        Notification.notification_id,
+        Notification.type,
+        Notification.message,
+        Notification.created_at,
+        or_(
+            func.coalesce(UserNotification.is_read, false()),
+            Notification.notification_id <= _read_through(user_id)
+        ).label('is_read'),
+        UserNotification.read_at,
+    ).outerjoin(
+        UserNotification, and_(
+            UserNotification.notification_id == Notification.notification_id,
+            UserNotification.user_id == user_id
+        )
+    ).where(
+        Notification.audience == BROADCAST_ALL,
+        Notification.created_at >= _joined_at(user_id),
+        cast(Notification.type, String).notin_(_disabled_types(user_id)),
+        or_(UserNotification.is_dismissed.is_(None), UserNotification.is_dismissed == False)
+    )
+
+    if notification_id is not None:
+        targeted = targeted.where(Notification.notification_id == notification_id)
+        broadcast = broadcast.where(Notification.notification_id == notification_id)
+    return union_all(targeted, broadcast).subquery('inbox')
+
+
+def _to_dict(row) -> Dict[str, Any]:
+    return {
+        "notification_id": row.notification_id,
+        "type": row.type,
+        "message": row.message,
+        "created_at": row.created_at,
+        "is_read": bool(row.is_read),
+        "read_at": row.read_at
+    }
+
+
+def list_inbox(db: Session, user_id: UUID, skip: int = 0, limit: int = 100) -> Tuple[List[Dict[str, Any]], int]:
+    """알림 목록과 전체 개수 (한 문장)"""
+    inbox = inbox_select(user_id)
+    rows = db.execute(
+        select(inbox, func.count().over().label('total_count'))
+        .order_by(inbox.c.created_at.desc(), inbox.c.notification_id.desc())
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    if rows:
+        total = rows[0].total_count
+    elif skip:
+        total = db.execute(select(func.count()).select_from(inbox)).scalar() or 0
+    else:
+        total = 0
+    return [_to_dict(row) for row in rows], total
+
+
+def get_inbox_item(db: Session, user_id: UUID, notification_id: int) -> Optional[Dict[str, Any]]:
+    inbox = inbox_select(user_id, notification_id)
+    row = db.execute(select(inbox)).first()
+    return _to_dict(row) if row else None
+
+
+def count_unread(db: Session, user_id: UUID) -> int:
+    inbox = inbox_select(user_id)
+    return db.execute(select(func.count()).select_from(inbox).where(inbox.c.is_read == False)).scalar() or 0
+
+
+def _user_row(db: Session, notification_id: int, user_id: UUID) -> Optional[UserNotification]:
+    """사용자 알림 행 (전체 알림은 처음 읽거나 지울 때 생성, 커밋은 호출자가)
+
+    같은 알림을 동시에 처음 읽어도 ON CONFLICT DO NOTHING으로 한 행만 생기고 다시 읽은 행을 사용한다
+    """
+    query = db.query(UserNotification).filter(
+        UserNotification.notification_id == notification_id,
+        UserNotification.user_id == user_id
+    )
+    row = query.first()
+    if row is None and get_inbox_item(db, user_id, notification_id) is not None:
+        db.execute(insert_statement(db, UserNotification).values(
+            user_id=user_id,
+            notification_id=notification_id,
+            is_read=False,
+            is_dismissed=False
+        ).on_conflict_do_nothing(index_elements=['user_id', 'notification_id']))
+        row = query.first()
+    return row
+
+
+def mark_read(db: Session, notification_id: int, user_id: UUID) -> bool:
+    row = _user_row(db, notification_id, user_id)
+    if row is None:
+        return False
+    row.is_read = True
+    row.read_at = datetime.now()
+    db.commit()
+    return True
+
+
+def dismiss(db: Session, notification_id: int, user_id: UUID) -> bool:
+    row = _user_row(db, notification_id, user_id)
+    if row is None:
+        return False
+    row.is_dismissed = True
+    db.commit()
+    return True
+
+
+def mark_all_read(db: Session, user_id: UUID) -> None:
+    """지정 알림은 행을 갱신하고, 전체 알림은 기준 id만 최신 전체 알림으로 올림 (커밋은 호출자가)"""
+    db.query(UserNotification).filter(
+        UserNotification.user_id == user_id,
+        UserNotification.is_read == False
+    ).update({
+        "is_read": True,
+        "read_at": datetime.now()
+    }, synchronize_session=False)
+
+    latest = db.query(func.max(Notification.notification_id)).filter(
+        Notification.audience.isnot(None)
+    ).scalar()
+    if latest is None:
+        return
+    mark = db.get(UserNotificationMark, user_id)
+    if mark is None:
+        db.add(UserNotificationMark(user_id=user_id, broadcast_read_through=latest))
+    elif mark.broadcast_read_through < latest:
+        mark.broadcast_read_through = latest
+
+
+def broadcast_read_counts(db: Session, notification_ids: List[int]) -> Dict[int, int]:
+    """전체 알림별 읽은 사용자 수 (개별 읽음 + 모두 읽음 기준 id, 여러 알림을 한 번의 GROUP BY로)"""
+    if not notification_ids:
+        return {}
+    readers = union_all(
+        select(UserNotification.notification_id, UserNotification.user_id).where(
+            UserNotification.notification_id.in_(notification_ids),
+            UserNotification.is_read == True
+        ),
+        select(Notification.notification_id, UserNotificationMark.user_id).join(
+            UserNotificationMark,
+            UserNotificationMark.broadcast_read_through >= Notification.notification_id
+        ).where(
+            Notification.notification_id.in_(notification_ids)
+        )
+    ).subquery()
+    rows = db.execute(
+        select(readers.c.notification_id, func.count(func.distinct(readers.c.user_id)))
+        .group_by(readers.c.notification_id)
+    ).all()
+    counts = {notification_id: 0 for notification_id in notification_ids}
+    counts.update({notification_id: count for notification_id, count in rows})
+    return counts
+
+
+def publish_created(db: Session, notification: Notification) -> None:
+    """새 알림 실시간 이벤트 (커밋 후 호출)
+    지정 알림은 실제로 행이 생긴 사용자에게만, 전체 알림은 연결된 모든 사용자에게
+    (수신 거부 유형은 연결마다 거름)
+    """
+    data = {
+        "notification_id": notification.notification_id,
+        "type": getattr(notification.type, 'value', notification.type),
+        "message": notification.message,
+        "created_at": notification.created_at,
+    }
+    if notification.audience == BROADCAST_ALL:
+        push.publish(push.EVENT_NOTIFICATION, data)
+        return
+    user_ids = [
+        row.user_id for row in db.query(UserNotification.user_id).filter(
+            UserNotification.notification_id == notification.notification_id
+        )
+    ]
+    push.publish_to(push.EVENT_NOTIFICATION, data, user_ids)
+
+
+def muted_types(db: Session, user_id: UUID) -> List[str]:
+    return [row[0] for row in db.execute(_disabled_types(user_id))]
@@ -18,6 +18,13 @@ class Notification(Base):
     type = Column(Enum(NotificationType, name='notification_type_enum'), nullable=False)
     message = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # 전체 발송 진행 상황 (PENDING/RUNNING/COMPLETED/FAILED, fanout.py)
+    delivery_status = Column(String(20), nullable=False, default='COMPLETED', server_default='COMPLETED')
+    target_count = Column(Integer)
+    recipient_count = Column(Integer, nullable=False, default=0, server_default='0')
+    fanout_cursor = Column(UUID(as_uuid=True))
+    # 전체 알림 대상 (NULL: user_notifications 행이 있는 사용자만, 'ALL': 가입 이후의 모든 활성 사용자, inbox.py)
+    audience = Column(String(20))
 
     # Relationships
     user_notifications = relationship("UserNotification", back_populates="notification", cascade="all, delete-orphan")
@@ -29,6 +36,7 @@ class UserNotification(Base):
     notification_id = Column(Integer, ForeignKey('notifications.notification_id', ondelete='CASCADE'), primary_key=True)
     is_read = Column(Boolean, default=False)
     read_at = Column(DateTime(timezone=True))
+    is_dismissed = Column(Boolean, nullable=False, default=False, server_default='false')
 
     # Relationships
     user = relationship("User", back_populates="notifications")
@@ -42,4 +50,13 @@ class UserNotificationSetting(Base):
     notification_type = Column(Enum(NotificationType, name='user_notification_type_enum'), nullable=False)
     is_enabled = Column(Boolean, default=True)
 
-    user = relationship("User", back_populates="notification_settings")
\ No newline at end of file
+    user = relationship("User", back_populates="notification_settings")
+
+
+class UserNotificationMark(Base):
+    """사용자별 전체 알림 "모두 읽음" 기준 (이 id 이하의 전체 알림은 읽은 것으로 봄)"""
+    __tablename__ = "user_notification_marks"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.user_id', ondelete='CASCADE'), primary_key=True)
+    broadcast_read_through = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
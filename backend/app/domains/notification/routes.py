@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core import push
 from app.core.deps import get_current_active_user
 from app.domains.user import schemas as user_schemas
-from . import schemas, services
+from . import schemas, services, inbox
 from typing import List
 from uuid import UUID
 
@@ -27,6 +29,38 @@ def get_notifications(
         "limit": limit
     }
 
+@router.get("/users/me/notifications/unread-count")
+def get_unread_notification_count(
+    db: Session = Depends(get_db),
+    current_user: user_schemas.User = Depends(get_current_active_user)
+):
+    """읽지 않은 알림 수를 조회합니다."""
+    return {"unread_count": services.get_unread_count(db, current_user.user_id)}
+
+@router.get("/users/me/events")
+def stream_user_events(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: user_schemas.User = Depends(get_current_active_user)
+):
+    """실시간 이벤트 스트림 (SSE) - 새 알림, 스톤 잔액, 결제 상태
+    연결 직후 읽지 않은 알림 수를 한 번 보내고 이후에는 변경이 있을 때만 보낸다
+    """
+    initial = push.make_message(
+        push.EVENT_UNREAD_COUNT,
+        {"unread_count": services.get_unread_count(db, current_user.user_id)},
+        [current_user.user_id]
+    )
+    muted_types = inbox.muted_types(db, current_user.user_id)
+    # 스트림이 열려 있는 동안 DB 연결을 잡고 있지 않도록 바로 반환
+    db.close()
+
+    return StreamingResponse(
+        push.get_push_hub().stream(request, current_user.user_id, muted_types, [initial]),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/users/me/notifications/{notification_id}", response_model=schemas.NotificationResponse)
 def get_notification_detail(
     notification_id: int,
@@ -51,6 +85,16 @@ def mark_notification_read(
         raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다")
     return notification
 
+@router.delete("/users/me/notifications/{notification_id}", status_code=204)
+def dismiss_notification(
+    notification_id: int,
+    db: Session = Depends(get_db),
+    current_user: user_schemas.User = Depends(get_current_active_user)
+):
+    """알림을 알림함에서 삭제합니다."""
+    if not services.dismiss_notification(db, notification_id, current_user.user_id):
+        raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다")
+
 @router.put("/users/me/notifications/read-all")
 def mark_all_notifications_read(
     db: Session = Depends(get_db),
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from . import models, schemas
+from . import models, schemas, fanout, inbox
 from typing import List, Tuple, Optional
 from uuid import UUID
 from datetime import datetime
@@ -18,82 +18,32 @@ def get_user_notifications(
         skip: int = 0,
         limit: int = 100
 ) -> Tuple[List[dict], int]:
-    """사용자의 알림 목록을 조회합니다."""
-    query = db.query(
-        models.Notification,
-        models.UserNotification.is_read,
-        models.UserNotification.read_at
-    ).join(
-        models.UserNotification,
-        models.Notification.notification_id == models.UserNotification.notification_id
-    ).filter(
-        models.UserNotification.user_id == user_id
-    )
-
-    total_count = query.count()
-
-    results = query.order_by(models.Notification.created_at.desc()) \
-        .offset(skip) \
-        .limit(limit) \
-        .all()
-
-    notifications = []
-    for notif, is_read, read_at in results:
-        notifications.append({
-            "notification_id": notif.notification_id,
-            "type": notif.type,
-            "message": notif.message,
-            "created_at": notif.created_at,
-            "is_read": is_read or False,
-            "read_at": read_at
-        })
-
-    return notifications, total_count
+    """사용자의 알림 목록을 조회합니다. (지정 알림 + 전체 알림)"""
+    return inbox.list_inbox(db, user_id, skip=skip, limit=limit)
 
 
 def get_notification(db: Session, notification_id: int, user_id: UUID) -> Optional[dict]:
     """특정 알림의 상세 정보를 조회합니다."""
-    result = db.query(
-        models.Notification,
-        models.UserNotification.is_read,
-        models.UserNotification.read_at
-    ).join(
-        models.UserNotification,
-        models.Notification.notification_id == models.UserNotification.notification_id
-    ).filter(
-        models.UserNotification.notification_id == notification_id,
-        models.UserNotification.user_id == user_id
-    ).first()
+    return inbox.get_inbox_item(db, user_id, notification_id)
 
-    if result:
-        notif, is_read, read_at = result
-        return {
-            "notification_id": notif.notification_id,
-            "type": notif.type,
-            "message": notif.message,
-            "created_at": notif.created_at,
-            "is_read": is_read or False,
-            "read_at": read_at
-        }
-    return None
+
+def get_unread_count(db: Session, user_id: UUID) -> int:
+    """읽지 않은 알림 수를 조회합니다."""
+    return inbox.count_unread(db, user_id)
 
 
 def mark_notification_as_read(db: Session, notification_id: int, user_id: UUID) -> Optional[dict]:
     """알림을 읽음 처리합니다."""
-    user_notification = db.query(models.UserNotification).filter(
-        models.UserNotification.notification_id == notification_id,
-        models.UserNotification.user_id == user_id
-    ).first()
-
-    if user_notification:
-        user_notification.is_read = True
-        user_notification.read_at = datetime.now()
-        db.commit()
-
+    if inbox.mark_read(db, notification_id, user_id):
         return get_notification(db, notification_id, user_id)
     return None
 
 
+def dismiss_notification(db: Session, notification_id: int, user_id: UUID) -> bool:
+    """알림을 알림함에서 삭제합니다."""
+    return inbox.dismiss(db, notification_id, user_id)
+
+
 def create_notification(db: Session, notification_data: schemas.NotificationCreate) -> models.Notification:
     """새로운 알림을 생성합니다."""
     try:
@@ -105,29 +55,19 @@ def create_notification(db: Session, notification_data: schemas.NotificationCrea
         db.add(db_notification)
         db.flush()
 
-        # 수신자가 지정된 경우
+        # 수신자가 지정된 경우 (알림 설정 확인)
         if notification_data.user_ids:
-            for user_id in notification_data.user_ids:
-                # 알림 설정 확인
-                if is_notification_enabled(db, UUID(user_id), notification_data.type):
-                    user_notification = models.UserNotification(
-                        user_id=UUID(user_id),
-                        notification_id=db_notification.notification_id
-                    )
-                    db.add(user_notification)
+            db_notification.recipient_count = fanout.insert_targeted(
+                db, db_notification.notification_id, notification_data.type, notification_data.user_ids
+            )
         else:
-            # 전체 사용자에게 알림 전송 (알림 설정 확인)
-            users = db.query(User).filter(User.status == 'ACTIVE').all()
-            for user in users:
-                if is_notification_enabled(db, user.user_id, notification_data.type):
-                    user_notification = models.UserNotification(
-                        user_id=user.user_id,
-                        notification_id=db_notification.notification_id
-                    )
-                    db.add(user_notification)
+            # 전체 알림은 한 행만 저장 (수신 거부는 알림함 조회 시 제외)
+            db_notification.audience = inbox.BROADCAST_ALL
+            db_notification.target_count = fanout.count_active_users(db)
 
         db.commit()
         db.refresh(db_notification)
+        inbox.publish_created(db, db_notification)
         return db_notification
 
     except Exception as e:
@@ -139,13 +79,7 @@ def create_notification(db: Session, notification_data: schemas.NotificationCrea
 def mark_all_notifications_as_read(db: Session, user_id: UUID):
     """사용자의 모든 알림을 읽음 처리합니다."""
     try:
-        db.query(models.UserNotification).filter(
-            models.UserNotification.user_id == user_id,
-            models.UserNotification.is_read == False
-        ).update({
-            "is_read": True,
-            "read_at": datetime.now()
-        })
+        inbox.mark_all_read(db, user_id)
         db.commit()
     except Exception as e:
         db.rollback()
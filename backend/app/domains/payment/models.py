@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from sqlalchemy import JSON, Column, Integer, String, Float, Enum, TIMESTAMP, ForeignKey
+from sqlalchemy import JSON, Column, Integer, String, Float, Enum, TIMESTAMP, ForeignKey, Text, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from app.db.base_class import Base
@@ -101,4 +101,32 @@ class PaymentCache(Base):
 
     user = relationship("User", back_populates="payment_caches")
     subscription = relationship("UserSubscription", back_populates="payment_caches")
-    subscription_plan = relationship("SubscriptionPlan", back_populates="payment_caches")
\ No newline at end of file
+    subscription_plan = relationship("SubscriptionPlan", back_populates="payment_caches")
+
+class PaymentWebhookEvent(Base):
+    """포트원 웹훅 수신 기록 겸 처리 대기열 (같은 결제의 같은 상태 알림은 한 건만)"""
+    __tablename__ = "payment_webhook_events"
+
+    event_id = Column(Integer, primary_key=True, autoincrement=True)
+    imp_uid = Column(String(50), nullable=False)
+    merchant_uid = Column(String(100), nullable=False)
+    status = Column(String(20), nullable=False)  # 포트원 결제 상태 (paid, failed, cancelled ...)
+    customer_uid = Column(String(100), nullable=True)
+    payload = Column(JSON, nullable=True)
+
+    processing_status = Column(String(20), nullable=False, default='pending')  # pending, processing, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    worker_id = Column(String(100), nullable=True)  # hostname:pid
+    received_at = Column(TIMESTAMP, nullable=False, default=datetime.now)
+    next_attempt_at = Column(TIMESTAMP, nullable=False, default=datetime.now)
+    locked_at = Column(TIMESTAMP, nullable=True)
+    processed_at = Column(TIMESTAMP, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('imp_uid', 'status', name='uq_payment_webhook_events_imp_uid_status'),
+        Index('idx_payment_webhook_events_queue', 'processing_status', 'next_attempt_at'),
+    )
+
+    def __repr__(self):
+        return f"<PaymentWebhookEvent(event_id={self.event_id}, imp_uid={self.imp_uid}, status={self.status}, processing_status={self.processing_status})>"
@@ -0,0 +1,229 @@
+"""
+포트원(아임포트) REST API 클라이언트
+프로세스 전체에서 커넥션 풀을 가진 httpx 클라이언트 하나를 쓰고, 액세스 토큰은 만료 직전까지 재사용한다
+(동시에 여러 요청이 만료를 만나도 토큰 발급은 한 번만 - single-flight)
+
+여러 예약 취소는 merchant_uid 목록을 한 번에 보내고, 일부가 이미 결제/취소되어 거절되면
+건별 요청을 최대 UNSCHEDULE_CONCURRENCY개까지 동시에 보낸다
+
+타임아웃: 연결 3초, 전체 10초
+재시도: 연결 실패는 전송 계층에서 2회, 조회(GET)는 5xx 응답도 2회까지 재시도
+결제/취소처럼 상태를 바꾸는 POST는 중복 실행을 막기 위해 응답을 받은 뒤에는 재시도하지 않는다
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+CONNECT_TIMEOUT_SECONDS = 3.0
+REQUEST_TIMEOUT_SECONDS = 10.0
+CONNECT_RETRIES = 2
+READ_RETRIES = 2
+RETRY_BACKOFF_SECONDS = 0.2
+# 만료 이 시간 전에 미리 새 토큰 발급
+TOKEN_REFRESH_MARGIN_SECONDS = 60
+POOL_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+UNSCHEDULE_CONCURRENCY = 4
+
+
+class PortOneError(Exception):
+    """포트원 API 오류 (HTTP 오류 또는 code != 0)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, code: Optional[int] = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.code = code
+
+
+class PortOneClient:
+    def __init__(self, base_url: str, imp_key: str, imp_secret: str,
+                 transport: Optional[httpx.BaseTransport] = None,
+                 clock: Callable[[], float] = time.time):
+        self.base_url = base_url.rstrip('/')
+        self.imp_key = imp_key
+        self.imp_secret = imp_secret
+        self._timeout = httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS)
+        self._transport = transport
+        self._clock = clock
+
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
+
+    # 클라이언트 (지연 생성, 프로세스 전체 공유)
+
+    def _sync_client(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        timeout=self._timeout,
+                        limits=POOL_LIMITS,
+                        transport=self._transport or httpx.HTTPTransport(retries=CONNECT_RETRIES),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    # 액세스 토큰
+
+    def _token_valid(self) -> bool:
+        return self._token is not None and self._clock() < self._token_expires_at - TOKEN_REFRESH_MARGIN_SECONDS
+
+    def _token_payload(self) -> Dict[str, str]:
+        return {"imp_key": self.imp_key, "imp_secret": self.imp_secret}
+
+    def _store_token(self, data: Dict[str, Any]) -> str:
+        # 서버 시각 기준 남은 시간을 로컬 시계에 더함 (서버와 시계가 달라도 안전)
+        ttl = float(data.get("expired_at", 0)) - float(data.get("now", 0))
+        self._token = data["access_token"]
+        self._token_expires_at = self._clock() + max(ttl, 0.0)
+        return self._token
+
+    def invalidate_token(self) -> None:
+        self._token = None
+        self._token_expires_at = 0.0
+
+    def access_token(self) -> str:
+        if self._token_valid():
+            return self._token
+        with self._token_lock:
+            if self._token_valid():
+                return self._token
+            response = self._sync_client().post("/users/getToken", json=self._token_payload())
+            return self._store_token(self._unwrap(response, "포트원 토큰 발급 실패"))
+
+    # 요청
+
+    @staticmethod
+    def _unwrap(response: httpx.Response, error_message: str) -> Any:
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        if response.status_code != 200 or body.get("code") != 0:
+            message = body.get("message") or error_message
+            raise PortOneError(message, status_code=response.status_code, code=body.get("code"))
+        return body.get("response")
+
+    @staticmethod
+    def _retryable(method: str, attempt: int, response: Optional[httpx.Response]) -> bool:
+        if method != "GET" or attempt >= READ_RETRIES:
+            return False
+        return response is None or response.status_code >= 500
+
+    def request(self, method: str, path: str, error_message: str = "포트원 요청 실패", **kwargs) -> Any:
+        attempt = 0
+        refreshed = False
+        while True:
+            headers = {"Authorization": f"Bearer {self.access_token()}"}
+            try:
+                response = self._sync_client().request(method, path, headers=headers, **kwargs)
+            except httpx.TransportError as e:
+                if not self._retryable(method, attempt, None):
+                    raise PortOneError(f"{error_message}: {str(e)}") from e
+                response = None
+            if response is not None and response.status_code == 401 and not refreshed:
+                # 다른 곳에서 토큰이 재발급되어 무효가 된 경우 한 번만 새로 받아 재시도
+                self.invalidate_token()
+                refreshed = True
+                continue
+            if response is not None and not self._retryable(method, attempt, response):
+                return self._unwrap(response, error_message)
+            attempt += 1
+            time.sleep(RETRY_BACKOFF_SECONDS * attempt)
+
+    # API
+
+    def get_payment(self, imp_uid: str) -> Dict[str, Any]:
+        return self.request("GET", f"/payments/{imp_uid}", "결제 정보를 가져오는 데 실패했습니다.")
+
+    def cancel_payment(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self.request("POST", "/payments/cancel", "알 수 없는 오류가 발생했습니다.", json=payload)
+
+    def get_schedules(self, customer_uid: str, schedule_status: str = "scheduled") -> List[Dict[str, Any]]:
+        data = self.request(
+            "GET", f"/subscribe/payments/schedule/customers/{customer_uid}", "예약 조회 실패",
+            params={"schedule-status": schedule_status}
+        )
+        return (data or {}).get("list", [])
+
+    def unschedule(self, customer_uid: str, merchant_uids: List[str]) -> Any:
+        return self.request(
+            "POST", "/subscribe/payments/unschedule", "예약 취소 실패",
+            json={"customer_uid": customer_uid, "merchant_uid": merchant_uids}
+        )
+
+    def unschedule_many(self, customer_uid: str, merchant_uids: List[str],
+                        max_workers: int = UNSCHEDULE_CONCURRENCY) -> Dict[str, str]:
+        """여러 예약 취소 - 취소하지 못한 merchant_uid별 오류 메시지 반환 (모두 취소되면 빈 dict)"""
+        if not merchant_uids:
+            return {}
+        try:
+            self.unschedule(customer_uid, merchant_uids)
+            return {}
+        except PortOneError as e:
+            if len(merchant_uids) == 1:
+                return {merchant_uids[0]: e.message}
+            logger.warning(f"예약 일괄 취소 실패, 건별로 재시도 ({customer_uid}, {len(merchant_uids)}건): {e.message}")
+
+        failed = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(merchant_uids))) as pool:
+            futures = {pool.submit(self.unschedule, customer_uid, [merchant_uid]): merchant_uid
+                       for merchant_uid in merchant_uids}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except PortOneError as e:
+                    failed[futures[future]] = e.message
+        return failed
+
+    def iter_schedules(self, schedule_from: int, schedule_to: int,
+                       schedule_status: str = "scheduled") -> Iterator[Dict[str, Any]]:
+        """기간 내 전체 고객의 예약 목록 (페이지를 넘기며 조회, 시각은 unix timestamp)"""
+        page = 1
+        while page:
+            data = self.request(
+                "GET", "/subscribe/payments/schedule", "예약 조회 실패",
+                params={
+                    "schedule_from": schedule_from,
+                    "schedule_to": schedule_to,
+                    "schedule-status": schedule_status,
+                    "page": page,
+                }
+            ) or {}
+            yield from data.get("list", [])
+            page = data.get("next") or 0
+
+    def schedule(self, payload: Dict[str, Any]) -> Any:
+        return self.request("POST", "/subscribe/payments/schedule", "결제 예약 실패", json=payload)
+
+
+_portone_client: Optional[PortOneClient] = None
+_portone_lock = threading.Lock()
+
+
+def get_portone_client() -> PortOneClient:
+    global _portone_client
+    if _portone_client is None:
+        with _portone_lock:
+            if _portone_client is None:
+                from app.core.config import settings
+                _portone_client = PortOneClient(
+                    settings.PORTONE_API_URL, settings.PORTONE_IMP_KEY, settings.PORTONE_IMP_SECRET
+                )
+    return _portone_client
@@ -1,8 +1,8 @@
 from calendar import monthrange
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from datetime import datetime, timedelta
-import requests
 import uuid
 import logging
 
@@ -10,11 +10,24 @@ from app.domains.token.models import TokenPlan, Token
 from app.domains.payment.models import Payment, Coupon, PaymentCache, UserCoupon, Refund
 from app.domains.payment import services, schemas
 from app.domains.subscription import services as subscription_services
+from app.domains.token.services import publish_token_balance
 from app.domains.subscription import models as subscriprion_models
 from app.core.config import settings
+from app.core import push
+from app.domains.payment.portone_client import PortOneError, get_portone_client
 
 logger = logging.getLogger("app")
 
+def publish_payment_status(payment):
+    """결제 상태 변경 실시간 이벤트 (커밋 후 호출)"""
+    push.publish(push.EVENT_PAYMENT_STATUS, {
+        "payment_id": payment.payment_id,
+        "status": payment.status,
+        "amount": payment.amount,
+        "tokens_purchased": payment.tokens_purchased,
+        "subscription_id": payment.subscription_id,
+    }, payment.user_id)
+
 def initiate_one_time_payment(payment_request, db: Session, current_user):
     """단건 결제 요청"""
     token_plan = db.query(TokenPlan).filter(
@@ -95,9 +108,9 @@ def initiate_one_time_payment(payment_request, db: Session, current_user):
 
 def initiate_subscription_payment(subscription_request, db: Session, current_user):
     """첫 구독 결제 요청"""
-    # 기존 활성화된 구독 정보 확인
+    # 기존 활성화된 구독 정보 확인 (다른 워커에서 방금 결제한 구독도 보이도록 캐시 대신 DB에서)
 
-    existing_subscription = subscription_services.is_user_subscribed(db, current_user.user_id)
+    existing_subscription = subscription_services.is_user_subscribed(db, current_user.user_id, use_cache=False)
     if existing_subscription:
         raise HTTPException(
             status_code=400,
@@ -215,50 +228,60 @@ def initiate_subscription_payment(subscription_request, db: Session, current_use
     }
 
 def get_portone_token():
-    """포트원 토큰 발급"""
-    response = requests.post(
-        f"{settings.PORTONE_API_URL}/users/getToken",
-        json={"imp_key": settings.PORTONE_IMP_KEY, "imp_secret": settings.PORTONE_IMP_SECRET},
-    )
-    if response.status_code != 200:
+    """포트원 토큰 (만료 직전까지 캐시된 토큰 재사용)"""
+    try:
+        return get_portone_client().access_token()
+    except PortOneError as e:
+        logger.error(f"Portone 토큰 발급 실패: {e.message}")
         raise HTTPException(status_code=500, detail="Portone 토큰을 가져오는 데 실패했습니다.")
-    return response.json()["response"]["access_token"]
 
-def get_portone_payment_info(imp_uid, token):
-    """결제 상세 조회"""
-    response = requests.get(
-        f"{settings.PORTONE_API_URL}/payments/{imp_uid}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    if response.status_code != 200:
+def get_portone_payment_info(imp_uid, token=None):
+    """결제 상세 조회 (token은 하위 호환용, 클라이언트가 캐시된 토큰 사용)"""
+    try:
+        return get_portone_client().get_payment(imp_uid)
+    except PortOneError as e:
+        logger.error(f"결제 정보 조회 실패 ({imp_uid}): {e.message}")
         raise HTTPException(status_code=400, detail="결제 정보를 가져오는 데 실패했습니다.")
-    return response.json()["response"]
+
+def insert_payment_once(payment_record, db) -> bool:
+    """
+    결제 기록 추가. 같은 결제(payment_id/payment_number)가 이미 있으면 False
+    (검증 API와 웹훅, 웹훅 재시도가 동시에 와도 유니크 제약으로 한 곳만 성공 - 스톤 적립도 이 결과로 한 번만)
+    """
+    try:
+        with db.begin_nested():
+            db.add(payment_record)
+    except IntegrityError:
+        logger.info(f"이미 저장된 결제: imp_uid={payment_record.payment_number}, merchant_uid={payment_record.payment_id}")
+        return False
+    return True
 
 def process_tokens(payment, db):
-    """토큰 처리"""
-    token = db.query(Token).filter(Token.user_id == payment.user_id).first()
+    """
+    스톤 적립 (커밋은 결제 기록과 같은 트랜잭션에서 호출하는 쪽이 함)
+    동시에 스톤을 쓰는 요청과 잔액이 엇갈리지 않도록 행을 잠그고 갱신
+    """
+    token = db.query(Token).filter(Token.user_id == payment.user_id).with_for_update().first()
     current_date = payment.payment_date
 
     if not token:
         token = Token(
             user_id=payment.user_id,
-            total_tokens=payment.tokens_purchased,
+            total_tokens=0,
             used_tokens=0,
-            tokens_expires_at=0,
             last_charged_at=current_date
         )
         db.add(token)
 
     token.total_tokens += payment.tokens_purchased
     token.tokens_expires_at = current_date + timedelta(days=365*5)
-    logger.info(f"단건결제 스톤 추가: {payment.tokens_purchased}")
-
-    token.total_tokens += payment.tokens_purchased
     token.last_charged_at = current_date
-    db.commit()
+    logger.info(f"단건결제 스톤 추가: {payment.tokens_purchased}")
+    return token
 
 def save_payment_data(payment_info, payment_cache, db):
-    """검증된 결제 데이터를 저장"""
+    """검증된 결제 데이터를 저장 (결제 기록, 스톤, 쿠폰, 캐시 삭제를 한 트랜잭션으로)"""
+    token = None
     if payment_cache.token_plan_id:
         token_plan = db.query(TokenPlan).filter(
             TokenPlan.token_plan_id == payment_cache.token_plan_id
@@ -277,8 +300,10 @@ def save_payment_data(payment_info, payment_cache, db):
             payment_date=datetime.fromtimestamp(payment_info["paid_at"]),
             status="SUCCESS",
         )
-        db.add(payment_record)
-        process_tokens(payment_record, db)
+        if not insert_payment_once(payment_record, db):
+            db.rollback()
+            return {"status": "duplicate", "message": "이미 처리된 결제 요청입니다."}
+        token = process_tokens(payment_record, db)
 
     elif payment_cache.subscription_plan_id:
         subscription_plan = db.query(subscriprion_models.SubscriptionPlan).filter(
@@ -328,8 +353,7 @@ def save_payment_data(payment_info, payment_cache, db):
             subscriptions_method=payment_cache.payment_method,
         )
         db.add(subscription)
-        db.commit()
-        db.refresh(subscription)
+        db.flush()
 
         # 8. Payment 엔티티 생성 (결제 기록)
         payment_record = Payment(
@@ -345,7 +369,10 @@ def save_payment_data(payment_info, payment_cache, db):
             payment_date=payment_date,
             status="SUCCESS",
         )
-        db.add(payment_record)
+        if not insert_payment_once(payment_record, db):
+            # 구독도 함께 되돌림
+            db.rollback()
+            return {"status": "duplicate", "message": "이미 처리된 결제 요청입니다."}
 
     # 쿠폰 처리
     if payment_cache.coupon_id:
@@ -365,11 +392,16 @@ def save_payment_data(payment_info, payment_cache, db):
 
     db.delete(payment_cache)
     db.commit()
+    if payment_record.subscription_id:
+        subscription_services.invalidate_subscription_status(payment_record.user_id)
+    publish_payment_status(payment_record)
+    if token is not None:
+        publish_token_balance(token)
+    return {"status": "success", "message": "결제 처리가 완료되었습니다."}
 
 def validate_payment_info(payment_request, db):
     """결제 정보를 검증하고 관련 데이터를 반환"""
-    token = get_portone_token()
-    payment_info = get_portone_payment_info(payment_request.imp_uid, token)
+    payment_info = get_portone_payment_info(payment_request.imp_uid)
 
     # 중복 결제 검증
     existing_payment = db.query(Payment).filter(
@@ -435,52 +467,37 @@ def validate_payment_info(payment_request, db):
 
 def verify_and_save_payment(payment_request, db):
     """결제 검증 및 저장"""
-    payment_info, payment_cache = validate_payment_info(payment_request, db)
-    save_payment_data(payment_info, payment_cache, db)
-    return {"status": "success", "message": "결제 처리가 완료되었습니다."}
-
-def cancel_scheduled_payments(customer_uid: str, headers: dict):
+    validated = validate_payment_info(payment_request, db)
+    if isinstance(validated, dict):
+        # 이미 처리된 결제
+        return validated
+    payment_info, payment_cache = validated
+    return save_payment_data(payment_info, payment_cache, db)
+
+def cancel_scheduled_payments(customer_uid: str, headers: dict = None):
     """
     아임포트 정기결제 예약 목록을 조회하고,
-    해당하는 모든 예약을 unschedule(취소)한다.
+    해당하는 모든 예약을 한 번의 요청으로 unschedule(취소)한다. (일괄 취소가 거절되면 건별로 동시에)
+    취소한 merchant_uid 목록을 반환한다.
+    (headers는 하위 호환용, 클라이언트가 캐시된 토큰 사용)
     """
-    schedule_api_url = f"https://api.iamport.kr/subscribe/payments/schedule/customers/{customer_uid}"
-    params = {
-        "schedule-status": "scheduled",  # 예약 상태가 'scheduled' 인 것만 조회
-        # 필요시 "from", "to", "page" 등 추가
-    }
-
-    # 1) 예약 목록 조회
-    schedule_response = requests.get(schedule_api_url, headers=headers, params=params)
-    if schedule_response.status_code != 200 or schedule_response.json().get("code") != 0:
-        error_msg = schedule_response.json().get("message", "예약 조회 실패")
-        raise HTTPException(status_code=400, detail=f"예약 조회 실패: {error_msg}")
+    client = get_portone_client()
 
-    schedule_data = schedule_response.json().get("response")
-    schedules = schedule_data.get("list", [])
+    # 1) 예약 목록 조회 (예약 상태가 'scheduled' 인 것만)
+    try:
+        schedules = client.get_schedules(customer_uid)
+    except PortOneError as e:
+        raise HTTPException(status_code=400, detail=f"예약 조회 실패: {e.message}")
 
     # 2) 스케줄 unschedule
-    for sch in schedules:
-        merchant_uid = sch.get("merchant_uid")
-        if not merchant_uid:
-            continue
-        unschedule_payload = {
-            "customer_uid": customer_uid,
-            "merchant_uid": [merchant_uid]
-        }
-        unschedule_resp = requests.post(
-            url="https://api.iamport.kr/subscribe/payments/unschedule",
-            headers=headers,
-            json=unschedule_payload
-        )
-        if unschedule_resp.status_code != 200 or unschedule_resp.json().get("code") != 0:
-            msg = unschedule_resp.json().get("message", "예약 취소 실패")
-            raise HTTPException(status_code=400, detail=f"예약 취소 실패: {msg}")
+    merchant_uids = [sch["merchant_uid"] for sch in schedules if sch.get("merchant_uid")]
+    failed = client.unschedule_many(customer_uid, merchant_uids)
+    if failed:
+        errors = ", ".join(f"{merchant_uid}: {message}" for merchant_uid, message in failed.items())
+        raise HTTPException(status_code=400, detail=f"예약 취소 실패: {errors}")
+    return merchant_uids
 
 def issue_refund(inquiry_id: int, db: Session):
-    access_token = get_portone_token()
-    headers = {"Authorization": f"Bearer {access_token}"}
-
     refund = db.query(Refund).filter(Refund.inquiry_id == inquiry_id).first()
     if not refund or refund.status != "PENDING":
         raise HTTPException(status_code=400, detail="환불 요청이 존재하지 않거나 이미 처리된 요청입니다.")
@@ -509,15 +526,10 @@ def issue_refund(inquiry_id: int, db: Session):
             "refund_account": refund.refund_account
         })
 
-    response = requests.post(
-        url="https://api.iamport.kr/payments/cancel",
-        headers=headers,
-        json=refund_payload
-    )
-
-    if response.status_code != 200 or response.json().get("code") != 0:
-        error_message = response.json().get("message", "알 수 없는 오류가 발생했습니다.")
-        raise HTTPException(status_code=400, detail=f"환불 요청 실패: {error_message}")
+    try:
+        cancel_response = get_portone_client().cancel_payment(refund_payload)
+    except PortOneError as e:
+        raise HTTPException(status_code=400, detail=f"환불 요청 실패: {e.message}")
 
     # 2) 구독 결제 취소(예약 취소) & 구독 상태 업데이트
     if payment.subscription_id:
@@ -534,7 +546,7 @@ def issue_refund(inquiry_id: int, db: Session):
             # 이미 예약된 결제 일정(정기결제) 취소 (아임포트)
             customer_uid = subscription.subscription_number
             if customer_uid:
-                cancel_scheduled_payments(customer_uid=customer_uid, headers=headers)
+                cancel_scheduled_payments(customer_uid=customer_uid)
     else:
         # 일반 단건 결제 → 스톤 차감
         token.total_tokens -= payment.tokens_purchased
@@ -546,18 +558,21 @@ def issue_refund(inquiry_id: int, db: Session):
     payment.status = "REFUNDED"
 
     db.commit()
+    publish_payment_status(payment)
+    if payment.subscription_id:
+        subscription_services.invalidate_subscription_status(payment.user_id)
+    else:
+        publish_token_balance(token)
 
     return {
         "status": "success",
-        "data": response.json().get("response")
+        "data": cancel_response
     }
 
 def schedule_subscription_payment(subscription_id, db: Session):
     """
     정기 결제 예약 로직.
     """
-    token = get_portone_token()
-
     subscription = db.query(subscriprion_models.UserSubscription).filter(
         subscriprion_models.UserSubscription.subscription_id == subscription_id
     ).first()
@@ -577,7 +592,7 @@ def schedule_subscription_payment(subscription_id, db: Session):
         "schedules": [
             {
                 "merchant_uid": f"sub_{uuid.uuid4()}",
-                "schedule_at": int(next_billing_date.timestamp()),
+                "schedule_at": int(datetime.combine(next_billing_date, datetime.min.time()).timestamp()),
                 "amount": float(subscription_plan.discounted_price or subscription_plan.price),
                 "name": subscription_plan.plan_name,
                 "notice_url": settings.PORTONE_WEPHOOK_URL,
@@ -586,17 +601,12 @@ def schedule_subscription_payment(subscription_id, db: Session):
     }
 
     try:
-        response = requests.post(
-            f"{settings.PORTONE_API_URL}/subscribe/payments/schedule",
-            json=schedule_data,
-            headers={"Authorization": f"Bearer {token}"},
-        )
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        raise HTTPException(status_code=500, detail=f"결제 예약 요청 중 오류가 발생했습니다: {str(e)}")
+        response = get_portone_client().schedule(schedule_data)
+    except PortOneError as e:
+        raise HTTPException(status_code=500, detail=f"결제 예약 요청 중 오류가 발생했습니다: {e.message}")
 
     logging.info(f"Next subscription payment scheduled. Subscription ID: {subscription.subscription_id}")
-    return response.json()
+    return response
 
 def identify_payment_type(merchant_uid: str) -> str:
     """
@@ -614,15 +624,8 @@ def identify_payment_type(merchant_uid: str) -> str:
 def process_subscription_payment(payment_info, db: Session):
     """
     정기 결제 처리 로직. 중복 처리 방지 포함
+    (구독, 이번 호출에서 결제를 저장했는지) 반환 - 이미 저장된 결제면 False
     """
-    existing_payment = db.query(Payment).filter(
-        Payment.payment_number == payment_info["imp_uid"]
-    ).first()
-
-    if existing_payment:
-        logging.info(f"Duplicate subscription payment detected. Imp_uid: {payment_info['imp_uid']}")
-        return
-
     subscription = db.query(subscriprion_models.UserSubscription).filter(
         subscriprion_models.UserSubscription.subscription_number == payment_info["customer_uid"]
     ).first()
@@ -650,24 +653,23 @@ def process_subscription_payment(payment_info, db: Session):
         status="SUCCESS",
     )
 
-    db.add(payment_record)
+    if not insert_payment_once(payment_record, db):
+        db.rollback()
+        logging.info(f"Duplicate subscription payment detected. Imp_uid: {payment_info['imp_uid']}")
+        return subscription, False
+
     db.commit()
+    subscription_services.invalidate_subscription_status(subscription.user_id)
+    publish_payment_status(payment_record)
     logging.info(f"Subscription payment processed and saved. Subscription ID: {subscription.subscription_id}")
 
-    return subscription
+    return subscription, True
 
 def process_single_payment(payment_info, db: Session):
     """
     단건 결제 처리 로직. 중복 처리 방지 포함
+    결제 기록과 스톤 적립을 한 트랜잭션으로 커밋 - 이미 저장된 결제면 적립하지 않고 False
     """
-    existing_payment = db.query(Payment).filter(
-        Payment.payment_number == payment_info["imp_uid"]
-    ).first()
-
-    if existing_payment:
-        logging.info(f"Duplicate single payment detected. Imp_uid: {payment_info['imp_uid']}")
-        return
-
     token_plan = db.query(TokenPlan).filter(
         TokenPlan.token_plan_id == payment_info["custom_data"]["token_plan_id"]
     ).first()
@@ -688,9 +690,17 @@ def process_single_payment(payment_info, db: Session):
         status="SUCCESS",
     )
 
-    db.add(payment_record)
+    if not insert_payment_once(payment_record, db):
+        db.rollback()
+        logging.info(f"Duplicate single payment detected. Imp_uid: {payment_info['imp_uid']}")
+        return False
+
+    token = process_tokens(payment_record, db)
     db.commit()
+    publish_payment_status(payment_record)
+    publish_token_balance(token)
     logging.info(f"Single payment processed and saved. Merchant UID: {payment_info['merchant_uid']}")
+    return True
 
 def handle_failed_subscription_payment(payment_info, db: Session):
     """
@@ -722,11 +732,62 @@ def handle_failed_subscription_payment(payment_info, db: Session):
         status="FAILED",
         manual_payment_reason="결제 실패로 인한 구독 취소",
     )
-    db.add(failed_payment)
+    if not insert_payment_once(failed_payment, db):
+        db.rollback()
+        logging.info(f"Duplicate failed subscription payment detected. Imp_uid: {payment_info['imp_uid']}")
+        return
 
     db.commit()
+    subscription_services.invalidate_subscription_status(subscription.user_id)
+    publish_payment_status(failed_payment)
     logging.info(f"Failed subscription payment processed and subscription cancelled. Subscription ID: {subscription.subscription_id}")
 
+def has_scheduled_payment(customer_uid: str) -> bool:
+    """빌링키에 예약된 결제가 남아 있는지"""
+    try:
+        return bool(get_portone_client().get_schedules(customer_uid))
+    except PortOneError as e:
+        raise HTTPException(status_code=500, detail=f"예약 조회 중 오류가 발생했습니다: {e.message}")
+
+def handle_webhook_event(imp_uid: str, merchant_uid: str, status: str, db: Session):
+    """
+    접수된 포트원 웹훅 한 건 처리 (webhook_queue 워커에서 호출)
+    결제 저장은 유니크 제약으로 한 번만 되므로 재시도/재처리해도 스톤 적립과 예약이 중복되지 않는다
+    """
+    payment_info = get_portone_payment_info(imp_uid)
+    name = payment_info.get("name") or ""
+    payment_type = identify_payment_type(merchant_uid)
+    logging.info(f"Webhook processing: imp_uid={imp_uid}, status={status}, type={payment_type}, name={name}")
+
+    # 결제 방식 변경을 위한 결제는 처리하지 않음 (새 빌링키로 다음 결제만 예약, 재시도/재처리 시 이미 예약돼 있으면 건너뜀)
+    if "결제 방식 변경" in name:
+        subscription = db.query(subscriprion_models.UserSubscription).filter(
+            subscriprion_models.UserSubscription.subscription_number == payment_info["customer_uid"]
+        ).first()
+        if not subscription:
+            raise HTTPException(status_code=404, detail="구독 정보를 찾을 수 없습니다.")
+        if not has_scheduled_payment(subscription.subscription_number):
+            schedule_subscription_payment(subscription.subscription_id, db)
+        logging.info(f"Skipping payment processing for method change. Name: {name}")
+        return {"status": "skipped", "message": "결제 방식 변경 요청은 처리하지 않습니다."}
+
+    if status == "paid":
+        if payment_type == "single":
+            process_single_payment(payment_info, db)
+        elif payment_type == "subscription":
+            subscription, created = process_subscription_payment(payment_info, db)
+            # 저장 후 예약 전에 중단됐던 이벤트를 다시 처리하는 경우에도 다음 결제 예약이 빠지지 않도록
+            if created or not has_scheduled_payment(subscription.subscription_number):
+                schedule_subscription_payment(subscription.subscription_id, db)
+    elif status == "failed":
+        if payment_type == "subscription":
+            handle_failed_subscription_payment(payment_info, db)
+        else:
+            logging.warning(f"Failed payment for non-subscription type. Merchant UID: {merchant_uid}")
+    else:
+        logging.warning(f"Unhandled payment status: {status} for imp_uid: {imp_uid}")
+    return {"status": "success", "message": "웹훅 처리 완료"}
+
 def initiate_change_payment_method(change_request, db: Session, current_user):
     """
     구독 결제 방식 변경 요청 초기화
@@ -752,9 +813,8 @@ def initiate_change_payment_method(change_request, db: Session, current_user):
     # 기존 예약 취소
     old_customer_uid = active_subscription.subscription_number
     if old_customer_uid:
-        access_token = get_portone_token()
         try:
-            cancel_scheduled_payments(old_customer_uid, access_token)
+            cancel_scheduled_payments(old_customer_uid)
             logging.info(f"Canceled existing schedule for customer_uid={old_customer_uid}")
         except HTTPException as e:
             logging.error(f"Failed to cancel existing schedule: {e.detail}")
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Form, File, UploadFile, Request
 from fastapi.responses import RedirectResponse
 from fastapi.encoders import jsonable_encoder
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Union
@@ -13,11 +14,11 @@ from app.domains.user.models import User
 from app.domains.user import schemas as user_schemas
 from app.domains.inquiry import services as inquiry_services
 from app.domains.payment.models import Payment
-from app.domains.payment import schemas, services, portone_services
-from app.domains.subscription import models as subscriprion_models
+from app.domains.payment import schemas, services, portone_services, webhook_queue
 from app.db.session import get_db
 from app.core.deps import get_current_active_user, get_current_admin_user
 from app.core.config import settings
+from app.core import response_cache
 
 logger = logging.getLogger("app")
 
@@ -26,13 +27,16 @@ router = APIRouter()
 
 # 상품 관련 엔드포인트
 @router.get("/payments/products", response_model=dict)
-async def get_all_products(db: Session = Depends(get_db)):
-    products = services.get_all_products(db)
-    return {
-        "subscription_plans": [schemas.SubscriptionPlanSchema.from_orm(plan) for plan in
-                products["subscription_plans"]],
-        "token_plans": [schemas.TokenPlanSchema.from_orm(plan) for plan in products["token_plans"]]
-    }
+async def get_all_products(request: Request, db: Session = Depends(get_db)):
+    def load_products():
+        products = services.get_all_products(db)
+        return {
+            "subscription_plans": [schemas.SubscriptionPlanSchema.from_orm(plan) for plan in
+                    products["subscription_plans"]],
+            "token_plans": [schemas.TokenPlanSchema.from_orm(plan) for plan in products["token_plans"]]
+        }
+
+    return response_cache.cached_response(request, response_cache.PRODUCTS, load_products)
 
 
 @router.get("/payments/products/{product_id}",
@@ -299,7 +303,8 @@ async def payment_complete(
 @router.post("/import/webhook")
 async def import_webhook(request: Request, db: Session = Depends(get_db)):
     """
-    포트원 웹훅 처리 라우터. 중복 처리 방지 및 정기 결제 예약 처리 포함.
+    포트원 웹훅 접수 라우터. 대기열에 넣고 바로 응답하며 처리는 webhook_queue 워커가 한다.
+    같은 결제의 같은 상태 알림(포트원 재전송)은 한 번만 접수된다.
     """
     try:
         # 요청 데이터 읽기
@@ -308,56 +313,17 @@ async def import_webhook(request: Request, db: Session = Depends(get_db)):
 
         imp_uid = body.get("imp_uid")
         merchant_uid = body.get("merchant_uid")
-        status = body.get("status")
-        customer_uid = body.get("customer_uid", None)
-
-        logging.info(f"Parsed body: imp_uid={imp_uid}, merchant_uid={merchant_uid}, status={status}, customer_uid={customer_uid}")
-
         if not imp_uid or not merchant_uid:
             raise HTTPException(status_code=400, detail="유효하지 않은 웹훅 요청입니다.")
 
-        existing_payment = db.query(Payment).filter(
-            Payment.payment_number == imp_uid
-        ).first()
-        if existing_payment:
-            logging.info(f"Duplicate payment detected for imp_uid: {imp_uid}. Skipping.")
-            return {"status": "duplicate", "message": "이미 처리된 결제 요청입니다."}
-
-        token = portone_services.get_portone_token()
-        payment_info = portone_services.get_portone_payment_info(imp_uid, token)
-        logging.info(f"Payment info retrieved: {json.dumps(payment_info, ensure_ascii=False)}")
-
-        name = payment_info.get("name")
-        logging.info(f"Retrieved name from payment info: {name}")
-        payment_type = portone_services.identify_payment_type(merchant_uid)
-        logging.info(f"Payment type identified: {payment_type}")
-
-        # 결제 방식 변경을 위한 결제는 처리하지 않음
-        if "결제 방식 변경" in name:
-            subscription = db.query(subscriprion_models.UserSubscription).filter(
-                subscriprion_models.UserSubscription.subscription_number == payment_info["customer_uid"]
-            ).first()
-            portone_services.schedule_subscription_payment(subscription.subscription_id, db)
-            logging.info(f"Skipping payment processing for method change. Name: {name}")
-            return {"status": "skipped", "message": "결제 방식 변경 요청은 처리하지 않습니다."}
-
-        if status == "paid":
-            if payment_type == "single":
-                logging.info("Processing single payment.")
-                portone_services.process_single_payment(payment_info, db)
-            elif payment_type == "subscription":
-                logging.info("Processing subscription payment.")
-                subscription = portone_services.process_subscription_payment(payment_info, db)
-                portone_services.schedule_subscription_payment(subscription.subscription_id, db)
-        elif status == "failed":
-            if payment_type == "subscription":
-                logging.info("Processing failed subscription payment.")
-                portone_services.handle_failed_subscription_payment(payment_info, db)
-            else:
-                logging.warning(f"Failed payment for non-subscription type. Merchant UID: {merchant_uid}")
-        else:
-            logging.warning(f"Unhandled payment status: {status} for imp_uid: {imp_uid}")
-        return {"status": "success", "message": "웹훅 처리 완료"}
+        # 동기 DB 쓰기라 이벤트 루프를 막지 않도록 스레드풀에서
+        event_id = await run_in_threadpool(webhook_queue.enqueue, db, body)
+        if event_id is None:
+            logging.info(f"Duplicate webhook for imp_uid: {imp_uid}, status: {body.get('status')}. Skipping.")
+            return {"status": "duplicate", "message": "이미 접수된 웹훅입니다."}
+
+        webhook_queue.notify()
+        return {"status": "accepted", "message": "웹훅이 접수되었습니다.", "event_id": event_id}
 
     except HTTPException as e:
         logging.error(f"HTTPException during webhook processing: {e.detail}")
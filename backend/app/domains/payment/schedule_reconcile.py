@@ -0,0 +1,187 @@
+"""
+정기결제 예약 대사 (매일 새벽)
+사용자마다 예약을 조회하지 않고 포트원의 기간별 예약 목록을 페이지 단위로 한 번에 받아
+로컬 user_subscriptions와 한 번의 쿼리로 비교한다
+
+- 해지된 구독의 빌링키에 남은 예약: 고객별로 한 번의 일괄 취소 (해지 후 결제되는 것을 막음)
+- 활성 구독인데 예약이 없거나 여러 개인 경우, 로컬에 없는 빌링키의 예약: 로그로만 보고
+  (결제가 걸린 일이라 자동으로 예약/취소하지 않음)
+여러 워커가 동시에 돌더라도 트랜잭션 advisory lock을 잡은 한 곳만 실행한다
+"""
+
+import logging
+import threading
+import zlib
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.db.locks import try_xact_lock
+from app.domains.subscription.models import UserSubscription
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_LOCK_KEY = zlib.crc32(b'culf:schedule-reconcile')
+# 월 구독이라 다음 결제 예약은 한 달 남짓 안에 있음
+LOOKAHEAD_DAYS = 62
+RECONCILE_HOUR = 4
+MANUAL_METHOD = '수동결제'
+
+
+def diff_schedules(subscriptions: Iterable[Any], schedules: Iterable[Dict[str, Any]],
+                   today: date, until: date) -> Dict[str, Any]:
+    """
+    로컬 구독(subscription_number, status, end_date, next_billing_date, subscriptions_method)과
+    포트원 예약 목록 비교
+    """
+    scheduled = defaultdict(list)
+    for schedule in schedules:
+        if schedule.get('customer_uid') and schedule.get('merchant_uid'):
+            scheduled[schedule['customer_uid']].append(schedule['merchant_uid'])
+
+    local = {subscription.subscription_number: subscription for subscription in subscriptions}
+
+    orphaned = {}
+    unknown = {}
+    for customer_uid, merchant_uids in scheduled.items():
+        subscription = local.get(customer_uid)
+        if subscription is None:
+            unknown[customer_uid] = merchant_uids
+        elif subscription.status != 'ACTIVE':
+            orphaned[customer_uid] = merchant_uids
+
+    missing = []
+    duplicated = {}
+    for customer_uid, subscription in local.items():
+        if subscription.status != 'ACTIVE':
+            continue
+        merchant_uids = scheduled.get(customer_uid, [])
+        if len(merchant_uids) > 1:
+            duplicated[customer_uid] = merchant_uids
+        elif (not merchant_uids
+              and subscription.subscriptions_method != MANUAL_METHOD
+              and subscription.end_date >= today
+              and subscription.next_billing_date <= until):
+            missing.append(customer_uid)
+
+    return {'orphaned': orphaned, 'unknown': unknown, 'missing': missing, 'duplicated': duplicated}
+
+
+def reconcile(db: Session, client=None, now: Optional[datetime] = None,
+              apply: bool = True) -> Optional[Dict[str, Any]]:
+    """예약 대사 실행 - 요약 반환, 다른 곳에서 실행 중이면 None"""
+    if client is None:
+        from app.domains.payment.portone_client import get_portone_client
+        client = get_portone_client()
+    now = now or datetime.now()
+    until = now + timedelta(days=LOOKAHEAD_DAYS)
+
+    try:
+        if not try_xact_lock(db, RECONCILE_LOCK_KEY):
+            db.rollback()
+            logger.info("다른 작업자가 예약 대사 중 - 건너뜀")
+            return None
+
+        schedules = list(client.iter_schedules(int(now.timestamp()), int(until.timestamp())))
+        customer_uids = {schedule['customer_uid'] for schedule in schedules if schedule.get('customer_uid')}
+
+        # 예약에 나온 빌링키와 활성 구독을 한 번에 조회
+        conditions = [UserSubscription.status == 'ACTIVE']
+        if customer_uids:
+            conditions.append(UserSubscription.subscription_number.in_(customer_uids))
+        subscriptions = db.query(
+            UserSubscription.subscription_number,
+            UserSubscription.status,
+            UserSubscription.end_date,
+            UserSubscription.next_billing_date,
+            UserSubscription.subscriptions_method,
+        ).filter(
+            UserSubscription.subscription_number.isnot(None),
+            or_(*conditions)
+        ).all()
+
+        diff = diff_schedules(subscriptions, schedules, now.date(), until.date())
+
+        failed: Dict[str, Dict[str, str]] = {}
+        if apply:
+            for customer_uid, merchant_uids in diff['orphaned'].items():
+                errors = client.unschedule_many(customer_uid, merchant_uids)
+                if errors:
+                    failed[customer_uid] = errors
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"정기결제 예약 대사 실패: {str(e)}")
+        raise
+
+    for customer_uid in diff['missing']:
+        logger.warning(f"활성 구독에 예약된 결제가 없음: customer_uid={customer_uid}")
+    for customer_uid, merchant_uids in diff['duplicated'].items():
+        logger.warning(f"한 구독에 예약이 여러 건: customer_uid={customer_uid}, merchant_uid={merchant_uids}")
+    for customer_uid, merchant_uids in diff['unknown'].items():
+        logger.warning(f"로컬에 없는 빌링키의 예약: customer_uid={customer_uid}, merchant_uid={merchant_uids}")
+    for customer_uid, errors in failed.items():
+        logger.error(f"해지된 구독의 예약 취소 실패: customer_uid={customer_uid}, {errors}")
+
+    orphaned = sum(len(merchant_uids) for merchant_uids in diff['orphaned'].values())
+    summary = {
+        'schedules': len(schedules),
+        'subscriptions': len(subscriptions),
+        'orphaned': orphaned,
+        'cancelled': orphaned - sum(len(errors) for errors in failed.values()) if apply else 0,
+        'missing': len(diff['missing']),
+        'duplicated': len(diff['duplicated']),
+        'unknown': len(diff['unknown']),
+    }
+    logger.info(f"정기결제 예약 대사 완료: {summary}")
+    return summary
+
+
+def seconds_until(hour: int, now: Optional[datetime] = None) -> float:
+    """다음 hour시 정각까지 남은 초"""
+    now = now or datetime.now()
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+class ScheduleReconciler:
+    """매일 정해진 시각에 예약 대사를 실행하는 백그라운드 스레드"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None,
+                 hour: int = RECONCILE_HOUR):
+        self.session_factory = session_factory
+        self.hour = hour
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run_once(self) -> Optional[Dict[str, Any]]:
+        if self.session_factory is None:
+            from app.db.session import SessionLocal
+            self.session_factory = SessionLocal
+        db = self.session_factory()
+        try:
+            return reconcile(db)
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(seconds_until(self.hour)):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("정기결제 예약 대사 오류")
+
+    def start(self) -> threading.Thread:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='schedule-reconcile', daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
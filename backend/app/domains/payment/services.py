@@ -1,14 +1,16 @@
 from calendar import monthrange
 from fastapi import HTTPException, status
-from sqlalchemy import extract, or_
+from sqlalchemy import extract, func, or_
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 from datetime import date, datetime, timedelta
 from uuid import UUID
 import uuid
+import json
 import logging
 
+from app.core import response_cache
 from app.domains.inquiry import services as inquiry_services
 from app.domains.payment import schemas as payment_schemas
 from app.domains.payment.models import Payment, Refund, Coupon, UserCoupon
@@ -21,6 +23,9 @@ from app.domains.inquiry.models import Inquiry
 
 logger = logging.getLogger("app")
 
+# 관리자 결제 목록 전체 개수 캐시 시간 (새 결제는 첫 페이지를 다시 열면 반영)
+ADMIN_PAYMENT_COUNT_TTL_SECONDS = 30
+
 def get_all_products(db: Session):
     subscription_plans = db.query(SubscriptionPlan).order_by(SubscriptionPlan.price.asc()).all()
     token_plans = db.query(TokenPlan).order_by(TokenPlan.price.asc()).all()
@@ -360,6 +365,8 @@ def create_manual_payment(db: Session, payment_data: dict) -> Payment:
         db.rollback()
         raise HTTPException(status_code=500, detail="Failed to create manual payment")
 
+    if payment.subscription_id:
+        subscription_services.invalidate_subscription_status(payment.user_id)
     return payment
 
 def get_admin_payments(
@@ -373,12 +380,21 @@ def get_admin_payments(
     sort: str,
     status: Optional[str] = None
 ) -> List[payment_schemas.AdminPaymentListResponse]:
+    # 상품명(스톤 플랜/구독 플랜)까지 한 쿼리로 조회 (전체 개수는 아래에서 따로)
     query_builder = db.query(
         Payment,
         User.nickname.label("user_nickname"),
-        Refund
+        Refund,
+        TokenPlan.tokens.label("plan_tokens"),
+        SubscriptionPlan.plan_name.label("plan_name")
     ).join(User, Payment.user_id == User.user_id, isouter=True).join(
         Refund, Payment.payment_id == Refund.payment_id, isouter=True
+    ).join(
+        TokenPlan, Payment.token_plan_id == TokenPlan.token_plan_id, isouter=True
+    ).join(
+        UserSubscription, Payment.subscription_id == UserSubscription.subscription_id, isouter=True
+    ).join(
+        SubscriptionPlan, UserSubscription.plan_id == SubscriptionPlan.plan_id, isouter=True
     )
 
     if query:
@@ -406,31 +422,40 @@ def get_admin_payments(
             Payment.payment_date.between(start_date, end_date)
         )
 
-    # 전체 개수를 먼저 구합니다
-    total_count = query_builder.count()
-
     sort_column, sort_direction = sort.split(":")
     if sort_direction == "desc":
         query_builder = query_builder.order_by(getattr(Payment, sort_column).desc())
     else:
         query_builder = query_builder.order_by(getattr(Payment, sort_column))
 
+    # 목록은 정렬 인덱스로 앞쪽 limit개만 읽음 (count(*) OVER ()는 매 페이지 전체를 정렬하게 함)
     results = query_builder.offset((page - 1) * limit).limit(limit).all()
 
+    # 전체 개수는 필터별로 짧게 캐시 - 첫 페이지에서 다시 세고, 다음 페이지들은 캐시를 씀
+    count_filters = {
+        "query": query,
+        "start_date": start_date,
+        "end_date": end_date,
+        "payment_method": payment_method,
+        "status": status,
+    }
+    cached_count = response_cache.get_response_cache().load(
+        response_cache.ADMIN_PAYMENT_COUNT,
+        lambda: query_builder.order_by(None).with_entities(func.count(Payment.payment_id)).scalar() or 0,
+        params=count_filters,
+        ttl=ADMIN_PAYMENT_COUNT_TTL_SECONDS,
+        refresh=page == 1,
+    )
+    total_count = json.loads(cached_count.body)
+
     payments = []
-    for payment, user_nickname, refund in results:
-        # product_name 구성 로직 추가
+    for payment, user_nickname, refund, plan_tokens, plan_name in results:
         product_name = None
-        payment_number = payment.payment_number
-
         if payment.token_plan_id:
-            token_plan = db.query(TokenPlan).get(payment.token_plan_id)
-            if token_plan:
-                product_name = f"{token_plan.tokens} 스톤"
+            if plan_tokens is not None:
+                product_name = f"{plan_tokens} 스톤"
         elif payment.subscription_id:
-            subscription = db.query(UserSubscription).get(payment.subscription_id)
-            if subscription and subscription.subscription_plan:
-                product_name = subscription.subscription_plan.plan_name
+            product_name = plan_name
 
         payments.append(
             payment_schemas.AdminPaymentListResponse(
@@ -0,0 +1,279 @@
+"""
+포트원 웹훅 대기열
+웹훅 요청은 payment_webhook_events에 한 행 넣고 바로 응답하고 (같은 imp_uid + 상태는 ON CONFLICT로 무시),
+결제 조회/저장/스톤 적립/다음 결제 예약은 워커가 대기열에서 하나씩 가져가 처리한다
+
+- 여러 워커가 동시에 돌아도 한 이벤트는 한 곳만 가져가도록 SKIP LOCKED
+- 처리 중 프로세스가 죽어 processing으로 남은 이벤트는 일정 시간 뒤 다시 가져감
+- 실패하면 점점 간격을 늘려 재시도하고, MAX_ATTEMPTS번 실패하면 failed로 두어 replay로 다시 처리
+- 결제 저장은 payments 유니크 제약으로 한 번만 되므로 재처리해도 스톤이 두 번 적립되지 않는다
+"""
+
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.db.locks import insert_statement
+from app.domains.payment.models import PaymentWebhookEvent
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_PROCESSING = 'processing'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+MAX_ATTEMPTS = 8
+# 재시도 간격: 30초, 1분, 2분 ... 최대 1시간
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+# processing 상태로 이 시간 넘게 남아 있으면 처리하던 워커가 죽은 것으로 간주
+STALE_PROCESSING = timedelta(minutes=10)
+POLL_INTERVAL_SECONDS = 5
+ERROR_MAX_LENGTH = 2000
+
+
+def current_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue(db: Session, body: Dict[str, Any]) -> Optional[int]:
+    """웹훅 접수 - 새로 넣었으면 event_id, 이미 접수된 알림이면 None"""
+    now = datetime.now()
+    statement = insert_statement(db, PaymentWebhookEvent).values(
+        imp_uid=body['imp_uid'],
+        merchant_uid=body['merchant_uid'],
+        status=body.get('status') or '',
+        customer_uid=body.get('customer_uid'),
+        payload=body,
+        processing_status=STATUS_PENDING,
+        attempts=0,
+        received_at=now,
+        next_attempt_at=now,
+    ).on_conflict_do_nothing(
+        index_elements=['imp_uid', 'status']
+    ).returning(PaymentWebhookEvent.event_id)
+    event_id = db.execute(statement).scalar()
+    db.commit()
+    return event_id
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)), RETRY_MAX_SECONDS))
+
+
+def event_to_dict(event: PaymentWebhookEvent) -> Dict[str, Any]:
+    return {
+        'event_id': event.event_id,
+        'imp_uid': event.imp_uid,
+        'merchant_uid': event.merchant_uid,
+        'status': event.status,
+        'customer_uid': event.customer_uid,
+        'processing_status': event.processing_status,
+        'attempts': event.attempts,
+        'last_error': event.last_error,
+        'received_at': event.received_at,
+        'processed_at': event.processed_at,
+        'next_attempt_at': event.next_attempt_at,
+    }
+
+
+def claim_next(db: Session, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """처리할 이벤트 하나를 processing으로 바꿔 가져옴 (여러 워커가 동시에 가져가지 않도록 SKIP LOCKED)"""
+    now = now or datetime.now()
+    event = db.query(PaymentWebhookEvent).filter(or_(
+        and_(
+            PaymentWebhookEvent.processing_status == STATUS_PENDING,
+            PaymentWebhookEvent.next_attempt_at <= now
+        ),
+        and_(
+            PaymentWebhookEvent.processing_status == STATUS_PROCESSING,
+            PaymentWebhookEvent.locked_at < now - STALE_PROCESSING
+        )
+    )).order_by(PaymentWebhookEvent.event_id).with_for_update(skip_locked=True).first()
+    if event is None:
+        db.rollback()
+        return None
+    event.processing_status = STATUS_PROCESSING
+    event.attempts += 1
+    event.locked_at = now
+    event.worker_id = current_worker_id()
+    claimed = event_to_dict(event)
+    db.commit()
+    return claimed
+
+
+def mark_done(db: Session, event_id: int) -> None:
+    db.query(PaymentWebhookEvent).filter(
+        PaymentWebhookEvent.event_id == event_id
+    ).update({
+        'processing_status': STATUS_DONE,
+        'processed_at': datetime.now(),
+        'last_error': None,
+    }, synchronize_session=False)
+    db.commit()
+
+
+def mark_failed(db: Session, event_id: int, attempts: int, error: str,
+                now: Optional[datetime] = None) -> str:
+    """실패 기록 - 재시도 횟수가 남았으면 pending(다음 시도 시각 지정), 아니면 failed"""
+    now = now or datetime.now()
+    status = STATUS_FAILED if attempts >= MAX_ATTEMPTS else STATUS_PENDING
+    db.query(PaymentWebhookEvent).filter(
+        PaymentWebhookEvent.event_id == event_id
+    ).update({
+        'processing_status': status,
+        'last_error': error[:ERROR_MAX_LENGTH],
+        'next_attempt_at': now + retry_delay(attempts),
+        'locked_at': None,
+    }, synchronize_session=False)
+    db.commit()
+    return status
+
+
+def _error_message(error: Exception) -> str:
+    if isinstance(error, HTTPException):
+        return f"{error.status_code}: {error.detail}"
+    return f"{type(error).__name__}: {str(error)}"
+
+
+def process_event(db: Session, event: Dict[str, Any]) -> Dict[str, Any]:
+    from app.domains.payment import portone_services
+    return portone_services.handle_webhook_event(event['imp_uid'], event['merchant_uid'], event['status'], db)
+
+
+def replay(db: Session, event_ids: Optional[List[int]] = None) -> int:
+    """
+    실패한 이벤트를 다시 대기열에 넣음 (event_ids를 주면 처리 완료된 이벤트도 포함)
+    결제 저장이 한 번만 되므로 완료된 이벤트를 다시 처리해도 스톤이 중복 적립되지 않는다
+    """
+    query = db.query(PaymentWebhookEvent)
+    if event_ids:
+        query = query.filter(
+            PaymentWebhookEvent.event_id.in_(event_ids),
+            PaymentWebhookEvent.processing_status.in_((STATUS_FAILED, STATUS_DONE))
+        )
+    else:
+        query = query.filter(PaymentWebhookEvent.processing_status == STATUS_FAILED)
+    replayed = query.update({
+        'processing_status': STATUS_PENDING,
+        'attempts': 0,
+        'next_attempt_at': datetime.now(),
+        'locked_at': None,
+        'processed_at': None,
+    }, synchronize_session=False)
+    db.commit()
+    if replayed:
+        logger.info(f"웹훅 재처리 등록: {replayed}건")
+    return replayed
+
+
+def list_events(db: Session, processing_status: Optional[str] = STATUS_FAILED,
+                limit: int = 100) -> List[Dict[str, Any]]:
+    query = db.query(PaymentWebhookEvent)
+    if processing_status:
+        query = query.filter(PaymentWebhookEvent.processing_status == processing_status)
+    events = query.order_by(PaymentWebhookEvent.event_id.desc()).limit(limit).all()
+    return [event_to_dict(event) for event in events]
+
+
+class WebhookWorker:
+    """대기열의 웹훅을 처리하는 백그라운드 스레드 (웹훅 접수 시 notify로 바로 깨움)"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None,
+                 poll_interval: float = POLL_INTERVAL_SECONDS,
+                 handler: Callable[[Session, Dict[str, Any]], Any] = process_event):
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.handler = handler
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _session(self) -> Session:
+        if self.session_factory is None:
+            from app.db.session import SessionLocal
+            self.session_factory = SessionLocal
+        return self.session_factory()
+
+    def run_one(self) -> Optional[str]:
+        """이벤트 하나 처리 - 처리 결과 상태, 처리할 이벤트가 없으면 None"""
+        db = self._session()
+        try:
+            event = claim_next(db)
+        finally:
+            db.close()
+        if event is None:
+            return None
+
+        db = self._session()
+        try:
+            self.handler(db, event)
+        except Exception as e:
+            db.rollback()
+            error = _error_message(e)
+            status = mark_failed(db, event['event_id'], event['attempts'], error)
+            log = logger.error if status == STATUS_FAILED else logger.warning
+            log(f"웹훅 처리 실패 (event_id={event['event_id']}, imp_uid={event['imp_uid']}, "
+                f"시도 {event['attempts']}회, {status}): {error}")
+            return status
+        else:
+            mark_done(db, event['event_id'])
+            return STATUS_DONE
+        finally:
+            db.close()
+
+    def run_pending(self, limit: int = 100) -> int:
+        processed = 0
+        while processed < limit and not self._stop.is_set():
+            if self.run_one() is None:
+                break
+            processed += 1
+        return processed
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_pending()
+            except Exception:
+                logger.exception("웹훅 대기열 처리 오류")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def start(self) -> threading.Thread:
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='payment-webhooks', daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+
+_worker: Optional[WebhookWorker] = None
+
+
+def start_worker(poll_interval: float = POLL_INTERVAL_SECONDS) -> WebhookWorker:
+    global _worker
+    if _worker is None:
+        _worker = WebhookWorker(poll_interval=poll_interval)
+    _worker.start()
+    return _worker
+
+
+def notify() -> None:
+    """이 프로세스에서 워커가 돌고 있으면 바로 처리하도록 깨움 (없으면 워커의 다음 폴링에서 처리)"""
+    if _worker is not None:
+        _worker.notify()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Text, Boolean, DateTime, Date, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Numeric, Text, Boolean, DateTime, Date, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSON
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -34,6 +34,11 @@ class UserSubscription(Base):
     subscription_number = Column(String(50), unique=True, nullable=True)
     subscriptions_method = Column(String(50), nullable=False)
 
+    __table_args__ = (
+        # 구독 여부 확인 (user_id = ? AND end_date >= today)
+        Index('idx_user_subscriptions_user_end_date', 'user_id', 'end_date'),
+    )
+
     subscription_plan = relationship("SubscriptionPlan", back_populates="user_subscriptions")
     usage_history = relationship("TokenUsageHistory", back_populates="subscription")
     payments = relationship("Payment", back_populates="subscription")
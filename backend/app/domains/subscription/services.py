@@ -2,11 +2,12 @@ from datetime import datetime, timedelta, date
 import logging
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-from . import models
+from . import models, status_cache
+from app.core import push
 from app.domains.token import models as token_models
 from app.domains.payment import models as payment_models
 from uuid import UUID
-from typing import Tuple
+from typing import Dict, Optional, Tuple
 
 def get_user_subscription(db: Session, user_id: UUID):
     logging.info(f"Searching for subscriptions with user_id: {user_id}")
@@ -37,22 +38,42 @@ def cancel_user_subscription(db: Session, user_id: UUID):
     user_subscription.status = 'CANCELLED'
     db.commit()
 
-def is_user_subscribed(db: Session, user_id) -> bool:
+def get_active_subscription(db: Session, user_id, use_cache: bool = True) -> Optional[status_cache.ActiveSubscription]:
     """
-    사용자가 현재 구독(무제한) 중인지 여부를 반환합니다.
-    - end_date가 오늘 이후(>= today)이면 구독 중으로 간주
+    현재 구독(end_date >= today)의 (subscription_id, end_date). 없으면 None
+    프로세스 캐시에서 먼저 찾음 (status_cache 참고), use_cache=False면 DB에서 다시 읽음
     """
-    today = date.today()
+    return status_cache.subscription_cache.get(db, user_id, refresh=not use_cache)
 
-    # end_date가 오늘 이후인 구독 레코드를 찾음
-    subscription = (
-        db.query(models.UserSubscription)
-        .filter(models.UserSubscription.user_id == user_id)
-        .filter(models.UserSubscription.end_date >= today)
-        .first()
-    )
+def get_active_subscriptions(db: Session, user_ids) -> Dict[str, Optional[status_cache.ActiveSubscription]]:
+    """여러 사용자의 현재 구독 (관리자 목록용, 키는 str(user_id))"""
+    return status_cache.subscription_cache.get_many(db, user_ids)
 
-    return subscription is not None
+def invalidate_subscription_status(user_id) -> None:
+    """구독 생성/갱신/해지/환불 커밋 후 호출 (이 프로세스는 바로, 다른 워커 프로세스는 push 내부 이벤트로)"""
+    status_cache.subscription_cache.invalidate(user_id)
+    push.publish(push.EVENT_SUBSCRIPTION_CHANGED, {}, user_id)
+
+def handle_subscription_event(message) -> None:
+    """다른 프로세스의 구독 변경 알림 - LISTEN이 끊겼다 다시 붙으면 놓친 알림이 있을 수 있어 전체를 비움"""
+    if message['event'] == push.EVENT_LISTEN_STARTED:
+        status_cache.subscription_cache.clear()
+        return
+    for user_id in message.get('user_ids') or ():
+        status_cache.subscription_cache.invalidate(user_id)
+
+def listen_for_subscription_changes() -> None:
+    """앱 시작 시 호출"""
+    push.add_handler(push.EVENT_SUBSCRIPTION_CHANGED, handle_subscription_event)
+    push.add_handler(push.EVENT_LISTEN_STARTED, handle_subscription_event)
+
+def is_user_subscribed(db: Session, user_id, use_cache: bool = True) -> bool:
+    """
+    사용자가 현재 구독(무제한) 중인지 여부를 반환합니다.
+    - end_date가 오늘 이후(>= today)이면 구독 중으로 간주
+    - use_cache=False면 캐시 대신 DB에서 확인 (새 구독 결제 전 중복 확인 등)
+    """
+    return get_active_subscription(db, user_id, use_cache=use_cache) is not None
 
 def check_refund_eligibility_for_subscription(db: Session, user_id) -> bool:
     """
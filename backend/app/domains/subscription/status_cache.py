@@ -0,0 +1,126 @@
+"""
+구독 상태 캐시 (프로세스 메모리)
+is_user_subscribed는 채팅, 스톤 사용, 환불 확인마다 불리므로 사용자별 현재 구독 구간(구독 ID, 종료일)을 기억해 두고
+대부분의 호출은 dict 조회로 끝낸다
+
+- 구독 중: 종료일이 지나면 다시 조회
+- 구독 없음 / 구독 중 모두 MAX_AGE_SECONDS가 지나면 다시 조회 (다른 워커 프로세스에서 바뀐 상태 반영)
+- 결제/해지/환불로 구독이 바뀌면 invalidate로 이 프로세스의 항목을 바로 지우고,
+  다른 워커 프로세스에는 push 내부 이벤트(Postgres NOTIFY)로 알려 각자 지우게 함 (subscription.services)
+- 새 구독 결제처럼 잘못 판단하면 안 되는 곳은 refresh=True로 DB에서 다시 읽음
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .models import UserSubscription
+
+MAX_AGE_SECONDS = 300
+MAX_ENTRIES = 50_000
+
+
+class ActiveSubscription(NamedTuple):
+    subscription_id: int
+    end_date: date
+
+
+def query_active_subscriptions(db: Session, user_ids: Iterable[Any],
+                               today: Optional[date] = None) -> Dict[str, ActiveSubscription]:
+    """end_date >= today 인 구독 (사용자별로 종료일이 가장 늦은 것, (user_id, end_date) 인덱스 사용)"""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+    rows = db.query(
+        UserSubscription.user_id,
+        UserSubscription.subscription_id,
+        UserSubscription.end_date
+    ).filter(
+        UserSubscription.user_id.in_(user_ids),
+        UserSubscription.end_date >= (today or date.today())
+    ).order_by(UserSubscription.end_date).all()
+    # 종료일 오름차순이므로 마지막 값이 남음
+    return {str(row.user_id): ActiveSubscription(row.subscription_id, row.end_date) for row in rows}
+
+
+class SubscriptionStatusCache:
+    def __init__(self, max_age_seconds: float = MAX_AGE_SECONDS, max_entries: int = MAX_ENTRIES,
+                 clock: Callable[[], float] = time.monotonic, today: Callable[[], date] = date.today):
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._today = today
+        self._entries: "OrderedDict[str, Tuple[Optional[ActiveSubscription], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 조회 중에 무효화가 있었으면 조회 결과(이전 상태일 수 있음)를 저장하지 않음
+        self._invalidations = 0
+
+    def _lookup(self, key: str) -> Tuple[bool, Optional[ActiveSubscription]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        active, cached_at = entry
+        if self._clock() - cached_at > self.max_age_seconds:
+            return False, None
+        if active is not None and active.end_date < self._today():
+            return False, None
+        return True, active
+
+    def _store(self, key: str, active: Optional[ActiveSubscription], generation: int) -> None:
+        with self._lock:
+            if generation != self._invalidations:
+                return
+            self._entries[key] = (active, self._clock())
+            self._entries.move_to_end(key)
+            # 오래 저장된 것부터 정리
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, db: Session, user_id, refresh: bool = False) -> Optional[ActiveSubscription]:
+        """refresh=True면 캐시를 건너뛰고 DB에서 읽어 캐시도 갱신"""
+        key = str(user_id)
+        if not refresh:
+            hit, active = self._lookup(key)
+            if hit:
+                return active
+        generation = self._invalidations
+        active = query_active_subscriptions(db, [user_id], self._today()).get(key)
+        self._store(key, active, generation)
+        return active
+
+    def get_many(self, db: Session, user_ids: Iterable[Any]) -> Dict[str, Optional[ActiveSubscription]]:
+        """여러 사용자 (관리자 목록용) - 캐시에 없는 사용자만 한 번의 쿼리로 조회"""
+        result: Dict[str, Optional[ActiveSubscription]] = {}
+        missing = []
+        for user_id in user_ids:
+            key = str(user_id)
+            hit, active = self._lookup(key)
+            if hit:
+                result[key] = active
+            else:
+                missing.append(user_id)
+        if missing:
+            generation = self._invalidations
+            loaded = query_active_subscriptions(db, missing, self._today())
+            for user_id in missing:
+                key = str(user_id)
+                result[key] = loaded.get(key)
+                self._store(key, result[key], generation)
+        return result
+
+    def invalidate(self, user_id) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+            self._entries.clear()
+
+
+subscription_cache = SubscriptionStatusCache()
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.core.deps import get_current_active_user
+from app.core import response_cache
 from app.domains.user import schemas as user_schemas
 from . import schemas, services
 from typing import List
@@ -10,18 +11,31 @@ router = APIRouter()
 
 @router.get("/terms", response_model=List[schemas.Terms])
 def read_terms_list(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: user_schemas.User = Depends(get_current_active_user)
 ):
-    return services.get_terms_list(db)
+    # 약관은 DB에서 직접 관리하므로 TTL이 지나면 반영됨
+    return response_cache.cached_response(
+        request,
+        response_cache.TERMS,
+        lambda: [schemas.Terms.from_orm(terms) for terms in services.get_terms_list(db)],
+        private=True
+    )
 
 @router.get("/terms/{terms_type}", response_model=schemas.Terms)
 def read_terms_by_type(
+    request: Request,
     terms_type: str,
     db: Session = Depends(get_db),
     current_user: user_schemas.User = Depends(get_current_active_user)
 ):
-    terms = services.get_terms_by_type(db, terms_type)
-    if terms is None:
-        raise HTTPException(status_code=404, detail="Terms not found")
-    return terms
\ No newline at end of file
+    def load_terms():
+        terms = services.get_terms_by_type(db, terms_type)
+        if terms is None:
+            raise HTTPException(status_code=404, detail="Terms not found")
+        return schemas.Terms.from_orm(terms)
+
+    return response_cache.cached_response(
+        request, response_cache.TERMS, load_terms, params={"type": terms_type}, private=True
+    )
\ No newline at end of file
@@ -1,12 +1,12 @@
-from datetime import datetime, date
+from datetime import datetime
 
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from . import models, schemas
 from app.domains.subscription import services as subscription_services
-from app.domains.subscription import models as subscriprion_models
 from uuid import UUID
+from app.core import push, response_cache
 
 def get_all_token_plans(db: Session) -> List[models.TokenPlan]:
     return db.query(models.TokenPlan).all()
@@ -19,6 +19,7 @@ def create_token_plan(db: Session, token_plan: schemas.TokenPlanCreate) -> model
     db.add(db_token_plan)
     db.commit()
     db.refresh(db_token_plan)
+    response_cache.invalidate(response_cache.PRODUCTS)
     return db_token_plan
 
 def update_token_plan(db: Session, token_plan_id: int, token_plan: schemas.TokenPlanUpdate) -> models.TokenPlan:
@@ -31,6 +32,7 @@ def update_token_plan(db: Session, token_plan_id: int, token_plan: schemas.Token
     
     db.commit()
     db.refresh(db_token_plan)
+    response_cache.invalidate(response_cache.PRODUCTS)
     return db_token_plan
 
 def delete_t2oken_plan(db: Session, token_plan_id: int):
@@ -40,6 +42,7 @@ def delete_t2oken_plan(db: Session, token_plan_id: int):
     
     db.delete(db_token_plan)
     db.commit()
+    response_cache.invalidate(response_cache.PRODUCTS)
 
 def get_user_tokens(db: Session, user_id: UUID) -> schemas.TokenInfo:
     token = db.query(models.Token).filter(models.Token.user_id == user_id).first()
@@ -52,23 +55,25 @@ def get_user_tokens(db: Session, user_id: UUID) -> schemas.TokenInfo:
     )
 
 
+def publish_token_balance(token: models.Token) -> None:
+    """스톤 잔액 실시간 이벤트 (커밋 후 호출)"""
+    push.publish(push.EVENT_TOKEN_BALANCE, {
+        "total_tokens": token.total_tokens,
+        "used_tokens": token.used_tokens,
+        "tokens_expires_at": token.tokens_expires_at,
+    }, token.user_id)
+
+
 def use_tokens(db: Session, user_id: UUID, tokens: int, conversation_id: Optional[UUID] = None) -> None:
     """토큰 사용 처리 함수"""
 
-    is_subscribed = subscription_services.is_user_subscribed(db, user_id)
-
-    if is_subscribed:
-        subscription = (
-            db.query(subscriprion_models.UserSubscription)
-            .filter(subscriprion_models.UserSubscription.user_id == user_id)
-            .filter(subscriprion_models.UserSubscription.end_date >= date.today())
-            .first()
-        )
+    subscription = subscription_services.get_active_subscription(db, user_id)
 
+    if subscription is not None:
         usage_history = models.TokenUsageHistory(
             user_id=user_id,
             conversation_id=conversation_id,
-            subscription_id=subscription.subscription_id if subscription else None,
+            subscription_id=subscription.subscription_id,
             tokens_used=tokens,
             used_at=datetime.now()
         )
@@ -119,4 +124,6 @@ def use_tokens(db: Session, user_id: UUID, tokens: int, conversation_id: Optiona
         raise HTTPException(
             status_code=500,
             detail=f"Failed to update token usage: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+    publish_token_balance(user_tokens)
\ No newline at end of file
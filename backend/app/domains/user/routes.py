@@ -1,3 +1,4 @@
+import logging
 import random
 from fastapi import APIRouter, Body, Depends, HTTPException, Header, Request
 from fastapi.responses import JSONResponse
@@ -166,10 +167,13 @@ def delete_user_me(
         raise HTTPException(status_code=400, detail=f"자동 환불 실패: {e.detail}")
 
     # 2) 현재 구독 상태(정기 결제)라면 예약 결제 취소
-    try:
-        portone_services.cancel_scheduled_payments(db, current_user.user_id)
-    except Exception as ex:
-        pass
+    for subscription in subscription_services.get_user_subscription(db, current_user.user_id):
+        if subscription.status != 'ACTIVE' or not subscription.subscription_number:
+            continue
+        try:
+            portone_services.cancel_scheduled_payments(subscription.subscription_number)
+        except Exception as ex:
+            logging.error(f"회원 탈퇴 중 예약 결제 취소 실패 ({subscription.subscription_number}): {str(ex)}")
 
     # 3) 실제 회원 탈퇴 처리
     user_services.delete_user(db, current_user.user_id, delete_info)
@@ -122,11 +122,56 @@ app.include_router(exhibition_routes.router, prefix=f"{settings.API_V1_STR}/exhi
 
 @app.on_event("startup")
 async def startup_event():
-    """앱 시작 시 초기화"""
+    """
+    앱 시작 시 백그라운드 작업 시작
+    하나가 실패해도(예: 부팅 직후 DB 연결 실패) 나머지는 시작되도록 각각 따로 처리하고,
+    결제 적립을 맡는 웹훅 워커를 가장 먼저 시작
+    """
+    # 포트원 웹훅 대기열 처리
+    if settings.PAYMENT_WEBHOOK_POLL_SECONDS > 0:
+        try:
+            from app.domains.payment import webhook_queue
+            webhook_queue.start_worker(poll_interval=settings.PAYMENT_WEBHOOK_POLL_SECONDS)
+        except Exception:
+            logger.exception("웹훅 대기열 워커 시작 실패")
+
+    # 다른 워커 프로세스에서 바뀐 구독 상태를 캐시에서 지움
     try:
-        logger.info("애플리케이션 시작 완료")
-    except Exception as e:
-        logger.error(f"애플리케이션 초기화 실패: {e}")
+        from app.domains.subscription.services import listen_for_subscription_changes
+        listen_for_subscription_changes()
+    except Exception:
+        logger.exception("구독 상태 변경 수신 시작 실패")
+
+    # 재시작 전에 끝나지 않은 전체 알림 발송 재개
+    try:
+        from app.db.session import SessionLocal
+        from app.domains.notification.fanout import resume_unfinished
+        db = SessionLocal()
+        try:
+            resumed = resume_unfinished(db)
+        finally:
+            db.close()
+        if resumed:
+            logger.info(f"알림 발송 재개: {resumed}")
+    except Exception:
+        logger.exception("알림 발송 재개 실패")
+
+    # 관리자 통계용 일간 사용량 집계 주기 갱신
+    if settings.USAGE_ROLLUP_REFRESH_SECONDS > 0:
+        try:
+            from app.domains.admin.rollup import RollupRefresher
+            RollupRefresher(interval_seconds=settings.USAGE_ROLLUP_REFRESH_SECONDS).start()
+        except Exception:
+            logger.exception("사용량 집계 갱신 시작 실패")
+
+    # 정기결제 예약 대사 (매일)
+    if 0 <= settings.SUBSCRIPTION_RECONCILE_HOUR <= 23:
+        try:
+            from app.domains.payment.schedule_reconcile import ScheduleReconciler
+            ScheduleReconciler(hour=settings.SUBSCRIPTION_RECONCILE_HOUR).start()
+        except Exception:
+            logger.exception("정기결제 예약 대사 시작 실패")
+    logger.info("애플리케이션 시작 완료")
 
 @app.get("/")
 def read_root():
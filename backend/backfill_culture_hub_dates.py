@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+culture_hubs 시작일/종료일 백필 스크립트
+기존 행 중 start_date/end_date가 비어 있는 행을 기간(period) 문자열로 다시 해석해 채웁니다.
+날짜가 바뀐 행은 content_hash도 다시 계산하므로 다음 증분 수집에서 불필요한 갱신이 생기지 않습니다.
+
+    python backfill_culture_hub_dates.py --dry-run        # 변경 건수만 확인
+    python backfill_culture_hub_dates.py --batch-size 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from sqlalchemy import or_
+
+# 현재 스크립트의 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from app.db.session import SessionLocal
+from app.domains.exhibition.date_parser import cache_info, resolve_dates
+from app.domains.exhibition.fingerprint import compute_content_hash, CULTURE_HUB_HASH_FIELDS
+from app.domains.exhibition.models import CultureHub
+
+
+def backfill(batch_size: int = 1000, dry_run: bool = False) -> dict:
+    """날짜가 비어 있고 기간 문자열이 있는 행을 id 순서로 batch_size개씩 처리 (배치마다 커밋)"""
+    columns = [CultureHub.id] + [getattr(CultureHub, field) for field in CULTURE_HUB_HASH_FIELDS]
+    summary = {'scanned': 0, 'updated': 0, 'unparsed': 0}
+    last_id = 0
+
+    db = SessionLocal()
+    try:
+        while True:
+            rows = db.query(*columns).filter(
+                CultureHub.id > last_id,
+                CultureHub.period.isnot(None),
+                CultureHub.period != '',
+                or_(CultureHub.start_date.is_(None), CultureHub.end_date.is_(None))
+            ).order_by(CultureHub.id).limit(batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            updates = []
+            for row in rows:
+                record = dict(row._mapping)
+                start, end = resolve_dates(record['start_date'], record['end_date'], record['period'])
+                if (start, end) == (record['start_date'], record['end_date']):
+                    summary['unparsed'] += 1
+                    continue
+                record['start_date'], record['end_date'] = start, end
+                updates.append({
+                    'id': record['id'],
+                    'start_date': start,
+                    'end_date': end,
+                    'content_hash': compute_content_hash(record),
+                })
+
+            summary['scanned'] += len(rows)
+            summary['updated'] += len(updates)
+            if updates and not dry_run:
+                db.bulk_update_mappings(CultureHub, updates)
+                db.commit()
+            logging.info(f"~id {last_id}: {len(rows)}행 확인, {len(updates)}행 갱신")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="culture_hubs 시작일/종료일 백필")
+    parser.add_argument('--batch-size', type=int, default=1000, help='배치당 행 수 (배치마다 커밋)')
+    parser.add_argument('--dry-run', action='store_true', help='DB에 쓰지 않고 갱신 대상 건수만 출력')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    started = time.perf_counter()
+    summary = backfill(batch_size=args.batch_size, dry_run=args.dry_run)
+    period_cache = cache_info()['period']
+
+    print(f"{'[dry-run] ' if args.dry_run else ''}확인 {summary['scanned']}행, "
+          f"갱신 {summary['updated']}행, 해석 불가 {summary['unparsed']}행 "
+          f"({time.perf_counter() - started:.1f}초, 기간 캐시 적중 {period_cache.hits}/{period_cache.hits + period_cache.misses})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+문화 허브 수집 파이프라인 녹화/재생 벤치마크 스크립트
+
+1) 실서버 응답 녹화:
+   python benchmark_cultural_hub.py record --fixtures fixtures/cultural_hub --max-pages 2
+2) 녹화 응답을 로컬 대체 서버로 재생하며 collect_all_exhibitions_safely 종단 측정:
+   python benchmark_cultural_hub.py run --fixtures fixtures/cultural_hub --max-pages 2 \
+       --latency 0.05 --error-rate 0.02 --json result.json --baseline previous.json
+
+run은 DB에 실제로 저장하므로 벤치마크 전용 DB(--database-url)를 사용하는 것을 권장합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+# 현재 스크립트의 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from app.domains.exhibition.fixture_replay import FixtureStore, ReplayServer, install_recorder, install_replay
+
+
+class QueryTimer:
+    """엔진 단위 SQL 실행 시간/횟수 누적"""
+
+    def __init__(self, engine):
+        self.total_time = 0.0
+        self.statements = 0
+        event.listen(engine, 'before_cursor_execute', self._before)
+        event.listen(engine, 'after_cursor_execute', self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        self.total_time += time.perf_counter() - conn.info['query_start_time'].pop()
+        self.statements += 1
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB) - Linux는 KB, macOS는 바이트 단위"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return peak / divisor
+
+
+def default_database_url() -> str:
+    from app.core.config import settings
+    return f"postgresql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}?client_encoding=utf8"
+
+
+def record(args) -> int:
+    """실제 문화기관 API를 호출하면서 응답을 녹화합니다."""
+    from app.domains.exhibition.cultural_hub_ai_system import CulturalHubAPISystem
+
+    store = FixtureStore(args.fixtures)
+    system = CulturalHubAPISystem()
+    install_recorder(system, store)
+
+    print(f"문화기관 API 응답 녹화를 시작합니다 (최대 {args.max_pages}페이지) → {args.fixtures}")
+    system.run_cultural_hub_integration(max_pages=args.max_pages, use_sequential=True)
+    print(f"녹화 완료: {len(store)}개 응답")
+    return 0
+
+
+def run(args) -> int:
+    """녹화된 응답으로 collect_all_exhibitions_safely를 실행하고 처리량을 측정합니다."""
+    from app.domains.exhibition.cultural_hub_service import CulturalHubExhibitionService
+
+    store = FixtureStore(args.fixtures)
+    if len(store) == 0:
+        print(f"녹화된 응답이 없습니다: {args.fixtures} (먼저 record를 실행하세요)")
+        return 2
+
+    engine = create_engine(args.database_url or default_database_url())
+    timer = QueryTimer(engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    server = ReplayServer(
+        store,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+
+    db = SessionLocal()
+    try:
+        with server:
+            service = CulturalHubExhibitionService(db)
+            install_replay(service.cultural_hub_system, server.url, base_delay=args.request_delay)
+
+            print(f"재생 서버: {server.url} (녹화 {len(store)}개, 지연 {args.latency}s, 오류율 {args.error_rate:.0%})")
+            started = time.perf_counter()
+            result = asyncio.run(service.collect_all_exhibitions_safely(
+                max_pages=args.max_pages,
+                use_sequential=not args.parallel,
+                incremental=not args.full,
+            ))
+            elapsed = time.perf_counter() - started
+            replay_stats = server.stats
+    finally:
+        db.close()
+        engine.dispose()
+
+    rows = result.get('total_collected', 0)
+    report = {
+        'success': result.get('success', False),
+        'elapsed_sec': round(elapsed, 3),
+        'rows': rows,
+        'rows_per_sec': round(rows / elapsed, 2) if elapsed > 0 else 0,
+        'new': result.get('total_new', 0),
+        'updated': result.get('total_updated', 0),
+        'unchanged': result.get('total_unchanged', 0),
+        'skipped': result.get('total_skipped', 0),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'db_time_sec': round(timer.total_time, 3),
+        'db_statements': timer.statements,
+        'db_time_ratio': round(timer.total_time / elapsed, 3) if elapsed > 0 else 0,
+        'replay': replay_stats,
+        'settings': {
+            'max_pages': args.max_pages,
+            'latency': args.latency,
+            'error_rate': args.error_rate,
+            'parallel': args.parallel,
+            'incremental': not args.full,
+        },
+    }
+
+    print("=" * 80)
+    print("문화 허브 수집 벤치마크 결과")
+    print(f"  수집 행 수     : {rows:,}개 ({report['rows_per_sec']:.1f}행/초, {elapsed:.1f}초)")
+    print(f"  신규/업데이트/변경없음/스킵: {report['new']}/{report['updated']}/{report['unchanged']}/{report['skipped']}")
+    print(f"  최대 RSS       : {report['peak_rss_mb']:.1f}MB")
+    print(f"  DB 시간        : {report['db_time_sec']:.2f}초 ({report['db_statements']}개 쿼리, 전체의 {report['db_time_ratio']:.0%})")
+    print(f"  재생 서버      : 적중 {replay_stats['hits']}, 미녹화 {replay_stats['misses']}, 주입 오류 {replay_stats['injected_errors']}")
+    print("=" * 80)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        floor = baseline['rows_per_sec'] * (1 - args.max_regression)
+        if report['rows_per_sec'] < floor:
+            print(f"성능 회귀: {report['rows_per_sec']:.1f}행/초 < 기준 {baseline['rows_per_sec']:.1f}행/초의 {1 - args.max_regression:.0%}")
+            return 1
+        print(f"기준 대비 정상: {report['rows_per_sec']:.1f}행/초 (기준 {baseline['rows_per_sec']:.1f}행/초)")
+
+    return 0 if report['success'] else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="문화 허브 수집 파이프라인 녹화/재생 벤치마크")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help='실서버 응답 녹화')
+    record_parser.add_argument('--fixtures', default='fixtures/cultural_hub', help='녹화 저장 디렉토리')
+    record_parser.add_argument('--max-pages', type=int, default=1, help='API별 최대 수집 페이지 수')
+    record_parser.set_defaults(func=record)
+
+    run_parser = subparsers.add_parser('run', help='녹화 응답 재생 + 처리량 측정')
+    run_parser.add_argument('--fixtures', default='fixtures/cultural_hub', help='녹화 저장 디렉토리')
+    run_parser.add_argument('--max-pages', type=int, default=1, help='API별 최대 수집 페이지 수 (녹화 시와 같게)')
+    run_parser.add_argument('--database-url', default=None, help='벤치마크용 DB URL (기본: 설정의 DB)')
+    run_parser.add_argument('--latency', type=float, default=0.0, help='재생 서버 요청당 지연(초)')
+    run_parser.add_argument('--jitter', type=float, default=0.0, help='추가 랜덤 지연 상한(초)')
+    run_parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 주입 비율 (0~1)')
+    run_parser.add_argument('--error-status', type=int, default=503, help='주입할 HTTP 상태 코드')
+    run_parser.add_argument('--seed', type=int, default=None, help='오류 주입 난수 시드')
+    run_parser.add_argument('--request-delay', type=float, default=0.0, help='API 호출 간 기본 대기(초, 운영값 1.5)')
+    run_parser.add_argument('--parallel', action='store_true', help='병렬 수집 모드')
+    run_parser.add_argument('--full', action='store_true', help='증분이 아닌 전체 수집 모드')
+    run_parser.add_argument('--json', default=None, help='결과 JSON 저장 경로')
+    run_parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    run_parser.add_argument('--max-regression', type=float, default=0.2, help='허용 처리량 감소 비율 (기본 20%%)')
+    run_parser.set_defaults(func=run)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
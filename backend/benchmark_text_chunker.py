@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+임베딩 청커 벤치마크 스크립트
+합성한 1000페이지 전시도록 텍스트로 기존 청킹 구현과 스트리밍 청커(text_chunker)를 비교합니다.
+
+    python benchmark_text_chunker.py                   # 1000페이지, 3회 반복
+    python benchmark_text_chunker.py --pages 3000 --repeat 5 --json result.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# 현재 스크립트의 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from app.domains.exhibition.text_chunker import chunk_texts, count_tokens, TIKTOKEN_AVAILABLE
+
+SENTENCES = [
+    "이번 전시는 한국 근현대 미술의 흐름을 조망한다.",
+    "작가는 1960년대부터 추상 회화의 새로운 가능성을 탐구해 왔다.",
+    "작품은 캔버스에 유채로 제작되었으며 크기는 162 x 130 cm이다.",
+    "전시 기간 동안 매주 토요일 오후 2시에 도슨트 해설이 진행됩니다!",
+    "관람객은 작품 앞에서 색채와 여백이 만들어내는 긴장을 경험하게 된다.",
+    "The exhibition brings together works from public and private collections.",
+    "자료 제공: 국립현대미술관 아카이브",
+    "작품 설명과 함께 작가 인터뷰 영상이 상영된다",
+]
+
+
+def build_catalog(pages: int, seed: int = 42):
+    """페이지당 약 1,500자 분량의 합성 도록 텍스트"""
+    rng = random.Random(seed)
+    catalog = []
+    for page_number in range(1, pages + 1):
+        lines = []
+        while sum(len(line) for line in lines) < 1500:
+            paragraph = ' '.join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 6)))
+            lines.append(paragraph)
+        catalog.append('\n'.join(lines) + f"\n{page_number}\n")
+    return catalog
+
+
+def legacy_smart_text_chunking(text: str, chunk_size: int = 1200, overlap: int = 300):
+    """기존 EmbeddingProcessor._smart_text_chunking (기준선)"""
+    if len(text) <= chunk_size:
+        return [text]
+
+    chunks = []
+    start = 0
+
+    while start < len(text):
+        end = start + chunk_size
+
+        if end >= len(text):
+            chunks.append(text[start:].strip())
+            break
+
+        chunk_text = text[start:end]
+
+        sentence_ends = []
+        for i, char in enumerate(chunk_text):
+            if char in '.!?。':
+                sentence_ends.append(start + i + 1)
+
+        if sentence_ends:
+            ideal_end = start + chunk_size * 0.8
+            best_end = min(sentence_ends, key=lambda x: abs(x - ideal_end))
+            chunk = text[start:best_end].strip()
+        else:
+            words = chunk_text.split()
+            if len(words) > 10:
+                chunk = ' '.join(words[:-3])
+                end = start + len(chunk)
+            else:
+                chunk = chunk_text
+
+        if chunk.strip():
+            chunks.append(chunk.strip())
+
+        start = end - overlap
+        if start >= len(text):
+            break
+
+    return chunks
+
+
+def measure(label, func, repeat):
+    timings = []
+    chunks = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chunks = func()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    sizes = [count_tokens(chunk) for chunk in chunks] if chunks else [0]
+    result = {
+        'label': label,
+        'best_seconds': round(best, 4),
+        'chunks': len(chunks),
+        'max_chunk_tokens': max(sizes),
+        'avg_chunk_tokens': round(sum(sizes) / len(sizes), 1),
+    }
+    print(f"{label:<28} {best:8.3f}s  청크 {len(chunks):>6}개  "
+          f"평균 {result['avg_chunk_tokens']:>7}토큰  최대 {result['max_chunk_tokens']:>6}토큰")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="임베딩 청커 벤치마크")
+    parser.add_argument('--pages', type=int, default=1000, help='합성 도록 페이지 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최솟값 기록)')
+    parser.add_argument('--max-tokens', type=int, default=600, help='청크 최대 토큰 수')
+    parser.add_argument('--overlap-tokens', type=int, default=150, help='청크 겹침 토큰 수')
+    parser.add_argument('--json', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    catalog = build_catalog(args.pages)
+    total_chars = sum(len(page) for page in catalog)
+    print(f"합성 도록: {args.pages}페이지, {total_chars:,}자 "
+          f"(토큰 계산: {'tiktoken' if TIKTOKEN_AVAILABLE else '정규식 근사'})")
+
+    results = [
+        measure('legacy (전체 텍스트 합침)', lambda: legacy_smart_text_chunking('\n'.join(catalog)), args.repeat),
+        measure('streaming (페이지 스트림)', lambda: list(chunk_texts(
+            iter(catalog), max_tokens=args.max_tokens, overlap_tokens=args.overlap_tokens)), args.repeat),
+    ]
+    speedup = results[0]['best_seconds'] / results[1]['best_seconds'] if results[1]['best_seconds'] else 0
+    print(f"속도 비율 (legacy / streaming): {speedup:.2f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'pages': args.pages, 'chars': total_chars, 'results': results,
+                       'speedup': round(speedup, 2)}, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
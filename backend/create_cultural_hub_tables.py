@@ -16,6 +16,7 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
 from app.core.config import settings
+from app.domains.exhibition.active_events import ensure_active_events_view
 
 def create_cultural_hub_tables():
     """문화 허브 관련 테이블들을 생성합니다."""
@@ -29,9 +30,12 @@ def create_cultural_hub_tables():
     # 기존 테이블 삭제 (순서 중요 - 외래키 관계 고려)
     drop_tables_sql = """
     -- 기존 테이블들 삭제 (의존성 순서대로)
+    DROP TABLE IF EXISTS collection_jobs CASCADE;
+    DROP TABLE IF EXISTS smart_file_pages CASCADE;
     DROP TABLE IF EXISTS smart_files CASCADE;
     DROP TABLE IF EXISTS exhibitions CASCADE;
     DROP TABLE IF EXISTS culture_hubs CASCADE;
+    DROP TABLE IF EXISTS venue_gazetteer CASCADE;
     DROP TABLE IF EXISTS api_sources CASCADE;
     DROP TABLE IF EXISTS institutions CASCADE;
     """
@@ -101,6 +105,7 @@ def create_cultural_hub_tables():
         
         -- 기타
         keywords VARCHAR(500),
+        content_hash VARCHAR(64),
         
         -- 상태
         status VARCHAR(30) DEFAULT 'active',
@@ -151,6 +156,17 @@ def create_cultural_hub_tables():
         -- API 메타데이터
         api_source VARCHAR(100) NOT NULL,
         culture_code VARCHAR(200),
+        content_hash VARCHAR(64),
+        
+        -- 소스 간 중복 판별
+        venue_key VARCHAR(100),
+        canonical_id INTEGER,
+        is_duplicate BOOLEAN DEFAULT FALSE,
+        
+        -- 위치 (장소 좌표 사전에서 연결)
+        latitude FLOAT,
+        longitude FLOAT,
+        geohash VARCHAR(12),
         
         -- 시스템
         collected_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -164,6 +180,24 @@ def create_cultural_hub_tables():
     CREATE INDEX idx_culture_hub_category ON culture_hubs(category);
     CREATE INDEX idx_culture_hub_api_source ON culture_hubs(api_source);
     CREATE INDEX idx_culture_hub_title ON culture_hubs(title);
+    CREATE INDEX idx_culture_hub_source_hash ON culture_hubs(api_source, culture_code, content_hash);
+    CREATE INDEX idx_culture_hub_venue_key ON culture_hubs(venue_key);
+    CREATE INDEX idx_culture_hub_canonical ON culture_hubs(canonical_id);
+    CREATE INDEX idx_culture_hub_geohash ON culture_hubs(geohash varchar_pattern_ops);
+
+    -- 장소 좌표 사전 (문화행사 venue → 좌표)
+    CREATE TABLE venue_gazetteer (
+        id SERIAL PRIMARY KEY,
+        venue_key VARCHAR(100) NOT NULL UNIQUE,
+        name VARCHAR(300) NOT NULL,
+        institution_id INTEGER REFERENCES institutions(id) ON DELETE SET NULL,
+        latitude FLOAT NOT NULL,
+        longitude FLOAT NOT NULL,
+        geohash VARCHAR(12) NOT NULL,
+        source VARCHAR(30) DEFAULT 'manual',
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP WITH TIME ZONE
+    );
 
     -- API 소스 테이블
     CREATE TABLE api_sources (
@@ -176,12 +210,40 @@ def create_cultural_hub_tables():
         is_active BOOLEAN DEFAULT TRUE,
         total_collected INTEGER DEFAULT 0,
         last_collection_at TIMESTAMP WITH TIME ZONE,
+        collect_interval_minutes INTEGER DEFAULT 1440,
+        next_collection_at TIMESTAMP WITH TIME ZONE,
+        last_change_count INTEGER DEFAULT 0,
         created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP WITH TIME ZONE
     );
 
     CREATE INDEX idx_api_sources_key ON api_sources(api_key);
     CREATE INDEX idx_api_sources_active ON api_sources(is_active);
+    CREATE INDEX idx_api_source_next_collection ON api_sources(next_collection_at);
+
+    -- 수집 작업 테이블 (진행 상황/취소 요청을 워커 간 공유)
+    CREATE TABLE collection_jobs (
+        id VARCHAR(36) PRIMARY KEY,
+        job_type VARCHAR(20) NOT NULL DEFAULT 'all',
+        api_key VARCHAR(200),
+        params JSONB,
+        status VARCHAR(20) NOT NULL DEFAULT 'running',
+        step INTEGER DEFAULT 1,
+        message TEXT,
+        percentage INTEGER DEFAULT 0,
+        cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+        error TEXT,
+        source_counters JSONB,
+        results JSONB,
+        worker_id VARCHAR(100),
+        heartbeat_at TIMESTAMP WITH TIME ZONE,
+        finished_at TIMESTAMP WITH TIME ZONE,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP WITH TIME ZONE
+    );
+
+    CREATE INDEX idx_collection_job_status ON collection_jobs(status);
+    CREATE INDEX idx_collection_job_finished ON collection_jobs(finished_at);
 
     -- 파일 관리 테이블
     CREATE TABLE smart_files (
@@ -210,6 +272,7 @@ def create_cultural_hub_tables():
         -- 추출 정보
         total_pages INTEGER,
         extracted_text TEXT,
+        content_hash VARCHAR(64),
         
         -- 시스템
         uploaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -222,6 +285,25 @@ def create_cultural_hub_tables():
     CREATE INDEX idx_smart_file_exhibition ON smart_files(exhibition_id);
     CREATE INDEX idx_smart_file_status ON smart_files(processing_status);
     CREATE INDEX idx_smart_files_active ON smart_files(is_active);
+
+    -- 파일 페이지별 텍스트
+    CREATE TABLE smart_file_pages (
+        id SERIAL PRIMARY KEY,
+        smart_file_id INTEGER NOT NULL REFERENCES smart_files(id) ON DELETE CASCADE,
+        page_number INTEGER NOT NULL,
+        
+        -- 추출 텍스트 및 전체 문서 내 위치
+        text TEXT,
+        char_start INTEGER NOT NULL DEFAULT 0,
+        char_end INTEGER NOT NULL DEFAULT 0,
+        
+        extraction_method VARCHAR(30),
+        text_hash VARCHAR(64) NOT NULL,
+        
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP WITH TIME ZONE,
+        CONSTRAINT uq_smart_file_page UNIQUE (smart_file_id, page_number)
+    );
     """
     
     # 기본 데이터 삽입 SQL
@@ -233,6 +315,20 @@ def create_cultural_hub_tables():
     ('국립중앙박물관', '박물관', '국립', '서울특별시 용산구 서빙고로 137', true, 'system'),
     ('예술의전당', '복합문화시설', '공공', '서울특별시 서초구 남부순환로 2406', true, 'system');
 
+    -- 장소 좌표 사전 기본 데이터 (주요 전시장)
+    INSERT INTO venue_gazetteer (venue_key, name, latitude, longitude, geohash, source) VALUES
+    ('국립현대미술관서울', '국립현대미술관 서울', 37.5788, 126.9801, 'wydmc9006', 'manual'),
+    ('국립현대미술관과천', '국립현대미술관 과천', 37.4305, 127.0074, 'wydkfn5bq', 'manual'),
+    ('국립현대미술관덕수궁', '국립현대미술관 덕수궁', 37.5658, 126.9752, 'wydm9qss8', 'manual'),
+    ('국립현대미술관청주', '국립현대미술관 청주', 36.6541, 127.4913, 'wyd8t0smd', 'manual'),
+    ('서울시립미술관', '서울시립미술관', 37.5640, 126.9738, 'wydm9q76p', 'manual'),
+    ('국립중앙박물관', '국립중앙박물관', 37.5239, 126.9804, 'wydm3x029', 'manual'),
+    ('예술의전당', '예술의전당', 37.4786, 127.0119, 'wydm4nz0x', 'manual'),
+    ('국립한글박물관', '국립한글박물관', 37.5212, 126.9810, 'wydm3w88z', 'manual'),
+    ('대한민국역사박물관', '대한민국역사박물관', 37.5743, 126.9780, 'wydmc2nw1', 'manual'),
+    ('아르코미술관', '아르코미술관', 37.5818, 127.0033, 'wydmf18cz', 'manual'),
+    ('마포아트센터', '마포아트센터', 37.5531, 126.9463, 'wydm8sr6x', 'manual');
+
     -- API 소스 기본 데이터 삽입
     INSERT INTO api_sources (api_key, name, description, base_url, location, is_active) VALUES
     ('kcdf', '한국공예디자인문화진흥원 전시도록', '공예 및 디자인 관련 전시 정보', 'http://api.kcisa.kr/openapi', '서울', true),
@@ -268,6 +364,9 @@ def create_cultural_hub_tables():
                 print("기본 데이터를 삽입합니다...")
                 conn.execute(text(insert_data_sql))
                 
+                print("진행 중 행사 구체화 뷰를 생성합니다...")
+                ensure_active_events_view(conn)
+                
                 # 트랜잭션 커밋
                 trans.commit()
                 
@@ -278,7 +377,7 @@ def create_cultural_hub_tables():
                     SELECT table_name 
                     FROM information_schema.tables 
                     WHERE table_schema = 'public' 
-                    AND table_name IN ('institutions', 'exhibitions', 'culture_hubs', 'api_sources', 'smart_files')
+                    AND table_name IN ('institutions', 'exhibitions', 'culture_hubs', 'venue_gazetteer', 'api_sources', 'collection_jobs', 'smart_files', 'smart_file_pages')
                     ORDER BY table_name;
                 """))
                 
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+문화 데이터 증분 수집 워커
+API 서버와 별도 프로세스로 실행하며, 여러 노드에서 실행해도 한 노드만 수집합니다.
+
+    python run_ingestion_scheduler.py                  # 상시 실행
+    python run_ingestion_scheduler.py --once           # 한 번만 실행 (cron 등)
+    python run_ingestion_scheduler.py --source mmca --source sema
+
+API 서버에 CULTURAL_HUB_COLLECT_IN_WORKER=True를 설정하면
+관리자 수동 수집 요청도 대기열에 등록되어 이 워커가 처리합니다.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+
+# 현재 스크립트의 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+from app.db.session import SessionLocal, engine
+from app.domains.exhibition.ingestion_scheduler import IngestionScheduler
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="문화 데이터 증분 수집 워커")
+    parser.add_argument('--once', action='store_true', help='한 번의 스케줄링 주기만 실행')
+    parser.add_argument('--poll-interval', type=float, default=60.0, help='수집 대상 확인 간격(초)')
+    parser.add_argument('--max-pages', type=int, default=1, help='API별 최대 수집 페이지 수')
+    parser.add_argument('--source', action='append', default=None, help='수집할 API 키 (여러 번 지정 가능, 기본: 전체)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    scheduler = IngestionScheduler(
+        SessionLocal,
+        engine,
+        max_pages=args.max_pages,
+        poll_interval=args.poll_interval,
+        sources=args.source,
+    )
+
+    def handle_signal(signum, frame):
+        logging.info(f"종료 신호 수신 ({signum}) - 현재 작업 후 종료합니다")
+        scheduler.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    if args.once:
+        try:
+            summary = scheduler.run_once()
+        finally:
+            scheduler.lock.release()
+        if not summary['leader']:
+            print("다른 노드가 수집 중입니다 (리더 잠금 획득 실패)")
+        else:
+            print(f"수집 완료: 대기열 작업 {summary['queued_jobs']}개, 정기 수집 {len(summary['collected_sources'])}개 소스")
+        return 0
+
+    scheduler.run_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+포트원 웹훅 대기열 워커 / 재처리 도구
+API 서버에 PAYMENT_WEBHOOK_POLL_SECONDS=0을 설정하면 웹훅은 접수만 하고 이 워커가 처리합니다.
+여러 개를 실행해도 한 이벤트는 한 워커만 처리합니다.
+
+    python run_payment_webhook_worker.py                   # 상시 실행
+    python run_payment_webhook_worker.py --once            # 대기 중인 이벤트만 처리하고 종료
+    python run_payment_webhook_worker.py --list            # 실패한 이벤트 목록
+    python run_payment_webhook_worker.py --replay          # 실패한 이벤트 전체 재처리 등록
+    python run_payment_webhook_worker.py --replay 12 15    # 지정한 이벤트 재처리 등록 (처리 완료 포함)
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+
+# 현재 스크립트의 디렉토리를 Python 경로에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(current_dir)
+
+import app.db  # noqa: F401 - 모델 등록
+from app.db.session import SessionLocal
+from app.domains.payment import webhook_queue
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="포트원 웹훅 대기열 워커")
+    parser.add_argument('--once', action='store_true', help='대기 중인 이벤트만 처리하고 종료')
+    parser.add_argument('--poll-interval', type=float, default=webhook_queue.POLL_INTERVAL_SECONDS,
+                        help='대기열 확인 간격(초)')
+    parser.add_argument('--list', action='store_true', help='실패한 이벤트 목록 출력')
+    parser.add_argument('--replay', nargs='*', type=int, default=None, metavar='EVENT_ID',
+                        help='재처리 등록 (ID를 주지 않으면 실패한 이벤트 전체)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.list:
+        db = SessionLocal()
+        try:
+            for event in webhook_queue.list_events(db):
+                print(f"{event['event_id']}\t{event['imp_uid']}\t{event['status']}\t"
+                      f"시도 {event['attempts']}회\t{event['received_at']}\t{event['last_error']}")
+        finally:
+            db.close()
+        return 0
+
+    if args.replay is not None:
+        db = SessionLocal()
+        try:
+            replayed = webhook_queue.replay(db, args.replay or None)
+        finally:
+            db.close()
+        print(f"재처리 등록: {replayed}건")
+        return 0
+
+    worker = webhook_queue.WebhookWorker(SessionLocal, poll_interval=args.poll_interval)
+
+    if args.once:
+        processed = worker.run_pending(limit=10_000)
+        print(f"웹훅 처리: {processed}건")
+        return 0
+
+    def handle_signal(signum, frame):
+        logging.info(f"종료 신호 수신 ({signum}) - 현재 이벤트 처리 후 종료합니다")
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    worker.start().join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,20 @@
 import os
 import sys
+import tempfile
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
-from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.types import UUID
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from app.main import app
+# 문화 허브 수집 모듈은 import 시점에 로그 파일 핸들러를 붙이므로 테스트 중에는 임시 경로에 씀
+os.environ.setdefault('CULTURAL_HUB_LOG_FILE', os.path.join(tempfile.gettempdir(), 'cultural_hub_api_test.log'))
+
 from app.db.base_class import Base
-from app.db.session import get_db
-from app.core.config import settings
-from app.domains.user.models import User
-from app.core.security import get_password_hash
 
 # Use in-memory SQLite database for testing
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -23,6 +25,37 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+# 도메인 단위 테스트용 SQLite에서 Postgres 전용 타입을 만들 수 있도록 대체
+@compiles(UUID, 'sqlite')
+def _uuid_on_sqlite(type_, compiler, **kw):
+    # 값은 UUID 타입이 32자리 hex로 바꿔 저장함
+    return 'CHAR(32)'
+
+
+@compiles(JSONB, 'sqlite')
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    return 'JSON'
+
+
+@pytest.fixture
+def sqlite_engine():
+    """모델 메타데이터로 필요한 테이블만 만든 SQLite 엔진을 돌려주는 함수
+
+    engine = sqlite_engine(CultureHub, Payment) 처럼 모델(또는 Table)을 넘긴다
+    url을 생략하면 메모리 DB를 모든 스레드가 한 연결로 공유한다
+    """
+    def make(*models, url='sqlite://'):
+        if url == 'sqlite://':
+            engine = create_engine(url, connect_args={'check_same_thread': False}, poolclass=StaticPool)
+        else:
+            engine = create_engine(url)
+        for model in models:
+            getattr(model, '__table__', model).create(engine)
+        return engine
+
+    return make
+
+
 @pytest.fixture(scope="session")
 def db():
     Base.metadata.create_all(bind=engine)
@@ -34,6 +67,11 @@ def db():
 
 @pytest.fixture(scope="module")
 def client(db):
+    # 앱(설정, DB 연결)은 API 테스트에서만 불러옴 - 도메인 단위 테스트는 설정 없이 실행
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db.session import get_db
+
     def override_get_db():
         try:
             yield db
@@ -47,6 +85,9 @@ def client(db):
 
 @pytest.fixture(scope="module")
 def test_user(db):
+    from app.core.security import get_password_hash
+    from app.domains.user.models import User
+
     user = User(
         email="test@example.com",
         password=get_password_hash("testpassword"),
@@ -63,6 +104,9 @@ def test_user(db):
 
 @pytest.fixture(scope="module")
 def test_superuser(db):
+    from app.core.security import get_password_hash
+    from app.domains.user.models import User
+
     user = User(
         email="admin@example.com",
         password=get_password_hash("adminpassword"),
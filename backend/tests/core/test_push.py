@@ -0,0 +1,148 @@
+import asyncio
+import threading
+
+from app.core.push import (
+    EVENT_NOTIFICATION,
+    EVENT_SUBSCRIPTION_CHANGED,
+    EVENT_TOKEN_BALANCE,
+    LocalTransport,
+    PushBroker,
+    PushHub,
+    USER_IDS_PER_MESSAGE,
+    format_sse,
+    make_message,
+)
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+class RecordingTransport:
+    name = 'recording'
+
+    def __init__(self):
+        self.broker = PushBroker()
+        self.messages = []
+
+    def start(self):
+        pass
+
+    def publish(self, message):
+        self.messages.append(message)
+
+
+def test_format_sse():
+    message = make_message(EVENT_TOKEN_BALANCE, {'total_tokens': 10, 'memo': '충전'}, ['u1'])
+
+    assert format_sse(message, 3) == 'id: 3\nevent: token_balance\ndata: {"total_tokens": 10, "memo": "충전"}\n\n'
+
+
+def test_dispatch_targets_user_and_broadcast_from_other_thread():
+    async def scenario():
+        broker = PushBroker()
+        first = broker.subscribe('u1')
+        second = broker.subscribe('u2')
+
+        sender = threading.Thread(target=lambda: (
+            broker.dispatch(make_message(EVENT_TOKEN_BALANCE, {'total_tokens': 5}, ['u1'])),
+            broker.dispatch(make_message(EVENT_NOTIFICATION, {'type': 'SYSTEM_NOTICE'})),
+        ))
+        sender.start()
+        sender.join()
+
+        first_events = [(await first.queue.get())['event'] for _ in range(2)]
+        second_events = [(await second.queue.get())['event']]
+        return first_events, second_events, second.queue.empty()
+
+    first_events, second_events, second_drained = asyncio.run(scenario())
+
+    assert first_events == [EVENT_TOKEN_BALANCE, EVENT_NOTIFICATION]
+    assert second_events == [EVENT_NOTIFICATION]
+    assert second_drained
+
+
+def test_muted_notification_types_are_skipped():
+    async def scenario():
+        broker = PushBroker()
+        subscription = broker.subscribe('u1', muted_types=['EVENT'])
+        delivered = broker.dispatch(make_message(EVENT_NOTIFICATION, {'type': 'EVENT'}))
+        await asyncio.sleep(0)
+        return delivered, subscription.queue.empty()
+
+    assert asyncio.run(scenario()) == (0, True)
+
+
+def test_slow_connection_drops_oldest():
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        broker = PushBroker()
+        subscription = broker.subscribe('u1', loop=loop)
+        for index in range(subscription.queue.maxsize + 2):
+            subscription.offer(make_message(EVENT_TOKEN_BALANCE, {'n': index}, ['u1']))
+        first = subscription.queue.get_nowait()
+        return first['data']['n'], broker.metrics()['dropped']
+
+    assert asyncio.run(scenario()) == (2, 2)
+
+
+def test_stream_sends_initial_and_published_events_then_unsubscribes():
+    async def scenario():
+        hub = PushHub(LocalTransport(PushBroker()))
+        request = FakeRequest()
+        initial = make_message('unread_count', {'unread_count': 3}, ['u1'])
+        stream = hub.stream(request, 'u1', initial_messages=[initial])
+
+        chunks = [await stream.__anext__()]
+        hub.publish(EVENT_TOKEN_BALANCE, {'total_tokens': 7}, ['u1'])
+        chunks.append(await stream.__anext__())
+        connected = hub.metrics()['connections']
+
+        request.disconnected = True
+        try:
+            await stream.__anext__()
+        except StopAsyncIteration:
+            pass
+        return chunks, connected, hub.metrics()
+
+    chunks, connected, metrics = asyncio.run(scenario())
+
+    assert chunks[0] == 'event: unread_count\ndata: {"unread_count": 3}\n\n'
+    assert chunks[1] == 'id: 1\nevent: token_balance\ndata: {"total_tokens": 7}\n\n'
+    assert connected == 1
+    assert metrics['connections'] == 0
+    assert metrics['backend'] == 'local'
+    assert metrics['published'] == 1
+    assert metrics['delivered'] == 1
+
+
+def test_publish_chunks_user_ids_and_skips_empty():
+    transport = RecordingTransport()
+    hub = PushHub(transport)
+
+    hub.publish(EVENT_NOTIFICATION, {}, [f'u{i}' for i in range(USER_IDS_PER_MESSAGE + 1)])
+    hub.publish(EVENT_NOTIFICATION, {}, [])
+
+    assert [len(message['user_ids']) for message in transport.messages] == [USER_IDS_PER_MESSAGE, 1]
+
+
+def test_internal_events_go_to_handlers_not_connections():
+    async def scenario():
+        broker = PushBroker()
+        subscription = broker.subscribe('u1')
+        handled = []
+
+        def fail(message):
+            raise RuntimeError('boom')
+
+        broker.add_handler(EVENT_SUBSCRIPTION_CHANGED, fail)
+        broker.add_handler(EVENT_SUBSCRIPTION_CHANGED, lambda message: handled.append(message['user_ids']))
+        delivered = broker.dispatch(make_message(EVENT_SUBSCRIPTION_CHANGED, {}, ['u1']))
+        await asyncio.sleep(0)
+        return delivered, handled, subscription.queue.empty(), broker.metrics()['published']
+
+    assert asyncio.run(scenario()) == (0, [['u1']], True, 0)
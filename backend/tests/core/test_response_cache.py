@@ -0,0 +1,131 @@
+from datetime import date
+from decimal import Decimal
+
+from starlette.requests import Request
+
+from app.core.response_cache import MemoryBackend, ResponseCache, etag_matches, serialize_payload
+
+
+def make_request(if_none_match=None):
+    headers = [(b'if-none-match', if_none_match.encode())] if if_none_match else []
+    return Request({'type': 'http', 'method': 'GET', 'path': '/', 'headers': headers, 'query_string': b''})
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting_loader(payload):
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return payload
+
+    return loader, calls
+
+
+def test_serialize_payload_is_stable_utf8_json():
+    body = serialize_payload({'title': '공지', 'price': Decimal('9900'), 'day': date(2024, 5, 1)})
+
+    assert body == '{"title":"공지","price":9900,"day":"2024-05-01"}'.encode('utf-8')
+
+
+def test_respond_caches_per_params_and_sets_headers():
+    cache = ResponseCache(MemoryBackend())
+    loader, calls = counting_loader([{'id': 1}])
+
+    first = cache.respond(make_request(), 'curators', loader, params={'category': '미술', 'tag': None})
+    second = cache.respond(make_request(), 'curators', loader, params={'tag': None, 'category': '미술'})
+    cache.respond(make_request(), 'curators', loader, params={'category': '음악'})
+
+    assert first.status_code == 200
+    assert first.body == b'[{"id":1}]'
+    assert first.headers['etag'] == second.headers['etag']
+    assert first.headers['cache-control'] == 'public, max-age=60'
+    assert len(calls) == 2
+
+
+def test_matching_if_none_match_returns_304_without_loading():
+    cache = ResponseCache(MemoryBackend())
+    loader, calls = counting_loader({'footer': 'cul.f'})
+    etag = cache.respond(make_request(), 'footer', loader).headers['etag']
+
+    response = cache.respond(make_request(f'"other", W/{etag}'), 'footer', loader, private=True)
+
+    assert response.status_code == 304
+    assert response.body == b''
+    assert response.headers['etag'] == etag
+    assert response.headers['cache-control'] == 'private, max-age=60'
+    assert len(calls) == 1
+
+
+def test_invalidate_bumps_namespace_only():
+    cache = ResponseCache(MemoryBackend())
+    banners, banner_calls = counting_loader([])
+    products, product_calls = counting_loader({})
+    cache.respond(make_request(), 'banners', banners)
+    cache.respond(make_request(), 'products', products)
+
+    cache.invalidate('banners')
+    cache.respond(make_request(), 'banners', banners)
+    cache.respond(make_request(), 'products', products)
+
+    assert len(banner_calls) == 2
+    assert len(product_calls) == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(MemoryBackend(clock=clock), default_ttl=300)
+    loader, calls = counting_loader([])
+
+    cache.load('terms', loader)
+    clock.now = 299
+    cache.load('terms', loader)
+    clock.now = 300
+    cache.load('terms', loader)
+
+    assert len(calls) == 2
+
+
+def test_refresh_reloads_and_replaces_entry():
+    cache = ResponseCache(MemoryBackend())
+    counts = iter([5, 6])
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return next(counts)
+
+    assert cache.load('admin_payment_count', loader).body == b'5'
+    assert cache.load('admin_payment_count', loader, refresh=True).body == b'6'
+    assert cache.load('admin_payment_count', loader).body == b'6'
+    assert len(calls) == 2
+
+
+def test_backend_errors_fall_back_to_loader():
+    class BrokenBackend:
+        def version(self, namespace):
+            raise ConnectionError('redis down')
+
+        def bump(self, namespace):
+            raise ConnectionError('redis down')
+
+    cache = ResponseCache(BrokenBackend())
+    loader, calls = counting_loader({'ok': True})
+
+    assert cache.respond(make_request(), 'notices', loader).body == b'{"ok":true}'
+    cache.invalidate('notices')
+    assert len(calls) == 1
+
+
+def test_etag_matches():
+    assert etag_matches('"a", "b"', '"b"')
+    assert etag_matches('*', '"b"')
+    assert not etag_matches(None, '"b"')
+    assert not etag_matches('"a"', '"b"')
@@ -0,0 +1,85 @@
+import csv
+import io
+from datetime import date, datetime, timezone
+
+from openpyxl import load_workbook
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서 (admin.export -> user/token 모델)
+from app.domains.admin.export import EXPORT_COLUMNS, export_query, iter_csv, iter_xlsx
+
+ROW = {
+    'nickname': '큐레이터',
+    'email': 'curator@example.com',
+    'created_at': datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc),
+    'last_chat_at': None,
+    'status': 'ACTIVE',
+    'role': 'USER',
+    'total_tokens': 120,
+    'monthly_token_usage': 15,
+    'marketing_agreed': True,
+    'is_corporate': False,
+    'provider': '카카오',
+    'phone_number': '01012345678',
+    'birthdate': date(1990, 1, 2),
+    'gender': 'F',
+}
+
+
+def test_csv_starts_with_bom_and_streams_in_chunks():
+    chunks = list(iter_csv([ROW] * 5, flush_rows=2))
+
+    assert len(chunks) > 1
+    assert chunks[0].startswith('﻿'.encode('utf-8'))
+    assert not any(chunk.startswith('﻿'.encode('utf-8')) for chunk in chunks[1:])
+
+    rows = list(csv.reader(io.StringIO(b''.join(chunks).decode('utf-8-sig'))))
+    assert rows[0] == [header for _, header in EXPORT_COLUMNS]
+    assert len(rows) == 6
+    assert rows[1][:4] == ['큐레이터', 'curator@example.com', '2024-05-01 09:30:00', '']
+    assert rows[1][8:10] == ['Y', 'N']
+    assert rows[1][12] == '1990-01-02'
+
+
+def test_csv_without_rows_has_header_only():
+    body = b''.join(iter_csv([])).decode('utf-8-sig')
+
+    assert body.strip() == ','.join(header for _, header in EXPORT_COLUMNS)
+
+
+def test_xlsx_round_trip():
+    body = b''.join(iter_xlsx([ROW, dict(ROW, nickname='두번째')], chunk_size=1024))
+
+    sheet = load_workbook(io.BytesIO(body), read_only=True).active
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0] == tuple(header for _, header in EXPORT_COLUMNS)
+    assert rows[1][0] == '큐레이터'
+    assert rows[1][2] == datetime(2024, 5, 1, 9, 30)
+    assert rows[1][6] == 120
+    assert rows[2][0] == '두번째'
+
+
+def test_export_query_aggregates_in_subqueries():
+    sql = str(export_query(Session()).statement.compile(dialect=postgresql.dialect()))
+
+    # 집계는 사용자 단위 서브쿼리에서 하고 바깥 쿼리는 사용자 한 명당 한 행
+    assert sql.count('GROUP BY') == 3
+    assert 'GROUP BY users.' not in sql
+    assert 'LEFT OUTER JOIN conversations ON' not in sql
+
+
+def test_formula_like_values_are_not_executed():
+    row = dict(ROW, nickname='=HYPERLINK("http://evil.example","x")', email='@SUM(1)', gender='-1+2', total_tokens=-3)
+
+    rows = list(csv.reader(io.StringIO(b''.join(iter_csv([row])).decode('utf-8-sig'))))
+    assert rows[1][0] == '\'=HYPERLINK("http://evil.example","x")'
+    assert rows[1][1] == "'@SUM(1)"
+    assert rows[1][13] == "'-1+2"
+    # 숫자는 그대로
+    assert rows[1][6] == '-3'
+
+    sheet = load_workbook(io.BytesIO(b''.join(iter_xlsx([row]))), read_only=True).active
+    cell = list(sheet.iter_rows())[1][0]
+    assert cell.data_type == 's'
+    assert cell.value == '=HYPERLINK("http://evil.example","x")'
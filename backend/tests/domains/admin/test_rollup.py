@@ -0,0 +1,105 @@
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.domains.admin import rollup
+from app.domains.admin.models import UserUsageDaily
+from app.domains.conversation.models import Conversation
+from app.domains.payment.models import Payment, Refund
+from app.domains.token.models import TokenUsageHistory
+
+USAGE = "INSERT INTO token_usage_history (history_id, user_id, conversation_id, tokens_used, used_at) VALUES "
+CONVERSATION = ("INSERT INTO conversations (conversation_id, user_id, room_id, question, answer, tokens_used, question_time) "
+                "VALUES ")
+PAYMENT = ("INSERT INTO payments (payment_id, user_id, payment_number, payment_method, amount, status, payment_date) "
+           "VALUES ")
+
+FACTS = [
+    USAGE + "(1, 'u1', 1, 10, '2024-05-01 09:00:00')",
+    USAGE + "(2, 'u1', 2, 30, '2024-05-01 23:59:00')",
+    USAGE + "(3, 'u2', 3, 5, '2024-05-02 00:10:00')",
+    CONVERSATION + "(1, 'u1', 'r1', 'q', 'a', 10, '2024-05-01 09:00:00')",
+    CONVERSATION + "(2, 'u1', 'r1', 'q', 'a', 30, '2024-05-01 23:59:00')",
+    CONVERSATION + "(3, 'u2', 'r1', 'q', 'a', 5, '2024-05-02 00:10:00')",
+    PAYMENT + "(1, 'u1', 'p1', 'card', 9900, 'SUCCESS', '2024-05-01 10:00:00')",
+    PAYMENT + "(2, 'u1', 'p2', 'card', 4900, 'FAILED', '2024-05-01 11:00:00')",
+]
+
+
+def make_session(sqlite_engine):
+    engine = sqlite_engine(TokenUsageHistory, Conversation, Payment, UserUsageDaily, Refund)
+    with engine.begin() as conn:
+        for statement in FACTS:
+            conn.execute(text(statement))
+    return Session(engine)
+
+
+def user_rows(db):
+    return db.execute(text(
+        "SELECT usage_date, user_id, tokens_used, usage_count, max_tokens_used, min_tokens_used, "
+        "conversations, payments, payment_amount FROM user_usage_daily ORDER BY usage_date, user_id"
+    )).all()
+
+
+def test_refresh_range_rolls_up_per_day_and_is_idempotent(sqlite_engine):
+    db = make_session(sqlite_engine)
+
+    assert rollup.refresh_range(db, date(2024, 5, 1), date(2024, 5, 2))
+    first = user_rows(db)
+    rollup.refresh_range(db, date(2024, 5, 1), date(2024, 5, 2))
+
+    assert user_rows(db) == first
+    assert [tuple(row) for row in first] == [
+        ('2024-05-01', 'u1', 40, 2, 30, 10, 2, 1, 9900.0),
+        ('2024-05-02', 'u2', 5, 1, 5, 5, 1, 0, 0.0),
+    ]
+
+
+def test_refresh_range_only_touches_requested_days(sqlite_engine):
+    db = make_session(sqlite_engine)
+    rollup.refresh_range(db, date(2024, 5, 1), date(2024, 5, 2))
+    db.execute(text(USAGE + "(4, 'u2', 4, 100, '2024-05-01 12:00:00')"))
+    db.commit()
+
+    rollup.refresh_range(db, date(2024, 5, 2), date(2024, 5, 2))
+    assert [row.user_id for row in user_rows(db) if str(row.usage_date) == '2024-05-01'] == ['u1']
+
+    rollup.refresh_range(db, date(2024, 5, 1), date(2024, 5, 1))
+    assert [row.user_id for row in user_rows(db) if str(row.usage_date) == '2024-05-01'] == ['u1', 'u2']
+
+
+def test_refresh_recent_backfills_when_empty(sqlite_engine):
+    db = make_session(sqlite_engine)
+
+    rollup.refresh_recent(db, today=date(2024, 6, 1))
+
+    assert len(user_rows(db)) == 2
+
+
+def test_refresh_recent_recomputes_days_of_refunded_payments(sqlite_engine):
+    db = make_session(sqlite_engine)
+    rollup.refresh_recent(db, today=date(2024, 6, 1))
+    assert [tuple(row)[7:] for row in user_rows(db)][0] == (1, 9900.0)
+
+    # 한 달 전 결제를 오늘 환불
+    db.execute(text("UPDATE payments SET status = 'REFUNDED' WHERE payment_id = 1"))
+    db.execute(text(
+        "INSERT INTO refunds (refund_id, payment_id, user_id, inquiry_id, amount, status, processed_at, created_at, "
+        "updated_at) VALUES (1, 1, 'u1', 1, 9900, 'APPROVED', '2024-06-01 08:00:00', '2024-06-01 08:00:00', "
+        "'2024-06-01 08:00:00')"
+    ))
+    db.commit()
+    rollup.refresh_recent(db, today=date(2024, 6, 1))
+
+    assert [tuple(row)[7:] for row in user_rows(db)][0] == (0, 0.0)
+
+
+def test_user_usage_since_reads_rollup_only():
+    sql = str(rollup.user_usage_since(Session(), date(2024, 5, 1)).select().compile(dialect=postgresql.dialect()))
+
+    assert 'user_usage_daily' in sql
+    assert 'token_usage_history' not in sql
+    assert rollup.window_start(today=date(2024, 5, 31)) == date(2024, 5, 2)
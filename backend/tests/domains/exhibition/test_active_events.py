@@ -0,0 +1,78 @@
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.domains.exhibition.active_events import (
+    ACTIVE_EVENTS_VIEW,
+    query_active_events,
+    source_regions,
+    view_statements,
+)
+from app.domains.exhibition.models import CultureHub
+from app.domains.exhibition.source_adapters import CULTURAL_API_CONFIG
+
+# 구체화 뷰 자리에 둔 일반 뷰로 조회 조건만 확인
+VIEW_ROWS = [
+    (1, '진행 중', '2024-05-01', '2024-05-31', '서울'),
+    (2, '이미 끝남', '2024-04-01', '2024-05-09', '서울'),
+    (3, '종료일 없음 (최근 시작)', '2024-05-01', None, '서울'),
+    (4, '종료일 없음 (오래전 시작)', '2024-03-01', None, '서울'),
+    (5, '곧 시작', '2024-05-12', '2024-06-30', '서울'),
+    (6, '종료일만 있음', None, '2024-05-10', '부산'),
+    (7, '전국 행사', '2024-05-01', '2024-05-20', '전국'),
+]
+
+
+def test_every_source_has_a_region():
+    regions = {source: region for source, _, region in source_regions()}
+
+    assert len(regions) == len(CULTURAL_API_CONFIG)
+    assert regions['mmca'] == '서울'
+    assert regions['mapo_art'] == '서울'
+    # 특별 처리 소스는 DB에 저장되는 이름으로 매핑
+    assert regions['제주문화예술진흥원 공연전시정보'] == '제주'
+
+
+def test_view_has_unique_index_for_concurrent_refresh():
+    statements = view_statements()
+
+    assert statements[0].strip().startswith(f"CREATE MATERIALIZED VIEW IF NOT EXISTS {ACTIVE_EVENTS_VIEW}")
+    assert any(f"UNIQUE INDEX IF NOT EXISTS idx_active_events_id ON {ACTIVE_EVENTS_VIEW}(id)" in s for s in statements)
+
+
+def make_view_session(sqlite_engine):
+    engine = sqlite_engine(CultureHub)
+    with engine.begin() as conn:
+        # 구체화 뷰와 같은 컬럼을 내는 일반 뷰 (지역은 장소 컬럼으로 대신)
+        conn.execute(text(
+            f"""CREATE VIEW {ACTIVE_EVENTS_VIEW} AS
+                SELECT id, title, start_date, end_date, category, venue AS location, venue AS region, collected_at
+                FROM culture_hubs"""
+        ))
+        for row_id, title, start, end, region in VIEW_ROWS:
+            conn.execute(
+                text("INSERT INTO culture_hubs (id, title, start_date, end_date, category, venue, api_source) "
+                     "VALUES (:id, :title, :start, :end, '전시', :region, 'test')"),
+                {'id': row_id, 'title': title, 'start': start, 'end': end, 'region': region}
+            )
+    return Session(engine)
+
+
+def test_query_returns_only_events_running_today(sqlite_engine):
+    db = make_view_session(sqlite_engine)
+
+    result = query_active_events(db, today=date(2024, 5, 10))
+
+    assert sorted(item['id'] for item in result['items']) == [1, 3, 6, 7]
+    assert result['total'] == 4
+    open_ended = next(item for item in result['items'] if item['id'] == 3)
+    assert open_ended['start_date'] == '2024-05-01' and open_ended['end_date'] is None
+
+
+def test_query_region_includes_nationwide_sources(sqlite_engine):
+    db = make_view_session(sqlite_engine)
+
+    result = query_active_events(db, region='부산', today=date(2024, 5, 10))
+
+    assert [item['id'] for item in result['items']] == [6, 7]
@@ -0,0 +1,76 @@
+from datetime import date, datetime
+
+from app.domains.exhibition.batch_normalizer import SourceMapper, map_culture_hub_fields
+from app.domains.exhibition.source_adapters import SOURCE_ADAPTERS
+
+STANDARD_COLUMNS = ['제목', '연계기관명', '장소', '시작일', '종료일', '전시ID']
+
+
+def test_source_mapper_maps_columns_and_fills_defaults():
+    adapter = SOURCE_ADAPTERS['arts_center']
+    mapper = SourceMapper(adapter, STANDARD_COLUMNS)
+    collected_at = datetime(2024, 5, 1, 9, 30)
+
+    rows = mapper.normalize([
+        {'TITLE': '전시 A', 'LOCAL_ID': 'A1', 'EVENT_SITE': '한가람미술관', 'CNTC_INSTT_NM': '예술의전당'},
+        {'TITLE': '  ', 'LOCAL_ID': 7},
+        {'place': '오페라하우스'},
+    ], collected_at=collected_at)
+
+    assert rows[0]['제목'] == '전시 A'
+    assert rows[0]['장소'] == '한가람미술관'
+    assert rows[0]['연계기관명'] == '예술의전당'
+    assert rows[0]['수집시간'] == '2024-05-01 09:30:00'
+    assert rows[0]['api_key'] == 'arts_center'
+    # 정수 ID가 float로 바뀌지 않음
+    assert rows[1]['전시ID'] == 7
+    assert rows[1]['제목'] == f"{adapter.name} 문화행사 #2"
+    assert rows[1]['연계기관명'] == adapter.institution_name
+    assert rows[2]['제목'] == '오페라하우스'
+    assert rows[2]['종료일'] == ''
+
+
+def test_culture_hub_fields_use_first_non_empty_candidate():
+    mapped = map_culture_hub_fields([
+        {'제목': '', 'title': '영문 제목', '장소': '  미술관  '},
+        {'제목': '국문 제목', 'subject': '무시'},
+        {'기타': 1},
+    ])
+
+    assert mapped[0] == {'title': '영문 제목', 'venue': '미술관'}
+    assert mapped[1] == {'title': '국문 제목'}
+    assert mapped[2] == {}
+
+
+def test_culture_hub_fields_truncate_to_field_limit():
+    mapped = map_culture_hub_fields([{'문의': '0' * 150, '소개설명': 'x' * 300}])
+
+    assert len(mapped[0]['contact']) == 100
+    assert len(mapped[0]['description']) == 200
+
+
+def test_culture_hub_dates_are_parsed():
+    mapped = map_culture_hub_fields([
+        {'시작일': '2024.01.05', '종료일': '2024/02/01 18:00'},
+        {'시작일': '2024-13-40', '종료일': '2024'},
+        {'시작일': '2024.01.05', '종료일': 20240301},
+    ])
+
+    assert mapped[0] == {'start_date': date(2024, 1, 5), 'end_date': date(2024, 2, 1)}
+    # 해석할 수 없는 날짜는 필드 없음
+    assert mapped[1] == {}
+    assert mapped[2] == {'start_date': date(2024, 1, 5), 'end_date': date(2024, 3, 1)}
+
+
+def test_culture_hub_dates_fall_back_to_period():
+    mapped = map_culture_hub_fields([
+        {'기간': '2024.03.01 ~ 2024.05.31'},
+        {'기간': '2024.03.01 ~ 2024.05.31', '시작일': '2024.02.15'},
+        {'기간': '상시'},
+    ])
+
+    assert mapped[0]['start_date'] == date(2024, 3, 1)
+    assert mapped[0]['end_date'] == date(2024, 5, 31)
+    assert mapped[1]['start_date'] == date(2024, 2, 15)
+    assert mapped[1]['end_date'] == date(2024, 5, 31)
+    assert mapped[2] == {'period': '상시'}
@@ -0,0 +1,104 @@
+from datetime import date
+
+from app.domains.exhibition.collection_jobs import (
+    CollectionJobStore,
+    STATUS_CANCELLED,
+    STATUS_QUEUED,
+    STATUS_RUNNING,
+    _compact_results,
+    job_to_progress,
+)
+from app.domains.exhibition.models import CollectionJob
+
+
+class CountingStore(CollectionJobStore):
+    """DB 대신 호출 횟수만 세는 저장소"""
+
+    def __init__(self, answers):
+        super().__init__(session_factory=lambda: None)
+        self.answers = list(answers)
+        self.calls = 0
+
+    def is_cancel_requested(self, job_id):
+        self.calls += 1
+        return self.answers.pop(0)
+
+
+def test_cancel_checker_throttles_db_checks():
+    store = CountingStore([False, True])
+    check = store.cancel_checker('job-1', interval=3600)
+
+    assert check() is False
+    assert check() is False
+    assert store.calls == 1
+
+
+def test_cancel_checker_latches_cancellation():
+    store = CountingStore([True])
+    check = store.cancel_checker('job-1', interval=0)
+
+    assert check() is True
+    assert check() is True
+    assert store.calls == 1
+
+
+class FailingHeartbeatStore(CollectionJobStore):
+    def __init__(self):
+        super().__init__(session_factory=lambda: None)
+        self.beats = 0
+
+    def heartbeat(self, job_id):
+        self.beats += 1
+        raise RuntimeError('db down')
+
+
+def test_heartbeat_callback_throttles_and_survives_errors():
+    store = FailingHeartbeatStore()
+    heartbeat = store.heartbeat_callback('job-1', interval=3600)
+
+    for _ in range(1000):
+        heartbeat()
+    assert store.beats == 1
+
+    heartbeat = store.heartbeat_callback('job-1', interval=0)
+    heartbeat()
+    heartbeat()
+    assert store.beats == 3
+
+
+def test_compact_results_drops_raw_rows_and_serializes_dates():
+    result = {
+        'success': True,
+        'total_collected': 2,
+        'details': {'integrated_data': [{'title': 'a'}, {'title': 'b'}], 'total_apis': 16},
+        'collected_on': date(2024, 5, 1),
+    }
+    compact = _compact_results(result)
+
+    assert 'integrated_data' not in compact['details']
+    assert compact['details']['total_apis'] == 16
+    assert compact['collected_on'] == '2024-05-01'
+    assert 'integrated_data' in result['details']
+
+
+def test_job_to_progress_keeps_legacy_fields():
+    job = CollectionJob(id='job-1', job_type='all', status=STATUS_RUNNING, step=4,
+                        message='수집 중', percentage=40)
+    progress = job_to_progress(job)
+    assert progress['completed'] is False
+    assert progress['cancelled'] is False
+    assert 'results' not in progress
+
+    job.status = STATUS_CANCELLED
+    job.results = {'total_new': 1}
+    progress = job_to_progress(job)
+    assert progress['completed'] is True and progress['cancelled'] is True
+    assert progress['results'] == {'total_new': 1}
+
+
+def test_queued_job_is_not_completed():
+    job = CollectionJob(id='job-2', job_type='single', api_key='mmca', status=STATUS_QUEUED,
+                        params={'max_pages': 2})
+    progress = job_to_progress(job)
+    assert progress['completed'] is False
+    assert progress['params'] == {'max_pages': 2}
@@ -0,0 +1,49 @@
+from datetime import date
+
+import pytest
+
+from app.domains.exhibition.date_parser import Period, cache_info, parse_date, parse_period, resolve_dates
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2024.03.01', date(2024, 3, 1)),
+    ('2024-3-1 18:00', date(2024, 3, 1)),
+    ('2024/03/01', date(2024, 3, 1)),
+    ('2024년 3월 1일', date(2024, 3, 1)),
+    ('20240301', date(2024, 3, 1)),
+    ('2024-02-30', None),
+    ('미정', None),
+])
+def test_parse_date_formats(text, expected):
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2024.03.01 ~ 2024.05.31', Period(date(2024, 3, 1), date(2024, 5, 31))),
+    ('2024-03-01 - 2024-05-31', Period(date(2024, 3, 1), date(2024, 5, 31))),
+    ('2024.03.01(금) ~ 2024.05.31(일) 10:00~18:00', Period(date(2024, 3, 1), date(2024, 5, 31))),
+    ('2024년 3월 1일 ~ 4월 30일', Period(date(2024, 3, 1), date(2024, 4, 30))),
+    ('2024.12.01 ~ 01.31', Period(date(2024, 12, 1), date(2025, 1, 31))),
+    ('2024년 3월', Period(date(2024, 3, 1), date(2024, 3, 31))),
+    ('2024.03.01 ~', Period(date(2024, 3, 1), None)),
+    ('2024-03-01 10:00 ~ 18:00', Period(date(2024, 3, 1), date(2024, 3, 1))),
+    ('2024년 3월 1일 오후 2시 ~ 5시', Period(date(2024, 3, 1), date(2024, 3, 1))),
+    ('~ 2024.05.31', Period(None, date(2024, 5, 31))),
+    ('2024.03.01 ~ 상시', Period(date(2024, 3, 1), None, True)),
+    ('상시', Period(None, None, True)),
+    ('문의 02-1234-5678', Period(None, None)),
+])
+def test_parse_period(text, expected):
+    assert parse_period(text) == expected
+
+
+def test_explicit_dates_win_over_period():
+    assert resolve_dates('2024.02.15', None, '2024.03.01 ~ 2024.05.31') == (date(2024, 2, 15), date(2024, 5, 31))
+    assert resolve_dates(None, None, None) == (None, None)
+
+
+def test_repeated_period_is_served_from_cache():
+    parse_period('2031.01.01 ~ 2031.02.01')
+    hits = cache_info()['period'].hits
+    parse_period('2031.01.01 ~ 2031.02.01')
+    assert cache_info()['period'].hits == hits + 1
@@ -0,0 +1,93 @@
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.domains.exhibition.entity_resolution import (
+    EventResolver,
+    cluster_events,
+    month_buckets,
+    normalize_title,
+    venue_key,
+)
+from app.domains.exhibition.models import CultureHub
+
+
+def event(event_id, source, title, venue='국립현대미술관 서울', start=date(2024, 3, 1), end=date(2024, 5, 31)):
+    return {
+        'id': event_id,
+        'api_source': source,
+        'title': title,
+        'venue': venue,
+        'start_date': start,
+        'end_date': end,
+    }
+
+
+def test_normalization_drops_brackets_and_room_details():
+    assert normalize_title('[특별전] 한국 현대미술의 지평 (연장)') == '한국현대미술의지평'
+    assert normalize_title('(제목만 괄호)') == '제목만괄호'
+    assert venue_key('국립현대미술관 서울 제1전시실') == venue_key('국립현대미술관  서울')
+    assert venue_key('서울시립미술관 2층') == '서울시립미술관'
+
+
+def test_month_buckets_cover_period():
+    assert month_buckets(date(2024, 11, 20), date(2025, 1, 5)) == [(2024, 11), (2024, 12), (2025, 1)]
+    assert month_buckets(None, None) == ['undated']
+    assert month_buckets(date(2024, 3, 1), None) == [(2024, 3)]
+
+
+def test_same_show_from_different_sources_shares_canonical_id():
+    canonical = cluster_events([
+        event(10, 'mmca', '한국 현대미술의 지평'),
+        event(4, 'integrated_exhibition', '[기획전] 한국 현대미술의 지평', venue='국립현대미술관 서울 (1층)'),
+        event(7, 'sema', '한국 현대미술의 지평展', start=date(2024, 4, 1), end=date(2024, 6, 30)),
+    ])
+
+    assert canonical == {10: 4, 4: 4, 7: 4}
+
+
+def test_distinct_events_are_not_merged():
+    canonical = cluster_events([
+        event(1, 'mmca', '한국 현대미술의 지평'),
+        # 같은 소스는 묶지 않음
+        event(2, 'mmca', '한국 현대미술의 지평'),
+        # 기간이 겹치지 않음
+        event(3, 'sema', '한국 현대미술의 지평', start=date(2025, 1, 1), end=date(2025, 2, 1)),
+        # 장소가 다름
+        event(4, 'integrated_exhibition', '한국 현대미술의 지평', venue='부산시립미술관'),
+        # 제목이 다름
+        event(5, 'arko', '사진으로 보는 서울'),
+    ])
+
+    assert canonical == {1: 1, 2: 2, 3: 3, 4: 4, 5: 5}
+
+
+def make_session(sqlite_engine):
+    engine = sqlite_engine(CultureHub)
+    with engine.begin() as conn:
+        for row_id, source in ((1, 'mmca'), (2, 'sema'), (3, 'integrated_exhibition')):
+            conn.execute(text(
+                "INSERT INTO culture_hubs (id, api_source, title, venue, start_date, end_date, is_duplicate, is_active) "
+                f"VALUES ({row_id}, '{source}', '한국 현대미술의 지평', '국립현대미술관 서울', '2024-03-01', '2024-05-31', 0, 1)"
+            ))
+    return Session(engine)
+
+
+def resolved(db):
+    return {row.id: (row.canonical_id, bool(row.is_duplicate))
+            for row in db.execute(text("SELECT id, canonical_id, is_duplicate FROM culture_hubs"))}
+
+
+def test_moving_canonical_row_releases_its_former_duplicates(sqlite_engine):
+    db = make_session(sqlite_engine)
+    EventResolver(db).resolve_pending()
+    assert resolved(db) == {1: (1, False), 2: (1, True), 3: (1, True)}
+
+    # 대표 행의 장소가 바뀌면 수집 단계에서 canonical_id를 지움
+    db.execute(text("UPDATE culture_hubs SET venue = '부산시립미술관', canonical_id = NULL WHERE id = 1"))
+    db.commit()
+    EventResolver(db).resolve_pending()
+
+    assert resolved(db) == {1: (1, False), 2: (2, False), 3: (2, True)}
@@ -0,0 +1,64 @@
+from datetime import date
+
+from app.domains.exhibition.fingerprint import (
+    compute_content_hash,
+    CULTURE_HUB_HASH_FIELDS,
+    EXHIBITION_HASH_FIELDS,
+)
+
+
+def sample_record():
+    return {
+        'title': '한국 현대미술의 지평',
+        'description': '국립현대미술관 기획전',
+        'start_date': date(2024, 3, 1),
+        'end_date': date(2024, 5, 31),
+        'period': '2024.03.01 ~ 2024.05.31',
+        'venue': '국립현대미술관 서울',
+        'category': '전시',
+        'artist': None,
+        'price': '무료',
+        'website': 'https://www.mmca.go.kr',
+        'image_url': None,
+    }
+
+
+def test_hash_is_stable_and_hex():
+    first = compute_content_hash(sample_record())
+    second = compute_content_hash(sample_record())
+    assert first == second
+    assert len(first) == 64
+    int(first, 16)
+
+
+def test_hash_ignores_non_content_fields_and_whitespace():
+    base = compute_content_hash(sample_record())
+
+    record = sample_record()
+    record['collected_at'] = '2024-03-02 00:00:00'
+    record['api_source'] = 'mmca'
+    record['title'] = '  한국 현대미술의 지평  '
+    assert compute_content_hash(record) == base
+
+
+def test_hash_treats_none_and_empty_equally():
+    record = sample_record()
+    record['artist'] = ''
+    assert compute_content_hash(record) == compute_content_hash(sample_record())
+
+
+def test_hash_changes_when_content_changes():
+    record = sample_record()
+    record['end_date'] = date(2024, 6, 30)
+    assert compute_content_hash(record) != compute_content_hash(sample_record())
+
+
+def test_date_and_iso_string_hash_the_same():
+    record = sample_record()
+    record['start_date'] = '2024-03-01'
+    assert compute_content_hash(record) == compute_content_hash(sample_record())
+
+
+def test_field_sets_differ_per_model():
+    record = sample_record()
+    assert compute_content_hash(record, CULTURE_HUB_HASH_FIELDS) != compute_content_hash(record, EXHIBITION_HASH_FIELDS)
@@ -0,0 +1,91 @@
+import requests
+
+from app.domains.exhibition import fixture_replay
+
+from app.domains.exhibition.fixture_replay import (
+    FixtureStore,
+    ReplayServer,
+    ReplaySession,
+    canonical_url,
+    fixture_key,
+)
+from app.domains.exhibition.source_adapters import SOURCE_ADAPTERS
+
+JEJU_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<jejunetApi>
+  <resultCode>00</resultCode><resultMsg>OK</resultMsg>
+  <items><item><title>제주 전시</title><seq>77</seq></item></items>
+</jejunetApi>""".encode('utf-8')
+
+
+def make_response(body: bytes, status: int = 200, content_type: str = 'text/xml; charset=utf-8'):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers['Content-Type'] = content_type
+    response.encoding = 'utf-8'
+    return response
+
+
+def test_canonical_url_ignores_param_order():
+    first = canonical_url('https://api.kcisa.kr/openapi/x', {'pageNo': 1, 'serviceKey': 'k'})
+    second = canonical_url('https://api.kcisa.kr/openapi/x?serviceKey=k', {'pageNo': '1'})
+    assert first == second
+    assert fixture_key('https://a/x', {'b': 1, 'a': 2}) == fixture_key('https://a/x', {'a': 2, 'b': 1})
+
+
+def test_store_round_trip(tmp_path):
+    store = FixtureStore(tmp_path)
+    key = store.save('http://www.jeju.go.kr/rest/list', {}, make_response(JEJU_XML))
+
+    reloaded = FixtureStore(tmp_path)
+    meta, body = reloaded.load(key)
+    assert body == JEJU_XML
+    assert meta['status'] == 200
+    assert len(reloaded) == 1
+
+
+def test_replay_server_serves_recorded_response(tmp_path):
+    adapter = SOURCE_ADAPTERS['jeju_culture']
+    store = FixtureStore(tmp_path)
+    store.save(adapter.url, adapter.build_params(1), make_response(JEJU_XML))
+
+    with ReplayServer(store) as server:
+        session = ReplaySession(server.url)
+        response = session.get(adapter.url, params=adapter.build_params(1), timeout=5)
+        missing = session.get(adapter.url + '/unknown', timeout=5)
+        stats = server.stats
+
+    assert response.status_code == 200
+    success, data, _ = adapter.parse_response(response.content, response.encoding)
+    assert success
+    assert adapter.extract_items(data)[1] == 1
+    assert missing.status_code == 404
+    assert stats['hits'] == 1 and stats['misses'] == 1
+
+
+def test_replay_server_injects_errors(tmp_path):
+    store = FixtureStore(tmp_path)
+    store.save('http://example.org/api', {'page': 1}, make_response(b'ok', content_type='text/plain'))
+
+    with ReplayServer(store, error_rate=1.0, error_status=503, seed=1) as server:
+        response = ReplaySession(server.url).get('http://example.org/api', params={'page': 1}, timeout=5)
+        stats = server.stats
+
+    assert response.status_code == 503
+    assert stats['injected_errors'] == 1
+
+
+def test_replay_server_jitter_only_delay_follows_seed(tmp_path, monkeypatch):
+    store = FixtureStore(tmp_path)
+    store.save('http://example.org/api', {'page': 1}, make_response(b'ok', content_type='text/plain'))
+    delays = []
+    monkeypatch.setattr(fixture_replay.time, 'sleep', delays.append)
+
+    for _ in range(2):
+        with ReplayServer(store, jitter=0.5, seed=7) as server:
+            ReplaySession(server.url).get('http://example.org/api', params={'page': 1}, timeout=5)
+
+    assert len(delays) == 2
+    assert 0 < delays[0] <= 0.5
+    assert delays[0] == delays[1]
@@ -0,0 +1,97 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.domains.exhibition.geosearch import (
+    VenueGeocoder,
+    covering_cells,
+    covering_precision,
+    distance_m,
+    encode_geohash,
+    find_nearby_events,
+)
+from app.domains.exhibition.models import CultureHub
+
+SEOUL_MUSEUM = (37.5640, 126.9738)
+
+
+def test_encode_geohash_matches_reference():
+    # 위키백과 예시 좌표
+    assert encode_geohash(57.64911, 10.40744, 11) == 'u4pruydqqvj'
+    assert encode_geohash(*SEOUL_MUSEUM, 5) == 'wydm9'
+
+
+def test_distance_between_seoul_venues():
+    # 서울시립미술관 ↔ 국립현대미술관 덕수궁 (약 240m)
+    assert distance_m(*SEOUL_MUSEUM, 37.5658, 126.9752) == pytest.approx(235, abs=30)
+    assert distance_m(*SEOUL_MUSEUM, *SEOUL_MUSEUM) == 0
+
+
+@pytest.mark.parametrize('radius_m', [100, 1500, 8000, 40000])
+def test_covering_cells_include_every_point_in_radius(radius_m):
+    cells = covering_cells(*SEOUL_MUSEUM, radius_m)
+    precision = covering_precision(SEOUL_MUSEUM[0], radius_m)
+
+    # 반경 원 둘레의 점은 모두 덮는 셀 안에 있어야 함
+    for bearing_lat, bearing_lng in ((1, 0), (-1, 0), (0, 1), (0, -1), (0.7, 0.7), (-0.7, -0.7)):
+        lat = SEOUL_MUSEUM[0] + bearing_lat * radius_m / 111320.0
+        lng = SEOUL_MUSEUM[1] + bearing_lng * radius_m / (111320.0 * 0.79)
+        assert encode_geohash(lat, lng, precision) in cells
+    assert len(cells) <= 9
+
+
+def test_geocoder_prefers_exact_then_longest_prefix():
+    geocoder = VenueGeocoder({
+        '서울시립미술관': (37.5640, 126.9738, 'wydm9q76p'),
+        '국립현대미술관': (37.0, 127.0, 'wydxxxxxx'),
+        '국립현대미술관서울': (37.5788, 126.9801, 'wydmc9006'),
+    })
+
+    assert geocoder.geocode('국립현대미술관 서울')[2] == 'wydmc9006'
+    assert geocoder.geocode('서울시립미술관 서소문본관 2층')[2] == 'wydm9q76p'
+    assert geocoder.geocode('국립현대미술관 청주')[2] == 'wydxxxxxx'
+    assert geocoder.geocode('부산시립미술관') is None
+
+
+INSERT_EVENT = text(
+    "INSERT INTO culture_hubs (id, title, venue, category, start_date, end_date, api_source, "
+    "latitude, longitude, geohash, is_active, is_duplicate) "
+    "VALUES (:id, '전시', '서울시립미술관', '전시', :start, :end, 'sema', :lat, :lng, :geohash, 1, 0)"
+)
+
+
+def test_nearby_search_bounds_events_without_end_date(sqlite_engine):
+    engine = sqlite_engine(CultureHub)
+    geohash = encode_geohash(*SEOUL_MUSEUM)
+    with engine.begin() as conn:
+        for row_id, start, end in ((1, '2024-05-01', '2024-05-31'), (2, '2024-05-01', None),
+                                   (3, '2024-03-01', None), (4, '2024-04-01', '2024-05-09')):
+            conn.execute(INSERT_EVENT, {'id': row_id, 'start': start, 'end': end, 'lat': SEOUL_MUSEUM[0],
+                                        'lng': SEOUL_MUSEUM[1], 'geohash': geohash})
+
+    events = find_nearby_events(Session(engine), *SEOUL_MUSEUM, 500, on_date=date(2024, 5, 10))
+
+    assert [event['id'] for event in events] == [1, 2]
+
+
+def test_nearby_search_fetches_only_limit_rows_inside_bounding_box(sqlite_engine):
+    engine = sqlite_engine(CultureHub)
+    with engine.begin() as conn:
+        # 중심에서 북쪽으로 1km 간격 40곳 (반경 20km 안은 20곳)
+        for index in range(40):
+            lat = SEOUL_MUSEUM[0] + (index + 1) * 1000 / 111320.0
+            conn.execute(INSERT_EVENT, {'id': index + 1, 'start': '2024-05-01', 'end': '2024-05-31', 'lat': lat,
+                                        'lng': SEOUL_MUSEUM[1], 'geohash': encode_geohash(lat, SEOUL_MUSEUM[1])})
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda conn, cursor, statement, *args: statements.append(statement))
+    db = Session(engine)
+
+    events = find_nearby_events(db, *SEOUL_MUSEUM, 20000, on_date=date(2024, 5, 10), limit=5)
+    assert [item['id'] for item in events] == [1, 2, 3, 4, 5]
+    assert 'LIMIT' in statements[-1]
+
+    events = find_nearby_events(db, *SEOUL_MUSEUM, 20000, on_date=date(2024, 5, 10), limit=100)
+    assert [item['id'] for item in events] == list(range(1, 21))
@@ -0,0 +1,30 @@
+from app.domains.exhibition.ingestion_scheduler import (
+    DEFAULT_INTERVAL_MINUTES,
+    FAILURE_RETRY_MINUTES,
+    MAX_INTERVAL_MINUTES,
+    MIN_INTERVAL_MINUTES,
+    next_interval,
+    retry_interval,
+)
+
+
+def test_changes_shorten_the_interval():
+    assert next_interval(1440, changed_count=3) == 720
+
+
+def test_no_changes_lengthen_the_interval():
+    assert next_interval(1440, changed_count=0) == 2160
+
+
+def test_interval_stays_within_bounds():
+    assert next_interval(MIN_INTERVAL_MINUTES, changed_count=10) == MIN_INTERVAL_MINUTES
+    assert next_interval(MAX_INTERVAL_MINUTES, changed_count=0) == MAX_INTERVAL_MINUTES
+
+
+def test_missing_interval_uses_default():
+    assert next_interval(None, changed_count=0) == int(DEFAULT_INTERVAL_MINUTES * 1.5)
+
+
+def test_failures_retry_no_later_than_cap():
+    assert retry_interval(MAX_INTERVAL_MINUTES) == FAILURE_RETRY_MINUTES
+    assert retry_interval(MIN_INTERVAL_MINUTES) == MIN_INTERVAL_MINUTES
@@ -0,0 +1,33 @@
+from app.domains.exhibition.page_store import (
+    PAGE_SEPARATOR,
+    build_page_rows,
+    preview_text,
+    text_hash,
+)
+
+
+def test_page_rows_carry_offsets_into_document_text():
+    pages = ['첫 페이지', '', '세 번째 페이지']
+    rows = build_page_rows(pages, 'serial')
+    document = PAGE_SEPARATOR.join(pages)
+
+    assert [row['page_number'] for row in rows] == [1, 2, 3]
+    for row, page in zip(rows, pages):
+        assert document[row['char_start']:row['char_end']] == page
+    assert rows[2]['text_hash'] == text_hash('세 번째 페이지')
+    assert rows[0]['extraction_method'] == 'serial'
+
+
+def test_unchanged_page_keeps_hash():
+    before = build_page_rows(['a', 'b'], 'serial')
+    after = build_page_rows(['a', 'B'], 'parallel')
+
+    assert before[0]['text_hash'] == after[0]['text_hash']
+    assert before[1]['text_hash'] != after[1]['text_hash']
+
+
+def test_preview_stops_at_limit():
+    pages = ['x' * 30, 'y' * 30, 'z' * 30]
+
+    assert preview_text(pages, limit=40) == 'x' * 30 + PAGE_SEPARATOR + 'y' * 9
+    assert preview_text(['', '본문'], limit=40) == '본문'
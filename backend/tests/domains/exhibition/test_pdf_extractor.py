@@ -0,0 +1,96 @@
+import pytest
+
+from app.domains.exhibition.pdf_extractor import (
+    ExtractionError,
+    PageTextCache,
+    extract_pdf_pages,
+    file_extension,
+    open_document,
+)
+
+
+def build_pdf(page_texts):
+    """페이지마다 한 줄짜리 텍스트가 있는 최소 PDF"""
+    page_count = len(page_texts)
+    font_id = 3 + page_count * 2
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{3 + i * 2} 0 R" for i in range(page_count)), page_count)).encode(),
+        font_id: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for i, text in enumerate(page_texts):
+        page_id, content_id = 3 + i * 2, 4 + i * 2
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects[page_id] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                            f"/Resources << /Font << /F1 {font_id} 0 R >> >> "
+                            f"/Contents {content_id} 0 R >>").encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += b"%d 0 obj\n%s\nendobj\n" % (obj_id, objects[obj_id])
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for obj_id in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[obj_id]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+@pytest.fixture
+def catalog_pdf(tmp_path):
+    path = tmp_path / "catalog.pdf"
+    path.write_bytes(build_pdf([f"Page {i + 1} artwork" for i in range(25)]))
+    return str(path)
+
+
+def test_extracts_every_page_without_truncation(catalog_pdf):
+    with open_document(catalog_pdf) as source:
+        extraction = extract_pdf_pages(source, max_workers=1, cache=None)
+
+    assert extraction.page_count == 25
+    assert extraction.method == 'serial'
+    assert extraction.pages[24] == 'Page 25 artwork'
+
+
+def test_parallel_extraction_matches_serial(catalog_pdf):
+    with open_document(catalog_pdf) as source:
+        serial = extract_pdf_pages(source, max_workers=1, cache=None)
+        parallel = extract_pdf_pages(source, max_workers=2, cache=None)
+
+    assert parallel.method == 'parallel'
+    assert parallel.pages == serial.pages
+
+
+def test_cached_pages_are_not_parsed_again(catalog_pdf):
+    cache = PageTextCache()
+    with open_document(catalog_pdf) as source:
+        first = extract_pdf_pages(source, max_workers=1, cache=cache)
+        second = extract_pdf_pages(source, max_workers=1, cache=cache)
+
+    assert first.cached_pages == 0
+    assert second.method == 'cache'
+    assert second.cached_pages == 25
+    assert second.pages == first.pages
+
+
+def test_cache_evicts_oldest_pages():
+    cache = PageTextCache(max_pages=2)
+    cache.put_many('a', {0: 'x', 1: 'y'})
+    cache.put_many('b', {0: 'z'})
+
+    assert cache.get_many('a', 2) == {1: 'y'}
+    assert len(cache) == 2
+
+
+def test_missing_local_file_raises():
+    with pytest.raises(ExtractionError):
+        with open_document('/nonexistent/catalog.pdf'):
+            pass
+
+
+def test_file_extension_ignores_query_string():
+    assert file_extension('https://cdn.example.com/files/a.PDF?X-Amz=1') == '.pdf'
@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from app.domains.exhibition.cultural_hub_ai_system import CulturalHubAPISystem
+from app.domains.exhibition.source_adapters import (
+    CULTURAL_API_CONFIG,
+    SOURCE_ADAPTERS,
+    DaeguAdapter,
+    JejuAdapter,
+    KcisaAdapter,
+    SemaArchiveAdapter,
+    SourceAdapter,
+    get_source_adapter,
+)
+
+KCISA_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header><resultCode>0000</resultCode><resultMsg>OK</resultMsg></header>
+  <body>
+    <totalCount>2</totalCount>
+    <items>
+      <item><TITLE>전시 A</TITLE><LOCAL_ID>A1</LOCAL_ID></item>
+      <item><TITLE>전시 B</TITLE><LOCAL_ID>B1</LOCAL_ID></item>
+    </items>
+  </body>
+</response>""".encode('utf-8')
+
+JEJU_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<jejunetApi>
+  <resultCode>00</resultCode><resultMsg>OK</resultMsg>
+  <items><item><title>제주 전시</title><seq>77</seq><start>2024-01-01</start><end>2024-02-01</end></item></items>
+</jejunetApi>""".encode('utf-8')
+
+DAEGU_JSON = json.dumps([
+    {'subject': '대구 공연', 'event_seq': 5, 'start_date': '2024-03-01', 'end_date': '2024-03-05'},
+], ensure_ascii=False).encode('utf-8')
+
+SEMA_HTML = (
+    '<html><body>{result={"rows": [{"fields": {"I_TITLE": "아카이브 자료"}, "location": {"rowid": 9}}]}, '
+    'totCnt=1, message=OK, list=[], status=success}</body></html>'
+).encode('utf-8')
+
+
+def test_registry_covers_every_configured_source():
+    assert set(SOURCE_ADAPTERS) == set(CULTURAL_API_CONFIG)
+    assert isinstance(SOURCE_ADAPTERS['arts_center'], KcisaAdapter)
+    assert isinstance(SOURCE_ADAPTERS['jeju_culture'], JejuAdapter)
+    assert isinstance(SOURCE_ADAPTERS['daegu_culture'], DaeguAdapter)
+    assert isinstance(SOURCE_ADAPTERS['sema_archive'], SemaArchiveAdapter)
+
+
+def test_urls_and_params():
+    assert SOURCE_ADAPTERS['museum_catalog'].url == 'https://api.kcisa.kr/API_CNV_049/request'
+    assert SOURCE_ADAPTERS['arts_center'].url.startswith('https://api.kcisa.kr/openapi/')
+    assert SOURCE_ADAPTERS['arts_center'].build_params(3)['pageNo'] == 3
+    assert SOURCE_ADAPTERS['arts_center'].test_params()['numOfRows'] == 5
+    assert SOURCE_ADAPTERS['jeju_culture'].build_params(1) == {}
+    assert SOURCE_ADAPTERS['sema_archive'].build_params(2)['page'] == '2'
+    assert 'page' not in SOURCE_ADAPTERS['sema_archive'].test_params()
+
+
+def test_kcisa_parse_and_extract():
+    adapter = SOURCE_ADAPTERS['arts_center']
+    success, data, _ = adapter.parse_response(KCISA_XML)
+    assert success
+    items, total = adapter.extract_items(data)
+    assert total == 2
+    assert [item['TITLE'] for item in items] == ['전시 A', '전시 B']
+
+
+def test_kcisa_error_code_fails():
+    adapter = SOURCE_ADAPTERS['arts_center']
+    body = KCISA_XML.replace(b'0000', b'99')
+    success, data, message = adapter.parse_response(body)
+    assert not success and data is None
+    assert '99' in message
+
+
+def test_special_sources_return_standard_structure():
+    for api_key, content in [('jeju_culture', JEJU_XML), ('daegu_culture', DAEGU_JSON), ('sema_archive', SEMA_HTML)]:
+        adapter = SOURCE_ADAPTERS[api_key]
+        success, data, _ = adapter.parse_response(content, 'utf-8')
+        assert success, api_key
+        items, total = adapter.extract_items(data)
+        assert total == 1 and len(items) == 1
+
+
+def test_normalize_extras_apply_source_overrides():
+    adapter = SOURCE_ADAPTERS['sema_archive']
+    _, data, _ = adapter.parse_response(SEMA_HTML)
+    item = adapter.extract_items(data)[0][0]
+    assert adapter.item_fields(item)['I_TITLE'] == '아카이브 자료'
+
+    normalized = {}
+    adapter.normalize_extras(item, normalized)
+    assert normalized['api_source'] == '서울시립미술관 아카이브'
+    assert normalized['전시ID'] == '9'
+
+    jeju = SOURCE_ADAPTERS['jeju_culture']
+    normalized = {}
+    jeju.normalize_extras({'seq': 77, 'start': '2024-01-01', 'end': '2024-02-01'}, normalized)
+    assert normalized['연계기관명'] == '제주문화예술진흥원'
+    assert normalized['시작일'] == '2024-01-01' and normalized['종료일'] == '2024-02-01'
+
+
+def test_get_source_adapter_builds_for_custom_config():
+    config = dict(CULTURAL_API_CONFIG['arts_center'], endpoint='custom/request')
+    adapter = get_source_adapter('arts_center', config)
+    assert adapter is not SOURCE_ADAPTERS['arts_center']
+    assert adapter.url.endswith('/custom/request')
+    assert get_source_adapter('arts_center') is SOURCE_ADAPTERS['arts_center']
+
+
+def test_base_adapter_requires_request_and_parse_methods():
+    with pytest.raises(TypeError):
+        SourceAdapter('arts_center', CULTURAL_API_CONFIG['arts_center'])
+
+
+def test_zero_record_id_is_kept():
+    normalized = {}
+    SOURCE_ADAPTERS['daegu_culture'].normalize_extras({'event_seq': 0}, normalized)
+    assert normalized['전시ID'] == '0'
+
+    normalized = {}
+    SOURCE_ADAPTERS['sema_archive'].normalize_extras({'location': {'rowid': 0}}, normalized)
+    assert normalized['전시ID'] == '0'
+
+
+def test_unpaged_sources_are_requested_once_on_failure():
+    system = CulturalHubAPISystem()
+    calls = []
+
+    def failing_call(api_key, config, params, *args):
+        calls.append(api_key)
+        return False, None, 'timeout'
+
+    system.safe_cultural_api_call = failing_call
+    for api_key in ('jeju_culture', 'daegu_culture'):
+        assert system.collect_cultural_data_safely(api_key, CULTURAL_API_CONFIG[api_key]) == []
+    assert calls == ['jeju_culture', 'daegu_culture']
@@ -0,0 +1,48 @@
+import pytest
+
+from app.domains.exhibition.text_chunker import (
+    chunk_text,
+    chunk_texts,
+    estimate_tokens,
+    iter_sentences,
+)
+
+
+def test_sentences_split_on_korean_endings_and_rejoin_to_original():
+    text = "전시는 5월에 시작한다. 작가는 김환기이다.\n이 작품은 1970년에 제작되었다\n다음 문단입니다!\n\nEnglish here."
+    sentences = list(iter_sentences(text))
+
+    assert sentences[2] == '이 작품은 1970년에 제작되었다\n'
+    assert ''.join(sentences) == text
+
+
+def test_chunks_respect_token_limit_and_overlap():
+    text = ' '.join(f"{i}번째 문장입니다." for i in range(200))
+    chunks = list(chunk_text(text, max_tokens=60, overlap_tokens=15, counter=estimate_tokens))
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 60 for chunk in chunks)
+    # 다음 청크는 앞 청크의 마지막 문장으로 시작
+    last_sentence = ' '.join(chunks[0].split(' ')[-2:])
+    assert chunks[1].startswith(last_sentence)
+    assert chunks[-1].endswith('199번째 문장입니다.')
+
+
+def test_sentence_longer_than_limit_is_split_on_spaces():
+    text = '가나다 ' * 300
+    chunks = list(chunk_text(text, max_tokens=100, overlap_tokens=10, counter=estimate_tokens))
+
+    assert all(estimate_tokens(chunk) <= 100 for chunk in chunks)
+    assert all(not chunk.startswith('나') for chunk in chunks)
+
+
+def test_pages_are_chunked_as_one_stream():
+    chunks = list(chunk_texts(['첫 페이지 문장.', '', '둘째 페이지 문장.'], max_tokens=100, overlap_tokens=10,
+                              counter=estimate_tokens))
+
+    assert chunks == ['첫 페이지 문장.\n둘째 페이지 문장.']
+
+
+def test_overlap_must_be_smaller_than_limit():
+    with pytest.raises(ValueError):
+        list(chunk_text('문장.', max_tokens=10, overlap_tokens=10))
@@ -0,0 +1,64 @@
+import uuid
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.domains.notice import services
+from app.domains.notice.models import UserNoticeRead, UserNoticeReadBitmap
+from app.domains.notice.read_bitmap import bitmap_from_ids, count_unread, from_bytes, set_bit
+
+USER_ID = uuid.UUID('00000000-0000-0000-0000-000000000001')
+
+
+def test_bitmap_round_trip():
+    bitmap = bitmap_from_ids([1, 3, 200])
+
+    assert len(bitmap) == 26
+    assert from_bytes(bitmap) == (1 << 1) | (1 << 3) | (1 << 200)
+    assert bitmap_from_ids([]) == b''
+
+
+def test_set_bit_grows_bitmap():
+    bitmap = set_bit(b'', 5)
+    bitmap = set_bit(bitmap, 5)
+    bitmap = set_bit(bitmap, 64)
+
+    assert bitmap == bitmap_from_ids([5, 64])
+
+
+def test_count_unread_ignores_read_notices_that_are_no_longer_visible():
+    visible = bitmap_from_ids([2, 4, 7, 9])
+    read = bitmap_from_ids([1, 4, 9, 300])
+
+    assert count_unread(visible, read) == 2
+    assert count_unread(visible, b'') == 4
+    assert count_unread(b'', read) == 0
+
+
+def make_session(sqlite_engine):
+    engine = sqlite_engine(UserNoticeRead, UserNoticeReadBitmap)
+    with engine.begin() as conn:
+        conn.execute(text(f"INSERT INTO user_notice_reads VALUES ('{USER_ID.hex}', 3, 1, CURRENT_TIMESTAMP)"))
+    return engine, Session(engine)
+
+
+def test_concurrent_first_bitmap_build_keeps_one_row(sqlite_engine):
+    engine, db = make_session(sqlite_engine)
+    raced = []
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def other_request_inserts_first(conn, cursor, statement, parameters, context, executemany):
+        # 같은 사용자의 다른 요청이 조회와 INSERT 사이에 먼저 비트맵을 만든 상황
+        if statement.startswith('INSERT INTO user_notice_read_bitmaps') and not raced:
+            raced.append(True)
+            cursor.execute(
+                "INSERT INTO user_notice_read_bitmaps (user_id, bitmap) VALUES (?, ?)",
+                (USER_ID.hex, bitmap_from_ids([3]))
+            )
+
+    services._mark_read_bit(db, USER_ID, 5)
+
+    rows = db.query(UserNoticeReadBitmap).all()
+    assert raced and len(rows) == 1
+    assert from_bytes(rows[0].bitmap) & (1 << 3) and from_bytes(rows[0].bitmap) & (1 << 5)
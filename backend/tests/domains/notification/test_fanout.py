@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import app.db  # noqa: F401 - 모델 등록 순서 (notification.models를 먼저 불러오면 순환 import)
+from app.domains.notification import fanout
+from app.domains.notification.fanout import (
+    DELIVERY_COMPLETED, DELIVERY_RUNNING, chunk_statement, delivery_progress
+)
+
+
+def make_notification(status, target, delivered):
+    return SimpleNamespace(notification_id=7, delivery_status=status, target_count=target, recipient_count=delivered)
+
+
+def test_chunk_statement_uses_keyset_cursor_and_opt_out_filter():
+    first = chunk_statement(has_cursor=False)
+    resumed = chunk_statement(has_cursor=True)
+
+    assert ':cursor' not in first
+    assert 'u.user_id > CAST(:cursor AS uuid)' in resumed
+    for statement in (first, resumed):
+        assert 'INSERT INTO user_notifications' in statement
+        assert 's.is_enabled = FALSE' in statement
+        assert 'ON CONFLICT DO NOTHING' in statement
+
+
+def test_delivery_progress_percentage():
+    assert delivery_progress(make_notification(DELIVERY_RUNNING, 200, 50))['percentage'] == 25
+    # 수신 거부로 대상보다 적게 보내도 완료면 100
+    assert delivery_progress(make_notification(DELIVERY_COMPLETED, 200, 180))['percentage'] == 100
+    # 진행 중에는 100을 넘기거나 채우지 않음
+    assert delivery_progress(make_notification(DELIVERY_RUNNING, 100, 120))['percentage'] == 99
+    assert delivery_progress(make_notification(DELIVERY_RUNNING, None, 0))['percentage'] == 0
+
+
+class LockingSession:
+    """advisory lock 결과만 흉내 내는 세션"""
+
+    def __init__(self, locked, notification=None):
+        self.bind = SimpleNamespace(dialect=SimpleNamespace(name='postgresql'))
+        self.locked = locked
+        self.notification = notification
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+        return SimpleNamespace(scalar=lambda: self.locked)
+
+    def get(self, model, notification_id):
+        return self.notification
+
+    def rollback(self):
+        pass
+
+    def commit(self):
+        pass
+
+
+def test_fan_out_runs_only_in_the_worker_holding_the_lock(monkeypatch):
+    sent = []
+    monkeypatch.setattr(fanout, 'fan_out', lambda db, notification_id: sent.append(notification_id))
+
+    busy = LockingSession(locked=False)
+    assert fanout.run_fan_out(busy, 7) is None
+    assert not any('pg_advisory_unlock' in statement for statement in busy.statements)
+
+    finished = LockingSession(locked=True, notification=make_notification(DELIVERY_COMPLETED, 10, 10))
+    assert fanout.run_fan_out(finished, 7) is None
+
+    owner = LockingSession(locked=True, notification=make_notification(DELIVERY_RUNNING, 10, 5))
+    fanout.run_fan_out(owner, 7)
+    assert sent == [7]
+    assert 'pg_advisory_unlock' in owner.statements[-1]
@@ -0,0 +1,99 @@
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서 (notification.models를 먼저 불러오면 순환 import)
+from app.domains.notification import inbox
+from app.domains.notification.inbox import inbox_select
+from app.domains.notification.models import (
+    Notification,
+    UserNotification,
+    UserNotificationMark,
+    UserNotificationSetting,
+)
+from app.domains.user.models import User
+
+MEMBER = UUID('00000000-0000-0000-0000-000000000001')
+WITHDRAWN = UUID('00000000-0000-0000-0000-000000000002')
+OTHER = UUID('00000000-0000-0000-0000-000000000003')
+
+USER_COLUMNS = "user_id, email, nickname, birthdate, gender, status, role, marketing_agreed, is_corporate, created_at"
+ROWS = [
+    f"INSERT INTO users ({USER_COLUMNS}) VALUES ('{MEMBER.hex}', 'a@test', 'a', '1990-01-01', 'N', 'ACTIVE', "
+    "'USER', 0, 0, '2024-01-01 00:00:00')",
+    f"INSERT INTO users ({USER_COLUMNS}) VALUES ('{WITHDRAWN.hex}', 'b@test', 'b', '1990-01-01', 'N', 'WITHDRAWN', "
+    "'USER', 0, 0, '2024-01-01 00:00:00')",
+    f"INSERT INTO users ({USER_COLUMNS}) VALUES ('{OTHER.hex}', 'c@test', 'c', '1990-01-01', 'N', 'ACTIVE', "
+    "'USER', 0, 0, '2024-01-01 00:00:00')",
+    # 가입 전 전체 알림, 전체 알림, 지정 알림, 수신 거부한 유형의 전체 알림
+    "INSERT INTO notifications (notification_id, type, message, created_at, audience) "
+    "VALUES (1, 'SYSTEM_NOTICE', '가입 전 공지', '2023-12-01 00:00:00', 'ALL')",
+    "INSERT INTO notifications (notification_id, type, message, created_at, audience) "
+    "VALUES (2, 'SYSTEM_NOTICE', '전체 공지', '2024-02-01 00:00:00', 'ALL')",
+    "INSERT INTO notifications (notification_id, type, message, created_at, audience) "
+    "VALUES (3, 'TOKEN_UPDATE', '스톤 충전', '2024-02-02 00:00:00', NULL)",
+    "INSERT INTO notifications (notification_id, type, message, created_at, audience) "
+    "VALUES (4, 'CONTENT_UPDATE', '콘텐츠 소식', '2024-02-03 00:00:00', 'ALL')",
+    f"INSERT INTO user_notifications (user_id, notification_id, is_read, is_dismissed) VALUES ('{MEMBER.hex}', 3, 0, 0)",
+    "INSERT INTO user_notification_settings (setting_id, user_id, notification_type, is_enabled) "
+    f"VALUES (1, '{MEMBER.hex}', 'CONTENT_UPDATE', 0)",
+    "INSERT INTO user_notification_marks (user_id, broadcast_read_through, updated_at) "
+    f"VALUES ('{OTHER.hex}', 2, '2024-02-05 00:00:00')",
+]
+
+
+def make_session(sqlite_engine):
+    engine = sqlite_engine(User, Notification, UserNotification, UserNotificationMark, UserNotificationSetting)
+    with engine.begin() as conn:
+        for statement in ROWS:
+            conn.execute(text(statement))
+    return Session(engine)
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def test_inbox_merges_targeted_and_broadcast_branches():
+    sql = compile_sql(select(inbox_select(uuid4())))
+
+    assert sql.count('UNION ALL') == 1
+    # 지정 알림은 사용자 행이 있어야 하고, 전체 알림은 행이 없어도 (LEFT OUTER JOIN) 보임
+    assert 'notifications.audience IS NULL' in sql
+    assert 'LEFT OUTER JOIN user_notifications' in sql
+    assert 'user_notification_marks.broadcast_read_through' in sql
+    assert 'user_notification_settings.is_enabled = false' in sql
+
+
+def test_inbox_item_filters_both_branches():
+    sql = compile_sql(select(inbox_select(uuid4(), notification_id=3)))
+
+    assert sql.count('notifications.notification_id = %(notification_id_') == 2
+
+
+def test_inbox_returns_visible_notifications_for_active_users_only(sqlite_engine):
+    db = make_session(sqlite_engine)
+
+    items, total = inbox.list_inbox(db, MEMBER)
+    assert [item['notification_id'] for item in items] == [3, 2]
+    assert total == 2
+    assert inbox.count_unread(db, MEMBER) == 2
+
+    # 탈퇴한 사용자에게는 전체 알림이 보이지 않음
+    assert inbox.list_inbox(db, WITHDRAWN) == ([], 0)
+
+
+def test_reading_a_broadcast_twice_creates_one_row(sqlite_engine):
+    db = make_session(sqlite_engine)
+
+    assert inbox.mark_read(db, 2, MEMBER)
+    assert inbox.mark_read(db, 2, MEMBER)
+    assert db.query(UserNotification).filter(UserNotification.notification_id == 2).count() == 1
+    assert inbox.count_unread(db, MEMBER) == 1
+    # 탈퇴한 사용자는 행을 만들지 않음
+    assert not inbox.mark_read(db, 2, WITHDRAWN)
+
+    # 개별 읽음(MEMBER) + 모두 읽음 기준(OTHER)
+    assert inbox.broadcast_read_counts(db, [2, 4]) == {2: 2, 4: 0}
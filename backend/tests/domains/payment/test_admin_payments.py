@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.core import response_cache
+from app.core.response_cache import MemoryBackend, ResponseCache
+from app.domains.inquiry.models import Inquiry
+from app.domains.payment import services
+from app.domains.payment.models import Payment, Refund
+from app.domains.subscription.models import SubscriptionPlan, UserSubscription
+from app.domains.token.models import TokenPlan
+from app.domains.user.models import User
+
+USER = uuid.UUID('00000000-0000-0000-0000-000000000001')
+
+
+def add_payment(db, number):
+    db.add(Payment(user_id=USER, payment_number=f"p{number}", amount=9900, payment_method='kakaopay',
+                   payment_date=datetime(2024, 5, 1, 0, number), status='SUCCESS'))
+    db.commit()
+
+
+def make_session(sqlite_engine, monkeypatch):
+    engine = sqlite_engine(Payment, User, Refund, Inquiry, TokenPlan, UserSubscription, SubscriptionPlan)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO users (user_id, email, nickname, birthdate, gender, status, role, marketing_agreed, "
+            f"is_corporate) VALUES ('{USER.hex}', 'a@test', '회원', '1990-01-01', 'N', 'ACTIVE', 'USER', 0, 0)"
+        ))
+    monkeypatch.setattr(response_cache, '_response_cache', ResponseCache(MemoryBackend()))
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda conn, cursor, statement, *args: statements.append(statement))
+    db = Session(engine)
+    for number in range(5):
+        add_payment(db, number)
+    return db, statements
+
+
+def admin_page(db, page, **filters):
+    return services.get_admin_payments(db, filters.get('query'), None, None, filters.get('payment_method'),
+                                       page, 2, 'payment_date:desc', filters.get('status'))
+
+
+def test_total_count_is_counted_on_first_page_and_reused_for_later_pages(sqlite_engine, monkeypatch):
+    db, statements = make_session(sqlite_engine, monkeypatch)
+
+    payments, total = admin_page(db, 1)
+    assert [payment.amount for payment in payments] == [9900, 9900] and total == 5
+    assert not any('OVER' in statement for statement in statements)
+
+    add_payment(db, 5)
+    del statements[:]
+    payments, total = admin_page(db, 2)
+    assert len(payments) == 2 and total == 5
+    assert not any('count(' in statement for statement in statements)
+
+    # 첫 페이지를 다시 열거나 필터를 바꾸면 다시 셈
+    assert admin_page(db, 1)[1] == 6
+    assert admin_page(db, 2, payment_method='manual') == ([], 0)
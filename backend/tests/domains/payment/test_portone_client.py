@@ -0,0 +1,234 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.domains.payment.portone_client import PortOneClient, PortOneError
+
+
+class FakePortOne:
+    """로컬 포트원 API (토큰 발급, 결제 조회, 예약 조회/취소, 결제 취소)"""
+
+    def __init__(self):
+        self.token_calls = 0
+        self.requests = []
+        self.fail_next_gets = 0
+        self.token_ttl = 1800
+        self.token_delay = 0.0
+        self.valid_tokens = set()
+        self.executed_schedules = set()
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _body(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                return json.loads(self.rfile.read(length) or b'{}')
+
+            def _authorized(self):
+                token = (self.headers.get('Authorization') or '').replace('Bearer ', '')
+                if token not in fake.valid_tokens:
+                    self._send(401, {'code': -1, 'message': 'Unauthorized', 'response': None})
+                    return False
+                return True
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                body = self._body()
+                fake.requests.append(('POST', url.path, body))
+                if url.path == '/users/getToken':
+                    time.sleep(fake.token_delay)
+                    with fake._lock:
+                        fake.token_calls += 1
+                        token = f'token-{fake.token_calls}'
+                        fake.valid_tokens.add(token)
+                    now = 1_700_000_000
+                    self._send(200, {'code': 0, 'message': None, 'response': {
+                        'access_token': token, 'now': now, 'expired_at': now + fake.token_ttl}})
+                    return
+                if not self._authorized():
+                    return
+                if url.path == '/payments/cancel':
+                    if body.get('imp_uid') == 'imp_refunded':
+                        self._send(200, {'code': 1, 'message': '이미 취소된 결제', 'response': None})
+                    else:
+                        self._send(200, {'code': 0, 'message': None, 'response': {'imp_uid': body['imp_uid'], 'status': 'cancelled'}})
+                elif url.path == '/subscribe/payments/unschedule':
+                    # 이미 결제된 예약이 섞여 있으면 요청 전체를 거절
+                    if fake.executed_schedules & set(body['merchant_uid']):
+                        self._send(200, {'code': 1, 'message': '취소할 수 없는 예약', 'response': None})
+                    else:
+                        self._send(200, {'code': 0, 'message': None, 'response': [{'merchant_uid': uid} for uid in body['merchant_uid']]})
+                else:
+                    self._send(404, {'code': -1, 'message': 'not found', 'response': None})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                fake.requests.append(('GET', url.path, parse_qs(url.query)))
+                if not self._authorized():
+                    return
+                if fake.fail_next_gets:
+                    fake.fail_next_gets -= 1
+                    self._send(503, {'code': -1, 'message': 'unavailable', 'response': None})
+                elif url.path.startswith('/payments/'):
+                    imp_uid = url.path.rsplit('/', 1)[1]
+                    self._send(200, {'code': 0, 'message': None, 'response': {'imp_uid': imp_uid, 'status': 'paid'}})
+                elif url.path == '/subscribe/payments/schedule':
+                    page = int(parse_qs(url.query)['page'][0])
+                    self._send(200, {'code': 0, 'message': None, 'response': {
+                        'total': 3, 'previous': page - 1, 'next': page + 1 if page < 2 else 0,
+                        'list': [{'customer_uid': f'cust_{page}', 'merchant_uid': f'sub_{page}_{i}'} for i in range(2 if page == 1 else 1)]}})
+                elif url.path.startswith('/subscribe/payments/schedule/customers/'):
+                    self._send(200, {'code': 0, 'message': None, 'response': {'list': [
+                        {'merchant_uid': 'sub_1'}, {'merchant_uid': 'sub_2'}]}})
+                else:
+                    self._send(404, {'code': -1, 'message': 'not found', 'response': None})
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def portone():
+    fake = FakePortOne()
+    yield fake
+    fake.stop()
+
+
+def make_client(fake, clock=None):
+    return PortOneClient(fake.url, 'key', 'secret', clock=clock or time.time)
+
+
+def test_token_is_cached_until_shortly_before_expiry(portone):
+    clock = FakeClock()
+    client = make_client(portone, clock)
+
+    assert client.get_payment('imp_1')['imp_uid'] == 'imp_1'
+    client.get_payment('imp_2')
+    assert portone.token_calls == 1
+
+    clock.now += 1800 - 30
+    client.get_payment('imp_3')
+    assert portone.token_calls == 2
+    client.close()
+
+
+def test_concurrent_requests_share_one_token_refresh(portone):
+    portone.token_delay = 0.2
+    client = make_client(portone)
+    errors = []
+
+    def call():
+        try:
+            client.get_payment('imp_1')
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert portone.token_calls == 1
+    client.close()
+
+
+def test_revoked_token_is_refreshed_once(portone):
+    client = make_client(portone)
+    client.access_token()
+    portone.valid_tokens.clear()
+
+    client.get_payment('imp_1')
+
+    assert portone.token_calls == 2
+    client.close()
+
+
+def test_get_retries_server_errors_but_post_reports_api_errors(portone):
+    client = make_client(portone)
+    portone.fail_next_gets = 2
+
+    assert client.get_payment('imp_1')['status'] == 'paid'
+    with pytest.raises(PortOneError) as error:
+        client.cancel_payment({'imp_uid': 'imp_refunded'})
+    assert error.value.message == '이미 취소된 결제'
+    assert sum(1 for method, path, _ in portone.requests if path == '/payments/cancel') == 1
+    client.close()
+
+
+def test_schedules_and_unschedule(portone):
+    client = make_client(portone)
+
+    schedules = client.get_schedules('cust_1')
+    client.unschedule('cust_1', [schedule['merchant_uid'] for schedule in schedules])
+
+    get = next(request for request in portone.requests if request[1].startswith('/subscribe/payments/schedule'))
+    assert get[2] == {'schedule-status': ['scheduled']}
+    assert portone.requests[-1] == ('POST', '/subscribe/payments/unschedule',
+                                    {'customer_uid': 'cust_1', 'merchant_uid': ['sub_1', 'sub_2']})
+    client.close()
+
+
+def test_unschedule_many_sends_one_request(portone):
+    client = make_client(portone)
+    failed = client.unschedule_many('cust_1', ['sub_1', 'sub_2', 'sub_3'])
+
+    unschedules = [request for request in portone.requests if request[1] == '/subscribe/payments/unschedule']
+    assert failed == {}
+    assert len(unschedules) == 1
+    client.close()
+
+
+def test_unschedule_many_falls_back_to_concurrent_single_requests(portone):
+    portone.executed_schedules = {'sub_2'}
+    client = make_client(portone)
+
+    failed = client.unschedule_many('cust_1', ['sub_1', 'sub_2', 'sub_3'])
+
+    unschedules = [request[2]['merchant_uid'] for request in portone.requests
+                   if request[1] == '/subscribe/payments/unschedule']
+    assert failed == {'sub_2': '취소할 수 없는 예약'}
+    assert unschedules[0] == ['sub_1', 'sub_2', 'sub_3']
+    assert sorted(unschedules[1:]) == [['sub_1'], ['sub_2'], ['sub_3']]
+    client.close()
+
+
+def test_iter_schedules_follows_pages(portone):
+    client = make_client(portone)
+
+    schedules = list(client.iter_schedules(1_700_000_000, 1_705_000_000))
+
+    assert [schedule['merchant_uid'] for schedule in schedules] == ['sub_1_0', 'sub_1_1', 'sub_2_0']
+    client.close()
@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.domains.payment import schedule_reconcile
+from app.domains.subscription.models import UserSubscription
+
+SUBSCRIPTIONS = [
+    # 해지했는데 예약이 남음
+    "INSERT INTO user_subscriptions VALUES (1, 'u1', 1, '2024-04-10', '2024-05-09', '2024-05-10', 'CANCELLED', 'cust_cancelled', 'card')",
+    # 정상
+    "INSERT INTO user_subscriptions VALUES (2, 'u2', 1, '2024-04-20', '2024-05-19', '2024-05-20', 'ACTIVE', 'cust_ok', 'card')",
+    # 활성인데 예약 없음
+    "INSERT INTO user_subscriptions VALUES (3, 'u3', 1, '2024-04-25', '2024-05-24', '2024-05-25', 'ACTIVE', 'cust_missing', 'card')",
+    # 수동 결제 구독은 예약이 없어도 정상
+    "INSERT INTO user_subscriptions VALUES (4, 'u4', 1, '2024-04-25', '2024-05-24', '2024-05-25', 'ACTIVE', 'cust_manual', '수동결제')",
+    # 예약 두 건
+    "INSERT INTO user_subscriptions VALUES (5, 'u5', 1, '2024-04-15', '2024-05-14', '2024-05-15', 'ACTIVE', 'cust_double', 'card')",
+]
+
+SCHEDULES = [
+    {'customer_uid': 'cust_cancelled', 'merchant_uid': 'sub_a'},
+    {'customer_uid': 'cust_cancelled', 'merchant_uid': 'sub_b'},
+    {'customer_uid': 'cust_ok', 'merchant_uid': 'sub_c'},
+    {'customer_uid': 'cust_double', 'merchant_uid': 'sub_d'},
+    {'customer_uid': 'cust_double', 'merchant_uid': 'sub_e'},
+    {'customer_uid': 'cust_unknown', 'merchant_uid': 'sub_f'},
+]
+
+
+class FakeClient:
+    def __init__(self):
+        self.list_calls = []
+        self.unscheduled = []
+
+    def iter_schedules(self, schedule_from, schedule_to, schedule_status='scheduled'):
+        self.list_calls.append((schedule_from, schedule_to))
+        return iter(SCHEDULES)
+
+    def unschedule_many(self, customer_uid, merchant_uids):
+        self.unscheduled.append((customer_uid, merchant_uids))
+        return {}
+
+
+def make_session(sqlite_engine):
+    engine = sqlite_engine(UserSubscription)
+    with engine.begin() as conn:
+        for statement in SUBSCRIPTIONS:
+            conn.execute(text(statement))
+    return Session(engine)
+
+
+def test_reconcile_cancels_schedules_of_cancelled_subscriptions_in_one_pass(sqlite_engine):
+    client = FakeClient()
+
+    summary = schedule_reconcile.reconcile(make_session(sqlite_engine), client=client, now=datetime(2024, 5, 1, 4))
+
+    assert len(client.list_calls) == 1
+    assert client.unscheduled == [('cust_cancelled', ['sub_a', 'sub_b'])]
+    assert summary == {
+        'schedules': 6,
+        'subscriptions': 5,
+        'orphaned': 2,
+        'cancelled': 2,
+        'missing': 1,
+        'duplicated': 1,
+        'unknown': 1,
+    }
+
+
+def test_reconcile_dry_run_only_reports(sqlite_engine):
+    client = FakeClient()
+
+    summary = schedule_reconcile.reconcile(make_session(sqlite_engine), client=client, now=datetime(2024, 5, 1, 4), apply=False)
+
+    assert client.unscheduled == []
+    assert summary['orphaned'] == 2
+    assert summary['cancelled'] == 0
+
+
+def test_seconds_until_next_run():
+    assert schedule_reconcile.seconds_until(4, datetime(2024, 5, 1, 3, 30)) == 30 * 60
+    assert schedule_reconcile.seconds_until(4, datetime(2024, 5, 1, 4, 0)) == 24 * 3600
@@ -0,0 +1,211 @@
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy import event, text
+from sqlalchemy.orm import sessionmaker
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.domains.payment import webhook_queue
+from app.domains.payment.models import Payment, PaymentWebhookEvent
+from app.domains.subscription.models import SubscriptionPlan, UserSubscription
+from app.domains.token.models import Token, TokenPlan
+
+USER = uuid.UUID('00000000-0000-0000-0000-000000000001')
+PAYMENT_ID = uuid.UUID('00000000-0000-0000-0000-0000000000aa')
+
+FIXTURES = [
+    "INSERT INTO token_plans (token_plan_id, tokens, price, discounted_price, discount_rate, is_promotion) "
+    "VALUES (1, 100, 9900, 9900, 0, 0)",
+    f"INSERT INTO tokens VALUES (1, '{USER.hex}', 10, 0, NULL, NULL)",
+    "INSERT INTO subscription_plans (plan_id, plan_name, price, discounted_price, tokens_included, is_promotion) "
+    "VALUES (1, '월 구독', 9900, 9900, 0, 0)",
+    f"INSERT INTO user_subscriptions VALUES (1, '{USER.hex}', 1, '2024-05-01', '2024-05-31', '2024-06-01', "
+    "'ACTIVE', 'cust_1', 'card')",
+]
+
+# 포트원 결제 조회 응답 (merchant_uid/user_id는 SQLite 바인딩을 위해 UUID 객체)
+PAYMENTS = {
+    'imp_one': {
+        'imp_uid': 'imp_one', 'merchant_uid': PAYMENT_ID, 'pg_tid': 'tid_one', 'amount': 9900,
+        'pay_method': 'card', 'paid_at': 1714521600, 'name': '스톤 100개',
+        'custom_data': {'token_plan_id': 1, 'user_id': USER},
+    },
+    'imp_change': {
+        'imp_uid': 'imp_change', 'merchant_uid': 'change_1', 'customer_uid': 'cust_1', 'amount': 0,
+        'pay_method': 'card', 'paid_at': 1714521600, 'name': '월 구독 결제 방식 변경',
+    },
+}
+
+
+class FakePortOne:
+    """결제 조회와 정기결제 예약만 흉내 (예약은 빌링키별로 쌓임)"""
+
+    def __init__(self):
+        self.scheduled = defaultdict(list)
+
+    def get_payment(self, imp_uid):
+        return dict(PAYMENTS[imp_uid])
+
+    def get_schedules(self, customer_uid, schedule_status='scheduled'):
+        return list(self.scheduled[customer_uid])
+
+    def schedule(self, payload):
+        self.scheduled[payload['customer_uid']].extend(payload['schedules'])
+        return payload['schedules']
+
+
+def make_session_factory(sqlite_engine, url='sqlite://'):
+    engine = sqlite_engine(PaymentWebhookEvent, Payment, Token, TokenPlan, SubscriptionPlan, UserSubscription, url=url)
+    with engine.begin() as conn:
+        for statement in FIXTURES:
+            conn.execute(text(statement))
+    return sessionmaker(bind=engine)
+
+
+def use_portone(monkeypatch, client):
+    # 설정(.env)이 있어야 가져올 수 있는 모듈이라 결제 처리 테스트에서만 가져옴
+    from app.domains.payment import portone_services
+    monkeypatch.setattr(portone_services, 'get_portone_client', lambda: client)
+    return portone_services
+
+
+def webhook(imp_uid='imp_1', status='paid', merchant_uid='sub_1'):
+    return {'imp_uid': imp_uid, 'merchant_uid': merchant_uid, 'status': status, 'customer_uid': 'cust_1'}
+
+
+def balance_and_payments(db):
+    total_tokens = db.execute(text("SELECT total_tokens FROM tokens")).scalar()
+    return total_tokens, db.execute(text("SELECT COUNT(*) FROM payments")).scalar()
+
+
+def events(db):
+    return {event.event_id: event for event in db.query(PaymentWebhookEvent).all()}
+
+
+def test_enqueue_accepts_each_status_once(sqlite_engine):
+    db = make_session_factory(sqlite_engine)()
+
+    first = webhook_queue.enqueue(db, webhook())
+    assert first is not None
+    assert webhook_queue.enqueue(db, webhook()) is None
+    assert webhook_queue.enqueue(db, webhook(status='failed')) not in (None, first)
+    assert len(events(db)) == 2
+
+
+def test_worker_processes_event_once(sqlite_engine):
+    factory = make_session_factory(sqlite_engine)
+    db = factory()
+    event_id = webhook_queue.enqueue(db, webhook())
+    handled = []
+    worker = webhook_queue.WebhookWorker(factory, handler=lambda session, event: handled.append(event['imp_uid']))
+
+    assert worker.run_pending() == 1
+    assert worker.run_one() is None
+    assert handled == ['imp_1']
+    event = events(factory())[event_id]
+    assert event.processing_status == webhook_queue.STATUS_DONE
+    assert event.attempts == 1
+
+
+def test_failed_event_is_retried_later_then_parked_for_replay(sqlite_engine):
+    factory = make_session_factory(sqlite_engine)
+    event_id = webhook_queue.enqueue(factory(), webhook())
+
+    def fail(session, event):
+        raise HTTPException(status_code=404, detail="구독 정보를 찾을 수 없습니다.")
+
+    worker = webhook_queue.WebhookWorker(factory, handler=fail)
+    assert worker.run_one() == webhook_queue.STATUS_PENDING
+    # 다음 시도 시각 전에는 가져가지 않음
+    assert worker.run_one() is None
+
+    db = factory()
+    event = events(db)[event_id]
+    assert event.last_error == "404: 구독 정보를 찾을 수 없습니다."
+    assert event.next_attempt_at > datetime.now()
+
+    status = webhook_queue.mark_failed(db, event_id, webhook_queue.MAX_ATTEMPTS, 'error')
+    assert status == webhook_queue.STATUS_FAILED
+    assert [event['event_id'] for event in webhook_queue.list_events(db)] == [event_id]
+
+    assert webhook_queue.replay(db) == 1
+    claimed = webhook_queue.claim_next(db)
+    assert claimed['event_id'] == event_id
+    assert claimed['attempts'] == 1
+
+
+def test_stale_processing_event_is_reclaimed(sqlite_engine):
+    db = make_session_factory(sqlite_engine)()
+    event_id = webhook_queue.enqueue(db, webhook())
+    now = datetime.now()
+
+    assert webhook_queue.claim_next(db, now=now)['event_id'] == event_id
+    assert webhook_queue.claim_next(db, now=now + timedelta(minutes=1)) is None
+    reclaimed = webhook_queue.claim_next(db, now=now + webhook_queue.STALE_PROCESSING + timedelta(seconds=1))
+    assert reclaimed['event_id'] == event_id
+    assert reclaimed['attempts'] == 2
+
+
+def test_paid_event_processed_twice_credits_once(monkeypatch, sqlite_engine):
+    use_portone(monkeypatch, FakePortOne())
+    factory = make_session_factory(sqlite_engine)
+    event_id = webhook_queue.enqueue(factory(), webhook('imp_one', merchant_uid='one_1'))
+    worker = webhook_queue.WebhookWorker(factory)
+
+    assert worker.run_pending() == 1
+    # 포트원 재전송은 접수 단계에서, 완료된 이벤트 재처리는 결제 유니크 제약에서 걸러짐
+    assert webhook_queue.enqueue(factory(), webhook('imp_one', merchant_uid='one_1')) is None
+    assert webhook_queue.replay(factory(), [event_id]) == 1
+    assert worker.run_pending() == 1
+
+    db = factory()
+    assert events(db)[event_id].processing_status == webhook_queue.STATUS_DONE
+    assert balance_and_payments(db) == (110, 1)
+
+
+def test_racing_sessions_credit_once(monkeypatch, tmp_path, sqlite_engine):
+    portone_services = use_portone(monkeypatch, FakePortOne())
+    factory = make_session_factory(sqlite_engine, f"sqlite:///{tmp_path / 'race.db'}")
+    first, second = factory(), factory()
+    raced = []
+
+    # 첫 세션이 결제를 INSERT 하기 직전에 두 번째 세션(검증 API 또는 다른 워커)이 같은 결제를 끝까지 처리
+    def race(conn, cursor, statement, *args):
+        if statement.startswith('INSERT INTO payments') and not raced:
+            raced.append(None)
+            raced[0] = portone_services.process_single_payment(PAYMENTS['imp_one'], second)
+
+    event.listen(first.get_bind(), 'before_cursor_execute', race)
+    saved = portone_services.process_single_payment(PAYMENTS['imp_one'], first)
+
+    assert raced == [True]
+    assert saved is False
+    assert balance_and_payments(factory()) == (110, 1)
+
+
+def test_payment_method_change_is_scheduled_once_on_retry_and_replay(monkeypatch, sqlite_engine):
+    client = FakePortOne()
+    use_portone(monkeypatch, client)
+    factory = make_session_factory(sqlite_engine)
+    event_id = webhook_queue.enqueue(factory(), webhook('imp_change', merchant_uid='change_1'))
+    calls = []
+
+    def fail_after_handling(session, event):
+        # 예약까지 마친 뒤 완료 기록 전에 실패한 것처럼 - 재시도 대상
+        calls.append(webhook_queue.process_event(session, event))
+        if len(calls) == 1:
+            raise RuntimeError('connection lost')
+
+    worker = webhook_queue.WebhookWorker(factory, handler=fail_after_handling)
+    assert worker.run_one() == webhook_queue.STATUS_PENDING
+    webhook_queue.mark_failed(factory(), event_id, webhook_queue.MAX_ATTEMPTS, 'error')
+    assert webhook_queue.replay(factory()) == 1
+    assert worker.run_one() == webhook_queue.STATUS_DONE
+    assert webhook_queue.replay(factory(), [event_id]) == 1
+    assert worker.run_one() == webhook_queue.STATUS_DONE
+
+    assert [call['status'] for call in calls] == ['skipped'] * 3
+    assert len(client.scheduled['cust_1']) == 1
+    assert balance_and_payments(factory()) == (10, 0)
@@ -0,0 +1,156 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+import app.db  # noqa: F401 - 모델 등록 순서
+from app.core import push
+from app.domains.subscription import services, status_cache
+from app.domains.subscription.models import UserSubscription
+from app.domains.subscription.status_cache import ActiveSubscription, SubscriptionStatusCache
+
+SUBSCRIBED = uuid.UUID('00000000-0000-0000-0000-000000000001')
+EXPIRED = uuid.UUID('00000000-0000-0000-0000-000000000002')
+NEVER = uuid.UUID('00000000-0000-0000-0000-000000000003')
+
+SUBSCRIPTIONS = [
+    f"INSERT INTO user_subscriptions VALUES (1, '{SUBSCRIBED.hex}', 1, '2024-04-01', '2024-04-30', '2024-05-01', 'ACTIVE', NULL, 'card')",
+    f"INSERT INTO user_subscriptions VALUES (2, '{SUBSCRIBED.hex}', 1, '2024-05-01', '2024-05-31', '2024-06-01', 'ACTIVE', NULL, 'card')",
+    f"INSERT INTO user_subscriptions VALUES (3, '{EXPIRED.hex}', 1, '2024-03-01', '2024-03-31', '2024-04-01', 'CANCELLED', NULL, 'card')",
+]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.today = date(2024, 5, 10)
+
+
+def make_session(sqlite_engine):
+    engine = sqlite_engine(UserSubscription)
+    with engine.begin() as conn:
+        for statement in SUBSCRIPTIONS:
+            conn.execute(text(statement))
+    queries = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: queries.append(args[2]))
+    return Session(engine), queries
+
+
+def make_cache(clock, **kwargs):
+    return SubscriptionStatusCache(clock=lambda: clock.now, today=lambda: clock.today, **kwargs)
+
+
+def test_repeated_lookups_are_served_from_cache(sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    clock = Clock()
+    cache = make_cache(clock)
+
+    assert cache.get(db, SUBSCRIBED) == ActiveSubscription(2, date(2024, 5, 31))
+    assert cache.get(db, NEVER) is None
+    for _ in range(10):
+        cache.get(db, SUBSCRIBED)
+        cache.get(db, NEVER)
+
+    assert len(queries) == 2
+
+
+def test_entry_expires_with_subscription_end_date_and_max_age(sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    clock = Clock()
+    cache = make_cache(clock, max_age_seconds=60)
+    cache.get(db, SUBSCRIBED)
+    cache.get(db, NEVER)
+
+    clock.today = date(2024, 6, 1)
+    assert cache.get(db, SUBSCRIBED) is None
+    assert len(queries) == 3
+
+    clock.now += 61
+    cache.get(db, NEVER)
+    assert len(queries) == 4
+
+
+def test_invalidate_forces_reload(sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    clock = Clock()
+    cache = make_cache(clock)
+    assert cache.get(db, EXPIRED) is None
+
+    db.execute(text(f"UPDATE user_subscriptions SET end_date = '2024-06-09' WHERE user_id = '{EXPIRED.hex}'"))
+    cache.invalidate(EXPIRED)
+
+    assert cache.get(db, EXPIRED) == ActiveSubscription(3, date(2024, 6, 9))
+
+
+def test_get_many_queries_only_missing_users_once(sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    clock = Clock()
+    cache = make_cache(clock)
+    cache.get(db, SUBSCRIBED)
+
+    result = cache.get_many(db, [SUBSCRIBED, EXPIRED, NEVER])
+
+    assert result == {str(SUBSCRIBED): ActiveSubscription(2, date(2024, 5, 31)), str(EXPIRED): None, str(NEVER): None}
+    assert len(queries) == 2
+    cache.get_many(db, [SUBSCRIBED, EXPIRED, NEVER])
+    assert len(queries) == 2
+
+
+def test_oldest_entries_are_evicted(sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    cache = make_cache(Clock(), max_entries=2)
+    for user_id in (SUBSCRIBED, EXPIRED, NEVER):
+        cache.get(db, user_id)
+
+    cache.get(db, NEVER)
+    assert len(queries) == 3
+    cache.get(db, SUBSCRIBED)
+    assert len(queries) == 4
+
+
+def test_refresh_reads_database_and_updates_cache(sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    clock = Clock()
+    cache = make_cache(clock)
+    assert cache.get(db, EXPIRED) is None
+
+    db.execute(text(f"UPDATE user_subscriptions SET end_date = '2024-06-09' WHERE user_id = '{EXPIRED.hex}'"))
+
+    assert cache.get(db, EXPIRED) is None
+    assert cache.get(db, EXPIRED, refresh=True) == ActiveSubscription(3, date(2024, 6, 9))
+    assert cache.get(db, EXPIRED) == ActiveSubscription(3, date(2024, 6, 9))
+    # 첫 조회, UPDATE, refresh 조회
+    assert len(queries) == 3
+
+
+def test_invalidation_from_other_process_reaches_this_cache(monkeypatch, sqlite_engine):
+    db, queries = make_session(sqlite_engine)
+    cache = make_cache(Clock())
+    monkeypatch.setattr(status_cache, 'subscription_cache', cache)
+    # 다른 프로세스 - 발행만 기록
+    published = []
+    monkeypatch.setattr(push, 'publish', lambda event, data, user_id=None: published.append((event, user_id)))
+    # 이 프로세스 - LISTEN 스레드가 받은 메시지를 브로커로 전달
+    broker = push.PushBroker()
+    broker.add_handler(push.EVENT_SUBSCRIPTION_CHANGED, services.handle_subscription_event)
+    broker.add_handler(push.EVENT_LISTEN_STARTED, services.handle_subscription_event)
+    assert services.is_user_subscribed(db, EXPIRED) is False
+
+    db.execute(text(f"UPDATE user_subscriptions SET end_date = '2024-06-09' WHERE user_id = '{EXPIRED.hex}'"))
+    services.invalidate_subscription_status(EXPIRED)
+    assert published == [(push.EVENT_SUBSCRIPTION_CHANGED, EXPIRED)]
+    cache.get(db, EXPIRED)
+    cache.get(db, NEVER)
+    queries.clear()
+
+    broker.dispatch(push.make_message(push.EVENT_SUBSCRIPTION_CHANGED, {}, [EXPIRED]))
+    assert cache.get(db, EXPIRED) == ActiveSubscription(3, date(2024, 6, 9))
+    cache.get(db, NEVER)
+    assert len(queries) == 1
+
+    # LISTEN 재연결 뒤에는 놓친 알림이 있을 수 있으므로 전부 다시 조회
+    broker.dispatch(push.make_message(push.EVENT_LISTEN_STARTED, {}))
+    cache.get(db, EXPIRED)
+    cache.get(db, NEVER)
+    assert len(queries) == 3
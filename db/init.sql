@@ -1,6 +1,7 @@
 -- 확장 기능 활성화
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS vector;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- Custom ENUM types
 CREATE TYPE gender_enum AS ENUM ('M', 'F', 'N');
@@ -191,6 +192,9 @@ CREATE TABLE User_Subscriptions (
     subscriptions_method VARCHAR(50) NOT NULL
 );
 
+-- 구독 여부 확인 (user_id = ? AND end_date >= today)
+CREATE INDEX idx_user_subscriptions_user_end_date ON User_Subscriptions(user_id, end_date);
+
 -- Token Plans 테이블
 CREATE TABLE Token_Plans (
     token_plan_id SERIAL PRIMARY KEY,
@@ -232,6 +236,13 @@ CREATE TABLE Payments (
     manual_payment_reason TEXT
 );
 
+-- 관리자 결제 목록: 결제일 정렬, 부분 문자열(ILIKE) 검색용 trigram 인덱스
+CREATE INDEX idx_payments_payment_date ON Payments(payment_date);
+CREATE INDEX idx_payments_payment_number_trgm ON Payments USING gin (payment_number gin_trgm_ops);
+CREATE INDEX idx_payments_payment_method_trgm ON Payments USING gin (payment_method gin_trgm_ops);
+CREATE INDEX idx_payments_manual_reason_trgm ON Payments USING gin (manual_payment_reason gin_trgm_ops);
+CREATE INDEX idx_users_nickname_trgm ON Users USING gin (nickname gin_trgm_ops);
+
 -- Payment Cache 테이블
 CREATE TABLE Payment_Cache (
     cache_id SERIAL PRIMARY KEY,
@@ -252,6 +263,27 @@ CREATE TABLE Payment_Cache (
     coupon_id INTEGER REFERENCES Coupons(coupon_id)
 );
 
+-- 포트원 웹훅 수신/처리 대기열 (같은 결제의 같은 상태 알림은 한 건만 저장)
+CREATE TABLE Payment_Webhook_Events (
+    event_id SERIAL PRIMARY KEY,
+    imp_uid VARCHAR(50) NOT NULL,
+    merchant_uid VARCHAR(100) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    customer_uid VARCHAR(100),
+    payload JSONB,
+    processing_status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    worker_id VARCHAR(100),
+    received_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    locked_at TIMESTAMP,
+    processed_at TIMESTAMP,
+    CONSTRAINT uq_payment_webhook_events_imp_uid_status UNIQUE (imp_uid, status)
+);
+
+CREATE INDEX idx_payment_webhook_events_queue ON Payment_Webhook_Events(processing_status, next_attempt_at);
+
 -- User Coupons 테이블
 CREATE TABLE User_Coupons (
     user_id UUID REFERENCES Users(user_id),
@@ -284,12 +316,24 @@ CREATE TABLE User_Notice_Reads (
     PRIMARY KEY (user_id, notice_id)
 );
 
+-- User Notice Read Bitmaps 테이블 (사용자별 읽은 공지 id 비트맵, 안 읽은 공지 수 배지용)
+CREATE TABLE user_notice_read_bitmaps (
+    user_id UUID PRIMARY KEY REFERENCES Users(user_id),
+    bitmap BYTEA NOT NULL DEFAULT '',
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Notifications 테이블
 CREATE TABLE Notifications (
     notification_id SERIAL PRIMARY KEY,
     type VARCHAR(50) NOT NULL,
     message TEXT NOT NULL,
-    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    delivery_status VARCHAR(20) NOT NULL DEFAULT 'COMPLETED',
+    target_count INTEGER,
+    recipient_count INTEGER NOT NULL DEFAULT 0,
+    fanout_cursor UUID,
+    audience VARCHAR(20)
 );
 
 -- user_notifications 테이블
@@ -298,9 +342,17 @@ CREATE TABLE user_notifications (
     notification_id INTEGER REFERENCES notifications(notification_id) ON DELETE CASCADE,
     is_read BOOLEAN NOT NULL DEFAULT FALSE,
     read_at TIMESTAMPTZ,
+    is_dismissed BOOLEAN NOT NULL DEFAULT FALSE,
     PRIMARY KEY (user_id, notification_id)
 );
 
+-- user_notification_marks 테이블 (전체 알림 "모두 읽음" 기준 id)
+CREATE TABLE user_notification_marks (
+    user_id UUID PRIMARY KEY REFERENCES users(user_id) ON DELETE CASCADE,
+    broadcast_read_through INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 -- UserNotificationSettings 테이블
 CREATE TABLE User_Notification_Settings (
     setting_id SERIAL PRIMARY KEY,
@@ -314,6 +366,8 @@ CREATE INDEX idx_notifications_created_at ON notifications(created_at DESC);
 CREATE INDEX idx_user_notifications_user_id ON user_notifications(user_id);
 CREATE INDEX idx_user_notifications_notification_id ON user_notifications(notification_id);
 CREATE INDEX idx_user_notification_settings_user_id ON user_notification_settings(user_id);
+CREATE INDEX idx_notifications_broadcast ON notifications(created_at DESC) WHERE audience IS NOT NULL;
+CREATE INDEX idx_notifications_delivery_pending ON notifications(notification_id) WHERE delivery_status IN ('PENDING', 'RUNNING');
 
 -- Inquiries 테이블
 CREATE TABLE Inquiries (
@@ -399,6 +453,22 @@ CREATE TABLE system_settings (
     created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 사용자별 일간 사용량 집계 (관리자 통계 조회용, 주기적으로 최근 며칠을 다시 계산)
+CREATE TABLE user_usage_daily (
+    usage_date DATE NOT NULL,
+    user_id UUID NOT NULL REFERENCES Users(user_id) ON DELETE CASCADE,
+    tokens_used INTEGER NOT NULL DEFAULT 0,
+    usage_count INTEGER NOT NULL DEFAULT 0,
+    max_tokens_used INTEGER,
+    min_tokens_used INTEGER,
+    conversations INTEGER NOT NULL DEFAULT 0,
+    payments INTEGER NOT NULL DEFAULT 0,
+    payment_amount FLOAT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (usage_date, user_id)
+);
+CREATE INDEX idx_user_usage_daily_user ON user_usage_daily(user_id, usage_date);
+
 -- Banners 테이블
 CREATE TABLE Banners (
     banner_id SERIAL PRIMARY KEY,
@@ -687,6 +757,7 @@ CREATE TABLE exhibitions (
     
     -- 기타
     keywords VARCHAR(500),
+    content_hash VARCHAR(64),
     
     -- 상태
     status VARCHAR(30) DEFAULT 'active',
@@ -737,6 +808,17 @@ CREATE TABLE culture_hubs (
     -- API 메타데이터
     api_source VARCHAR(100) NOT NULL,
     culture_code VARCHAR(200),
+    content_hash VARCHAR(64),
+    
+    -- 소스 간 중복 판별
+    venue_key VARCHAR(100),
+    canonical_id INTEGER,
+    is_duplicate BOOLEAN DEFAULT FALSE,
+    
+    -- 위치 (장소 좌표 사전에서 연결)
+    latitude FLOAT,
+    longitude FLOAT,
+    geohash VARCHAR(12),
     
     -- 시스템
     collected_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -750,6 +832,26 @@ CREATE INDEX idx_culture_hub_venue ON culture_hubs(venue);
 CREATE INDEX idx_culture_hub_category ON culture_hubs(category);
 CREATE INDEX idx_culture_hub_api_source ON culture_hubs(api_source);
 CREATE INDEX idx_culture_hub_title ON culture_hubs(title);
+CREATE INDEX idx_culture_hub_source_hash ON culture_hubs(api_source, culture_code, content_hash);
+CREATE INDEX idx_culture_hub_venue_key ON culture_hubs(venue_key);
+CREATE INDEX idx_culture_hub_canonical ON culture_hubs(canonical_id);
+CREATE INDEX idx_culture_hub_geohash ON culture_hubs(geohash varchar_pattern_ops);
+-- 진행 중 행사 구체화 뷰(active_culture_events)는 소스별 지역 정보가 수집 설정에 있으므로
+-- 앱(app/domains/exhibition/active_events.py)이 첫 갱신 때 생성한다
+
+-- 장소 좌표 사전 (문화행사 venue → 좌표)
+CREATE TABLE venue_gazetteer (
+    id SERIAL PRIMARY KEY,
+    venue_key VARCHAR(100) NOT NULL UNIQUE,
+    name VARCHAR(300) NOT NULL,
+    institution_id INTEGER REFERENCES institutions(id) ON DELETE SET NULL,
+    latitude FLOAT NOT NULL,
+    longitude FLOAT NOT NULL,
+    geohash VARCHAR(12) NOT NULL,
+    source VARCHAR(30) DEFAULT 'manual',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE
+);
 
 -- API 소스 테이블
 CREATE TABLE api_sources (
@@ -762,12 +864,40 @@ CREATE TABLE api_sources (
     is_active BOOLEAN DEFAULT TRUE,
     total_collected INTEGER DEFAULT 0,
     last_collection_at TIMESTAMP WITH TIME ZONE,
+    collect_interval_minutes INTEGER DEFAULT 1440,
+    next_collection_at TIMESTAMP WITH TIME ZONE,
+    last_change_count INTEGER DEFAULT 0,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE
 );
 
 CREATE INDEX idx_api_sources_key ON api_sources(api_key);
 CREATE INDEX idx_api_sources_active ON api_sources(is_active);
+CREATE INDEX idx_api_source_next_collection ON api_sources(next_collection_at);
+
+-- 수집 작업 테이블 (진행 상황/취소 요청을 워커 간 공유)
+CREATE TABLE collection_jobs (
+    id VARCHAR(36) PRIMARY KEY,
+    job_type VARCHAR(20) NOT NULL DEFAULT 'all',
+    api_key VARCHAR(200),
+    params JSONB,
+    status VARCHAR(20) NOT NULL DEFAULT 'running',
+    step INTEGER DEFAULT 1,
+    message TEXT,
+    percentage INTEGER DEFAULT 0,
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    error TEXT,
+    source_counters JSONB,
+    results JSONB,
+    worker_id VARCHAR(100),
+    heartbeat_at TIMESTAMP WITH TIME ZONE,
+    finished_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX idx_collection_job_status ON collection_jobs(status);
+CREATE INDEX idx_collection_job_finished ON collection_jobs(finished_at);
 
 -- 파일 관리 테이블
 CREATE TABLE smart_files (
@@ -796,6 +926,7 @@ CREATE TABLE smart_files (
     -- 추출 정보
     total_pages INTEGER,
     extracted_text TEXT,
+    content_hash VARCHAR(64),
     
     -- 시스템
     uploaded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -809,6 +940,25 @@ CREATE INDEX idx_smart_file_exhibition ON smart_files(exhibition_id);
 CREATE INDEX idx_smart_file_status ON smart_files(processing_status);
 CREATE INDEX idx_smart_files_active ON smart_files(is_active);
 
+-- 파일 페이지별 텍스트
+CREATE TABLE smart_file_pages (
+    id SERIAL PRIMARY KEY,
+    smart_file_id INTEGER NOT NULL REFERENCES smart_files(id) ON DELETE CASCADE,
+    page_number INTEGER NOT NULL,
+    
+    -- 추출 텍스트 및 전체 문서 내 위치
+    text TEXT,
+    char_start INTEGER NOT NULL DEFAULT 0,
+    char_end INTEGER NOT NULL DEFAULT 0,
+    
+    extraction_method VARCHAR(30),
+    text_hash VARCHAR(64) NOT NULL,
+    
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT uq_smart_file_page UNIQUE (smart_file_id, page_number)
+);
+
 -- 기본 기관 데이터 삽입
 INSERT INTO institutions (name, type, category, address, is_active, created_by) VALUES
 ('국립현대미술관', '미술관', '국립', '서울특별시 종로구 삼청로 30', true, 'system'),
@@ -816,6 +966,20 @@ INSERT INTO institutions (name, type, category, address, is_active, created_by)
 ('국립중앙박물관', '박물관', '국립', '서울특별시 용산구 서빙고로 137', true, 'system'),
 ('예술의전당', '복합문화시설', '공공', '서울특별시 서초구 남부순환로 2406', true, 'system');
 
+-- 장소 좌표 사전 기본 데이터 (주요 전시장)
+INSERT INTO venue_gazetteer (venue_key, name, latitude, longitude, geohash, source) VALUES
+('국립현대미술관서울', '국립현대미술관 서울', 37.5788, 126.9801, 'wydmc9006', 'manual'),
+('국립현대미술관과천', '국립현대미술관 과천', 37.4305, 127.0074, 'wydkfn5bq', 'manual'),
+('국립현대미술관덕수궁', '국립현대미술관 덕수궁', 37.5658, 126.9752, 'wydm9qss8', 'manual'),
+('국립현대미술관청주', '국립현대미술관 청주', 36.6541, 127.4913, 'wyd8t0smd', 'manual'),
+('서울시립미술관', '서울시립미술관', 37.5640, 126.9738, 'wydm9q76p', 'manual'),
+('국립중앙박물관', '국립중앙박물관', 37.5239, 126.9804, 'wydm3x029', 'manual'),
+('예술의전당', '예술의전당', 37.4786, 127.0119, 'wydm4nz0x', 'manual'),
+('국립한글박물관', '국립한글박물관', 37.5212, 126.9810, 'wydm3w88z', 'manual'),
+('대한민국역사박물관', '대한민국역사박물관', 37.5743, 126.9780, 'wydmc2nw1', 'manual'),
+('아르코미술관', '아르코미술관', 37.5818, 127.0033, 'wydmf18cz', 'manual'),
+('마포아트센터', '마포아트센터', 37.5531, 126.9463, 'wydm8sr6x', 'manual');
+
 -- API 소스 기본 데이터 삽입
 INSERT INTO api_sources (api_key, name, description, base_url, location, is_active) VALUES
 ('kcdf', '한국공예디자인문화진흥원 전시도록', '공예 및 디자인 관련 전시 정보', 'http://api.kcisa.kr/openapi', '서울', true),